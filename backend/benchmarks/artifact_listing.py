@@ -0,0 +1,305 @@
+"""Benchmark of the full and summary artifact listings.
+
+Seeds one throwaway organization, orbit and collection with ``--artifacts`` artifacts,
+each carrying a file index of ``--index-entries`` entries and a realistic manifest, in
+the database ``POSTGRESQL_DSN`` points at (migrations must already be applied). Then
+pages through the collection with both listing views and reports the time per page,
+the JSON payload per page and the bytes Postgres reads for the selected columns. The
+seeded organization is deleted afterwards::
+
+    uv run python -m benchmarks.artifact_listing --artifacts 50000 --index-entries 500
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from luml.models import (
+    ArtifactOrm,
+    BucketSecretOrm,
+    CollectionOrm,
+    OrbitOrm,
+    OrganizationOrm,
+)
+from luml.repositories.artifacts import ArtifactRepository
+from luml.schemas.artifacts import (
+    ArtifactsList,
+    ArtifactStatus,
+    ArtifactSummaryList,
+    ArtifactType,
+)
+from luml.schemas.general import Cursor, PaginationParams, SortOrder
+from luml.settings import config
+from pydantic import BaseModel
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+_BATCH = 1_000
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    view: str
+    artifacts: int
+    pages: int
+    ms_per_page: float
+    payload_bytes_per_page: int
+    db_bytes_per_row: int
+
+
+@dataclass(frozen=True)
+class _Seeded:
+    organization_id: uuid.UUID
+    orbit_id: uuid.UUID
+    collection_id: uuid.UUID
+
+
+def _artifact_row(
+    collection_id: uuid.UUID, i: int, index_entries: int, rng: random.Random
+) -> dict[str, Any]:
+    file_index = {
+        f"data/shard-{j:05d}/part-{rng.getrandbits(32):08x}.parquet": (j * 4096, 4096)
+        for j in range(index_entries)
+    }
+    return {
+        "id": uuid.uuid7(),
+        "collection_id": collection_id,
+        "file_name": f"model-{i}.luml",
+        "name": f"model-{i}",
+        "description": None,
+        "extra_values": {
+            "accuracy": rng.random(),
+            "f1": rng.random(),
+            "loss": rng.random(),
+        },
+        "manifest": {
+            "variant": "pipeline",
+            "name": f"model-{i}",
+            "version": "1.0.0",
+            "producer_name": "benchmark",
+            "producer_version": "1.0.0",
+            "producer_tags": ["benchmark"],
+            "inputs": [
+                {"name": f"feature_{k}", "content_type": "JSON", "dtype": "float32"}
+                for k in range(64)
+            ],
+            "outputs": [{"name": "y", "content_type": "JSON", "dtype": "float32"}],
+            "dynamic_attributes": [],
+            "env_vars": [],
+        },
+        "file_hash": f"{rng.getrandbits(128):032x}",
+        "file_index": file_index,
+        "bucket_location": f"bench/{collection_id}/model-{i}.luml",
+        "size": rng.randint(1_000, 10_000_000_000),
+        "unique_identifier": f"bench-{i}",
+        "tags": ["benchmark", f"group-{i % 10}"],
+        "created_by_user": "benchmark",
+        "status": ArtifactStatus.UPLOADED.value,
+        "type": ArtifactType.MODEL.value,
+    }
+
+
+async def seed(
+    engine: AsyncEngine, artifacts: int, index_entries: int, seed: int = 0
+) -> _Seeded:
+    """One organization, orbit and collection holding ``artifacts`` artifacts."""
+    rng = random.Random(seed)
+    seeded = _Seeded(uuid.uuid7(), uuid.uuid7(), uuid.uuid7())
+    secret_id = uuid.uuid7()
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(OrganizationOrm).values(
+                id=seeded.organization_id, name="artifact-listing-benchmark"
+            )
+        )
+        await conn.execute(
+            insert(BucketSecretOrm).values(
+                id=secret_id,
+                organization_id=seeded.organization_id,
+                endpoint="benchmark.invalid",
+                bucket_name="benchmark",
+                type="s3",
+            )
+        )
+        await conn.execute(
+            insert(OrbitOrm).values(
+                id=seeded.orbit_id,
+                name="benchmark",
+                organization_id=seeded.organization_id,
+                bucket_secret_id=secret_id,
+            )
+        )
+        await conn.execute(
+            insert(CollectionOrm).values(
+                id=seeded.collection_id,
+                orbit_id=seeded.orbit_id,
+                name="benchmark",
+                description="",
+                type="model",
+            )
+        )
+        for start in range(0, artifacts, _BATCH):
+            rows = [
+                _artifact_row(seeded.collection_id, i, index_entries, rng)
+                for i in range(start, min(start + _BATCH, artifacts))
+            ]
+            await conn.execute(insert(ArtifactOrm), rows)
+        await conn.exec_driver_sql("ANALYZE artifacts")
+    return seeded
+
+
+async def _db_bytes_per_row(
+    engine: AsyncEngine, collection_id: uuid.UUID, summary: bool
+) -> int:
+    columns = [ArtifactOrm.extra_values, ArtifactOrm.tags]
+    if not summary:
+        columns += [ArtifactOrm.manifest, ArtifactOrm.file_index]
+    size = sum((func.pg_column_size(column) for column in columns), start=0)
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(func.avg(size)).where(ArtifactOrm.collection_id == collection_id)
+        )
+        return int(result.scalar() or 0)
+
+
+async def _page_through(
+    list_page: Callable[[PaginationParams], Awaitable[tuple[list[Any], Cursor | None]]],
+    to_payload: Callable[[list[Any]], BaseModel],
+    pages: int,
+    limit: int,
+) -> tuple[float, int, int]:
+    cursor: Cursor | None = None
+    seconds, payload, fetched = 0.0, 0, 0
+    for _ in range(pages):
+        pagination = PaginationParams(
+            cursor=cursor, sort_by="created_at", order=SortOrder.DESC, limit=limit
+        )
+        start = time.perf_counter()
+        items, cursor = await list_page(pagination)
+        payload += len(to_payload(items).model_dump_json())
+        seconds += time.perf_counter() - start
+        fetched += 1
+        if cursor is None:
+            break
+    return seconds, payload, fetched
+
+
+async def run_benchmark(
+    engine: AsyncEngine,
+    seeded: _Seeded,
+    *,
+    artifacts: int,
+    pages: int,
+    limit: int,
+) -> list[BenchmarkResult]:
+    repo = ArtifactRepository(engine)
+    collection_ids = [seeded.collection_id]
+    views: dict[str, tuple[Any, Callable[[list[Any]], BaseModel], bool]] = {
+        "full": (
+            repo.get_collection_artifacts,
+            lambda items: ArtifactsList(items=items, cursor=None),
+            False,
+        ),
+        "summary": (
+            repo.get_collection_artifact_summaries,
+            lambda items: ArtifactSummaryList(items=items, cursor=None),
+            True,
+        ),
+    }
+
+    results = []
+    for view, (list_method, to_payload, summary) in views.items():
+
+        def list_page(
+            pagination: PaginationParams,
+            list_method: Any = list_method,  # noqa: ANN401
+        ) -> Awaitable[tuple[list[Any], Cursor | None]]:
+            return list_method(
+                seeded.orbit_id, pagination, collection_ids=collection_ids
+            )
+
+        # Warm the connection pool and Postgres caches before timing.
+        await _page_through(list_page, to_payload, 1, limit)
+        seconds, payload, fetched = await _page_through(
+            list_page, to_payload, pages, limit
+        )
+        results.append(
+            BenchmarkResult(
+                view=view,
+                artifacts=artifacts,
+                pages=fetched,
+                ms_per_page=seconds * 1000 / max(fetched, 1),
+                payload_bytes_per_page=payload // max(fetched, 1),
+                db_bytes_per_row=await _db_bytes_per_row(
+                    engine, seeded.collection_id, summary
+                ),
+            )
+        )
+    return results
+
+
+async def cleanup(engine: AsyncEngine, seeded: _Seeded) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(
+            delete(OrganizationOrm).where(OrganizationOrm.id == seeded.organization_id)
+        )
+
+
+def _format_table(results: list[BenchmarkResult]) -> str:
+    header = (
+        f"{'view':<10}{'artifacts':>11}{'pages':>7}{'ms/page':>10}"
+        f"{'KiB/page':>11}{'DB B/row':>11}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.view:<10}{r.artifacts:>11}{r.pages:>7}{r.ms_per_page:>10.1f}"
+            f"{r.payload_bytes_per_page / 1024:>11.1f}{r.db_bytes_per_row:>11}"
+        )
+    return "\n".join(lines)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(config.POSTGRESQL_DSN)
+    seeded = await seed(engine, args.artifacts, args.index_entries, args.seed)
+    try:
+        results = await run_benchmark(
+            engine,
+            seeded,
+            artifacts=args.artifacts,
+            pages=args.pages,
+            limit=args.limit,
+        )
+    finally:
+        await cleanup(engine, seeded)
+        await engine.dispose()
+
+    if args.json:
+        for result in results:
+            sys.stdout.write(json.dumps(asdict(result)) + "\n")
+    else:
+        sys.stdout.write(_format_table(results) + "\n")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the full and summary artifact listings."
+    )
+    parser.add_argument("--artifacts", type=int, default=50_000)
+    parser.add_argument("--index-entries", type=int, default=500)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit results as JSON")
+    asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,16 @@ from luml.infra.dependencies import UserAuthentication
 from luml.infra.endpoint_responses import endpoint_responses
 from luml.schemas.artifacts import (
     Artifact,
+    ArtifactBatch,
+    ArtifactBatchIn,
     ArtifactDetails,
+    ArtifactDownloadUrls,
+    ArtifactDownloadUrlsIn,
     ArtifactIn,
+    ArtifactListView,
     ArtifactsList,
+    ArtifactSummaryBatch,
+    ArtifactSummaryList,
     ArtifactType,
     ArtifactUpdateIn,
     CreateArtifactResponse,
@@ -73,7 +80,7 @@ async def update_artifact(
 @artifacts_router.get(
     "/artifacts",
     responses=endpoint_responses,
-    response_model=ArtifactsList,
+    response_model=ArtifactsList | ArtifactSummaryList,
 )
 async def get_orbit_artifacts(
     request: Request,
@@ -87,7 +94,8 @@ async def get_orbit_artifacts(
     collection_ids: Annotated[list[UUID] | None, Query()] = None,
     search: str | None = None,
     excluded_tracks: Annotated[list[UUID] | None, Query()] = None,
-) -> ArtifactsList:
+    view: ArtifactListView = ArtifactListView.FULL,
+) -> ArtifactsList | ArtifactSummaryList:
     return await artifacts_handler.get_collection_artifacts(
         user_id=request.user.id,
         organization_id=organization_id,
@@ -100,6 +108,7 @@ async def get_orbit_artifacts(
         collection_ids=collection_ids,
         search=search,
         excluded_tracks=excluded_tracks,
+        view=view,
     )
 
 
@@ -141,6 +150,45 @@ async def get_artifact_download_url(
     return {"url": url}
 
 
+@artifacts_router.post(
+    "/artifacts/download-urls",
+    responses=endpoint_responses,
+    response_model=ArtifactDownloadUrls,
+)
+async def get_artifact_download_urls(
+    request: Request,
+    organization_id: UUID,
+    orbit_id: UUID,
+    data: ArtifactDownloadUrlsIn,
+) -> ArtifactDownloadUrls:
+    return await artifacts_handler.request_download_urls(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        data.artifact_ids,
+    )
+
+
+@artifacts_router.post(
+    "/artifacts/batch",
+    responses=endpoint_responses,
+    response_model=ArtifactBatch | ArtifactSummaryBatch,
+)
+async def get_artifacts_batch(
+    request: Request,
+    organization_id: UUID,
+    orbit_id: UUID,
+    data: ArtifactBatchIn,
+) -> ArtifactBatch | ArtifactSummaryBatch:
+    return await artifacts_handler.get_artifacts_batch(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        data.artifact_ids,
+        data.view,
+    )
+
+
 @artifacts_router.get(
     "/collections/{collection_id}/artifacts/{artifact_id}/delete-url",
     responses=endpoint_responses,
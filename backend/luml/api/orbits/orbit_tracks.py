@@ -11,6 +11,7 @@ from luml.schemas.tracks import (
     Stage,
     Track,
     TrackCreateIn,
+    TrackEntriesCreateIn,
     TrackEntriesDeleteIn,
     TrackEntriesList,
     TrackEntry,
@@ -168,6 +169,23 @@ async def create_entry(
     )
 
 
+@tracks_router_entries.post(
+    "/batch",
+    responses=endpoint_responses,
+    response_model=list[TrackEntry],
+)
+async def create_entries(
+    request: Request,
+    organization_id: UUID,
+    orbit_id: UUID,
+    track_id: UUID,
+    payload: TrackEntriesCreateIn,
+) -> list[TrackEntry]:
+    return await tracks_handler.create_entries(
+        request.user.id, organization_id, orbit_id, track_id, payload.entries
+    )
+
+
 @tracks_router_entries.get(
     "/by-stage",
     responses=endpoint_responses,
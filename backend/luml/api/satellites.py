@@ -1,7 +1,7 @@
-from typing import Any
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from luml.handlers.artifacts import ArtifactHandler
 from luml.handlers.deployments import DeploymentHandler
@@ -10,6 +10,8 @@ from luml.handlers.satellites import SatelliteHandler
 from luml.infra.dependencies import UserAuthentication
 from luml.infra.endpoint_responses import endpoint_responses
 from luml.schemas.artifacts import (
+    ArtifactDownloadUrls,
+    ArtifactDownloadUrlsIn,
     SatelliteArtifactResponse,
     SatelliteModelArtifactResponse,
 )
@@ -73,10 +75,12 @@ async def get_orbit_secret(request: Request, secret_id: UUID) -> OrbitSecret:
     response_model=list[SatelliteQueueTask],
 )
 async def list_tasks(
-    request: Request, status: SatelliteTaskStatus | None = None
+    request: Request,
+    status: SatelliteTaskStatus | None = None,
+    wait: Annotated[float | None, Query(ge=0, le=60)] = None,
 ) -> list[SatelliteQueueTask]:
     await satellite_handler.touch_last_seen(request.user.id)
-    return await satellite_handler.list_tasks(request.user.id, status)
+    return await satellite_handler.list_tasks(request.user.id, status, wait)
 
 
 @satellite_worker_router.post(
@@ -198,6 +202,20 @@ async def get_artifact_download_url(
     return {"url": url}
 
 
+@satellite_worker_router.post(
+    "/artifacts/download-urls",
+    responses=endpoint_responses,
+    response_model=ArtifactDownloadUrls,
+)
+async def get_artifact_download_urls(
+    request: Request, data: ArtifactDownloadUrlsIn
+) -> ArtifactDownloadUrls:
+    await satellite_handler.touch_last_seen(request.user.id)
+    return await artifacts_handler.request_satellite_download_urls(
+        request.user.orbit_id, data.artifact_ids
+    )
+
+
 @satellite_worker_router.get(
     "/artifacts/{artifact_id}",
     responses=endpoint_responses,
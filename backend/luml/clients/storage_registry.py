@@ -0,0 +1,81 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from uuid import UUID
+
+from luml.clients.base_storage_client import BaseStorageClient
+from luml.clients.storage_factory import create_storage_client
+from luml.infra.cache import TTLCache, invalidate, memoized
+from luml.schemas.bucket_secrets import BucketSecret
+from luml.settings import config
+
+type _ClientKey = tuple[UUID, datetime | None]
+
+
+class StorageClientRegistry:
+    """Bucket secrets, storage clients and presigned download URLs, reused across calls.
+
+    Secrets are cached for ``secret_ttl`` seconds. Clients are keyed by secret id and
+    version (``updated_at``), so an edited secret gets a fresh client. A presigned GET
+    URL is handed out again until fewer than ``url_reuse_margin`` seconds of its
+    validity remain. ``invalidate`` drops everything derived from a secret; it only
+    affects this process.
+    """
+
+    def __init__(self, secret_ttl: float, url_reuse_margin: float) -> None:
+        self._secrets: TTLCache[UUID, BucketSecret | None] = TTLCache(secret_ttl)
+        self._clients: dict[_ClientKey, BaseStorageClient] = {}
+        url_lifetime = BaseStorageClient._url_expire * 3600
+        self._download_urls: TTLCache[tuple[UUID, datetime | None, str], str] = (
+            TTLCache(max(url_lifetime - url_reuse_margin, 0), max_size=50_000)
+        )
+
+    async def get_secret(
+        self,
+        secret_id: UUID,
+        load: Callable[[UUID], Awaitable[BucketSecret | None]],
+    ) -> BucketSecret | None:
+        return await memoized(self._secrets, secret_id, lambda: load(secret_id))
+
+    def get_client(self, secret: BucketSecret) -> BaseStorageClient:
+        key = (secret.id, secret.updated_at)
+        client = self._clients.get(key)
+        if client is None:
+            for stale in [k for k in self._clients if k[0] == secret.id]:
+                del self._clients[stale]
+            client = create_storage_client(secret.type)(secret)  # type: ignore[arg-type]
+            self._clients[key] = client
+        return client
+
+    async def get_download_url(self, secret: BucketSecret, object_name: str) -> str:
+        key = (secret.id, secret.updated_at, object_name)
+        url = self._download_urls.get(key)
+        if url is None:
+            url = await self.get_client(secret).get_download_url(object_name)
+            self._download_urls.set(key, url)
+        return url
+
+    async def get_download_urls(
+        self, secret: BucketSecret, object_names: Iterable[str]
+    ) -> dict[str, str]:
+        names = list(dict.fromkeys(object_names))
+        urls = await asyncio.gather(
+            *(self.get_download_url(secret, name) for name in names)
+        )
+        return dict(zip(names, urls, strict=True))
+
+    def invalidate(self, secret_id: UUID) -> None:
+        invalidate(self._secrets, lambda key: key == secret_id)
+        for key in [k for k in self._clients if k[0] == secret_id]:
+            del self._clients[key]
+        self._download_urls.discard_where(lambda key: key[0] == secret_id)
+
+    def clear(self) -> None:
+        self._secrets.clear()
+        self._clients.clear()
+        self._download_urls.clear()
+
+
+storage_clients = StorageClientRegistry(
+    config.BUCKET_SECRET_CACHE_TTL_SEC, config.PRESIGNED_URL_REUSE_MARGIN_SEC
+)
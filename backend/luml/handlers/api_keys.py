@@ -4,15 +4,19 @@ import secrets
 from typing import Any
 from uuid import UUID
 
+from luml.handlers.permissions import PermissionsHandler
 from luml.infra.db import engine
 from luml.infra.exceptions import UserAPIKeyCreateError
+from luml.infra.principals import principal_cache
 from luml.repositories.users import UserRepository
+from luml.schemas.permissions import Action, Resource
 from luml.schemas.user import APIKeyCreateOut, UpdateUserAPIKey, UserOut
 from luml.settings import config
 
 
 class APIKeyHandler:
     __user_repository = UserRepository(engine)
+    __permissions_handler = PermissionsHandler()
 
     def __init__(
         self,
@@ -38,6 +42,13 @@ class APIKeyHandler:
             self._get_key_hash(api_key)
         )
 
+    async def has_orbit_permission(
+        self, api_key: str, orbit_id: UUID, resource: Resource, action: Action
+    ) -> bool:
+        return await self.__permissions_handler.check_api_key_orbit_permission(
+            self._get_key_hash(api_key), orbit_id, resource, action
+        )
+
     async def create_user_api_key(self, user_id: UUID) -> APIKeyCreateOut:
         key = self._generate_api_key()
 
@@ -47,8 +58,12 @@ class APIKeyHandler:
 
         if not created_key:
             raise UserAPIKeyCreateError()
+        principal_cache.revoke_user(user_id=user_id)
+        PermissionsHandler.invalidate_user(user_id)
 
         return APIKeyCreateOut(key=key)
 
     async def delete_user_api_key(self, user_id: UUID) -> None:
         await self.__user_repository.delete_api_key_by_user_id(user_id)
+        principal_cache.revoke_user(user_id=user_id)
+        PermissionsHandler.invalidate_user(user_id)
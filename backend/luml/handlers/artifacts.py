@@ -1,7 +1,8 @@
+import logging
 from uuid import UUID, uuid4
 
 from luml.clients.base_storage_client import BaseStorageClient
-from luml.clients.storage_factory import create_storage_client
+from luml.clients.storage_registry import storage_clients
 from luml.handlers.permissions import PermissionsHandler
 from luml.infra.db import engine
 from luml.infra.exceptions import (
@@ -16,6 +17,7 @@ from luml.infra.exceptions import (
     OrbitNotFoundError,
     OrganizationLimitReachedError,
 )
+from luml.infra.metric_sorts import MetricSortBatcher
 from luml.repositories.artifacts import ArtifactRepository
 from luml.repositories.bucket_secrets import BucketSecretRepository
 from luml.repositories.collections import CollectionRepository
@@ -25,12 +27,17 @@ from luml.repositories.tracks import TrackEntryRepository, TrackRepository
 from luml.repositories.users import UserRepository
 from luml.schemas.artifacts import (
     Artifact,
+    ArtifactBatch,
     ArtifactCreate,
     ArtifactDetails,
+    ArtifactDownloadUrls,
     ArtifactIn,
+    ArtifactListView,
     ArtifactsList,
     ArtifactSortBy,
     ArtifactStatus,
+    ArtifactSummaryBatch,
+    ArtifactSummaryList,
     ArtifactType,
     ArtifactUpdate,
     ArtifactUpdateIn,
@@ -43,8 +50,11 @@ from luml.schemas.collections import Collection, is_artifact_type_allowed
 from luml.schemas.general import Cursor, PaginationParams, SortOrder
 from luml.schemas.orbit import Orbit
 from luml.schemas.permissions import Action, Resource
+from luml.settings import config
 from luml.utils.pagination import build_scope_id, decode_cursor, encode_cursor
 
+logger = logging.getLogger(__name__)
+
 
 class ArtifactHandler:
     __repository = ArtifactRepository(engine)
@@ -56,6 +66,9 @@ class ArtifactHandler:
     __track_repository = TrackRepository(engine)
     __user_repository = UserRepository(engine)
     __permissions_handler = PermissionsHandler()
+    __metric_sorts = MetricSortBatcher(
+        __repository.record_metric_sorts, config.METRIC_SORT_FLUSH_SEC
+    )
 
     __artifact_transitions = {
         ArtifactStatus.PENDING_UPLOAD: {
@@ -65,15 +78,55 @@ class ArtifactHandler:
         ArtifactStatus.PENDING_DELETION: {ArtifactStatus.DELETION_FAILED},
     }
 
+    @classmethod
+    async def ensure_metric_sort_indexes(cls) -> None:
+        if config.METRIC_SORT_INDEX_LIMIT <= 0:
+            return
+        try:
+            keys = await cls.__repository.ensure_metric_sort_indexes(
+                config.METRIC_SORT_INDEX_LIMIT
+            )
+        except Exception:
+            logger.exception("Failed to update metric sort indexes")
+            return
+        if keys:
+            logger.info(f"Metric sort indexes cover: {', '.join(keys)}")
+
+    @classmethod
+    async def flush_metric_sorts(cls) -> None:
+        await cls.__metric_sorts.close()
+
+    def _record_metric_sort(
+        self, pagination: PaginationParams, collection_ids: list[UUID] | None
+    ) -> None:
+        # Only first pages count: paging through one listing is still one sort.
+        if pagination.extra_sort_field and pagination.cursor is None and collection_ids:
+            self.__metric_sorts.record(collection_ids, pagination.extra_sort_field)
+
     async def _get_secret_or_raise(self, secret_id: UUID) -> BucketSecret:
-        secret = await self.__secret_repository.get_bucket_secret(secret_id)
+        secret = await storage_clients.get_secret(
+            secret_id, self.__secret_repository.get_bucket_secret
+        )
         if not secret:
             raise BucketSecretNotFoundError()
         return secret
 
     async def _get_storage_client(self, secret_id: UUID) -> BaseStorageClient:
         secret = await self._get_secret_or_raise(secret_id)
-        return create_storage_client(secret.type)(secret)  # type: ignore[arg-type]
+        return storage_clients.get_client(secret)
+
+    async def _get_download_url(self, secret_id: UUID, bucket_location: str) -> str:
+        secret = await self._get_secret_or_raise(secret_id)
+        return await storage_clients.get_download_url(secret, bucket_location)
+
+    async def _get_download_urls(
+        self, secret_id: UUID, artifacts: list[Artifact]
+    ) -> dict[UUID, str]:
+        secret = await self._get_secret_or_raise(secret_id)
+        urls = await storage_clients.get_download_urls(
+            secret, (artifact.bucket_location for artifact in artifacts)
+        )
+        return {artifact.id: urls[artifact.bucket_location] for artifact in artifacts}
 
     async def _check_orbit_and_collection_access(
         self, organization_id: UUID, orbit_id: UUID, collection_id: UUID
@@ -338,8 +391,52 @@ class ArtifactHandler:
         if not artifact or artifact.collection_id != collection_id:
             raise ArtifactNotFoundError()
 
-        storage_service = await self._get_storage_client(orbit.bucket_secret_id)
-        return await storage_service.get_download_url(artifact.bucket_location)
+        return await self._get_download_url(
+            orbit.bucket_secret_id, artifact.bucket_location
+        )
+
+    async def request_download_urls(
+        self,
+        user_id: UUID,
+        organization_id: UUID,
+        orbit_id: UUID,
+        artifact_ids: list[UUID],
+    ) -> ArtifactDownloadUrls:
+        await self.__permissions_handler.check_permissions(
+            organization_id,
+            user_id,
+            Resource.ARTIFACT,
+            Action.READ,
+            orbit_id,
+        )
+
+        orbit = await self.__orbit_repository.get_orbit_simple(
+            orbit_id, organization_id
+        )
+        if not orbit:
+            raise OrbitNotFoundError()
+
+        return await self._get_orbit_download_urls(orbit, artifact_ids)
+
+    async def _get_orbit_download_urls(
+        self, orbit: Orbit, artifact_ids: list[UUID]
+    ) -> ArtifactDownloadUrls:
+        artifacts = await self.__repository.get_orbit_artifacts_by_ids(
+            artifact_ids, orbit.id
+        )
+        urls = (
+            await self._get_download_urls(orbit.bucket_secret_id, artifacts)
+            if artifacts
+            else {}
+        )
+        return ArtifactDownloadUrls(
+            urls=urls,
+            not_found=[
+                artifact_id
+                for artifact_id in dict.fromkeys(artifact_ids)
+                if artifact_id not in urls
+            ],
+        )
 
     async def request_delete_url(
         self,
@@ -407,8 +504,20 @@ class ArtifactHandler:
         if not orbit:
             raise OrbitNotFoundError()
 
-        storage_service = await self._get_storage_client(orbit.bucket_secret_id)
-        return await storage_service.get_download_url(artifact.bucket_location)
+        return await self._get_download_url(
+            orbit.bucket_secret_id, artifact.bucket_location
+        )
+
+    async def request_satellite_download_urls(
+        self,
+        orbit_id: UUID,
+        artifact_ids: list[UUID],
+    ) -> ArtifactDownloadUrls:
+        orbit = await self.__orbit_repository.get_orbit_by_id(orbit_id)
+        if not orbit:
+            raise OrbitNotFoundError()
+
+        return await self._get_orbit_download_urls(orbit, artifact_ids)
 
     async def confirm_deletion(
         self,
@@ -459,6 +568,46 @@ class ArtifactHandler:
             return cursor
         return None
 
+    async def get_artifacts_batch(
+        self,
+        user_id: UUID,
+        organization_id: UUID,
+        orbit_id: UUID,
+        artifact_ids: list[UUID],
+        view: ArtifactListView = ArtifactListView.FULL,
+    ) -> ArtifactBatch | ArtifactSummaryBatch:
+        await self.__permissions_handler.check_permissions(
+            organization_id,
+            user_id,
+            Resource.ARTIFACT,
+            Action.READ,
+            orbit_id,
+        )
+        orbit = await self.__orbit_repository.get_orbit_simple(
+            orbit_id, organization_id
+        )
+        if not orbit:
+            raise OrbitNotFoundError()
+
+        if view == ArtifactListView.SUMMARY:
+            summaries = await self.__repository.get_orbit_artifact_summaries_by_ids(
+                artifact_ids, orbit_id
+            )
+            found = {summary.id for summary in summaries}
+            return ArtifactSummaryBatch(
+                items=summaries,
+                not_found=[i for i in dict.fromkeys(artifact_ids) if i not in found],
+            )
+
+        items = await self.__repository.get_orbit_listed_artifacts_by_ids(
+            artifact_ids, orbit_id
+        )
+        found = {item.id for item in items}
+        return ArtifactBatch(
+            items=items,
+            not_found=[i for i in dict.fromkeys(artifact_ids) if i not in found],
+        )
+
     async def get_collection_artifacts(
         self,
         user_id: UUID,
@@ -472,7 +621,8 @@ class ArtifactHandler:
         order: SortOrder = SortOrder.DESC,
         search: str | None = None,
         excluded_tracks: list[UUID] | None = None,
-    ) -> ArtifactsList:
+        view: ArtifactListView = ArtifactListView.FULL,
+    ) -> ArtifactsList | ArtifactSummaryList:
         await self.__permissions_handler.check_permissions(
             organization_id,
             user_id,
@@ -503,6 +653,23 @@ class ArtifactHandler:
             scope_id=scope_id,
         )
 
+        if view == ArtifactListView.SUMMARY:
+            (
+                summaries,
+                cursor,
+            ) = await self.__repository.get_collection_artifact_summaries(
+                orbit_id=orbit_id,
+                pagination=pagination,
+                collection_ids=collection_ids,
+                artifact_types=artifact_types,
+                search=search,
+                excluded_tracks=excluded_tracks,
+            )
+            self._record_metric_sort(pagination, collection_ids)
+            return ArtifactSummaryList(
+                items=summaries[:limit], cursor=encode_cursor(cursor)
+            )
+
         items, cursor = await self.__repository.get_collection_artifacts(
             orbit_id=orbit_id,
             pagination=pagination,
@@ -511,6 +678,7 @@ class ArtifactHandler:
             search=search,
             excluded_tracks=excluded_tracks,
         )
+        self._record_metric_sort(pagination, collection_ids)
 
         return ArtifactsList(items=items[:limit], cursor=encode_cursor(cursor))
 
@@ -561,6 +729,7 @@ class ArtifactHandler:
         if not orbit:
             raise OrbitNotFoundError()
 
-        storage_service = await self._get_storage_client(orbit.bucket_secret_id)
-        url = await storage_service.get_download_url(artifact.bucket_location)
+        url = await self._get_download_url(
+            orbit.bucket_secret_id, artifact.bucket_location
+        )
         return SatelliteArtifactResponse(artifact=artifact, url=url)
@@ -19,6 +19,7 @@ from luml.infra.exceptions import (
     AuthError,
     EmailDeliveryError,
 )
+from luml.infra.principals import principal_cache
 from luml.repositories.token_blacklist import TokenBlackListRepository
 from luml.repositories.users import UserRepository
 from luml.schemas.auth import OAuthLogin, Token
@@ -112,18 +113,20 @@ class AuthHandler:
             token_type="bearer",
         )
 
-    def _verify_token(self, token: str) -> EmailStr:
+    def _decode_access_token(self, token: str) -> dict[str, Any]:
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             if payload.get("type") != "access":
                 raise AuthError("Invalid token type", 401)
-            email: EmailStr = payload.get("sub")
-            if email is None:
+            if payload.get("sub") is None:
                 raise AuthError("Invalid token", 401)
-            return email
+            return payload
         except InvalidTokenError as err:
             raise AuthError("Invalid token", 401) from err
 
+    def _verify_token(self, token: str) -> EmailStr:
+        return self._decode_access_token(token)["sub"]
+
     async def _authenticate_user(self, email: EmailStr, password: str) -> User:
         user = await self.__user_repository.get_user(email)
         if user is None:
@@ -220,10 +223,13 @@ class AuthHandler:
         )
         if hashed_password:
             update_user.hashed_password = hashed_password
-        return await self.__user_repository.update_user(update_user)
+        updated = await self.__user_repository.update_user(update_user)
+        principal_cache.revoke_user(email=email)
+        return updated
 
     async def handle_delete_account(self, email: EmailStr) -> None:
         await self.__user_repository.delete_user(email)
+        principal_cache.revoke_user(email=email)
 
     async def handle_get_current_user(self, email: EmailStr) -> UserOut:
         user = await self.__user_repository.get_public_user(email)
@@ -251,6 +257,7 @@ class AuthHandler:
                     await self.__token_black_list_repository.add_token(
                         access_token, exp
                     )
+                    principal_cache.revoke_token(access_token)
                 except InvalidTokenError:
                     pass
 
@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from luml.clients.storage_factory import create_storage_client
+from luml.clients.storage_registry import storage_clients
 from luml.handlers.permissions import PermissionsHandler
 from luml.infra.db import engine
 from luml.infra.exceptions import (
@@ -147,6 +148,7 @@ class BucketSecretHandler:
 
         if not db_secret:
             raise NotFoundError("Secret not found")
+        storage_clients.invalidate(secret_id)
 
         return validate_bucket_secret_out(db_secret)
 
@@ -165,6 +167,7 @@ class BucketSecretHandler:
 
         if not deleted:
             raise NotFoundError("Secret not found")
+        storage_clients.invalidate(secret_id)
 
     async def get_bucket_urls(self, secret: BucketSecretCreateIn) -> BucketSecretUrls:
         return await self.generate_bucket_urls(secret)
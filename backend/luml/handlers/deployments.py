@@ -5,9 +5,9 @@ from luml.handlers.permissions import PermissionsHandler
 from luml.infra.db import engine
 from luml.infra.exceptions import (
     ApplicationError,
-    InsufficientPermissionsError,
     NotFoundError,
 )
+from luml.infra.task_notifier import task_notifier
 from luml.repositories.artifacts import ArtifactRepository
 from luml.repositories.bucket_secrets import BucketSecretRepository
 from luml.repositories.collections import CollectionRepository
@@ -100,6 +100,7 @@ class DeploymentHandler:
                 tags=data.tags,
             )
         )
+        task_notifier.notify(data.satellite_id)
         return deployment
 
     async def list_deployments(
@@ -156,6 +157,7 @@ class DeploymentHandler:
                 409,
             )
 
+        task_notifier.notify(task.satellite_id)
         return task
 
     async def force_delete_deployment(
@@ -253,23 +255,9 @@ class DeploymentHandler:
         return updated
 
     async def verify_user_inference_access(self, orbit_id: UUID, api_key: str) -> bool:
-        user = await self.__api_key_handler.authenticate_api_key(api_key)
-        if not user:
-            return False
-        orbit = await self.__orbit_repo.get_orbit_by_id(orbit_id)
-        if not orbit:
-            return False
-        try:
-            await self.__permissions_handler.check_permissions(
-                orbit.organization_id,
-                user.id,
-                Resource.DEPLOYMENT,
-                Action.READ,
-                orbit.id,
-            )
-        except (NotFoundError, InsufficientPermissionsError):
-            return False
-        return True
+        return await self.__api_key_handler.has_orbit_permission(
+            api_key, orbit_id, Resource.DEPLOYMENT, Action.READ
+        )
 
     async def update_worker_deployment_status(
         self,
@@ -255,6 +255,7 @@ class OrbitHandler:
 
         if not await self.__orbits_repository.delete_orbit(orbit_id, organization_id):
             raise OrbitNotFoundError()
+        self.__permissions_handler.invalidate_orbit(orbit_id)
 
     async def get_orbit_members(
         self, user_id: UUID, organization_id: UUID, orbit_id: UUID
@@ -294,6 +295,7 @@ class OrbitHandler:
             created_member = await self.__orbits_repository.create_orbit_member(member)
         except DatabaseConstraintError as error:
             raise OrbitMemberAlreadyExistsError() from error
+        self.__permissions_handler.invalidate_user(member.user_id)
 
         orbit = await self.__orbits_repository.get_orbit_simple(
             member.orbit_id, organization_id
@@ -338,6 +340,7 @@ class OrbitHandler:
 
         if not updated:
             raise OrbitMemberNotFoundError()
+        self.__permissions_handler.invalidate_user(member_obj.user.id)
 
         return updated
 
@@ -363,4 +366,5 @@ class OrbitHandler:
             Action.DELETE,
             orbit_id,
         )
-        return await self.__orbits_repository.delete_orbit_member(member_id)
+        await self.__orbits_repository.delete_orbit_member(member_id)
+        self.__permissions_handler.invalidate_user(member_obj.user.id)
@@ -133,7 +133,8 @@ class OrganizationHandler:
                 "Organization has members and cant be deleted"
             )
 
-        return await self.__user_repository.delete_organization(organization_id)
+        await self.__user_repository.delete_organization(organization_id)
+        self.__permissions_handler.invalidate_organization(organization_id)
 
     async def leave_from_organization(
         self, user_id: UUID, organization_id: UUID
@@ -142,9 +143,10 @@ class OrganizationHandler:
             organization_id, user_id, Resource.ORGANIZATION, Action.LEAVE
         )
 
-        return await self.__user_repository.delete_organization_member_by_user_id(
+        await self.__user_repository.delete_organization_member_by_user_id(
             user_id, organization_id
         )
+        self.__permissions_handler.invalidate_user(user_id)
 
     async def get_user_organizations(self, user_id: UUID) -> list[OrganizationSwitcher]:
         organizations = await self.__user_repository.get_user_organizations(user_id)
@@ -264,6 +266,7 @@ class OrganizationHandler:
             )
         except DatabaseConstraintError as error:
             raise OrganizationMemberAlreadyExistsError() from error
+        self.__permissions_handler.invalidate_user(user_id)
 
         await self.__invites_repository.delete_organization_invites_for_user(
             invite.organization_id, invite.email
@@ -338,9 +341,11 @@ class OrganizationHandler:
                 "Only Organization Owner can assign new admins."
             )
 
-        return await self.__user_repository.update_organization_member(
+        updated = await self.__user_repository.update_organization_member(
             member_id, member
         )
+        self.__permissions_handler.invalidate_user(member_to_update.user.id)
+        return updated
 
     async def delete_organization_member_by_id(
         self, user_id: UUID, organization_id: UUID, member_id: UUID
@@ -367,7 +372,8 @@ class OrganizationHandler:
         if member_to_delete and member_to_delete.role == OrgRole.OWNER:
             raise InsufficientPermissionsError("Organization Owner can not be removed.")
 
-        return await self.__user_repository.delete_organization_member(member_id)
+        await self.__user_repository.delete_organization_member(member_id)
+        self.__permissions_handler.invalidate_user(member_to_delete.user.id)
 
     async def add_organization_member(
         self,
@@ -397,5 +403,6 @@ class OrganizationHandler:
             )
         except DatabaseConstraintError as error:
             raise OrganizationMemberAlreadyExistsError() from error
+        self.__permissions_handler.invalidate_user(member.user_id)
 
         return created_member
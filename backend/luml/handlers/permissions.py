@@ -1,6 +1,7 @@
 from collections.abc import Sequence
 from uuid import UUID
 
+from luml.infra.cache import TTLCache, invalidate, memoized
 from luml.infra.db import engine
 from luml.infra.exceptions import (
     InsufficientPermissionsError,
@@ -12,10 +13,25 @@ from luml.schemas.orbit import OrbitRole
 from luml.schemas.organization import OrgRole
 from luml.schemas.permissions import (
     Action,
+    ApiKeyOrbitAccess,
     Resource,
     orbit_permissions,
     organization_permissions,
 )
+from luml.settings import config
+
+# Resolved memberships keyed by (lookup, scope id, user or organization id). Lookups
+# repeated within a request hit the request memo; across requests they are reused
+# for PERMISSIONS_CACHE_TTL_SEC, unless a membership change invalidates them first.
+_memberships: TTLCache[tuple[str, UUID, UUID], str | bool | None] = TTLCache(
+    config.PERMISSIONS_CACHE_TTL_SEC
+)
+
+# API key access to an orbit, keyed by (orbit id, API key hash), for the inference
+# checks satellites make. Dropped together with the memberships above.
+_api_key_access: TTLCache[tuple[UUID, str], ApiKeyOrbitAccess | None] = TTLCache(
+    config.INFERENCE_ACCESS_CACHE_TTL_SEC
+)
 
 
 class PermissionsHandler:
@@ -36,6 +52,73 @@ class PermissionsHandler:
             resource, []
         )
 
+    @staticmethod
+    def invalidate_user(user_id: UUID) -> None:
+        invalidate(
+            _memberships,
+            lambda key: key[0] in ("org_role", "orbit_role") and key[2] == user_id,
+        )
+        _api_key_access.discard_values_where(
+            lambda access: access is not None and access.user_id == user_id
+        )
+
+    @staticmethod
+    def invalidate_organization(organization_id: UUID) -> None:
+        invalidate(
+            _memberships,
+            lambda key: (
+                (key[0] == "org_role" and key[1] == organization_id)
+                or (key[0] == "orbit" and key[2] == organization_id)
+            ),
+        )
+        _api_key_access.discard_values_where(
+            lambda access: (
+                access is not None and access.organization_id == organization_id
+            )
+        )
+
+    @staticmethod
+    def invalidate_orbit(orbit_id: UUID) -> None:
+        invalidate(
+            _memberships,
+            lambda key: key[0] in ("orbit", "orbit_role") and key[1] == orbit_id,
+        )
+        invalidate(_api_key_access, lambda key: key[0] == orbit_id)
+
+    @staticmethod
+    def clear_cache() -> None:
+        _memberships.clear()
+        _api_key_access.clear()
+
+    async def _get_organization_member_role(
+        self, organization_id: UUID, user_id: UUID
+    ) -> str | None:
+        return await memoized(
+            _memberships,
+            ("org_role", organization_id, user_id),
+            lambda: self.__user_repository.get_organization_member_role(
+                organization_id, user_id
+            ),
+        )
+
+    async def _orbit_in_organization(
+        self, orbit_id: UUID, organization_id: UUID
+    ) -> bool:
+        async def _load() -> bool:
+            orbit = await self.__orbits_repository.get_orbit_simple(
+                orbit_id, organization_id
+            )
+            return orbit is not None
+
+        return await memoized(_memberships, ("orbit", orbit_id, organization_id), _load)
+
+    async def _get_orbit_member_role(self, orbit_id: UUID, user_id: UUID) -> str | None:
+        return await memoized(
+            _memberships,
+            ("orbit_role", orbit_id, user_id),
+            lambda: self.__orbits_repository.get_orbit_member_role(orbit_id, user_id),
+        )
+
     async def check_permissions(
         self,
         organization_id: UUID,
@@ -44,7 +127,7 @@ class PermissionsHandler:
         action: Action,
         orbit_id: UUID | None = None,
     ) -> None:
-        org_member_role = await self.__user_repository.get_organization_member_role(
+        org_member_role = await self._get_organization_member_role(
             organization_id, user_id
         )
 
@@ -53,7 +136,7 @@ class PermissionsHandler:
 
         # Must precede the org-role short-circuit: every user owns a personal
         # organization, so an org role alone says nothing about the addressed orbit.
-        if orbit_id and not await self.__orbits_repository.get_orbit_simple(
+        if orbit_id and not await self._orbit_in_organization(
             orbit_id, organization_id
         ):
             raise NotFoundError("Orbit not found")
@@ -65,9 +148,7 @@ class PermissionsHandler:
             raise InsufficientPermissionsError()
 
         if orbit_id and not has_org_permission:  # if org member
-            member_role = await self.__orbits_repository.get_orbit_member_role(
-                orbit_id, user_id
-            )
+            member_role = await self._get_orbit_member_role(orbit_id, user_id)
 
             if not member_role:
                 raise InsufficientPermissionsError()
@@ -75,6 +156,30 @@ class PermissionsHandler:
             if not self.has_orbit_permission(member_role, resource, action):
                 raise InsufficientPermissionsError()
 
+    async def check_api_key_orbit_permission(
+        self,
+        hashed_api_key: str,
+        orbit_id: UUID,
+        resource: Resource,
+        action: Action,
+    ) -> bool:
+        """Same decision as ``check_permissions`` for the API key's user, made from
+        one cached lookup."""
+        access = await memoized(
+            _api_key_access,
+            (orbit_id, hashed_api_key),
+            lambda: self.__orbits_repository.get_api_key_orbit_access(
+                hashed_api_key, orbit_id
+            ),
+        )
+        if access is None or access.organization_role is None:
+            return False
+        if self.has_organization_permission(access.organization_role, resource, action):
+            return True
+        return access.orbit_role is not None and self.has_orbit_permission(
+            access.orbit_role, resource, action
+        )
+
     @staticmethod
     def _get_organization_permissions_for_role_and_resources(
         role: OrgRole,
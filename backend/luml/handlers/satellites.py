@@ -1,6 +1,8 @@
+import asyncio
 import hashlib
 import hmac
 import secrets
+from contextlib import suppress
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -15,6 +17,9 @@ from luml.infra.exceptions import (
     NotFoundError,
     OrganizationLimitReachedError,
 )
+from luml.infra.last_seen import LastSeenBatcher
+from luml.infra.principals import principal_cache
+from luml.infra.task_notifier import task_notifier
 from luml.repositories.orbits import OrbitRepository
 from luml.repositories.satellites import SatelliteRepository
 from luml.repositories.users import UserRepository
@@ -37,6 +42,9 @@ from luml.settings import config
 
 class SatelliteHandler:
     __sat_repo = SatelliteRepository(engine)
+    __last_seen = LastSeenBatcher(
+        __sat_repo.touch_last_seen_many, config.SATELLITE_LAST_SEEN_FLUSH_SEC
+    )
     __orbit_repo = OrbitRepository(engine)
     __user_repo = UserRepository(engine)
     __permissions_handler = PermissionsHandler()
@@ -133,6 +141,7 @@ class SatelliteHandler:
                 api_key_hash=self._get_key_hash(api_key),
             )
         )
+        principal_cache.revoke_satellite(satellite_id)
         return api_key
 
     async def create_satellite(
@@ -232,12 +241,36 @@ class SatelliteHandler:
         return updated_satellite
 
     async def touch_last_seen(self, satellite_id: UUID) -> None:
-        await self.__sat_repo.touch_last_seen(satellite_id)
+        self.__last_seen.touch(satellite_id)
+
+    @classmethod
+    async def flush_last_seen(cls) -> None:
+        await cls.__last_seen.close()
 
     async def list_tasks(
-        self, satellite_id: UUID, status: SatelliteTaskStatus | None = None
+        self,
+        satellite_id: UUID,
+        status: SatelliteTaskStatus | None = None,
+        wait: float | None = None,
     ) -> list[SatelliteQueueTask]:
-        return await self.__sat_repo.list_tasks(satellite_id, status)
+        if not wait:
+            return await self.__sat_repo.list_tasks(satellite_id, status)
+
+        # Long-poll: hold the request until a task is queued for this satellite or
+        # the wait expires. The notifier wakes us immediately for tasks created in
+        # this process; the periodic recheck covers tasks created elsewhere.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(wait, config.SATELLITE_TASKS_MAX_WAIT_SEC)
+        while True:
+            event = task_notifier.listen(satellite_id)
+            tasks = await self.__sat_repo.list_tasks(satellite_id, status)
+            remaining = deadline - loop.time()
+            if tasks or remaining <= 0:
+                return tasks
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    event.wait(), min(remaining, config.SATELLITE_TASKS_RECHECK_SEC)
+                )
 
     async def update_task_status(
         self,
@@ -273,6 +306,7 @@ class SatelliteHandler:
         if not satellite or satellite.orbit_id != orbit_id:
             raise NotFoundError("Satellite not found")
         try:
-            return await self.__sat_repo.delete_satellite(satellite_id)
+            await self.__sat_repo.delete_satellite(satellite_id)
         except DatabaseConstraintError as e:
             raise ApplicationError(e.message, 409) from e
+        principal_cache.revoke_satellite(satellite_id)
@@ -296,6 +296,84 @@ class TracksHandler:
                 "Artifact is already an entry in this track.", 409
             ) from error
 
+    async def _check_stages_free(self, track_id: UUID, stage_ids: list[UUID]) -> None:
+        stages = {
+            stage.id: stage
+            for stage in await self.__stage_repository.list_stages(track_id)
+        }
+        if any(stage_id not in stages for stage_id in stage_ids):
+            raise ApplicationError("Stage does not belong to this track.", 422)
+
+        holders = await self.__entry_repository.list_entries_by_stages(
+            track_id, stage_ids
+        )
+        if holders:
+            holder = holders[0]
+            stage = stages[holder.stage_id]  # type: ignore[index]
+            raise ApplicationError(
+                f"Stage '{stage.name}' is already assigned to v{holder.version}.",
+                409,
+            )
+
+    async def create_entries(
+        self,
+        user_id: UUID,
+        organization_id: UUID,
+        orbit_id: UUID,
+        track_id: UUID,
+        entries_in: list[TrackEntryCreateIn],
+    ) -> list[TrackEntry]:
+        await self.__permissions_handler.check_permissions(
+            organization_id,
+            user_id,
+            Resource.TRACK,
+            Action.CREATE,
+            orbit_id,
+        )
+        track = await self.__track_repository.get_track(track_id)
+        if not track or track.orbit_id != orbit_id:
+            raise NotFoundError("Track not found")
+
+        artifact_ids = [entry.artifact_id for entry in entries_in]
+        if len(set(artifact_ids)) != len(artifact_ids):
+            raise ApplicationError("Duplicate artifacts are not allowed.", 422)
+        stage_ids = [e.stage_id for e in entries_in if e.stage_id is not None]
+        if len(set(stage_ids)) != len(stage_ids):
+            raise ApplicationError("A stage can only be assigned once.", 422)
+
+        artifacts = await self.__artifact_repository.get_orbit_artifacts_by_ids(
+            artifact_ids, orbit_id
+        )
+        if len(artifacts) != len(artifact_ids):
+            raise NotFoundError("Artifact not found")
+        for artifact in artifacts:
+            if artifact.type != track.artifact_type:
+                raise ArtifactTypeMismatchError(
+                    f"Artifact type '{artifact.type}' does not match "
+                    f"track artifact type '{track.artifact_type}'."
+                )
+
+        if stage_ids:
+            await self._check_stages_free(track_id, stage_ids)
+
+        entries_create = [
+            TrackEntryCreate(
+                track_id=track_id,
+                artifact_id=entry_in.artifact_id,
+                added_by=user_id,
+                stage_id=entry_in.stage_id,
+            )
+            for entry_in in entries_in
+        ]
+        try:
+            return await self.__entry_repository.create_entries(
+                track_id, entries_create
+            )
+        except IntegrityError as error:
+            raise ApplicationError(
+                "Artifact is already an entry in this track.", 409
+            ) from error
+
     async def get_entry(
         self,
         user_id: UUID,
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import suppress
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBatcher[K: Hashable, V]:
+    """Collects values in memory and hands them to ``write`` once per ``interval``.
+
+    ``add`` never touches the database; a background task started on the first add
+    passes everything gathered since the previous flush to ``write`` in a single call.
+    ``combine(older, newer)`` merges two values recorded for the same key, both while
+    collecting and when a failed write is put back. A crashed worker loses at most one
+    interval of values.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[dict[K, V]], Awaitable[None]],
+        interval: float,
+        combine: Callable[[V, V], V],
+        label: str,
+    ) -> None:
+        self._write = write
+        self._interval = interval
+        self._combine = combine
+        self._label = label
+        self._pending: dict[K, V] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def add(self, key: K, value: V) -> None:
+        if key in self._pending:
+            value = self._combine(self._pending[key], value)
+        self._pending[key] = value
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to write %s", self._label)
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        try:
+            await self._write(pending)
+        except Exception:
+            for key, value in pending.items():
+                if key in self._pending:
+                    value = self._combine(value, self._pending[key])
+                self._pending[key] = value
+            raise
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
@@ -0,0 +1,128 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from contextvars import ContextVar
+from typing import Any
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_MISSING: Any = object()
+
+
+class TTLCache[K: Hashable, V]:
+    """Bounded in-process cache whose entries expire ``ttl`` seconds after being set.
+
+    The least recently used entry is evicted once ``max_size`` is reached. A ``ttl``
+    of 0 disables caching. Entries live in one worker process only; other workers
+    keep serving their own copy until it expires.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, default: Any = None) -> V | Any:  # noqa: ANN401
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> None:
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def discard_values_where(self, predicate: Callable[[V], bool]) -> None:
+        for key in [
+            key for key, (_, value) in self._entries.items() if predicate(value)
+        ]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_request_memo: ContextVar[dict[Hashable, Any] | None] = ContextVar(
+    "request_memo", default=None
+)
+
+
+def request_memo() -> dict[Hashable, Any] | None:
+    """Values memoized for the current request, or None outside of one."""
+    return _request_memo.get()
+
+
+class RequestMemoMiddleware:
+    """Gives every HTTP request a fresh memo for lookups repeated within it."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_memo.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_memo.reset(token)
+
+
+async def memoized[V](
+    cache: TTLCache[Any, V], key: Hashable, load: Callable[[], Any]
+) -> V:
+    """Look ``key`` up in the request memo, then ``cache``, then await ``load()``."""
+    memo = request_memo()
+    memo_key = (id(cache), key)
+    if memo is not None and memo_key in memo:
+        return memo[memo_key]
+
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = await load()
+        cache.set(key, value)
+
+    if memo is not None:
+        memo[memo_key] = value
+    return value
+
+
+def invalidate(cache: TTLCache[Any, Any], predicate: Callable[[Any], bool]) -> None:
+    """Drop matching keys from ``cache`` and from the current request's memo."""
+    cache.discard_where(predicate)
+    memo = request_memo()
+    if memo is None:
+        return
+    for memo_key in list(memo):
+        if (
+            isinstance(memo_key, tuple)
+            and memo_key[0] == id(cache)
+            and predicate(memo_key[1])
+        ):
+            del memo[memo_key]
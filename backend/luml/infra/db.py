@@ -1,5 +1,17 @@
 from sqlalchemy.ext.asyncio import create_async_engine
 
+from luml.infra.query_stats import InstrumentedPool, instrument_engine
 from luml.settings import config
 
-engine = create_async_engine(config.POSTGRESQL_DSN)
+engine = create_async_engine(
+    config.POSTGRESQL_DSN,
+    poolclass=InstrumentedPool,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_timeout=config.DB_POOL_TIMEOUT_SEC,
+    pool_recycle=config.DB_POOL_RECYCLE_SEC,
+    pool_pre_ping=config.DB_POOL_PRE_PING,
+    query_cache_size=config.DB_QUERY_CACHE_SIZE,
+    connect_args={"prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE},
+)
+instrument_engine(engine.sync_engine, config.DB_SLOW_QUERY_MS)
@@ -0,0 +1,27 @@
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from uuid import UUID
+
+from luml.infra.batching import WriteBatcher
+
+
+class LastSeenBatcher(WriteBatcher[UUID, datetime]):
+    """Coalesces last-seen touches into one write per ``interval`` seconds.
+
+    The latest touch of each entity wins.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[dict[UUID, datetime]], Awaitable[None]],
+        interval: float,
+    ) -> None:
+        super().__init__(
+            write,
+            interval,
+            combine=lambda _, newer: newer,
+            label="last-seen timestamps",
+        )
+
+    def touch(self, entity_id: UUID) -> None:
+        self.add(entity_id, datetime.now(UTC))
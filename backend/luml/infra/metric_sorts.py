@@ -0,0 +1,26 @@
+import operator
+from collections.abc import Awaitable, Callable, Iterable
+from uuid import UUID
+
+from luml.infra.batching import WriteBatcher
+
+MetricSortCounts = dict[tuple[UUID, str], int]
+
+
+class MetricSortBatcher(WriteBatcher[tuple[UUID, str], int]):
+    """Counts metric-sorted listings per collection and key, written once per
+    ``interval``, so listing stays a read. A lost interval only delays an index.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[MetricSortCounts], Awaitable[None]],
+        interval: float,
+    ) -> None:
+        super().__init__(
+            write, interval, combine=operator.add, label="metric sort counts"
+        )
+
+    def record(self, collection_ids: Iterable[UUID], key: str) -> None:
+        for collection_id in collection_ids:
+            self.add((collection_id, key), 1)
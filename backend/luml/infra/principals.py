@@ -0,0 +1,89 @@
+import hashlib
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from starlette.authentication import AuthCredentials
+
+from luml.infra.cache import TTLCache
+from luml.models import AuthSatellite, AuthUser
+from luml.settings import config
+
+type AuthPrincipal = AuthUser | AuthSatellite
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPrincipal:
+    scopes: tuple[str, ...]
+    principal: AuthPrincipal
+    # Wall-clock expiry of the credential itself (JWT ``exp``), if it has one.
+    expires_at: float | None = None
+
+    def credentials(self) -> AuthCredentials:
+        return AuthCredentials(list(self.scopes))
+
+
+class PrincipalCache:
+    """Verified principals keyed by a SHA-256 digest of the presented credential.
+
+    Only successful authentications are cached, so a freshly issued token or key
+    works at once. Logout, key rotation and account changes revoke entries in this
+    process; other worker processes keep theirs until the TTL runs out.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self._entries: TTLCache[str, CachedPrincipal] = TTLCache(ttl, max_size)
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> CachedPrincipal | None:
+        key = self._digest(token)
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        if cached.expires_at is not None and cached.expires_at <= time.time():
+            self._entries.pop(key)
+            return None
+        return cached
+
+    def put(
+        self,
+        token: str,
+        scopes: list[str],
+        principal: AuthPrincipal,
+        expires_at: float | None = None,
+    ) -> CachedPrincipal:
+        cached = CachedPrincipal(tuple(scopes), principal, expires_at)
+        self._entries.set(self._digest(token), cached)
+        return cached
+
+    def revoke_token(self, token: str) -> None:
+        self._entries.pop(self._digest(token))
+
+    def revoke_user(
+        self, *, user_id: UUID | None = None, email: str | None = None
+    ) -> None:
+        self._entries.discard_values_where(
+            lambda cached: (
+                isinstance(cached.principal, AuthUser)
+                and (cached.principal.id == user_id or cached.principal.email == email)
+            )
+        )
+
+    def revoke_satellite(self, satellite_id: UUID) -> None:
+        self._entries.discard_values_where(
+            lambda cached: (
+                isinstance(cached.principal, AuthSatellite)
+                and cached.principal.id == satellite_id
+            )
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    config.AUTH_PRINCIPAL_CACHE_TTL_SEC, config.AUTH_PRINCIPAL_CACHE_SIZE
+)
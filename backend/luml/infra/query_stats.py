@@ -0,0 +1,189 @@
+import hashlib
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """``statement`` with literals, parameters and IN-lists collapsed to ``?``.
+
+    Statements that differ only in their values share a fingerprint.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _PARAMETER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(statement: str) -> str:
+    return hashlib.sha1(fingerprint(statement).encode()).hexdigest()[:12]
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    # Statement text is kept only when asked for; counts and timings always are.
+    record_statements: bool = False
+    statements: list[str] = field(default_factory=list)
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Counters for the current request or ``track_queries`` block, if any."""
+    return _query_stats.get()
+
+
+@contextmanager
+def track_queries(*, record_statements: bool = False) -> Iterator[QueryStats]:
+    """Count queries issued by instrumented engines inside the block.
+
+    With ``record_statements`` the text of each statement is kept as well.
+    """
+    stats = QueryStats(record_statements=record_statements)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def _do_get(self) -> Any:  # noqa: ANN401
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            stats = _query_stats.get()
+            if stats is not None:
+                stats.pool_wait += time.perf_counter() - start
+
+
+def instrument_engine(engine: Engine, slow_query_ms: float) -> None:
+    """Count and time every statement on ``engine``, and log slow ones."""
+    if getattr(engine, "_luml_instrumented", False):
+        return
+    engine._luml_instrumented = True  # type: ignore[attr-defined]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: Any,  # noqa: ANN401
+        executemany: bool,
+    ) -> None:
+        context._luml_query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: Any,  # noqa: ANN401
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - context._luml_query_start
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_time += elapsed
+            if stats.record_statements:
+                stats.statements.append(statement)
+        if elapsed * 1000 >= slow_query_ms:
+            logger.warning(
+                "Slow query (%.1f ms) [%s]: %s",
+                elapsed * 1000,
+                fingerprint_id(statement),
+                fingerprint(statement),
+            )
+
+
+class QueryStatsMiddleware:
+    """Counts the queries, DB time and pool wait of every HTTP request.
+
+    The numbers are returned in a ``Server-Timing`` header and logged per route at
+    debug level, together with the statements the request repeated. Statement text
+    is only kept while debug logging is on.
+
+    Register it after the authentication middleware so it wraps it: Starlette runs
+    the last added middleware first, so the queries authentication makes are
+    counted too.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        with track_queries(record_statements=debug) as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"server-timing", self._server_timing(stats).encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                if debug:
+                    route = scope.get("route")
+                    logger.debug(
+                        "%s %s: %d queries, %.1f ms in DB, %.1f ms pool wait%s",
+                        scope["method"],
+                        getattr(route, "path", scope["path"]),
+                        stats.queries,
+                        stats.db_time * 1000,
+                        stats.pool_wait * 1000,
+                        self._repeated(stats.statements),
+                    )
+
+    @staticmethod
+    def _repeated(statements: list[str]) -> str:
+        counts = Counter(fingerprint(statement) for statement in statements)
+        return "".join(
+            f"\n  {count}x {statement}"
+            for statement, count in counts.most_common()
+            if count > 1
+        )
+
+    @staticmethod
+    def _server_timing(stats: QueryStats) -> str:
+        return (
+            f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries", '
+            f"db-pool;dur={stats.pool_wait * 1000:.1f}"
+        )
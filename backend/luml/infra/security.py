@@ -5,11 +5,10 @@ from luml.handlers.api_keys import APIKeyHandler
 from luml.handlers.auth import AuthHandler
 from luml.handlers.satellites import SatelliteHandler
 from luml.infra.exceptions import AuthError
+from luml.infra.principals import AuthPrincipal, principal_cache
 from luml.models import AuthSatellite, AuthUser
 from luml.settings import config
 
-type AuthPrincipal = AuthUser | AuthSatellite
-
 
 class JWTAuthenticationBackend(AuthenticationBackend):
     def __init__(self) -> None:
@@ -30,7 +29,8 @@ class JWTAuthenticationBackend(AuthenticationBackend):
                 full_name=user.full_name,
                 disabled=user.disabled,
             )
-            return AuthCredentials(["authenticated", "api_key"]), auth_user
+            cached = principal_cache.put(token, ["authenticated", "api_key"], auth_user)
+            return cached.credentials(), auth_user
         return None
 
     async def _authenticate_with_satellite_key(
@@ -38,9 +38,11 @@ class JWTAuthenticationBackend(AuthenticationBackend):
     ) -> tuple[AuthCredentials, AuthPrincipal] | None:
         sat = await self.satellite_handler.authenticate_api_key(token)
         if sat:
-            await self.satellite_handler.touch_last_seen(sat.id)
             auth_sat = AuthSatellite(satellite_id=sat.id, orbit_id=sat.orbit_id)
-            return AuthCredentials(["authenticated", "satellite"]), auth_sat
+            cached = principal_cache.put(
+                token, ["authenticated", "satellite"], auth_sat
+            )
+            return cached.credentials(), auth_sat
         return None
 
     async def _authenticate_with_jwt_token(
@@ -49,18 +51,38 @@ class JWTAuthenticationBackend(AuthenticationBackend):
         if await self.auth_handler.is_token_blacklisted(token):
             return None
         try:
-            email = self.auth_handler._verify_token(token)
-            user = await self.auth_handler.handle_get_current_user(email)
+            payload = self.auth_handler._decode_access_token(token)
+            user = await self.auth_handler.handle_get_current_user(payload["sub"])
             auth_user = AuthUser(
                 user_id=user.id,
                 email=user.email,
                 full_name=user.full_name,
                 disabled=user.disabled,
             )
-            return AuthCredentials(["authenticated", "jwt"]), auth_user
+            cached = principal_cache.put(
+                token, ["authenticated", "jwt"], auth_user, payload.get("exp")
+            )
+            return cached.credentials(), auth_user
         except AuthError:
             return None
 
+    async def _authenticate_token(
+        self, token: str
+    ) -> tuple[AuthCredentials, AuthPrincipal] | None:
+        cached = principal_cache.get(token)
+        if cached is not None:
+            result = cached.credentials(), cached.principal
+        elif token.startswith("dfs_"):
+            result = await self._authenticate_with_api_key(token)
+        elif token.startswith("dfssat_"):
+            result = await self._authenticate_with_satellite_key(token)
+        else:
+            result = await self._authenticate_with_jwt_token(token)
+
+        if result is not None and isinstance(result[1], AuthSatellite):
+            await self.satellite_handler.touch_last_seen(result[1].id)
+        return result
+
     async def authenticate(
         self,
         conn: HTTPConnection,
@@ -80,10 +102,6 @@ class JWTAuthenticationBackend(AuthenticationBackend):
             token = conn.cookies.get("access_token")
 
         if token:
-            if token.startswith("dfs_"):
-                return await self._authenticate_with_api_key(token)
-            if token.startswith("dfssat_"):
-                return await self._authenticate_with_satellite_key(token)
-            return await self._authenticate_with_jwt_token(token)
+            return await self._authenticate_token(token)
 
         return None
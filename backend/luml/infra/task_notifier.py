@@ -0,0 +1,24 @@
+import asyncio
+from uuid import UUID
+
+
+class SatelliteTaskNotifier:
+    """Wakes long-polling satellites as soon as a task is queued for them.
+
+    Notifications are in-process only. A satellite whose long-poll is served by another
+    worker process still picks the task up on the next periodic recheck.
+    """
+
+    def __init__(self) -> None:
+        self._events: dict[UUID, asyncio.Event] = {}
+
+    def listen(self, satellite_id: UUID) -> asyncio.Event:
+        return self._events.setdefault(satellite_id, asyncio.Event())
+
+    def notify(self, satellite_id: UUID) -> None:
+        event = self._events.pop(satellite_id, None)
+        if event is not None:
+            event.set()
+
+
+task_notifier = SatelliteTaskNotifier()
@@ -1,4 +1,4 @@
-from luml.models.artifacts import ArtifactOrm
+from luml.models.artifacts import ArtifactExtraValueKeyOrm, ArtifactOrm
 from luml.models.auth import AuthSatellite, AuthUser
 from luml.models.base import Base, TimestampMixin
 from luml.models.bucket_secrets import BucketSecretOrm
@@ -34,6 +34,7 @@ __all__ = [
     "StatsEmailSendOrm",
     "BucketSecretOrm",
     "ArtifactOrm",
+    "ArtifactExtraValueKeyOrm",
     "CollectionOrm",
     "AuthSatellite",
     "AuthUser",
@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import UUID, BigInteger, ForeignKey, Index, String
+from sqlalchemy import UUID, BigInteger, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,6 +11,7 @@ from luml.schemas.artifacts import (
     ArtifactDetails,
     ArtifactListed,
     ArtifactStatus,
+    ArtifactSummary,
 )
 
 
@@ -73,5 +74,32 @@ class ArtifactOrm(TimestampMixin, Base):
     def to_listed_artifact(self) -> ArtifactListed:
         return ArtifactListed.model_validate(self)
 
+    def to_artifact_summary(self) -> ArtifactSummary:
+        return ArtifactSummary.model_validate(self)
+
     def to_artifact_details(self) -> ArtifactDetails:
         return ArtifactDetails.model_validate(self)
+
+
+class ArtifactExtraValueKeyOrm(Base):
+    """How many artifacts of a collection carry an extra-value key with a JSON type.
+
+    Maintained by ``ArtifactRepository`` on artifact create and delete, so sort-key
+    validation and the collection's key list do not scan ``artifacts.extra_values``.
+    ``sort_count`` counts listings sorted by the key and picks the keys that get an
+    expression index.
+    """
+
+    __tablename__ = "artifact_extra_value_keys"
+
+    collection_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("collections.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    value_type: Mapped[str] = mapped_column(String, primary_key=True)
+    artifact_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sort_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
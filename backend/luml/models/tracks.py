@@ -1,6 +1,15 @@
 import uuid
 
-from sqlalchemy import UUID, ForeignKey, Integer, String, UniqueConstraint, func, select
+from sqlalchemy import (
+    UUID,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+    select,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
@@ -16,6 +25,7 @@ class TrackArtifactOrm(TimestampMixin, Base):
         UniqueConstraint(
             "track_id", "version", name="uq_track_entries_track_id_version"
         ),
+        Index("ix_track_entries_track_id_created_at", "track_id", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -45,13 +55,14 @@ class TrackArtifactOrm(TimestampMixin, Base):
         nullable=False,
     )
 
+    # Relationships are loaded on request only, see TrackEntryRepository.
     track: Mapped[TrackOrm] = relationship(  # noqa: F821
-        "TrackOrm", back_populates="entries", lazy="selectin"
+        "TrackOrm", back_populates="entries", lazy="raise"
     )
     artifact: Mapped[ArtifactOrm] = relationship(  # type: ignore[name-defined]  # noqa: F821
-        "ArtifactOrm", lazy="selectin"
+        "ArtifactOrm", lazy="raise"
     )
-    stage: Mapped[TrackStageOrm | None] = relationship("TrackStageOrm", lazy="selectin")
+    stage: Mapped[TrackStageOrm | None] = relationship("TrackStageOrm", lazy="raise")
 
     def __repr__(self) -> str:
         return f"TrackArtifact(id={self.id!r}, version={self.version!r})"
@@ -59,6 +70,9 @@ class TrackArtifactOrm(TimestampMixin, Base):
 
 class TrackOrm(TimestampMixin, Base):
     __tablename__ = "tracks"
+    __table_args__ = (
+        Index("ix_tracks_orbit_id_created_at", "orbit_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid7
@@ -74,27 +88,28 @@ class TrackOrm(TimestampMixin, Base):
     description: Mapped[str | None] = mapped_column(String, nullable=True)
     tags: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True, default=list)
     next_version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # Maintained by TrackEntryRepository on every entry insert and delete.
+    total_entries: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     orbit: Mapped[OrbitOrm] = relationship(  # type: ignore[name-defined]  # noqa: F821
-        "OrbitOrm", back_populates="tracks", lazy="selectin"
+        "OrbitOrm", back_populates="tracks", lazy="raise"
     )
     entries: Mapped[list[TrackArtifactOrm]] = relationship(
-        back_populates="track", cascade="all, delete, delete-orphan"
+        back_populates="track",
+        cascade="all, delete, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     stages: Mapped[list[TrackStageOrm]] = relationship(
         back_populates="track",
         cascade="all, delete, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
         order_by="TrackStageOrm.created_at",
     )
 
-    total_entries = column_property(
-        select(func.count(TrackArtifactOrm.id))
-        .where(TrackArtifactOrm.track_id == id)
-        .correlate_except(TrackArtifactOrm)
-        .scalar_subquery()
-    )
-
     def __repr__(self) -> str:
         return f"Track(id={self.id!r}, name={self.name!r})"
 
@@ -117,7 +132,7 @@ class TrackStageOrm(TimestampMixin, Base):
     name: Mapped[str] = mapped_column(String, nullable=False)
 
     track: Mapped[TrackOrm] = relationship(  # noqa: F821
-        "TrackOrm", back_populates="stages", lazy="selectin"
+        "TrackOrm", back_populates="stages", lazy="raise"
     )
 
     is_used = column_property(
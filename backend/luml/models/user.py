@@ -21,7 +21,7 @@ class UserOrm(TimestampMixin, Base):
     auth_method: Mapped[str] = mapped_column(String, nullable=False)
     photo: Mapped[HttpUrl | None] = mapped_column(String, nullable=True)
     hashed_password: Mapped[str | None] = mapped_column(String, nullable=True)
-    hashed_api_key: Mapped[str] = mapped_column(String, nullable=True)
+    hashed_api_key: Mapped[str] = mapped_column(String, nullable=True, index=True)
 
     memberships: Mapped[list[OrganizationMemberOrm]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "OrganizationMemberOrm",
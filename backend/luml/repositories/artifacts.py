@@ -1,12 +1,16 @@
+import hashlib
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import case, delete, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
 from luml.infra.exceptions import DatabaseConstraintError, InvalidSortingError
 from luml.models import (
+    ArtifactExtraValueKeyOrm,
     ArtifactOrm,
     CollectionOrm,
     DeploymentOrm,
@@ -19,19 +23,131 @@ from luml.schemas.artifacts import (
     ArtifactDetails,
     ArtifactListed,
     ArtifactStatus,
+    ArtifactSummary,
     ArtifactType,
     ArtifactUpdate,
 )
 from luml.schemas.deployment import DeploymentStatus
 from luml.schemas.general import Cursor, PaginationParams
 
+_METRIC_INDEX_PREFIX = "ix_artifacts_metric_"
+_METRIC_INDEX_LOCK_ID = 0x6C756D6C_0001
+
+
+def _metric_index_name(key: str) -> str:
+    return _METRIC_INDEX_PREFIX + hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def _json_type(value: Any) -> str:  # noqa: ANN401
+    """The ``jsonb_typeof`` name of a decoded JSON value."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int | float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+# Everything but the manifest and file index, which can be megabytes per artifact.
+_SUMMARY_COLUMNS = (
+    ArtifactOrm.id,
+    ArtifactOrm.collection_id,
+    ArtifactOrm.file_name,
+    ArtifactOrm.name,
+    ArtifactOrm.description,
+    ArtifactOrm.extra_values,
+    ArtifactOrm.file_hash,
+    ArtifactOrm.size,
+    ArtifactOrm.tags,
+    ArtifactOrm.type,
+    ArtifactOrm.unique_identifier,
+    ArtifactOrm.status,
+    ArtifactOrm.created_by_user,
+    ArtifactOrm.created_at,
+    ArtifactOrm.updated_at,
+)
+
+
+def _listing_options(columns: tuple[Any, ...] | None) -> list[Any]:
+    """Loader options for listed artifacts: collection name and active deployments,
+    plus ``columns`` only when given."""
+    return [
+        *([load_only(*columns)] if columns else []),
+        selectinload(ArtifactOrm.collection).load_only(
+            CollectionOrm.id,
+            CollectionOrm.name,
+        ),
+        selectinload(
+            ArtifactOrm.deployments.and_(
+                DeploymentOrm.status == DeploymentStatus.ACTIVE.value
+            )
+        ).load_only(
+            DeploymentOrm.id,
+            DeploymentOrm.name,
+            DeploymentOrm.status,
+            DeploymentOrm.orbit_id,
+            DeploymentOrm.artifact_id,
+        ),
+    ]
+
 
 class ArtifactRepository(RepositoryBase, CrudMixin):
     async def create_artifact(self, artifact: ArtifactCreate) -> Artifact:
         async with self._get_session() as session:
-            db_artifact = await self.create_model(session, ArtifactOrm, artifact)
+            db_artifact = ArtifactOrm(**artifact.model_dump())
+            session.add(db_artifact)
+            await self._count_extra_value_keys(
+                session, artifact.collection_id, artifact.extra_values, 1
+            )
+            await session.commit()
+            await session.refresh(db_artifact)
             return db_artifact.to_artifact()
 
+    @staticmethod
+    async def _count_extra_value_keys(
+        session: AsyncSession,
+        collection_id: UUID,
+        extra_values: dict[str, Any] | None,
+        delta: int,
+    ) -> None:
+        if not extra_values:
+            return
+        rows = [
+            {
+                "collection_id": collection_id,
+                "key": key,
+                "value_type": _json_type(value),
+                "artifact_count": delta,
+            }
+            for key, value in extra_values.items()
+        ]
+        stmt = pg_insert(ArtifactExtraValueKeyOrm).values(rows)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    ArtifactExtraValueKeyOrm.collection_id,
+                    ArtifactExtraValueKeyOrm.key,
+                    ArtifactExtraValueKeyOrm.value_type,
+                ],
+                set_={
+                    "artifact_count": ArtifactExtraValueKeyOrm.artifact_count
+                    + stmt.excluded.artifact_count
+                },
+            )
+        )
+        if delta < 0:
+            await session.execute(
+                delete(ArtifactExtraValueKeyOrm).where(
+                    ArtifactExtraValueKeyOrm.collection_id == collection_id,
+                    ArtifactExtraValueKeyOrm.artifact_count <= 0,
+                )
+            )
+
     async def update_status(
         self, artifact_id: UUID, status: ArtifactStatus
     ) -> Artifact | None:
@@ -47,7 +163,17 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
     async def delete_artifact(self, artifact_id: UUID) -> None:
         try:
             async with self._get_session() as session:
-                await self.delete_model(session, ArtifactOrm, artifact_id)
+                result = await session.execute(
+                    delete(ArtifactOrm)
+                    .where(ArtifactOrm.id == artifact_id)
+                    .returning(ArtifactOrm.collection_id, ArtifactOrm.extra_values)
+                )
+                deleted = result.one_or_none()
+                if deleted:
+                    await self._count_extra_value_keys(
+                        session, deleted.collection_id, deleted.extra_values, -1
+                    )
+                await session.commit()
         except IntegrityError as error:
             error_mess = "Cannot delete artifact."
             raise DatabaseConstraintError(
@@ -59,32 +185,111 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
     async def get_collection_artifacts_extra_values(
         self, collection_id: UUID
     ) -> list[str]:
-        async with self._get_session() as session:
-            query = select(
-                func.jsonb_each(ArtifactOrm.extra_values).scalar_table_valued("key")
-            ).where(
-                ArtifactOrm.collection_id == collection_id,
-                ArtifactOrm.extra_values.is_not(None),
-                ArtifactOrm.extra_values != {},
-            )
-            result = await session.execute(query)
-
-            return sorted({row[0] for row in result.unique().all()})
+        return await self.get_batch_collection_artifacts_extra_values([collection_id])
 
     async def get_batch_collection_artifacts_extra_values(
         self, collection_ids: list[UUID]
     ) -> list[str]:
+        return sorted(await self.get_extra_value_key_types(collection_ids))
+
+    async def get_extra_value_key_types(
+        self, collection_ids: list[UUID]
+    ) -> dict[str, set[str]]:
         async with self._get_session() as session:
-            query = select(
-                func.jsonb_each(ArtifactOrm.extra_values).scalar_table_valued("key")
-            ).where(
-                ArtifactOrm.collection_id.in_(collection_ids),
-                ArtifactOrm.extra_values.is_not(None),
-                ArtifactOrm.extra_values != {},
+            result = await session.execute(
+                select(
+                    ArtifactExtraValueKeyOrm.key, ArtifactExtraValueKeyOrm.value_type
+                ).where(
+                    ArtifactExtraValueKeyOrm.collection_id.in_(collection_ids),
+                    ArtifactExtraValueKeyOrm.artifact_count > 0,
+                )
             )
-            result = await session.execute(query)
-
-            return sorted({row[0] for row in result.unique().all()})
+            key_types: dict[str, set[str]] = {}
+            for key, value_type in result.all():
+                key_types.setdefault(key, set()).add(value_type)
+            return key_types
+
+    async def record_metric_sorts(self, counts: dict[tuple[UUID, str], int]) -> None:
+        if not counts:
+            return
+        by_key: dict[str, dict[UUID, int]] = {}
+        for (collection_id, key), count in counts.items():
+            by_key.setdefault(key, {})[collection_id] = count
+        async with self._get_session() as session:
+            for key, increments in by_key.items():
+                await session.execute(
+                    update(ArtifactExtraValueKeyOrm)
+                    .where(
+                        ArtifactExtraValueKeyOrm.collection_id.in_(list(increments)),
+                        ArtifactExtraValueKeyOrm.key == key,
+                        ArtifactExtraValueKeyOrm.value_type == "number",
+                    )
+                    .values(
+                        sort_count=ArtifactExtraValueKeyOrm.sort_count
+                        + case(increments, value=ArtifactExtraValueKeyOrm.collection_id)
+                    )
+                )
+            await session.commit()
+
+    async def ensure_metric_sort_indexes(self, limit: int) -> list[str]:
+        """Keep expression indexes for the ``limit`` most-sorted numeric keys.
+
+        Builds missing indexes and drops those of keys that fell out of the top, both
+        concurrently. Returns the indexed keys. Holds an advisory lock, so concurrent
+        callers return an empty list instead of racing on the same DDL.
+        """
+        async with self._engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            locked = await conn.scalar(
+                select(func.pg_try_advisory_lock(_METRIC_INDEX_LOCK_ID))
+            )
+            if not locked:
+                return []
+            try:
+                sort_count = func.sum(ArtifactExtraValueKeyOrm.sort_count)
+                top = await conn.execute(
+                    select(ArtifactExtraValueKeyOrm.key)
+                    .where(ArtifactExtraValueKeyOrm.value_type == "number")
+                    .group_by(ArtifactExtraValueKeyOrm.key)
+                    .having(sort_count > 0)
+                    .order_by(sort_count.desc(), ArtifactExtraValueKeyOrm.key)
+                    .limit(limit)
+                )
+                keys = list(top.scalars())
+                wanted = {_metric_index_name(key): key for key in keys}
+                existing = await conn.execute(
+                    text(
+                        "SELECT index.relname, pg_index.indisvalid FROM pg_index "
+                        "JOIN pg_class index ON index.oid = pg_index.indexrelid "
+                        "JOIN pg_class tbl ON tbl.oid = pg_index.indrelid "
+                        "WHERE tbl.relname = 'artifacts' "
+                        "AND index.relname LIKE :prefix"
+                    ),
+                    {"prefix": f"{_METRIC_INDEX_PREFIX}%"},
+                )
+                # An interrupted concurrent build leaves an invalid index behind;
+                # drop it so it gets rebuilt.
+                indexes = existing.all()
+                existing_names = {name for name, valid in indexes if valid}
+                invalid_names = {name for name, valid in indexes if not valid}
+                for name in (existing_names - wanted.keys()) | invalid_names:
+                    await conn.exec_driver_sql(
+                        f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'
+                    )
+                for name, key in wanted.items():
+                    if name in existing_names:
+                        continue
+                    literal_key = "'" + key.replace("'", "''") + "'"
+                    await conn.exec_driver_sql(
+                        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON '
+                        f"artifacts (collection_id, "
+                        f"artifact_metric(extra_values, {literal_key}))"
+                    )
+                return keys
+            finally:
+                await conn.scalar(
+                    select(func.pg_advisory_unlock(_METRIC_INDEX_LOCK_ID))
+                )
 
     async def get_collection_artifacts_tags(self, collection_id: UUID) -> list[str]:
         async with self._get_session() as session:
@@ -104,10 +309,12 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
         if hasattr(ArtifactOrm, sort_by):
             return False
 
-        metrics = await self.get_batch_collection_artifacts_extra_values(collection_ids)
+        key_types = await self.get_extra_value_key_types(collection_ids)
 
-        if sort_by not in metrics:
+        if sort_by not in key_types:
             raise InvalidSortingError(f"Invalid sorting column: {sort_by}")
+        if "number" not in key_types[sort_by]:
+            raise InvalidSortingError(f"Metric '{sort_by}' has no numeric values")
         return True
 
     @staticmethod
@@ -118,6 +325,9 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
     ) -> Cursor:
         if is_extra_value and pagination.extra_sort_field:
             value = cursor_rec.extra_values.get(pagination.extra_sort_field)
+            # Match artifact_metric: anything but a JSON number sorts as NULL.
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                value = None
         else:
             value = getattr(cursor_rec, pagination.sort_by, None)
         return Cursor(
@@ -128,7 +338,7 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
             scope_id=pagination.scope_id,
         )
 
-    async def get_collection_artifacts(
+    async def _get_collection_artifacts_page(
         self,
         orbit_id: UUID,
         pagination: PaginationParams,
@@ -136,7 +346,8 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
         artifact_types: list[ArtifactType] | None = None,
         search: str | None = None,
         excluded_tracks: list[UUID] | None = None,
-    ) -> tuple[list[ArtifactListed], Cursor | None]:
+        columns: tuple[Any, ...] | None = None,
+    ) -> tuple[list[ArtifactOrm], Cursor | None]:
         async with self._get_session() as session:
             sort_by = pagination.sort_by
             is_extra_values = False
@@ -150,6 +361,10 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
                     pagination.extra_sort_field = sort_by
                     pagination.sort_by = "extra_values"
 
+            if columns and sort_by not in {column.key for column in columns}:
+                # The cursor is built from the sort column, so it has to be loaded.
+                columns = (*columns, getattr(ArtifactOrm, pagination.sort_by))
+
             conditions: list[Any] = [
                 ArtifactOrm.collection_id.in_(
                     select(CollectionOrm.id).where(CollectionOrm.orbit_id == orbit_id)
@@ -181,23 +396,7 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
                 ArtifactOrm,
                 *conditions,
                 pagination=pagination,
-                options=[
-                    selectinload(ArtifactOrm.collection).load_only(
-                        CollectionOrm.id,
-                        CollectionOrm.name,
-                    ),
-                    selectinload(
-                        ArtifactOrm.deployments.and_(
-                            DeploymentOrm.status == DeploymentStatus.ACTIVE.value
-                        )
-                    ).load_only(
-                        DeploymentOrm.id,
-                        DeploymentOrm.name,
-                        DeploymentOrm.status,
-                        DeploymentOrm.orbit_id,
-                        DeploymentOrm.artifact_id,
-                    ),
-                ],
+                options=_listing_options(columns),
             )
             db_models = result.items
 
@@ -209,17 +408,106 @@ class ArtifactRepository(RepositoryBase, CrudMixin):
                 )
             )
 
-            artifacts = [
-                orm_artifact.to_listed_artifact() for orm_artifact in db_models
-            ]
+            return list(db_models), cursor
+
+    async def get_collection_artifacts(
+        self,
+        orbit_id: UUID,
+        pagination: PaginationParams,
+        collection_ids: list[UUID] | None = None,
+        artifact_types: list[ArtifactType] | None = None,
+        search: str | None = None,
+        excluded_tracks: list[UUID] | None = None,
+    ) -> tuple[list[ArtifactListed], Cursor | None]:
+        db_models, cursor = await self._get_collection_artifacts_page(
+            orbit_id,
+            pagination,
+            collection_ids,
+            artifact_types,
+            search,
+            excluded_tracks,
+        )
+        return [db_model.to_listed_artifact() for db_model in db_models], cursor
 
-            return artifacts, cursor
+    async def get_collection_artifact_summaries(
+        self,
+        orbit_id: UUID,
+        pagination: PaginationParams,
+        collection_ids: list[UUID] | None = None,
+        artifact_types: list[ArtifactType] | None = None,
+        search: str | None = None,
+        excluded_tracks: list[UUID] | None = None,
+    ) -> tuple[list[ArtifactSummary], Cursor | None]:
+        db_models, cursor = await self._get_collection_artifacts_page(
+            orbit_id,
+            pagination,
+            collection_ids,
+            artifact_types,
+            search,
+            excluded_tracks,
+            columns=_SUMMARY_COLUMNS,
+        )
+        return [db_model.to_artifact_summary() for db_model in db_models], cursor
 
     async def get_artifact(self, artifact_id: UUID) -> Artifact | None:
         async with self._get_session() as session:
             db_artifact = await self.get_model(session, ArtifactOrm, artifact_id)
             return db_artifact.to_artifact() if db_artifact else None
 
+    async def get_orbit_artifacts_by_ids(
+        self, artifact_ids: list[UUID], orbit_id: UUID
+    ) -> list[Artifact]:
+        async with self._get_session() as session:
+            result = await session.execute(
+                select(ArtifactOrm)
+                .join(CollectionOrm, ArtifactOrm.collection_id == CollectionOrm.id)
+                .where(
+                    ArtifactOrm.id.in_(artifact_ids),
+                    CollectionOrm.orbit_id == orbit_id,
+                )
+            )
+            return [db_artifact.to_artifact() for db_artifact in result.scalars()]
+
+    async def _get_orbit_listed_artifacts_by_ids(
+        self,
+        artifact_ids: list[UUID],
+        orbit_id: UUID,
+        columns: tuple[Any, ...] | None = None,
+    ) -> list[ArtifactOrm]:
+        async with self._get_session() as session:
+            result = await session.execute(
+                select(ArtifactOrm)
+                .join(CollectionOrm, ArtifactOrm.collection_id == CollectionOrm.id)
+                .where(
+                    ArtifactOrm.id.in_(artifact_ids),
+                    CollectionOrm.orbit_id == orbit_id,
+                )
+                .options(*_listing_options(columns))
+            )
+            by_id = {db_artifact.id: db_artifact for db_artifact in result.scalars()}
+            return [
+                by_id[artifact_id]
+                for artifact_id in dict.fromkeys(artifact_ids)
+                if artifact_id in by_id
+            ]
+
+    async def get_orbit_listed_artifacts_by_ids(
+        self, artifact_ids: list[UUID], orbit_id: UUID
+    ) -> list[ArtifactListed]:
+        """Artifacts of the orbit among ``artifact_ids``, in request order."""
+        db_artifacts = await self._get_orbit_listed_artifacts_by_ids(
+            artifact_ids, orbit_id
+        )
+        return [db_artifact.to_listed_artifact() for db_artifact in db_artifacts]
+
+    async def get_orbit_artifact_summaries_by_ids(
+        self, artifact_ids: list[UUID], orbit_id: UUID
+    ) -> list[ArtifactSummary]:
+        db_artifacts = await self._get_orbit_listed_artifacts_by_ids(
+            artifact_ids, orbit_id, columns=_SUMMARY_COLUMNS
+        )
+        return [db_artifact.to_artifact_summary() for db_artifact in db_artifacts]
+
     async def get_artifact_details(self, artifact_id: UUID) -> ArtifactDetails | None:
         async with self._get_session() as session:
             db_artifact = await self.get_model(
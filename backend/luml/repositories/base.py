@@ -7,10 +7,11 @@ from pydantic import BaseModel
 from sqlalchemy import (
     Float,
     asc,
-    cast,
     delete,
     desc,
     func,
+    insert,
+    literal,
     nullsfirst,
     nullslast,
     select,
@@ -49,18 +50,56 @@ class CrudMixin:
         return db_obj
 
     @staticmethod
+    async def insert_rows(
+        session: AsyncSession,
+        orm_class: type[TOrm],
+        rows: list[dict[str, Any]],
+    ) -> list[UUID]:
+        """Insert ``rows`` with batched INSERT ... RETURNING, without committing.
+
+        Returns the new ids in the order of ``rows``.
+        """
+        if not rows:
+            return []
+        result = await session.execute(
+            insert(orm_class).returning(
+                orm_class.id,  # type: ignore[attr-defined]
+                sort_by_parameter_order=True,
+            ),
+            rows,
+        )
+        return list(result.scalars())
+
+    @staticmethod
+    async def get_models_by_ids(
+        session: AsyncSession,
+        orm_class: type[TOrm],
+        ids: list[UUID],
+        options: list[Any] | None = None,  # noqa: ANN401
+    ) -> list[TOrm]:
+        """Load ``ids`` in one SELECT, in the order given."""
+        if not ids:
+            return []
+        result = await session.execute(
+            select(orm_class)
+            .where(orm_class.id.in_(ids))  # type: ignore[attr-defined]
+            .options(*(options or []))
+        )
+        by_id = {obj.id: obj for obj in result.scalars()}  # type: ignore[attr-defined]
+        return [by_id[obj_id] for obj_id in ids if obj_id in by_id]
+
+    @classmethod
     async def create_models(
+        cls,
         session: AsyncSession,
         orm_class: type[TOrm],
         data_list: list[TPydantic],
     ) -> list[TOrm]:
-        db_objects = [orm_class(**item.model_dump()) for item in data_list]
-        session.add_all(db_objects)
-        await session.flush()
+        ids = await cls.insert_rows(
+            session, orm_class, [item.model_dump() for item in data_list]
+        )
         await session.commit()
-        for obj in db_objects:
-            await session.refresh(obj)
-        return db_objects
+        return await cls.get_models_by_ids(session, orm_class, ids)
 
     @staticmethod
     async def update_model_where(
@@ -221,9 +260,11 @@ class CrudMixin:
             return orm_class.created_at  # type: ignore[attr-defined]
 
         if extra_sort_field and sort_by == "extra_values":
-            return cast(
-                orm_class.extra_values[extra_sort_field].astext,  # type: ignore[attr-defined]
-                Float,
+            # Key rendered inline, so the expression matches the per-key indexes.
+            return func.artifact_metric(
+                orm_class.extra_values,  # type: ignore[attr-defined]
+                literal(extra_sort_field, literal_execute=True),
+                type_=Float,
             )
         return getattr(orm_class, sort_by, orm_class.created_at)  # type: ignore[attr-defined]
 
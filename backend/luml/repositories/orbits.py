@@ -1,12 +1,18 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, select
+from sqlalchemy import and_, case, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
 from luml.infra.exceptions import DatabaseConstraintError
-from luml.models import CollectionOrm, OrbitMembersOrm, OrbitOrm
+from luml.models import (
+    CollectionOrm,
+    OrbitMembersOrm,
+    OrbitOrm,
+    OrganizationMemberOrm,
+    UserOrm,
+)
 from luml.repositories.base import CrudMixin, RepositoryBase
 from luml.schemas.orbit import (
     Orbit,
@@ -19,6 +25,7 @@ from luml.schemas.orbit import (
     OrbitUpdate,
     UpdateOrbitMember,
 )
+from luml.schemas.permissions import ApiKeyOrbitAccess
 from luml.utils.organizations import convert_orbit_simple_members
 
 
@@ -233,6 +240,43 @@ class OrbitRepository(RepositoryBase, CrudMixin):
                 session, OrbitMembersOrm, OrbitMembersOrm.orbit_id == orbit_id
             )
 
+    async def get_api_key_orbit_access(
+        self, hashed_api_key: str, orbit_id: UUID
+    ) -> ApiKeyOrbitAccess | None:
+        """The API key's user and their roles in the orbit, in one query.
+
+        None when the key or the orbit does not exist.
+        """
+        async with self._get_session() as session:
+            result = await session.execute(
+                select(
+                    UserOrm.id.label("user_id"),
+                    OrbitOrm.organization_id,
+                    OrganizationMemberOrm.role.label("organization_role"),
+                    OrbitMembersOrm.role.label("orbit_role"),
+                )
+                .select_from(UserOrm)
+                .join(OrbitOrm, OrbitOrm.id == orbit_id)
+                .outerjoin(
+                    OrganizationMemberOrm,
+                    and_(
+                        OrganizationMemberOrm.organization_id
+                        == OrbitOrm.organization_id,
+                        OrganizationMemberOrm.user_id == UserOrm.id,
+                    ),
+                )
+                .outerjoin(
+                    OrbitMembersOrm,
+                    and_(
+                        OrbitMembersOrm.orbit_id == OrbitOrm.id,
+                        OrbitMembersOrm.user_id == UserOrm.id,
+                    ),
+                )
+                .where(UserOrm.hashed_api_key == hashed_api_key)
+            )
+            row = result.one_or_none()
+            return ApiKeyOrbitAccess.model_validate(row._mapping) if row else None
+
     async def get_orbit_member_role(self, orbit_id: UUID, user_id: UUID) -> str | None:
         member = await self.get_orbit_member_where(
             OrbitMembersOrm.orbit_id == orbit_id, OrbitMembersOrm.user_id == user_id
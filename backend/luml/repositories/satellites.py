@@ -2,7 +2,7 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import case, select, update
 from sqlalchemy.exc import IntegrityError
 
 from luml.infra.exceptions import DatabaseConstraintError
@@ -116,6 +116,17 @@ class SatelliteRepository(RepositoryBase, CrudMixin):
                 sat.last_seen_at = datetime.now(UTC)
                 await session.commit()
 
+    async def touch_last_seen_many(self, seen: dict[UUID, datetime]) -> None:
+        if not seen:
+            return
+        async with self._get_session() as session:
+            await session.execute(
+                update(SatelliteOrm)
+                .where(SatelliteOrm.id.in_(list(seen)))
+                .values(last_seen_at=case(seen, value=SatelliteOrm.id))
+            )
+            await session.commit()
+
     async def delete_satellite(self, satellite_id: UUID) -> None:
         try:
             async with self._get_session() as session:
@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import Any
 from uuid import UUID
 
@@ -12,6 +13,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
 from luml.infra.exceptions import ApplicationError
 from luml.models.artifacts import ArtifactOrm
@@ -33,8 +35,30 @@ from luml.schemas.tracks import (
     TrackUpdate,
 )
 
+# Relationships on the track models raise unless loaded here on purpose.
+_TRACK_OPTIONS = [selectinload(TrackOrm.stages)]
+_ENTRY_OPTIONS = [
+    selectinload(TrackArtifactOrm.artifact).options(
+        load_only(ArtifactOrm.collection_id, ArtifactOrm.name, ArtifactOrm.description),
+        raiseload("*"),
+    ),
+    selectinload(TrackArtifactOrm.stage).options(
+        load_only(TrackStageOrm.name), raiseload("*")
+    ),
+]
+
 
 class TrackRepository(RepositoryBase, CrudMixin):
+    @staticmethod
+    async def _load_track(session: AsyncSession, track_id: UUID) -> TrackOrm | None:
+        result = await session.execute(
+            select(TrackOrm)
+            .where(TrackOrm.id == track_id)
+            .options(*_TRACK_OPTIONS)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     async def create_track(
         self, track: TrackCreate, stage_names: list[str] | None = None
     ) -> Track:
@@ -48,12 +72,11 @@ class TrackRepository(RepositoryBase, CrudMixin):
                     for name in stage_names
                 )
             await session.commit()
-            await session.refresh(db_track)
-            return Track.model_validate(db_track)
+            return Track.model_validate(await self._load_track(session, db_track.id))
 
     async def get_track(self, track_id: UUID) -> Track | None:
         async with self._get_session() as session:
-            db_track = await self.get_model(session, TrackOrm, track_id)
+            db_track = await self._load_track(session, track_id)
             return Track.model_validate(db_track) if db_track else None
 
     async def get_orbit_tracks(
@@ -83,6 +106,7 @@ class TrackRepository(RepositoryBase, CrudMixin):
                 TrackOrm,
                 *conditions,
                 pagination=pagination,
+                options=_TRACK_OPTIONS,
             )
             db_tracks = result.items
             cursor = (
@@ -112,8 +136,7 @@ class TrackRepository(RepositoryBase, CrudMixin):
                 await TrackStageRepository.apply_stage_sync(session, track_id, stages)
 
             await session.commit()
-            await session.refresh(db_track)
-            return Track.model_validate(db_track)
+            return Track.model_validate(await self._load_track(session, track_id))
 
     async def delete_track(self, track_id: UUID) -> None:
         async with self._get_session() as session:
@@ -301,6 +324,18 @@ class TrackEntryRepository(RepositoryBase, CrudMixin):
             scope_id=pagination.scope_id,
         )
 
+    @staticmethod
+    async def _load_entry(
+        session: AsyncSession, entry_id: UUID
+    ) -> TrackArtifactOrm | None:
+        result = await session.execute(
+            select(TrackArtifactOrm)
+            .where(TrackArtifactOrm.id == entry_id)
+            .options(*_ENTRY_OPTIONS)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def clear_stage_from_entries_in_session(
         session: AsyncSession,
@@ -318,29 +353,39 @@ class TrackEntryRepository(RepositoryBase, CrudMixin):
         await session.flush()
 
     async def create_entry(self, entry: TrackEntryCreate) -> TrackEntry:
+        entries = await self.create_entries(entry.track_id, [entry])
+        return entries[0]
+
+    async def create_entries(
+        self, track_id: UUID, entries: list[TrackEntryCreate]
+    ) -> list[TrackEntry]:
+        """Add ``entries`` with consecutive versions, in one transaction."""
         async with self._get_session() as session:
             result = await session.execute(
                 text(
-                    "UPDATE tracks SET next_version = next_version + 1 "
+                    "UPDATE tracks SET next_version = next_version + :count, "
+                    "total_entries = total_entries + :count "
                     "WHERE id = :track_id RETURNING next_version"
                 ),
-                {"track_id": entry.track_id},
+                {"track_id": track_id, "count": len(entries)},
             )
             row = result.fetchone()
             assert row is not None
-            version = row[0] - 1
-
-            db_entry = TrackArtifactOrm(
-                track_id=entry.track_id,
-                artifact_id=entry.artifact_id,
-                version=version,
-                added_by=entry.added_by,
-                stage_id=entry.stage_id,
+            first_version = row[0] - len(entries)
+
+            ids = await self.insert_rows(
+                session,
+                TrackArtifactOrm,
+                [
+                    entry.model_dump() | {"version": first_version + i}
+                    for i, entry in enumerate(entries)
+                ],
             )
-            session.add(db_entry)
             await session.commit()
-            await session.refresh(db_entry)
-            return TrackEntry.model_validate(db_entry)
+            db_entries = await self.get_models_by_ids(
+                session, TrackArtifactOrm, ids, options=_ENTRY_OPTIONS
+            )
+            return [TrackEntry.model_validate(e) for e in db_entries]
 
     async def list_entries(
         self,
@@ -358,6 +403,7 @@ class TrackEntryRepository(RepositoryBase, CrudMixin):
                 TrackArtifactOrm,
                 *conditions,
                 pagination=pagination,
+                options=_ENTRY_OPTIONS,
             )
             db_entries = result.items
             cursor = (
@@ -369,7 +415,7 @@ class TrackEntryRepository(RepositoryBase, CrudMixin):
 
     async def get_entry(self, entry_id: UUID) -> TrackEntry | None:
         async with self._get_session() as session:
-            db_entry = await self.get_model(session, TrackArtifactOrm, entry_id)
+            db_entry = await self._load_entry(session, entry_id)
             return TrackEntry.model_validate(db_entry) if db_entry else None
 
     async def update_entry(
@@ -395,22 +441,40 @@ class TrackEntryRepository(RepositoryBase, CrudMixin):
                 setattr(db_entry, field, value)
 
             await session.commit()
-            await session.refresh(db_entry)
-            return TrackEntry.model_validate(db_entry)
+            return TrackEntry.model_validate(await self._load_entry(session, entry_id))
+
+    @staticmethod
+    async def _delete_entries_where(
+        session: AsyncSession,
+        *where_conditions: Any,  # noqa: ANN401
+    ) -> None:
+        result = await session.execute(
+            delete(TrackArtifactOrm)
+            .where(*where_conditions)
+            .returning(TrackArtifactOrm.track_id)
+        )
+        for track_id, count in Counter(result.scalars()).items():
+            await session.execute(
+                update(TrackOrm)
+                .where(TrackOrm.id == track_id)
+                .values(
+                    total_entries=TrackOrm.total_entries - count,
+                    updated_at=TrackOrm.updated_at,
+                )
+            )
+        await session.commit()
 
     async def delete_entry(self, entry_id: UUID) -> None:
         async with self._get_session() as session:
-            await self.delete_model(session, TrackArtifactOrm, entry_id)
+            await self._delete_entries_where(session, TrackArtifactOrm.id == entry_id)
 
     async def delete_entries(self, track_id: UUID, entry_ids: list[UUID]) -> None:
         async with self._get_session() as session:
-            await session.execute(
-                delete(TrackArtifactOrm).where(
-                    TrackArtifactOrm.track_id == track_id,
-                    TrackArtifactOrm.id.in_(entry_ids),
-                )
+            await self._delete_entries_where(
+                session,
+                TrackArtifactOrm.track_id == track_id,
+                TrackArtifactOrm.id.in_(entry_ids),
             )
-            await session.commit()
 
     async def list_entries_for_artifact(self, artifact_id: UUID) -> list[TrackEntry]:
         async with self._get_session() as session:
@@ -418,6 +482,7 @@ class TrackEntryRepository(RepositoryBase, CrudMixin):
                 session,
                 TrackArtifactOrm,
                 TrackArtifactOrm.artifact_id == artifact_id,
+                options=_ENTRY_OPTIONS,
                 order_by=[TrackArtifactOrm.created_at],
             )
             return [TrackEntry.model_validate(r) for r in rows]
@@ -431,6 +496,19 @@ class TrackEntryRepository(RepositoryBase, CrudMixin):
             )
             return count > 0
 
+    async def list_entries_by_stages(
+        self, track_id: UUID, stage_ids: list[UUID]
+    ) -> list[TrackEntry]:
+        async with self._get_session() as session:
+            rows = await self.get_models_where(
+                session,
+                TrackArtifactOrm,
+                TrackArtifactOrm.track_id == track_id,
+                TrackArtifactOrm.stage_id.in_(stage_ids),
+                options=_ENTRY_OPTIONS,
+            )
+            return [TrackEntry.model_validate(r) for r in rows]
+
     async def get_entry_by_stage(
         self, track_id: UUID, stage_id: UUID
     ) -> TrackEntry | None:
@@ -440,5 +518,6 @@ class TrackEntryRepository(RepositoryBase, CrudMixin):
                 TrackArtifactOrm,
                 TrackArtifactOrm.track_id == track_id,
                 TrackArtifactOrm.stage_id == stage_id,
+                options=_ENTRY_OPTIONS,
             )
             return TrackEntry.model_validate(db_entry) if db_entry else None
@@ -53,6 +53,11 @@ class ArtifactType(StrEnum):
     DATASET = "dataset"
 
 
+class ArtifactListView(StrEnum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+
 class ModelIO(BaseModel):
     name: str
     content_type: str
@@ -184,6 +189,28 @@ class ArtifactListed(Artifact):
     collection_name: str = Field(validation_alias=AliasPath("collection", "name"))
 
 
+class ArtifactSummary(BaseModel, BaseOrmConfig):
+    """Listing row without the manifest and file index; fetch the artifact for those."""
+
+    id: UUID
+    collection_id: UUID
+    collection_name: str = Field(validation_alias=AliasPath("collection", "name"))
+    file_name: str
+    name: str | None = None
+    description: str | None = None
+    extra_values: dict[str, Any]
+    file_hash: str
+    size: int
+    tags: list[str] | None = None
+    type: ArtifactType
+    unique_identifier: str
+    status: ArtifactStatus
+    created_by_user: str | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
+    deployments: list[DeploymentBase] = []
+
+
 class ArtifactDetails(Artifact):
     deployments: list[Deployment] | None = None
     collection: Collection
@@ -200,6 +227,15 @@ class SatelliteArtifactResponse(BaseModel):
     url: str
 
 
+class ArtifactDownloadUrlsIn(BaseModel):
+    artifact_ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class ArtifactDownloadUrls(BaseModel):
+    urls: dict[UUID, str]
+    not_found: list[UUID] = Field(default_factory=list)
+
+
 class SatelliteModelArtifactResponse(SatelliteArtifactResponse):
     @computed_field(deprecated=True)  # type: ignore[prop-decorator]
     @property
@@ -210,3 +246,23 @@ class SatelliteModelArtifactResponse(SatelliteArtifactResponse):
 class ArtifactsList(BaseModel):
     items: list[ArtifactListed]
     cursor: str | None
+
+
+class ArtifactSummaryList(BaseModel):
+    items: list[ArtifactSummary]
+    cursor: str | None
+
+
+class ArtifactBatchIn(BaseModel):
+    artifact_ids: list[UUID] = Field(min_length=1, max_length=500)
+    view: ArtifactListView = ArtifactListView.FULL
+
+
+class ArtifactBatch(BaseModel):
+    items: list[ArtifactListed]
+    not_found: list[UUID] = Field(default_factory=list)
+
+
+class ArtifactSummaryBatch(BaseModel):
+    items: list[ArtifactSummary]
+    not_found: list[UUID] = Field(default_factory=list)
@@ -1,4 +1,5 @@
 from enum import StrEnum
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -35,6 +36,15 @@ class Action(StrEnum):
     REJECT = "reject"
 
 
+class ApiKeyOrbitAccess(BaseModel):
+    """Memberships of an API key's user in an orbit and its organization."""
+
+    user_id: UUID
+    organization_id: UUID
+    organization_role: str | None = None
+    orbit_role: str | None = None
+
+
 class OrgPermission(BaseModel, BaseOrmConfig):
     role: OrgRole | str
     resource: Resource
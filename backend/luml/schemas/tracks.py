@@ -99,6 +99,10 @@ class TrackEntryCreateIn(BaseModel):
     stage_id: UUID | None = None
 
 
+class TrackEntriesCreateIn(BaseModel):
+    entries: list[TrackEntryCreateIn] = Field(min_length=1, max_length=500)
+
+
 class TrackEntriesDeleteIn(BaseModel):
     entry_ids: list[UUID] = Field(min_length=1)
 
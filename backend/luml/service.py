@@ -1,3 +1,6 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, Request
@@ -12,14 +15,29 @@ from luml.api.organization.organization import organization_router
 from luml.api.organization_routes import organization_all_routers
 from luml.api.satellites import satellite_worker_router
 from luml.api.user_routes import users_routers
+from luml.handlers.artifacts import ArtifactHandler
+from luml.handlers.satellites import SatelliteHandler
+from luml.infra.cache import RequestMemoMiddleware
 from luml.infra.exceptions import ApplicationError
 from luml.infra.middleware import SecurityHeadersMiddleware
+from luml.infra.query_stats import QueryStatsMiddleware
 from luml.infra.security import JWTAuthenticationBackend
 from luml.settings import config
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Index builds run concurrently and can take minutes; do not hold up startup.
+    metric_indexes = asyncio.create_task(ArtifactHandler.ensure_metric_sort_indexes())
+    yield
+    metric_indexes.cancel()
+    await SatelliteHandler.flush_last_seen()
+    await ArtifactHandler.flush_metric_sorts()
+
+
 class AppService(FastAPI):
     def __init__(self, *args, **kwargs) -> None:  # type: ignore
+        kwargs.setdefault("lifespan", lifespan)
         super().__init__(*args, **kwargs)
 
         self.include_router(router=auth_router, prefix="/v1")
@@ -43,6 +61,9 @@ class AppService(FastAPI):
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        self.add_middleware(RequestMemoMiddleware)
+        # Added last so it runs first and also counts the authentication queries.
+        self.add_middleware(QueryStatsMiddleware)
 
     def include_authentication(self) -> None:
         self.add_middleware(
@@ -11,6 +11,15 @@ class Settings(BaseSettings):
     AUTH_COOKIE_SAMESITE: Literal["lax", "strict", "none"] = "lax"
 
     POSTGRESQL_DSN: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SEC: float = 30.0
+    DB_POOL_RECYCLE_SEC: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # asyncpg prepared statements per connection; set 0 behind pgbouncer.
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_QUERY_CACHE_SIZE: int = 500
+    DB_SLOW_QUERY_MS: float = 200.0
 
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
@@ -39,6 +48,19 @@ class Settings(BaseSettings):
     TEMPLATE_ID_ORGANIZATION_INVITE_EMAIL: str
     TEMPLATE_ID_ADDED_TO_ORBIT_EMAIL: str
 
+    SATELLITE_TASKS_MAX_WAIT_SEC: float = 25.0
+    SATELLITE_TASKS_RECHECK_SEC: float = 1.0
+
+    PERMISSIONS_CACHE_TTL_SEC: float = 5.0
+    INFERENCE_ACCESS_CACHE_TTL_SEC: float = 10.0
+    AUTH_PRINCIPAL_CACHE_TTL_SEC: float = 30.0
+    AUTH_PRINCIPAL_CACHE_SIZE: int = 10_000
+    SATELLITE_LAST_SEEN_FLUSH_SEC: float = 15.0
+    BUCKET_SECRET_CACHE_TTL_SEC: float = 60.0
+    PRESIGNED_URL_REUSE_MARGIN_SEC: float = 3 * 3600
+    METRIC_SORT_INDEX_LIMIT: int = 8
+    METRIC_SORT_FLUSH_SEC: float = 60.0
+
     CORS_ORIGINS: str = "https://app.dataforce.studio,https://dev.dataforce.studio,https://app.luml.ai,https://dev.luml.ai"
 
     # quickfix, to be refactored later
@@ -0,0 +1,60 @@
+"""Artifact extra value keys catalog
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-19 10:12:41.218634
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "034"
+down_revision: str | None = "033"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "artifact_extra_value_keys",
+        sa.Column("collection_id", sa.UUID(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("value_type", sa.String(), nullable=False),
+        sa.Column("artifact_count", sa.Integer(), nullable=False),
+        sa.Column("sort_count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(
+            ["collection_id"], ["collections.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("collection_id", "key", "value_type"),
+    )
+    op.execute(
+        """
+        INSERT INTO artifact_extra_value_keys (collection_id, key, value_type,
+                                               artifact_count)
+        SELECT a.collection_id, e.key, jsonb_typeof(e.value), count(*)
+        FROM artifacts a, jsonb_each(a.extra_values) e
+        GROUP BY a.collection_id, e.key, jsonb_typeof(e.value)
+        """
+    )
+    # Sort expression for extra values. Non-numeric values sort as NULL instead of
+    # failing the cast, which also makes it safe to index.
+    op.execute(
+        """
+        CREATE FUNCTION artifact_metric(extra_values jsonb, key text)
+        RETURNS double precision
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$
+            SELECT CASE WHEN jsonb_typeof(extra_values -> key) = 'number'
+                        THEN (extra_values ->> key)::double precision END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION artifact_metric(jsonb, text) CASCADE")
+    op.drop_table("artifact_extra_value_keys")
@@ -0,0 +1,53 @@
+"""Track entry counter and keyset indexes
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-10-19 14:37:05.512904
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "035"
+down_revision: str | None = "034"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tracks",
+        sa.Column("total_entries", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE tracks t
+        SET total_entries = e.count
+        FROM (
+            SELECT track_id, count(*) AS count FROM track_entries GROUP BY track_id
+        ) e
+        WHERE e.track_id = t.id
+        """
+    )
+    op.create_index(
+        "ix_tracks_orbit_id_created_at",
+        "tracks",
+        ["orbit_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_track_entries_track_id_created_at",
+        "track_entries",
+        ["track_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_track_entries_track_id_created_at", table_name="track_entries")
+    op.drop_index("ix_tracks_orbit_id_created_at", table_name="tracks")
+    op.drop_column("tracks", "total_entries")
@@ -0,0 +1,27 @@
+"""Index users by API key hash
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-10-19 16:02:48.730115
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "036"
+down_revision: str | None = "035"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_users_hashed_api_key"), "users", ["hashed_api_key"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_users_hashed_api_key"), table_name="users")
@@ -1,12 +1,15 @@
 import datetime
 import random
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from dataclasses import dataclass
 from uuid import uuid7
 
 import asyncpg  # type: ignore[import-untyped]
+import pytest
 import pytest_asyncio
+from luml.infra.query_stats import QueryStats, instrument_engine, track_queries
 from luml.models import OrganizationOrm
 from luml.repositories.artifacts import ArtifactRepository
 from luml.repositories.bucket_secrets import BucketSecretRepository
@@ -137,6 +140,27 @@ class SatelliteFixtureData(OrbitFixtureData):
     satellite: Satellite
 
 
+type AssertNumQueries = Callable[[AsyncEngine, int], AbstractContextManager[QueryStats]]
+
+
+@pytest.fixture
+def assert_num_queries() -> AssertNumQueries:
+    """Fails the test unless the block issues exactly ``expected`` queries on
+    ``engine``. Guards endpoints against N+1 regressions."""
+
+    @contextmanager
+    def _assert_num_queries(engine: AsyncEngine, expected: int) -> Iterator[QueryStats]:
+        instrument_engine(engine.sync_engine, config.DB_SLOW_QUERY_MS)
+        with track_queries(record_statements=True) as stats:
+            yield stats
+        assert stats.queries == expected, (
+            f"expected {expected} queries, got {stats.queries}:\n"
+            + "\n".join(stats.statements)
+        )
+
+    return _assert_num_queries
+
+
 @pytest_asyncio.fixture(scope="function")
 async def create_database_and_apply_migrations() -> AsyncGenerator[str]:  # noqa: ANN201
     admin_dsn = config.POSTGRESQL_DSN.replace("+asyncpg", "").replace(
@@ -105,6 +105,27 @@ async def test_get_artifact(
     assert fetched_model.collection_id == collection.id
 
 
+@pytest.mark.asyncio
+async def test_get_orbit_artifacts_by_ids(
+    create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
+) -> None:
+    data = create_collection
+    engine, collection = data.engine, data.collection
+    repo = ArtifactRepository(engine)
+
+    model = test_artifact.model_copy()
+    model.collection_id = collection.id
+    created_model = await repo.create_artifact(model)
+
+    fetched = await repo.get_orbit_artifacts_by_ids(
+        [created_model.id, uuid.uuid4()], collection.orbit_id
+    )
+    foreign = await repo.get_orbit_artifacts_by_ids([created_model.id], uuid.uuid4())
+
+    assert [artifact.id for artifact in fetched] == [created_model.id]
+    assert foreign == []
+
+
 @pytest.mark.asyncio
 async def test_get_collection_artifacts(
     create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
@@ -136,6 +157,63 @@ async def test_get_collection_artifacts(
     assert created_model2.id in model_ids
 
 
+@pytest.mark.asyncio
+async def test_get_collection_artifact_summaries(
+    create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
+) -> None:
+    data = create_collection
+    engine, collection = data.engine, data.collection
+    repo = ArtifactRepository(engine)
+
+    created = []
+    for i, size in enumerate((10, 30, 20)):
+        model = test_artifact.model_copy()
+        model.collection_id = collection.id
+        model.unique_identifier = f"uid{i}"
+        model.size = size
+        created.append(await repo.create_artifact(model))
+
+    summaries, cursor = await repo.get_collection_artifact_summaries(
+        data.orbit.id,
+        PaginationParams(limit=2, sort_by="size", order=SortOrder.DESC),
+        collection_ids=[collection.id],
+    )
+
+    assert [s.id for s in summaries] == [created[1].id, created[2].id]
+    assert summaries[0].collection_name == collection.name
+    assert summaries[0].extra_values == test_artifact.extra_values
+    assert cursor is not None
+    assert cursor.value == 20
+
+
+@pytest.mark.asyncio
+async def test_get_orbit_artifacts_by_ids_in_request_order(
+    create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
+) -> None:
+    data = create_collection
+    repo = ArtifactRepository(data.engine)
+
+    created = []
+    for i in range(3):
+        model = test_artifact.model_copy()
+        model.collection_id = data.collection.id
+        model.unique_identifier = f"uid{i}"
+        created.append(await repo.create_artifact(model))
+    requested = [created[2].id, uuid.uuid4(), created[0].id, created[2].id]
+
+    listed = await repo.get_orbit_listed_artifacts_by_ids(requested, data.orbit.id)
+    summaries = await repo.get_orbit_artifact_summaries_by_ids(requested, data.orbit.id)
+    other_orbit = await repo.get_orbit_artifact_summaries_by_ids(
+        requested, data.organization.id
+    )
+
+    assert [a.id for a in listed] == [created[2].id, created[0].id]
+    assert listed[0].manifest == created[2].manifest
+    assert [s.id for s in summaries] == [created[2].id, created[0].id]
+    assert summaries[0].collection_name == data.collection.name
+    assert other_orbit == []
+
+
 @pytest.mark.asyncio
 async def test_get_collection_artifacts_returns_only_active_deployments(
     create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
@@ -353,6 +431,91 @@ async def test_get_collection_artifacts_extra_values(
     assert result == sorted(result)
 
 
+@pytest.mark.asyncio
+async def test_extra_value_key_catalog_follows_create_and_delete(
+    create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
+) -> None:
+    data = create_collection
+    engine, collection = data.engine, data.collection
+    repo = ArtifactRepository(engine)
+
+    first = test_artifact.model_copy()
+    first.collection_id = collection.id
+    first.unique_identifier = "uid1"
+    first.extra_values = {"accuracy": 0.9, "notes": "baseline"}
+    second = test_artifact.model_copy()
+    second.collection_id = collection.id
+    second.unique_identifier = "uid2"
+    second.extra_values = {"accuracy": 0.8}
+
+    created_first = await repo.create_artifact(first)
+    created_second = await repo.create_artifact(second)
+
+    assert await repo.get_extra_value_key_types([collection.id]) == {
+        "accuracy": {"number"},
+        "notes": {"string"},
+    }
+
+    await repo.delete_artifact(created_first.id)
+    assert await repo.get_collection_artifacts_extra_values(collection.id) == [
+        "accuracy"
+    ]
+
+    await repo.delete_artifact(created_second.id)
+    assert await repo.get_collection_artifacts_extra_values(collection.id) == []
+
+
+@pytest.mark.asyncio
+async def test_get_collection_artifacts_rejects_non_numeric_metric_sort(
+    create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
+) -> None:
+    data = create_collection
+    engine, collection = data.engine, data.collection
+    repo = ArtifactRepository(engine)
+
+    model = test_artifact.model_copy()
+    model.collection_id = collection.id
+    model.extra_values = {"notes": "baseline"}
+    await repo.create_artifact(model)
+
+    with pytest.raises(InvalidSortingError):
+        await repo.get_collection_artifacts(
+            data.orbit.id,
+            PaginationParams(limit=10, sort_by="notes"),
+            collection_ids=[collection.id],
+        )
+
+
+@pytest.mark.asyncio
+async def test_ensure_metric_sort_indexes(
+    create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
+) -> None:
+    data = create_collection
+    engine, collection = data.engine, data.collection
+    repo = ArtifactRepository(engine)
+
+    for i, accuracy in enumerate((0.7, 0.9, 0.8)):
+        model = test_artifact.model_copy()
+        model.collection_id = collection.id
+        model.unique_identifier = f"uid{i}"
+        model.extra_values = {"accuracy": accuracy, "loss": 1 - accuracy}
+        await repo.create_artifact(model)
+
+    models, _ = await repo.get_collection_artifacts(
+        data.orbit.id,
+        PaginationParams(limit=10, sort_by="accuracy", order=SortOrder.DESC),
+        collection_ids=[collection.id],
+    )
+    assert [m.extra_values["accuracy"] for m in models] == [0.9, 0.8, 0.7]
+
+    # Listing is a read; sorts are counted by the handler and written in batches.
+    assert await repo.ensure_metric_sort_indexes(limit=4) == []
+    await repo.record_metric_sorts({(collection.id, "accuracy"): 3})
+
+    assert await repo.ensure_metric_sort_indexes(limit=4) == ["accuracy"]
+    assert await repo.ensure_metric_sort_indexes(limit=0) == []
+
+
 @pytest.mark.asyncio
 async def test_get_collection_artifacts_extra_values_empty(
     create_collection: CollectionFixtureData, test_artifact: ArtifactCreate
@@ -467,6 +630,43 @@ async def test_get_collection_artifacts_sort_by_metric(
     assert second[0].extra_values["accuracy"] == 0.9
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", [SortOrder.ASC, SortOrder.DESC])
+async def test_get_collection_artifacts_metric_pages_over_non_numeric_values(
+    create_collection: CollectionFixtureData,
+    test_artifact: ArtifactCreate,
+    order: SortOrder,
+) -> None:
+    data = create_collection
+    repo = ArtifactRepository(data.engine)
+    values: list[object] = [0.1, 0.9, "0.5", True, "high"]
+    for i, value in enumerate(values):
+        await _make_artifact(
+            repo,
+            test_artifact,
+            data.collection.id,
+            name=f"model-{i}",
+            extra_values={"accuracy": value},
+        )
+
+    # Page size 1 puts a page boundary on every string and bool value.
+    seen: list[object] = []
+    cursor = None
+    for _ in range(len(values) + 1):
+        page, cursor = await repo.get_collection_artifacts(
+            data.orbit.id,
+            PaginationParams(limit=1, sort_by="accuracy", order=order, cursor=cursor),
+            collection_ids=[data.collection.id],
+        )
+        seen.extend(a.extra_values["accuracy"] for a in page)
+        if cursor is None:
+            break
+
+    assert sorted(map(str, seen)) == sorted(map(str, values))
+    numeric = [v for v in seen if isinstance(v, float)]
+    assert numeric == ([0.1, 0.9] if order == SortOrder.ASC else [0.9, 0.1])
+
+
 @pytest.mark.asyncio
 async def test_get_collection_artifacts_sort_extra_values_key_raises(
     create_collection: CollectionFixtureData,
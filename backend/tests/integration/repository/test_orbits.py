@@ -19,6 +19,7 @@ from luml.schemas.orbit import (
 )
 from luml.schemas.orbit_secret import OrbitSecretCreate
 from luml.schemas.organization import OrganizationCreateIn
+from luml.schemas.user import UpdateUserAPIKey
 
 from tests.conftest import (
     CollectionFixtureData,
@@ -199,6 +200,25 @@ async def test_get_orbit_simple_from_another_organization(
     assert await repo.get_orbit_simple(orbit.id, orbit.organization_id) is not None
 
 
+@pytest.mark.asyncio
+async def test_get_api_key_orbit_access(create_orbit: OrbitFixtureData) -> None:
+    data = create_orbit
+    repo = OrbitRepository(data.engine)
+    await UserRepository(data.engine).create_user_api_key(
+        UpdateUserAPIKey(id=data.user.id, hashed_api_key="hashed-key")
+    )
+
+    access = await repo.get_api_key_orbit_access("hashed-key", data.orbit.id)
+
+    assert access is not None
+    assert access.user_id == data.user.id
+    assert access.organization_id == data.organization.id
+    assert access.organization_role == "owner"
+    assert await repo.get_api_key_orbit_access("unknown", data.orbit.id) is None
+    missing_orbit = data.organization.id
+    assert await repo.get_api_key_orbit_access("hashed-key", missing_orbit) is None
+
+
 @pytest.mark.asyncio
 async def test_get_orbit(create_orbit: OrbitFixtureData) -> None:
     data = create_orbit
@@ -184,3 +184,34 @@ async def test_touch_last_seen(create_orbit: OrbitFixtureData) -> None:
     assert seen_satellite
     assert seen_satellite.last_seen_at is not None
     assert seen_satellite.last_seen_at != original_last_seen
+
+
+@pytest.mark.asyncio
+async def test_touch_last_seen_many(create_orbit: OrbitFixtureData) -> None:
+    data = create_orbit
+    engine, orbit = data.engine, data.orbit
+
+    repo = SatelliteRepository(engine)
+    first = await repo.create_satellite(
+        SatelliteCreate(orbit_id=orbit.id, api_key_hash=str(uuid.uuid4()), name="a")
+    )
+    second = await repo.create_satellite(
+        SatelliteCreate(orbit_id=orbit.id, api_key_hash=str(uuid.uuid4()), name="b")
+    )
+    untouched = await repo.create_satellite(
+        SatelliteCreate(orbit_id=orbit.id, api_key_hash=str(uuid.uuid4()), name="c")
+    )
+    seen = {
+        first.id: datetime(2026, 1, 1, 12, 0, tzinfo=UTC),
+        second.id: datetime(2026, 1, 1, 12, 5, tzinfo=UTC),
+    }
+
+    await repo.touch_last_seen_many(seen)
+
+    for satellite_id, seen_at in seen.items():
+        fetched = await repo.get_satellite(satellite_id)
+        assert fetched
+        assert fetched.last_seen_at == seen_at
+    fetched_untouched = await repo.get_satellite(untouched.id)
+    assert fetched_untouched
+    assert fetched_untouched.last_seen_at is None
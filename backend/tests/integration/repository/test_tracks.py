@@ -32,7 +32,7 @@ from luml.schemas.tracks import (
 )
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from tests.conftest import CollectionFixtureData, OrbitFixtureData
+from tests.conftest import AssertNumQueries, CollectionFixtureData, OrbitFixtureData
 
 
 def _make_manifest() -> Manifest:
@@ -286,6 +286,92 @@ async def test_create_entry_and_version_assignment(
     assert updated_track.next_version == 2
 
 
+@pytest.mark.asyncio
+async def test_create_entries_assigns_consecutive_versions(
+    create_collection: CollectionFixtureData,
+) -> None:
+    data = create_collection
+    repo = TrackRepository(data.engine)
+    entry_repo = TrackEntryRepository(data.engine)
+    stage_repo = TrackStageRepository(data.engine)
+
+    track = await repo.create_track(
+        TrackCreate(
+            orbit_id=data.orbit.id,
+            name="batch-track",
+            artifact_type=ArtifactType.MODEL,
+        )
+    )
+    stage = await stage_repo.create_stage(
+        StageCreate(track_id=track.id, name="production")
+    )
+    first = await _create_artifact(data.engine, data.collection.id)
+    await entry_repo.create_entry(
+        TrackEntryCreate(track_id=track.id, artifact_id=first.id, added_by=data.user.id)
+    )
+    artifacts = [
+        await _create_artifact(data.engine, data.collection.id) for _ in range(3)
+    ]
+
+    entries = await entry_repo.create_entries(
+        track.id,
+        [
+            TrackEntryCreate(
+                track_id=track.id,
+                artifact_id=artifact.id,
+                added_by=data.user.id,
+                stage_id=stage.id if i == 0 else None,
+            )
+            for i, artifact in enumerate(artifacts)
+        ],
+    )
+
+    assert [e.version for e in entries] == [2, 3, 4]
+    assert [e.artifact_id for e in entries] == [a.id for a in artifacts]
+    assert entries[0].stage_id == stage.id
+    holders = await entry_repo.list_entries_by_stages(track.id, [stage.id])
+    assert [h.id for h in holders] == [entries[0].id]
+
+    updated_track = await repo.get_track(track.id)
+    assert updated_track is not None
+    assert updated_track.next_version == 5
+    assert updated_track.total_entries == 4
+    assert [s.name for s in updated_track.stages] == ["production"]
+
+
+@pytest.mark.asyncio
+async def test_total_entries_maintained_on_delete(
+    create_collection: CollectionFixtureData,
+) -> None:
+    data = create_collection
+    repo = TrackRepository(data.engine)
+    entry_repo = TrackEntryRepository(data.engine)
+    track = await repo.create_track(
+        TrackCreate(
+            orbit_id=data.orbit.id, name="counted", artifact_type=ArtifactType.MODEL
+        )
+    )
+    artifacts = [
+        await _create_artifact(data.engine, data.collection.id) for _ in range(3)
+    ]
+    entries = await entry_repo.create_entries(
+        track.id,
+        [
+            TrackEntryCreate(track_id=track.id, artifact_id=a.id, added_by=data.user.id)
+            for a in artifacts
+        ],
+    )
+
+    await entry_repo.delete_entry(entries[0].id)
+    await entry_repo.delete_entries(track.id, [entries[1].id, uuid.uuid4()])
+
+    updated_track = await repo.get_track(track.id)
+    assert updated_track is not None
+    assert updated_track.total_entries == 1
+    assert updated_track.updated_at == track.updated_at
+    assert updated_track.next_version == 4
+
+
 @pytest.mark.asyncio
 async def test_list_entries(create_collection: CollectionFixtureData) -> None:
     data = create_collection
@@ -436,6 +522,34 @@ async def _collect_pages(
     return collected
 
 
+@pytest.mark.asyncio
+async def test_list_entries_query_count_independent_of_page_size(
+    create_collection: CollectionFixtureData, assert_num_queries: AssertNumQueries
+) -> None:
+    data = create_collection
+    track_id, entries = await _seed_entries(
+        data, [("alpha", None), ("beta", "b"), ("gamma", None)]
+    )
+    entry_repo = TrackEntryRepository(data.engine)
+    stage = await TrackStageRepository(data.engine).create_stage(
+        StageCreate(track_id=track_id, name="production")
+    )
+    await entry_repo.update_entry(entries[0].id, TrackEntryUpdate(stage_id=stage.id))
+    pagination = PaginationParams(
+        sort_by="artifact_name", order=SortOrder.ASC, limit=50
+    )
+
+    # Entries, then their artifacts and stages in one SELECT each.
+    with assert_num_queries(data.engine, 3):
+        items, _ = await entry_repo.list_entries(track_id, pagination)
+    assert [e.stage_name for e in items] == ["production", None, None]
+
+    with assert_num_queries(data.engine, 2):
+        await TrackRepository(data.engine).get_orbit_tracks(
+            data.orbit.id, PaginationParams(limit=50)
+        )
+
+
 @pytest.mark.asyncio
 async def test_list_entries_sort_version(
     create_collection: CollectionFixtureData,
@@ -0,0 +1,18 @@
+from collections.abc import Iterator
+
+import pytest
+from luml.clients.storage_registry import storage_clients
+from luml.handlers.permissions import PermissionsHandler
+from luml.infra.principals import principal_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Iterator[None]:
+    # Tests reuse ids and tokens with different mocks; cached results must not leak.
+    PermissionsHandler.clear_cache()
+    principal_cache.clear()
+    storage_clients.clear()
+    yield
+    PermissionsHandler.clear_cache()
+    principal_cache.clear()
+    storage_clients.clear()
@@ -21,8 +21,12 @@ from luml.schemas.artifacts import (
     ArtifactDetails,
     ArtifactIn,
     ArtifactListed,
+    ArtifactListView,
     ArtifactsList,
     ArtifactStatus,
+    ArtifactSummary,
+    ArtifactSummaryBatch,
+    ArtifactSummaryList,
     ArtifactType,
     ArtifactUpdate,
     ArtifactUpdateIn,
@@ -369,6 +373,142 @@ async def test_get_collection_artifacts(
     )
 
 
+@patch(
+    "luml.handlers.artifacts.ArtifactRepository.get_collection_artifacts",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.ArtifactRepository.get_collection_artifact_summaries",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.ArtifactHandler._check_orbit_and_collections_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.PermissionsHandler.check_permissions",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_collection_artifacts_summary_view(
+    mock_check_permissions: AsyncMock,
+    mock_check_orbit_and_collections_access: AsyncMock,
+    mock_get_summaries: AsyncMock,
+    mock_get_collection_artifacts: AsyncMock,
+) -> None:
+    user_id = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
+    organization_id = UUID("0199c337-09f2-7af1-af5e-83fd7a5b51a0")
+    orbit_id = UUID("0199c337-09f3-753e-9def-b27745e69be6")
+    collection_id = UUID("0199c337-09f4-7a01-9f5f-5f68db62cf70")
+
+    summaries = [
+        ArtifactSummary.model_validate(
+            {
+                "id": uuid7(),
+                "collection_id": collection_id,
+                "collection": {"name": "models"},
+                "file_name": "model1.pkl",
+                "name": "model1",
+                "extra_values": {"accuracy": 0.95},
+                "file_hash": "hash1",
+                "size": 100,
+                "unique_identifier": "uid1",
+                "status": ArtifactStatus.UPLOADED,
+                "created_at": datetime.now(),
+                "type": ArtifactType.MODEL,
+            }
+        )
+    ]
+    mock_get_summaries.return_value = (summaries, None)
+
+    result = await handler.get_collection_artifacts(
+        user_id,
+        organization_id,
+        orbit_id,
+        [collection_id],
+        view=ArtifactListView.SUMMARY,
+    )
+
+    assert result == ArtifactSummaryList(items=summaries, cursor=None)
+    assert "manifest" not in result.model_dump()["items"][0]
+    mock_get_summaries.assert_awaited_once()
+    assert mock_get_summaries.await_args.kwargs["collection_ids"] == [collection_id]
+    mock_get_collection_artifacts.assert_not_awaited()
+
+
+@patch(
+    "luml.handlers.artifacts.ArtifactRepository.get_orbit_artifact_summaries_by_ids",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.OrbitRepository.get_orbit_simple",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.PermissionsHandler.check_permissions",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_artifacts_batch_summary_view(
+    mock_check_permissions: AsyncMock,
+    mock_get_orbit_simple: AsyncMock,
+    mock_get_summaries: AsyncMock,
+) -> None:
+    user_id = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
+    organization_id = UUID("0199c337-09f2-7af1-af5e-83fd7a5b51a0")
+    orbit_id = UUID("0199c337-09f3-753e-9def-b27745e69be6")
+    found, missing = uuid7(), uuid7()
+    summary = ArtifactSummary.model_validate(
+        {
+            "id": found,
+            "collection_id": uuid7(),
+            "collection": {"name": "models"},
+            "file_name": "model1.pkl",
+            "extra_values": {},
+            "file_hash": "hash1",
+            "size": 100,
+            "unique_identifier": "uid1",
+            "status": ArtifactStatus.UPLOADED,
+            "created_at": datetime.now(),
+            "type": ArtifactType.MODEL,
+        }
+    )
+    mock_get_summaries.return_value = [summary]
+
+    result = await handler.get_artifacts_batch(
+        user_id,
+        organization_id,
+        orbit_id,
+        [found, missing, missing],
+        ArtifactListView.SUMMARY,
+    )
+
+    assert result == ArtifactSummaryBatch(items=[summary], not_found=[missing])
+    mock_get_summaries.assert_awaited_once_with([found, missing, missing], orbit_id)
+    mock_check_permissions.assert_awaited_once_with(
+        organization_id, user_id, Resource.ARTIFACT, Action.READ, orbit_id
+    )
+
+
+@patch(
+    "luml.handlers.artifacts.OrbitRepository.get_orbit_simple",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.PermissionsHandler.check_permissions",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_artifacts_batch_orbit_not_found(
+    mock_check_permissions: AsyncMock,
+    mock_get_orbit_simple: AsyncMock,
+) -> None:
+    mock_get_orbit_simple.return_value = None
+
+    with pytest.raises(OrbitNotFoundError):
+        await handler.get_artifacts_batch(uuid7(), uuid7(), uuid7(), [uuid7()])
+
+
 def _make_listed(manifest: Manifest, **overrides: object) -> ArtifactListed:
     base: dict[str, object] = {
         "id": uuid7(),
@@ -718,6 +858,47 @@ async def test_get_collection_artifacts_encodes_returned_cursor(
     assert result.cursor == encode_cursor(next_cursor)
 
 
+@patch("luml.handlers.artifacts.MetricSortBatcher.record")
+@patch(
+    "luml.handlers.artifacts.ArtifactRepository.get_collection_artifacts",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.ArtifactHandler._check_orbit_and_collections_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.PermissionsHandler.check_permissions",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_collection_artifacts_counts_metric_sort_without_writing(
+    mock_check_permissions: AsyncMock,
+    mock_check_access: AsyncMock,
+    mock_repo: AsyncMock,
+    mock_record: Mock,
+    manifest_example: Manifest,
+) -> None:
+    collection_id = uuid7()
+
+    async def list_sorted(
+        orbit_id: UUID, pagination: PaginationParams, **kwargs: object
+    ) -> tuple[list[ArtifactListed], Cursor | None]:
+        if pagination.sort_by not in {"created_at", "extra_values"}:
+            pagination.extra_sort_field = pagination.sort_by
+            pagination.sort_by = "extra_values"
+        return [_make_listed(manifest_example)], None
+
+    mock_repo.side_effect = list_sorted
+
+    await handler.get_collection_artifacts(
+        uuid7(), uuid7(), uuid7(), [collection_id], sort_by="accuracy"
+    )
+    await handler.get_collection_artifacts(uuid7(), uuid7(), uuid7(), [collection_id])
+
+    mock_record.assert_called_once_with([collection_id], "accuracy")
+
+
 @patch(
     "luml.handlers.artifacts.ArtifactHandler._check_organization_artifacts_limit",
     new_callable=AsyncMock,
@@ -942,13 +1123,10 @@ async def test_get_artifact_not_found(
     "luml.handlers.artifacts.ArtifactHandler._get_secret_or_raise",
     new_callable=AsyncMock,
 )
-@patch(
-    "luml.handlers.artifacts.ArtifactHandler._get_storage_client",
-    new_callable=AsyncMock,
-)
+@patch("luml.clients.storage_registry.create_storage_client")
 @pytest.mark.asyncio
 async def test_request_download_url(
-    mock_get_storage_client: AsyncMock,
+    mock_create_storage_client: Mock,
     mock_get_secret_or_raise: AsyncMock,
     mock_get_artifact: AsyncMock,
     mock_get_orbit_simple: AsyncMock,
@@ -991,7 +1169,7 @@ async def test_request_download_url(
     mock_get_secret_or_raise.return_value = mock_secret
     mock_storage_client = AsyncMock()
     mock_storage_client.get_download_url.return_value = "url"
-    mock_get_storage_client.return_value = mock_storage_client
+    mock_create_storage_client.return_value = Mock(return_value=mock_storage_client)
 
     url = await handler.request_download_url(
         user_id, organization_id, orbit_id, collection_id, artifact_id
@@ -1001,12 +1179,74 @@ async def test_request_download_url(
     mock_check_permissions.assert_awaited_once_with(
         organization_id, user_id, Resource.ARTIFACT, Action.READ, orbit_id
     )
-    mock_get_storage_client.assert_awaited_once()
+    mock_create_storage_client.assert_called_once_with(test_bucket.type)
     mock_storage_client.get_download_url.assert_awaited_once_with(
         artifact.bucket_location
     )
 
 
+@patch(
+    "luml.handlers.artifacts.PermissionsHandler.check_permissions",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.OrbitRepository.get_orbit_simple",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.ArtifactRepository.get_orbit_artifacts_by_ids",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.artifacts.BucketSecretRepository.get_bucket_secret",
+    new_callable=AsyncMock,
+)
+@patch("luml.clients.storage_registry.create_storage_client")
+@pytest.mark.asyncio
+async def test_request_download_urls(
+    mock_create_storage_client: Mock,
+    mock_get_bucket_secret: AsyncMock,
+    mock_get_orbit_artifacts_by_ids: AsyncMock,
+    mock_get_orbit_simple: AsyncMock,
+    mock_check_permissions: AsyncMock,
+    test_bucket: S3BucketSecret,
+) -> None:
+    user_id = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
+    organization_id = UUID("0199c337-09f2-7af1-af5e-83fd7a5b51a0")
+    orbit_id = UUID("0199c337-09f3-753e-9def-b27745e69be6")
+    first_id, second_id, missing_id = uuid7(), uuid7(), uuid7()
+
+    mock_get_orbit_simple.return_value = Mock(
+        id=orbit_id, bucket_secret_id=test_bucket.id
+    )
+    mock_get_orbit_artifacts_by_ids.return_value = [
+        Mock(id=first_id, bucket_location="a.luml"),
+        Mock(id=second_id, bucket_location="b.luml"),
+    ]
+    mock_get_bucket_secret.return_value = test_bucket
+    mock_storage_client = AsyncMock()
+    mock_storage_client.get_download_url.side_effect = lambda name: f"url/{name}"
+    mock_create_storage_client.return_value = Mock(return_value=mock_storage_client)
+
+    result = await handler.request_download_urls(
+        user_id, organization_id, orbit_id, [first_id, second_id, missing_id]
+    )
+    again = await handler.request_download_urls(
+        user_id, organization_id, orbit_id, [first_id]
+    )
+
+    assert result.urls == {first_id: "url/a.luml", second_id: "url/b.luml"}
+    assert result.not_found == [missing_id]
+    assert again.urls == {first_id: "url/a.luml"}
+    mock_check_permissions.assert_awaited_with(
+        organization_id, user_id, Resource.ARTIFACT, Action.READ, orbit_id
+    )
+    mock_get_orbit_artifacts_by_ids.assert_awaited_with([first_id], orbit_id)
+    mock_get_bucket_secret.assert_awaited_once_with(test_bucket.id)
+    mock_create_storage_client.assert_called_once_with(test_bucket.type)
+    assert mock_storage_client.get_download_url.await_count == 2
+
+
 @patch(
     "luml.handlers.artifacts.PermissionsHandler.check_permissions",
     new_callable=AsyncMock,
@@ -1553,7 +1793,7 @@ async def test_update_artifact_not_found(
     mock_update_artifact.assert_not_awaited()
 
 
-@patch("luml.handlers.artifacts.create_storage_client")
+@patch("luml.clients.storage_registry.create_storage_client")
 @patch(
     "luml.handlers.artifacts.BucketSecretRepository.get_bucket_secret",
     new_callable=AsyncMock,
@@ -1940,7 +2180,7 @@ async def test_artifact_deletion_checks_not_found(
 
 
 @patch(
-    "luml.handlers.artifacts.create_storage_client",
+    "luml.clients.storage_registry.create_storage_client",
 )
 @patch(
     "luml.handlers.artifacts.BucketSecretRepository.get_bucket_secret",
@@ -2208,7 +2448,7 @@ async def test_force_delete_artifact_with_deployments(
 
 
 @patch(
-    "luml.handlers.artifacts.create_storage_client",
+    "luml.clients.storage_registry.create_storage_client",
 )
 @patch(
     "luml.handlers.artifacts.BucketSecretRepository.get_bucket_secret",
@@ -2743,7 +2983,7 @@ async def test_request_delete_url_blocked_by_tracks(
 
 
 @patch(
-    "luml.handlers.artifacts.ArtifactHandler._get_storage_client",
+    "luml.handlers.artifacts.ArtifactHandler._get_download_url",
     new_callable=AsyncMock,
 )
 @patch(
@@ -2763,7 +3003,7 @@ async def test_request_download_url_rejects_artifact_from_another_collection(
     mock_check_permissions: AsyncMock,
     mock_check_access: AsyncMock,
     mock_get_artifact: AsyncMock,
-    mock_get_storage_client: AsyncMock,
+    mock_get_download_url: AsyncMock,
 ) -> None:
     mock_check_access.return_value = (Mock(id=_ORBIT), Mock(id=_COLLECTION))
     mock_get_artifact.return_value = Mock(
@@ -2774,7 +3014,7 @@ async def test_request_download_url_rejects_artifact_from_another_collection(
         await handler.request_download_url(_USER, _ORG, _ORBIT, _COLLECTION, _ARTIFACT)
 
     assert error.value.status_code == 404
-    mock_get_storage_client.assert_not_awaited()
+    mock_get_download_url.assert_not_awaited()
 
 
 @patch(
@@ -2967,7 +3207,7 @@ async def test_force_delete_artifact_rejects_artifact_from_another_collection(
 
 
 @patch(
-    "luml.handlers.artifacts.ArtifactHandler._get_storage_client",
+    "luml.handlers.artifacts.ArtifactHandler._get_download_url",
     new_callable=AsyncMock,
 )
 @patch(
@@ -2987,7 +3227,7 @@ async def test_get_satellite_artifact_rejects_artifact_outside_orbit(
     mock_get_artifact: AsyncMock,
     mock_get_collection: AsyncMock,
     mock_get_orbit_by_id: AsyncMock,
-    mock_get_storage_client: AsyncMock,
+    mock_get_download_url: AsyncMock,
     manifest_example: Manifest,
 ) -> None:
     mock_get_artifact.return_value = _make_artifact(
@@ -2997,7 +3237,7 @@ async def test_get_satellite_artifact_rejects_artifact_outside_orbit(
         id=_FOREIGN_COLLECTION, orbit_id=_FOREIGN_ORBIT
     )
     mock_get_orbit_by_id.return_value = Mock(id=_ORBIT, bucket_secret_id=uuid7())
-    mock_get_storage_client.return_value.get_download_url.return_value = "url"
+    mock_get_download_url.return_value = "url"
 
     with pytest.raises(ArtifactNotFoundError) as error:
         await handler.get_satellite_artifact(_ORBIT, _ARTIFACT)
@@ -3005,11 +3245,11 @@ async def test_get_satellite_artifact_rejects_artifact_outside_orbit(
     assert error.value.status_code == 404
     mock_get_collection.assert_awaited_once_with(_FOREIGN_COLLECTION)
     mock_get_orbit_by_id.assert_not_awaited()
-    mock_get_storage_client.assert_not_awaited()
+    mock_get_download_url.assert_not_awaited()
 
 
 @patch(
-    "luml.handlers.artifacts.ArtifactHandler._get_storage_client",
+    "luml.handlers.artifacts.ArtifactHandler._get_download_url",
     new_callable=AsyncMock,
 )
 @patch(
@@ -3029,7 +3269,7 @@ async def test_get_satellite_artifact_collection_not_found(
     mock_get_artifact: AsyncMock,
     mock_get_collection: AsyncMock,
     mock_get_orbit_by_id: AsyncMock,
-    mock_get_storage_client: AsyncMock,
+    mock_get_download_url: AsyncMock,
     manifest_example: Manifest,
 ) -> None:
     mock_get_artifact.return_value = _make_artifact(
@@ -3037,10 +3277,39 @@ async def test_get_satellite_artifact_collection_not_found(
     )
     mock_get_collection.return_value = None
     mock_get_orbit_by_id.return_value = Mock(id=_ORBIT, bucket_secret_id=uuid7())
-    mock_get_storage_client.return_value.get_download_url.return_value = "url"
+    mock_get_download_url.return_value = "url"
 
     with pytest.raises(ArtifactNotFoundError) as error:
         await handler.get_satellite_artifact(_ORBIT, _ARTIFACT)
 
     assert error.value.status_code == 404
-    mock_get_storage_client.assert_not_awaited()
+    mock_get_download_url.assert_not_awaited()
+
+
+@patch(
+    "luml.handlers.artifacts.ArtifactRepository.ensure_metric_sort_indexes",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_ensure_metric_sort_indexes_swallows_errors(
+    mock_ensure_indexes: AsyncMock,
+) -> None:
+    mock_ensure_indexes.side_effect = RuntimeError("lock timeout")
+
+    await ArtifactHandler.ensure_metric_sort_indexes()
+
+    mock_ensure_indexes.assert_awaited_once()
+
+
+@patch("luml.handlers.artifacts.config.METRIC_SORT_INDEX_LIMIT", 0)
+@patch(
+    "luml.handlers.artifacts.ArtifactRepository.ensure_metric_sort_indexes",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_ensure_metric_sort_indexes_disabled(
+    mock_ensure_indexes: AsyncMock,
+) -> None:
+    await ArtifactHandler.ensure_metric_sort_indexes()
+
+    mock_ensure_indexes.assert_not_awaited()
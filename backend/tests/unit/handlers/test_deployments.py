@@ -5,9 +5,9 @@ from uuid import UUID, uuid7
 import pytest
 from fastapi import status
 from luml.handlers.deployments import DeploymentHandler
+from luml.handlers.permissions import PermissionsHandler
 from luml.infra.exceptions import (
     ApplicationError,
-    InsufficientPermissionsError,
     NotFoundError,
 )
 from luml.schemas.deployment import (
@@ -20,7 +20,7 @@ from luml.schemas.deployment import (
     DeploymentUpdate,
     DeploymentUpdateIn,
 )
-from luml.schemas.permissions import Action, Resource
+from luml.schemas.permissions import Action, ApiKeyOrbitAccess, Resource
 from luml.schemas.satellite import (
     SatelliteQueueTask,
     SatelliteTaskStatus,
@@ -1104,166 +1104,68 @@ async def test_update_worker_deployment_not_found(
     )
 
 
-@patch(
-    "luml.handlers.deployments.PermissionsHandler.check_permissions",
-    new_callable=AsyncMock,
-)
-@patch(
-    "luml.handlers.deployments.OrbitRepository.get_orbit_by_id",
-    new_callable=AsyncMock,
-)
-@patch(
-    "luml.handlers.deployments.APIKeyHandler.authenticate_api_key",
-    new_callable=AsyncMock,
-)
-@pytest.mark.asyncio
-async def test_verify_user_inference_access(
-    mock_authenticate_api_key: AsyncMock,
-    mock_get_orbit_by_id: AsyncMock,
-    mock_check_permissions: AsyncMock,
-) -> None:
-    api_key = "test_api_key"
-    user_id = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
-    organization_id = UUID("0199c337-09f2-7af1-af5e-83fd7a5b51a0")
-    orbit_id = UUID("0199c337-09f3-753e-9def-b27745e69be6")
-
-    mock_authenticate_api_key.return_value = Mock(id=user_id)
-    mock_get_orbit_by_id.return_value = Mock(
-        id=orbit_id, organization_id=organization_id
-    )
+ORBIT_ID = UUID("0199c337-09f3-753e-9def-b27745e69be6")
+INFERENCE_USER_ID = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
 
-    result = await handler.verify_user_inference_access(orbit_id, api_key)
 
-    assert result is True
-    mock_authenticate_api_key.assert_awaited_once_with(api_key)
-    mock_get_orbit_by_id.assert_awaited_once_with(orbit_id)
-    mock_check_permissions.assert_awaited_once_with(
-        organization_id, user_id, Resource.DEPLOYMENT, Action.READ, orbit_id
+def _api_key_access(
+    organization_role: str | None = "member", orbit_role: str | None = None
+) -> ApiKeyOrbitAccess:
+    return ApiKeyOrbitAccess(
+        user_id=INFERENCE_USER_ID,
+        organization_id=UUID("0199c337-09f2-7af1-af5e-83fd7a5b51a0"),
+        organization_role=organization_role,
+        orbit_role=orbit_role,
     )
 
 
-@patch(
-    "luml.handlers.deployments.APIKeyHandler.authenticate_api_key",
-    new_callable=AsyncMock,
+@pytest.mark.parametrize(
+    ("access", "expected"),
+    [
+        (_api_key_access(organization_role="owner"), True),
+        (_api_key_access(orbit_role="member"), True),
+        (_api_key_access(), False),
+        (_api_key_access(organization_role=None, orbit_role="member"), False),
+        (None, False),
+    ],
 )
-@pytest.mark.asyncio
-async def test_verify_user_inference_access_invalid_api_key(
-    mock_authenticate_api_key: AsyncMock,
-) -> None:
-    api_key = "invalid_api_key"
-    orbit_id = UUID("0199c337-09f3-753e-9def-b27745e69be6")
-
-    mock_authenticate_api_key.return_value = None
-
-    result = await handler.verify_user_inference_access(orbit_id, api_key)
-
-    assert result is False
-    mock_authenticate_api_key.assert_awaited_once_with(api_key)
-
-
 @patch(
-    "luml.handlers.deployments.OrbitRepository.get_orbit_by_id",
-    new_callable=AsyncMock,
-)
-@patch(
-    "luml.handlers.deployments.APIKeyHandler.authenticate_api_key",
+    "luml.handlers.permissions.OrbitRepository.get_api_key_orbit_access",
     new_callable=AsyncMock,
 )
 @pytest.mark.asyncio
-async def test_verify_user_inference_access_orbit_not_found(
-    mock_authenticate_api_key: AsyncMock,
-    mock_get_orbit_by_id: AsyncMock,
-) -> None:
-    api_key = "test_api_key"
-    user_id = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
-    orbit_id = UUID("0199c337-09f3-753e-9def-b27745e69be6")
-
-    mock_authenticate_api_key.return_value = Mock(id=user_id)
-    mock_get_orbit_by_id.return_value = None
-
-    result = await handler.verify_user_inference_access(orbit_id, api_key)
-
-    assert result is False
-    mock_authenticate_api_key.assert_awaited_once_with(api_key)
-    mock_get_orbit_by_id.assert_awaited_once_with(orbit_id)
-
-
-@patch(
-    "luml.handlers.deployments.PermissionsHandler.check_permissions",
-    new_callable=AsyncMock,
-)
-@patch(
-    "luml.handlers.deployments.OrbitRepository.get_orbit_by_id",
-    new_callable=AsyncMock,
-)
-@patch(
-    "luml.handlers.deployments.APIKeyHandler.authenticate_api_key",
-    new_callable=AsyncMock,
-)
-@pytest.mark.asyncio
-async def test_verify_user_inference_access_insufficient_permissions(
-    mock_authenticate_api_key: AsyncMock,
-    mock_get_orbit_by_id: AsyncMock,
-    mock_check_permissions: AsyncMock,
+async def test_verify_user_inference_access(
+    mock_get_access: AsyncMock, access: ApiKeyOrbitAccess | None, expected: bool
 ) -> None:
-    api_key = "test_api_key"
-    user_id = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
-    organization_id = UUID("0199c337-09f2-7af1-af5e-83fd7a5b51a0")
-    orbit_id = UUID("0199c337-09f3-753e-9def-b27745e69be6")
+    mock_get_access.return_value = access
 
-    mock_user = Mock(id=user_id)
-    mock_orbit = Mock(id=orbit_id, organization_id=organization_id)
+    result = await handler.verify_user_inference_access(ORBIT_ID, "test_api_key")
 
-    mock_authenticate_api_key.return_value = mock_user
-    mock_get_orbit_by_id.return_value = mock_orbit
-    mock_check_permissions.side_effect = InsufficientPermissionsError()
+    assert result is expected
+    hashed_api_key, orbit_id = mock_get_access.await_args.args
+    assert orbit_id == ORBIT_ID
+    assert hashed_api_key != "test_api_key"
 
-    result = await handler.verify_user_inference_access(orbit_id, api_key)
 
-    assert result is False
-    mock_authenticate_api_key.assert_awaited_once_with(api_key)
-    mock_get_orbit_by_id.assert_awaited_once_with(orbit_id)
-    mock_check_permissions.assert_awaited_once_with(
-        organization_id, user_id, Resource.DEPLOYMENT, Action.READ, orbit_id
-    )
-
-
-@patch(
-    "luml.handlers.deployments.PermissionsHandler.check_permissions",
-    new_callable=AsyncMock,
-)
-@patch(
-    "luml.handlers.deployments.OrbitRepository.get_orbit_by_id",
-    new_callable=AsyncMock,
-)
 @patch(
-    "luml.handlers.deployments.APIKeyHandler.authenticate_api_key",
+    "luml.handlers.permissions.OrbitRepository.get_api_key_orbit_access",
     new_callable=AsyncMock,
 )
 @pytest.mark.asyncio
-async def test_verify_user_inference_access_orbit_ownership_rejected(
-    mock_authenticate_api_key: AsyncMock,
-    mock_get_orbit_by_id: AsyncMock,
-    mock_check_permissions: AsyncMock,
+async def test_verify_user_inference_access_cached_until_membership_change(
+    mock_get_access: AsyncMock,
 ) -> None:
-    """check_permissions may now raise NotFoundError; it must not escape as a 404."""
-    api_key = "test_api_key"
-    user_id = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
-    organization_id = UUID("0199c337-09f2-7af1-af5e-83fd7a5b51a0")
-    orbit_id = UUID("0199c337-09f3-753e-9def-b27745e69be6")
+    mock_get_access.return_value = _api_key_access(orbit_role="member")
 
-    mock_authenticate_api_key.return_value = Mock(id=user_id)
-    mock_get_orbit_by_id.return_value = Mock(
-        id=orbit_id, organization_id=organization_id
-    )
-    mock_check_permissions.side_effect = NotFoundError("Orbit not found")
+    assert await handler.verify_user_inference_access(ORBIT_ID, "test_api_key")
+    assert await handler.verify_user_inference_access(ORBIT_ID, "test_api_key")
+    mock_get_access.assert_awaited_once()
 
-    result = await handler.verify_user_inference_access(orbit_id, api_key)
+    mock_get_access.return_value = _api_key_access()
+    PermissionsHandler.invalidate_user(INFERENCE_USER_ID)
 
-    assert result is False
-    mock_check_permissions.assert_awaited_once_with(
-        organization_id, user_id, Resource.DEPLOYMENT, Action.READ, orbit_id
-    )
+    assert not await handler.verify_user_inference_access(ORBIT_ID, "test_api_key")
+    assert mock_get_access.await_count == 2
 
 
 @patch(
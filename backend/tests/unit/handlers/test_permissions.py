@@ -399,3 +399,99 @@ async def test_check_permissions_without_orbit_skips_orbit_lookup(
     await handler.check_permissions(ORG_A, USER_A, Resource.ORBIT, Action.CREATE)
 
     mock_get_orbit_simple.assert_not_awaited()
+
+
+@patch(
+    "luml.handlers.permissions.UserRepository.get_organization_member_role",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.permissions.OrbitRepository.get_orbit_simple",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.permissions.OrbitRepository.get_orbit_member_role",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_check_permissions_reuses_resolved_memberships(
+    mock_get_orbit_member_role: AsyncMock,
+    mock_get_orbit_simple: AsyncMock,
+    mock_get_organization_member_role: AsyncMock,
+) -> None:
+    mock_get_organization_member_role.return_value = OrgRole.MEMBER.value
+    mock_get_orbit_simple.side_effect = scoped_orbit_lookup(ORBIT_A, ORG_A)
+    mock_get_orbit_member_role.return_value = OrbitRole.ADMIN.value
+
+    for _ in range(3):
+        await handler.check_permissions(
+            ORG_A, USER_A, Resource.ARTIFACT, Action.LIST, ORBIT_A
+        )
+
+    mock_get_organization_member_role.assert_awaited_once_with(ORG_A, USER_A)
+    mock_get_orbit_simple.assert_awaited_once_with(ORBIT_A, ORG_A)
+    mock_get_orbit_member_role.assert_awaited_once_with(ORBIT_A, USER_A)
+
+
+@patch(
+    "luml.handlers.permissions.UserRepository.get_organization_member_role",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.permissions.OrbitRepository.get_orbit_simple",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.permissions.OrbitRepository.get_orbit_member_role",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_check_permissions_sees_role_change_after_invalidation(
+    mock_get_orbit_member_role: AsyncMock,
+    mock_get_orbit_simple: AsyncMock,
+    mock_get_organization_member_role: AsyncMock,
+) -> None:
+    mock_get_organization_member_role.return_value = OrgRole.MEMBER.value
+    mock_get_orbit_simple.side_effect = scoped_orbit_lookup(ORBIT_A, ORG_A)
+    mock_get_orbit_member_role.return_value = OrbitRole.ADMIN.value
+
+    await handler.check_permissions(
+        ORG_A, USER_A, Resource.ORBIT_USER, Action.CREATE, ORBIT_A
+    )
+
+    mock_get_orbit_member_role.return_value = OrbitRole.MEMBER.value
+    handler.invalidate_user(USER_A)
+
+    with pytest.raises(InsufficientPermissionsError):
+        await handler.check_permissions(
+            ORG_A, USER_A, Resource.ORBIT_USER, Action.CREATE, ORBIT_A
+        )
+    assert mock_get_orbit_member_role.await_count == 2
+
+
+@patch(
+    "luml.handlers.permissions.UserRepository.get_organization_member_role",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.permissions.OrbitRepository.get_orbit_simple",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_deleted_orbit_is_not_served_from_cache(
+    mock_get_orbit_simple: AsyncMock,
+    mock_get_organization_member_role: AsyncMock,
+) -> None:
+    mock_get_organization_member_role.return_value = OrgRole.OWNER.value
+    mock_get_orbit_simple.side_effect = scoped_orbit_lookup(ORBIT_A, ORG_A)
+
+    await handler.check_permissions(ORG_A, USER_A, Resource.ORBIT, Action.READ, ORBIT_A)
+
+    mock_get_orbit_simple.side_effect = None
+    mock_get_orbit_simple.return_value = None
+    handler.invalidate_orbit(ORBIT_A)
+
+    with pytest.raises(NotFoundError):
+        await handler.check_permissions(
+            ORG_A, USER_A, Resource.ORBIT, Action.READ, ORBIT_A
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -10,6 +11,7 @@ from luml.infra.exceptions import (
     DatabaseConstraintError,
     NotFoundError,
 )
+from luml.infra.task_notifier import task_notifier
 from luml.schemas.permissions import Action, Resource
 from luml.schemas.satellite import (
     Satellite,
@@ -456,17 +458,14 @@ async def test_pair_satellite_update_error(
     mock_pair_satellite.assert_awaited_once()
 
 
-@patch(
-    "luml.handlers.satellites.SatelliteRepository.touch_last_seen",
-    new_callable=AsyncMock,
-)
+@patch("luml.handlers.satellites.LastSeenBatcher.touch")
 @pytest.mark.asyncio
-async def test_touch_last_seen(mock_touch_last_seen: AsyncMock) -> None:
+async def test_touch_last_seen(mock_touch: Mock) -> None:
     satellite_id = UUID("0199c418-8be4-737c-a5e4-997685950d42")
 
     await handler.touch_last_seen(satellite_id)
 
-    mock_touch_last_seen.assert_awaited_once_with(satellite_id)
+    mock_touch.assert_called_once_with(satellite_id)
 
 
 @patch(
@@ -525,6 +524,47 @@ async def test_list_tasks_with_status(mock_list_tasks: AsyncMock) -> None:
     mock_list_tasks.assert_awaited_once_with(satellite_id, status)
 
 
+@patch(
+    "luml.handlers.satellites.SatelliteRepository.list_tasks",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_list_tasks_long_poll_wakes_on_notify(mock_list_tasks: AsyncMock) -> None:
+    satellite_id = uuid4()
+    queued = [Mock(status=SatelliteTaskStatus.PENDING)]
+    mock_list_tasks.side_effect = [[], queued]
+
+    async def _enqueue() -> None:
+        await asyncio.sleep(0.05)
+        task_notifier.notify(satellite_id)
+
+    enqueue = asyncio.create_task(_enqueue())
+    started = asyncio.get_running_loop().time()
+    tasks = await handler.list_tasks(satellite_id, SatelliteTaskStatus.PENDING, wait=10)
+    elapsed = asyncio.get_running_loop().time() - started
+    await enqueue
+
+    assert tasks == queued
+    assert elapsed < 0.5
+    assert mock_list_tasks.await_count == 2
+
+
+@patch(
+    "luml.handlers.satellites.SatelliteRepository.list_tasks",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_list_tasks_long_poll_returns_empty_after_wait(
+    mock_list_tasks: AsyncMock,
+) -> None:
+    mock_list_tasks.return_value = []
+
+    tasks = await handler.list_tasks(uuid4(), SatelliteTaskStatus.PENDING, wait=0.05)
+
+    assert tasks == []
+    assert mock_list_tasks.await_count >= 2
+
+
 @patch(
     "luml.handlers.satellites.SatelliteRepository.update_task_status",
     new_callable=AsyncMock,
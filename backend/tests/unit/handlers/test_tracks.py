@@ -650,6 +650,161 @@ async def test_create_entry_stage_already_used(
     assert exc.value.status_code == 409
 
 
+@patch(
+    "luml.handlers.permissions.PermissionsHandler.check_permissions",
+    new_callable=AsyncMock,
+)
+@patch("luml.handlers.tracks.TrackRepository.get_track", new_callable=AsyncMock)
+@patch(
+    "luml.handlers.tracks.ArtifactRepository.get_orbit_artifacts_by_ids",
+    new_callable=AsyncMock,
+)
+@patch("luml.handlers.tracks.TrackStageRepository.list_stages", new_callable=AsyncMock)
+@patch(
+    "luml.handlers.tracks.TrackEntryRepository.list_entries_by_stages",
+    new_callable=AsyncMock,
+)
+@patch(
+    "luml.handlers.tracks.TrackEntryRepository.create_entries",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_create_entries(
+    mock_create: AsyncMock,
+    mock_by_stages: AsyncMock,
+    mock_list_stages: AsyncMock,
+    mock_get_arts: AsyncMock,
+    mock_get_track: AsyncMock,
+    mock_perms: AsyncMock,
+) -> None:
+    other_artifact = UUID("0199c337-09fe-7a01-9f5f-000000000098")
+    mock_get_track.return_value = _make_track()
+    mock_get_arts.return_value = [Mock(type="model"), Mock(type="model")]
+    mock_list_stages.return_value = [_make_stage()]
+    mock_by_stages.return_value = []
+    expected = [
+        _make_entry(version=1, stage_id=STAGE_ID),
+        _make_entry(version=2, artifact_id=other_artifact),
+    ]
+    mock_create.return_value = expected
+
+    result = await tracks_handler.create_entries(
+        USER_ID,
+        ORG_ID,
+        ORBIT_ID,
+        TRACK_ID,
+        [
+            TrackEntryCreateIn(artifact_id=ARTIFACT_ID, stage_id=STAGE_ID),
+            TrackEntryCreateIn(artifact_id=other_artifact),
+        ],
+    )
+
+    assert result == expected
+    mock_get_arts.assert_awaited_once_with([ARTIFACT_ID, other_artifact], ORBIT_ID)
+    mock_by_stages.assert_awaited_once_with(TRACK_ID, [STAGE_ID])
+    track_id, entries = mock_create.await_args.args
+    assert track_id == TRACK_ID
+    assert [e.stage_id for e in entries] == [STAGE_ID, None]
+    assert all(e.added_by == USER_ID for e in entries)
+
+
+@patch(
+    "luml.handlers.permissions.PermissionsHandler.check_permissions",
+    new_callable=AsyncMock,
+)
+@patch("luml.handlers.tracks.TrackRepository.get_track", new_callable=AsyncMock)
+@patch(
+    "luml.handlers.tracks.ArtifactRepository.get_orbit_artifacts_by_ids",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_create_entries_artifact_outside_orbit(
+    mock_get_arts: AsyncMock,
+    mock_get_track: AsyncMock,
+    mock_perms: AsyncMock,
+) -> None:
+    other_artifact = UUID("0199c337-09fe-7a01-9f5f-000000000098")
+    mock_get_track.return_value = _make_track()
+    mock_get_arts.return_value = [Mock(type="model")]
+
+    with pytest.raises(NotFoundError, match="Artifact not found"):
+        await tracks_handler.create_entries(
+            USER_ID,
+            ORG_ID,
+            ORBIT_ID,
+            TRACK_ID,
+            [
+                TrackEntryCreateIn(artifact_id=ARTIFACT_ID),
+                TrackEntryCreateIn(artifact_id=other_artifact),
+            ],
+        )
+
+
+@patch(
+    "luml.handlers.permissions.PermissionsHandler.check_permissions",
+    new_callable=AsyncMock,
+)
+@patch("luml.handlers.tracks.TrackRepository.get_track", new_callable=AsyncMock)
+@patch(
+    "luml.handlers.tracks.ArtifactRepository.get_orbit_artifacts_by_ids",
+    new_callable=AsyncMock,
+)
+@patch("luml.handlers.tracks.TrackStageRepository.list_stages", new_callable=AsyncMock)
+@patch(
+    "luml.handlers.tracks.TrackEntryRepository.list_entries_by_stages",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_create_entries_stage_already_used(
+    mock_by_stages: AsyncMock,
+    mock_list_stages: AsyncMock,
+    mock_get_arts: AsyncMock,
+    mock_get_track: AsyncMock,
+    mock_perms: AsyncMock,
+) -> None:
+    mock_get_track.return_value = _make_track()
+    mock_get_arts.return_value = [Mock(type="model")]
+    mock_list_stages.return_value = [_make_stage()]
+    mock_by_stages.return_value = [_make_entry(version=2, stage_id=STAGE_ID)]
+
+    with pytest.raises(ApplicationError, match="already assigned to v2") as exc:
+        await tracks_handler.create_entries(
+            USER_ID,
+            ORG_ID,
+            ORBIT_ID,
+            TRACK_ID,
+            [TrackEntryCreateIn(artifact_id=ARTIFACT_ID, stage_id=STAGE_ID)],
+        )
+    assert exc.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_create_entries_duplicate_artifacts() -> None:
+    with (
+        patch(
+            "luml.handlers.permissions.PermissionsHandler.check_permissions",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "luml.handlers.tracks.TrackRepository.get_track",
+            new_callable=AsyncMock,
+            return_value=_make_track(),
+        ),
+        pytest.raises(ApplicationError, match="Duplicate artifacts") as exc,
+    ):
+        await tracks_handler.create_entries(
+            USER_ID,
+            ORG_ID,
+            ORBIT_ID,
+            TRACK_ID,
+            [
+                TrackEntryCreateIn(artifact_id=ARTIFACT_ID),
+                TrackEntryCreateIn(artifact_id=ARTIFACT_ID),
+            ],
+        )
+    assert exc.value.status_code == 422
+
+
 @patch(
     "luml.handlers.permissions.PermissionsHandler.check_permissions",
     new_callable=AsyncMock,
@@ -0,0 +1,84 @@
+import operator
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from luml.infra.batching import WriteBatcher
+from luml.infra.last_seen import LastSeenBatcher
+from luml.infra.metric_sorts import MetricSortBatcher, MetricSortCounts
+
+ENTITY_A = UUID("0199c418-8be4-737c-a5e4-997685950d42")
+ENTITY_B = UUID("0199c418-8be4-737c-a5e4-997685950d43")
+
+
+@pytest.mark.asyncio
+async def test_values_are_combined_into_one_write() -> None:
+    writes: list[dict[UUID, int]] = []
+
+    async def write(values: dict[UUID, int]) -> None:
+        writes.append(values)
+
+    batcher = WriteBatcher(write, interval=3600, combine=operator.add, label="counts")
+    for _ in range(3):
+        batcher.add(ENTITY_A, 1)
+    batcher.add(ENTITY_B, 1)
+
+    assert writes == []
+    await batcher.close()
+
+    assert writes == [{ENTITY_A: 3, ENTITY_B: 1}]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_merged_into_next_flush() -> None:
+    writes: list[dict[UUID, int]] = []
+    fail = True
+
+    async def write(values: dict[UUID, int]) -> None:
+        if fail:
+            raise RuntimeError("database unavailable")
+        writes.append(values)
+
+    batcher = WriteBatcher(write, interval=3600, combine=operator.add, label="counts")
+    batcher.add(ENTITY_A, 1)
+
+    with pytest.raises(RuntimeError):
+        await batcher.flush()
+
+    batcher.add(ENTITY_A, 1)
+    fail = False
+    await batcher.close()
+
+    assert writes == [{ENTITY_A: 2}]
+
+
+@pytest.mark.asyncio
+async def test_last_seen_keeps_latest_touch() -> None:
+    writes: list[dict[UUID, datetime]] = []
+
+    async def write(seen: dict[UUID, datetime]) -> None:
+        writes.append(seen)
+
+    batcher = LastSeenBatcher(write, interval=3600)
+    batcher.touch(ENTITY_A)
+    first = batcher._pending[ENTITY_A]
+    batcher.touch(ENTITY_A)
+    await batcher.close()
+
+    assert len(writes) == 1
+    assert writes[0][ENTITY_A] >= first
+
+
+@pytest.mark.asyncio
+async def test_metric_sorts_count_per_collection_and_key() -> None:
+    writes: list[MetricSortCounts] = []
+
+    async def write(counts: MetricSortCounts) -> None:
+        writes.append(counts)
+
+    batcher = MetricSortBatcher(write, interval=3600)
+    batcher.record([ENTITY_A], "accuracy")
+    batcher.record([ENTITY_A, ENTITY_B], "accuracy")
+    await batcher.close()
+
+    assert writes == [{(ENTITY_A, "accuracy"): 2, (ENTITY_B, "accuracy"): 1}]
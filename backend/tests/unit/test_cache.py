@@ -0,0 +1,88 @@
+from typing import Any
+
+import pytest
+from luml.infra.cache import (
+    RequestMemoMiddleware,
+    TTLCache,
+    invalidate,
+    memoized,
+    request_memo,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(ttl=5.0, clock=clock)
+
+    cache.set("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl=60.0, max_size=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_with_zero_ttl_stores_nothing() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_memoized_caches_none_values() -> None:
+    cache: TTLCache[str, int | None] = TTLCache(ttl=60.0)
+    calls = 0
+
+    async def load() -> None:
+        nonlocal calls
+        calls += 1
+
+    assert await memoized(cache, "k", load) is None
+    assert await memoized(cache, "k", load) is None
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_request_memo_is_scoped_to_one_request() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl=0)
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:  # noqa: ANN401
+        assert request_memo() is not None
+        first = await memoized(cache, "k", load)
+        assert await memoized(cache, "k", load) == first
+        invalidate(cache, lambda key: key == "k")
+        assert await memoized(cache, "k", load) == first + 1
+
+    middleware = RequestMemoMiddleware(app)
+    await middleware({"type": "http"}, None, None)  # type: ignore[arg-type]
+    await middleware({"type": "http"}, None, None)  # type: ignore[arg-type]
+
+    assert calls == 4
+    assert request_memo() is None
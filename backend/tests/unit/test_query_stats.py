@@ -0,0 +1,121 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from luml.infra.query_stats import (
+    QueryStatsMiddleware,
+    fingerprint,
+    instrument_engine,
+    track_queries,
+)
+from sqlalchemy import create_engine, text
+from starlette.authentication import (
+    AuthCredentials,
+    AuthenticationBackend,
+    SimpleUser,
+)
+from starlette.middleware.authentication import AuthenticationMiddleware
+from starlette.requests import HTTPConnection
+
+
+def test_fingerprint_collapses_values() -> None:
+    first = fingerprint(
+        "SELECT * FROM artifacts\n WHERE id IN ($1, $2, $3) AND name = 'a''b' LIMIT 10"
+    )
+    second = fingerprint(
+        "SELECT * FROM artifacts WHERE id IN ($1) AND name = 'c' LIMIT 5"
+    )
+
+    assert (
+        first
+        == second
+        == "SELECT * FROM artifacts WHERE id IN (?) AND name = ? LIMIT ?"
+    )
+    assert fingerprint("SELECT col1 FROM t2") == "SELECT col1 FROM t2"
+
+
+def test_track_queries_counts_statements() -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, slow_query_ms=1000)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries(record_statements=True) as stats:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        with track_queries() as counted_only:
+            conn.execute(text("SELECT 3"))
+
+    assert stats.queries == 2
+    assert stats.statements == ["SELECT 1", "SELECT 2"]
+    assert stats.db_time > 0
+    assert counted_only.queries == 1
+    assert counted_only.statements == []
+
+
+def test_query_stats_middleware_sets_server_timing() -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, slow_query_ms=1000)
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/")
+    async def read_root() -> dict[str, int]:
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text(f"SELECT {i}"))
+        return {"ok": 1}
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 200
+    assert 'desc="3 queries"' in response.headers["server-timing"]
+    assert "db-pool;dur=" in response.headers["server-timing"]
+
+
+def test_query_stats_middleware_counts_authentication_queries() -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, slow_query_ms=1000)
+
+    class QueryingBackend(AuthenticationBackend):
+        async def authenticate(
+            self, conn: HTTPConnection
+        ) -> tuple[AuthCredentials, SimpleUser]:
+            with engine.connect() as db:
+                db.execute(text("SELECT 1"))
+            return AuthCredentials(["authenticated"]), SimpleUser("user")
+
+    app = FastAPI()
+    # Same order as the service: authentication first, query stats last.
+    app.add_middleware(AuthenticationMiddleware, backend=QueryingBackend())
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/")
+    async def read_root() -> dict[str, int]:
+        return {"ok": 1}
+
+    response = TestClient(app).get("/")
+
+    assert 'desc="1 queries"' in response.headers["server-timing"]
+
+
+def test_query_stats_middleware_logs_repeated_statements_at_debug(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, slow_query_ms=1000)
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/")
+    async def read_root() -> dict[str, int]:
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text(f"SELECT {i}"))
+        return {"ok": 1}
+
+    with caplog.at_level(logging.DEBUG, logger="luml.infra.query_stats"):
+        TestClient(app).get("/")
+
+    assert "3x SELECT ?" in caplog.text
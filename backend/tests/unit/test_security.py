@@ -1,11 +1,12 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import UUID
 
 import pytest
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Request
 from fastapi.testclient import TestClient
 from luml.handlers.auth import AuthHandler
 from luml.infra.dependencies import UserAuthentication
+from luml.infra.principals import principal_cache
 from luml.infra.security import JWTAuthenticationBackend
 from luml.schemas.user import UserOut
 from luml.settings import config
@@ -13,6 +14,8 @@ from starlette.middleware.authentication import AuthenticationMiddleware
 
 EMAIL = "caller@example.com"
 USER_ID = UUID("0199c337-09f1-7d8f-b0c4-b68349bbe24b")
+SATELLITE_ID = UUID("0199c418-8be4-737c-a5e4-997685950d42")
+ORBIT_ID = UUID("0199c337-0a02-753e-9def-b27745e69be6")
 
 token_minter = AuthHandler(secret_key=config.AUTH_SECRET_KEY)
 
@@ -94,3 +97,70 @@ def test_access_token_authenticates_api_requests(
     )
 
     assert response.status_code == 200
+
+
+@patch(
+    "luml.handlers.auth.TokenBlackListRepository.is_token_blacklisted",
+    new_callable=AsyncMock,
+)
+@patch("luml.handlers.auth.UserRepository.get_public_user", new_callable=AsyncMock)
+def test_verified_principal_is_reused_until_revoked(
+    mock_get_public_user: AsyncMock,
+    mock_is_token_blacklisted: AsyncMock,
+    bearer_tokens: dict[str, str],
+) -> None:
+    mock_is_token_blacklisted.return_value = False
+    mock_get_public_user.return_value = UserOut(
+        id=USER_ID,
+        email=EMAIL,
+        full_name="Caller",
+        disabled=False,
+        photo=None,
+        has_api_key=False,
+    )
+    client = _client()
+    headers = {"Authorization": f"Bearer {bearer_tokens['access']}"}
+
+    for _ in range(3):
+        assert client.get("/protected", headers=headers).status_code == 200
+    mock_is_token_blacklisted.assert_awaited_once()
+    mock_get_public_user.assert_awaited_once()
+
+    principal_cache.revoke_token(bearer_tokens["access"])
+    mock_is_token_blacklisted.return_value = True
+
+    assert client.get("/protected", headers=headers).status_code == 401
+
+
+@patch(
+    "luml.handlers.satellites.SatelliteRepository.get_satellite_by_hash",
+    new_callable=AsyncMock,
+)
+@patch("luml.handlers.satellites.LastSeenBatcher.touch")
+def test_cached_satellite_key_still_records_last_seen(
+    mock_touch: Mock,
+    mock_get_satellite_by_hash: AsyncMock,
+) -> None:
+    satellite = Mock(id=SATELLITE_ID, orbit_id=ORBIT_ID)
+    mock_get_satellite_by_hash.return_value = satellite
+    app = FastAPI()
+
+    @app.get("/worker")
+    async def worker(request: Request) -> dict[str, str]:
+        return {"user": request.user.display_name}
+
+    app.add_middleware(AuthenticationMiddleware, backend=JWTAuthenticationBackend())
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer dfssat_key"}
+
+    for _ in range(3):
+        response = client.get("/worker", headers=headers)
+        assert response.json() == {"user": f"satellite-{SATELLITE_ID}"}
+
+    mock_get_satellite_by_hash.assert_awaited_once()
+    assert mock_touch.call_count == 3
+
+    principal_cache.revoke_satellite(SATELLITE_ID)
+    mock_get_satellite_by_hash.return_value = None
+
+    assert client.get("/worker", headers=headers).json() == {"user": ""}
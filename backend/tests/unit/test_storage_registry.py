@@ -0,0 +1,71 @@
+import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from luml.clients.storage_registry import StorageClientRegistry
+from luml.schemas.bucket_secrets import S3BucketSecret
+
+
+def _storage_client(url: str = "https://s3.example.com/signed") -> Mock:
+    client = Mock()
+    client.get_download_url = AsyncMock(return_value=url)
+    return client
+
+
+@patch("luml.clients.storage_registry.create_storage_client")
+def test_get_client_reused_per_secret_version(
+    mock_create_storage_client: Mock, test_bucket: S3BucketSecret
+) -> None:
+    registry = StorageClientRegistry(secret_ttl=60, url_reuse_margin=60)
+    mock_create_storage_client.return_value = Mock(
+        side_effect=lambda secret: Mock(secret=secret)
+    )
+
+    first = registry.get_client(test_bucket)
+    assert registry.get_client(test_bucket) is first
+
+    edited = test_bucket.model_copy(
+        update={"updated_at": datetime.datetime.now() + datetime.timedelta(seconds=1)}
+    )
+    assert registry.get_client(edited) is not first
+    assert mock_create_storage_client.call_count == 2
+
+
+@patch("luml.clients.storage_registry.create_storage_client")
+@pytest.mark.asyncio
+async def test_get_download_urls_signs_each_object_once(
+    mock_create_storage_client: Mock, test_bucket: S3BucketSecret
+) -> None:
+    registry = StorageClientRegistry(secret_ttl=60, url_reuse_margin=60)
+    client = _storage_client()
+    mock_create_storage_client.return_value = Mock(return_value=client)
+
+    urls = await registry.get_download_urls(test_bucket, ["a.luml", "b.luml", "a.luml"])
+    await registry.get_download_url(test_bucket, "b.luml")
+
+    assert set(urls) == {"a.luml", "b.luml"}
+    assert client.get_download_url.await_count == 2
+
+
+@patch("luml.clients.storage_registry.create_storage_client")
+@pytest.mark.asyncio
+async def test_invalidate_drops_secret_client_and_urls(
+    mock_create_storage_client: Mock, test_bucket: S3BucketSecret
+) -> None:
+    registry = StorageClientRegistry(secret_ttl=60, url_reuse_margin=60)
+    client = _storage_client()
+    mock_create_storage_client.return_value = Mock(return_value=client)
+    load = AsyncMock(return_value=test_bucket)
+
+    assert await registry.get_secret(test_bucket.id, load) == test_bucket
+    await registry.get_secret(test_bucket.id, load)
+    await registry.get_download_url(test_bucket, "a.luml")
+    load.assert_awaited_once_with(test_bucket.id)
+
+    registry.invalidate(test_bucket.id)
+
+    await registry.get_secret(test_bucket.id, load)
+    await registry.get_download_url(test_bucket, "a.luml")
+    assert load.await_count == 2
+    assert client.get_download_url.await_count == 2
+    assert mock_create_storage_client.call_count == 2
@@ -2,6 +2,7 @@ import { watch, onUnmounted, ref } from 'vue'
 import { usePrismaStore } from '@/stores/prisma'
 import { api } from '@/lib/api'
 import type { useUploadFlow } from '@/hooks/useUploadFlow'
+import type { SnapshotResume } from '@/lib/api/prisma/prisma.interfaces'
 
 const MAX_RECONNECT_ATTEMPTS = 20
 const BASE_DELAY_MS = 1000
@@ -21,6 +22,9 @@ export function useAgentWebSocket(uploadFlow?: ReturnType<typeof useUploadFlow>)
   let reconnectAttempts = 0
   let activeRunId: string | null = null
   let intentionalClose = false
+  // Where the graph stood when the socket dropped. Taken before catch-up
+  // advances lastSeq, so the server's delta covers the whole gap.
+  let resumeFrom: SnapshotResume | null = null
   const connected = ref(false)
   const reconnecting = ref(false)
 
@@ -67,7 +71,8 @@ export function useAgentWebSocket(uploadFlow?: ReturnType<typeof useUploadFlow>)
     intentionalClose = false
     activeRunId = runId
 
-    ws = api.dataAgent.createRunWebSocket(runId)
+    ws = api.dataAgent.createRunWebSocket(runId, resumeFrom ?? undefined)
+    resumeFrom = null
 
     ws.onopen = () => {
       connected.value = true
@@ -80,6 +85,8 @@ export function useAgentWebSocket(uploadFlow?: ReturnType<typeof useUploadFlow>)
         const msg = JSON.parse(event.data)
         if (msg.type === 'snapshot') {
           store.applySnapshot(msg.data)
+        } else if (msg.type === 'snapshot_delta') {
+          store.applySnapshotDelta(msg.data)
         } else if (msg.type === 'event') {
           const eventData = msg.data
           if (uploadFlow && eventData.type && UPLOAD_EVENT_TYPES.has(eventData.type)) {
@@ -97,6 +104,9 @@ export function useAgentWebSocket(uploadFlow?: ReturnType<typeof useUploadFlow>)
       connected.value = false
       ws = null
       if (!intentionalClose && activeRunId === runId) {
+        resumeFrom = store.snapshotEpoch
+          ? { since: store.lastSeq, epoch: store.snapshotEpoch }
+          : null
         catchUp(runId)
         scheduleReconnect(runId)
       }
@@ -119,6 +129,7 @@ export function useAgentWebSocket(uploadFlow?: ReturnType<typeof useUploadFlow>)
     (runId) => {
       if (runId != null) {
         reconnectAttempts = 0
+        resumeFrom = null
         connect(runId)
       } else {
         disconnect()
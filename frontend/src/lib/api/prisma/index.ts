@@ -13,6 +13,7 @@ import type {
   RunGraph,
   RunEvent,
   PendingUpload,
+  SnapshotResume,
 } from './prisma.interfaces'
 
 const STORAGE_KEY = 'luml-agent-backend-url'
@@ -257,7 +258,10 @@ export class PrismaApi {
     await this.api.post(`/runs/${runId}/uploads/${uploadId}/artifact-link`, artifactLink)
   }
 
-  createRunWebSocket(runId: string): WebSocket {
-    return new WebSocket(`${this.wsBaseUrl()}/runs/${runId}`)
+  createRunWebSocket(runId: string, resume?: SnapshotResume): WebSocket {
+    const query = resume
+      ? `?since=${resume.since}&epoch=${encodeURIComponent(resume.epoch)}`
+      : ''
+    return new WebSocket(`${this.wsBaseUrl()}/runs/${runId}${query}`)
   }
 }
@@ -177,6 +177,19 @@ export interface RunGraph {
   edges: RunEdge[]
 }
 
+// Sent over the run WebSocket. A `snapshot_delta` carries only the nodes and
+// edges changed after the `since` seq the client reconnected with.
+export interface RunSnapshot extends RunGraph {
+  run?: Run
+  seq?: number
+  epoch?: string
+}
+
+export interface SnapshotResume {
+  since: number
+  epoch: string
+}
+
 export interface RunCreate {
   repository_id: string
   name: string
@@ -1,7 +1,7 @@
 import { describe, it, expect, beforeEach } from 'vitest'
 import { setActivePinia, createPinia } from 'pinia'
 import { usePrismaStore } from '@/stores/prisma'
-import type { AgentTask, Run } from '@/lib/api/prisma/prisma.interfaces'
+import type { AgentTask, Run, RunEdge, RunNode } from '@/lib/api/prisma/prisma.interfaces'
 
 const makeTask = (overrides: Partial<AgentTask> = {}): AgentTask => ({
   id: 'task1',
@@ -141,6 +141,34 @@ describe('prisma store', () => {
       expect(store.edges).toEqual([])
     })
 
+    it('applySnapshotDelta upserts nodes and edges', () => {
+      const node = (id: string, status: string) =>
+        ({ id, status }) as unknown as RunNode
+      const edge = (id: string) => ({ id }) as unknown as RunEdge
+      store.applySnapshot({
+        nodes: [node('n1', 'queued'), node('n2', 'queued')],
+        edges: [edge('e1')],
+        seq: 3,
+        epoch: 'ep1',
+      })
+
+      store.applySnapshotDelta({
+        nodes: [node('n2', 'running'), node('n3', 'queued')],
+        edges: [edge('e1'), edge('e2')],
+        seq: 7,
+        epoch: 'ep1',
+      })
+
+      expect(store.nodes.map((n) => [n.id, n.status])).toEqual([
+        ['n1', 'queued'],
+        ['n2', 'running'],
+        ['n3', 'queued'],
+      ])
+      expect(store.edges.map((e) => e.id)).toEqual(['e1', 'e2'])
+      expect(store.lastSeq).toBe(7)
+      expect(store.snapshotEpoch).toBe('ep1')
+    })
+
     it('removeRun clears selection if selected', () => {
       store.setRuns([makeRun({ id: 'r1' })])
       store.selectRun('r1')
@@ -7,7 +7,7 @@ import type {
   RunNode,
   RunEdge,
   RunEvent,
-  RunGraph,
+  RunSnapshot,
 } from '@/lib/api/prisma/prisma.interfaces'
 
 export const usePrismaStore = defineStore('prisma', () => {
@@ -26,6 +26,7 @@ export const usePrismaStore = defineStore('prisma', () => {
   const edges = ref<RunEdge[]>([])
   const selectedNodeId = ref<string | null>(null)
   const lastSeq = ref(0)
+  const snapshotEpoch = ref<string | null>(null)
 
   const selectedRun = computed(() => runs.value.find((r) => r.id === selectedRunId.value) ?? null)
 
@@ -44,6 +45,7 @@ export const usePrismaStore = defineStore('prisma', () => {
       edges.value = []
       selectedNodeId.value = null
       lastSeq.value = 0
+      snapshotEpoch.value = null
     }
   }
 
@@ -51,15 +53,46 @@ export const usePrismaStore = defineStore('prisma', () => {
     selectedNodeId.value = id
   }
 
-  function applySnapshot(graph: RunGraph & { run?: Run }) {
+  function applySnapshot(graph: RunSnapshot) {
     nodes.value = graph.nodes
     edges.value = graph.edges
-    if (graph.run) {
-      const idx = runs.value.findIndex((r) => r.id === graph.run?.id)
+    // A full snapshot may follow a run restart, where event seqs start over.
+    if (graph.seq !== undefined) {
+      lastSeq.value = graph.seq
+    }
+    applySnapshotRun(graph)
+  }
+
+  function applySnapshotDelta(delta: RunSnapshot) {
+    for (const node of delta.nodes) {
+      const idx = nodes.value.findIndex((n) => n.id === node.id)
+      if (idx >= 0) {
+        nodes.value[idx] = node
+      } else {
+        nodes.value.push(node)
+      }
+    }
+    for (const edge of delta.edges) {
+      if (!edges.value.some((e) => e.id === edge.id)) {
+        edges.value.push(edge)
+      }
+    }
+    applySnapshotRun(delta)
+  }
+
+  function applySnapshotRun(snapshot: RunSnapshot) {
+    if (snapshot.run) {
+      const idx = runs.value.findIndex((r) => r.id === snapshot.run?.id)
       if (idx >= 0) {
-        runs.value[idx] = graph.run
+        runs.value[idx] = snapshot.run
       }
     }
+    if (snapshot.seq !== undefined && snapshot.seq > lastSeq.value) {
+      lastSeq.value = snapshot.seq
+    }
+    if (snapshot.epoch !== undefined) {
+      snapshotEpoch.value = snapshot.epoch
+    }
   }
 
   function applyEvent(event: RunEvent) {
@@ -197,6 +230,7 @@ export const usePrismaStore = defineStore('prisma', () => {
     selectedNodeId,
     selectedNode,
     lastSeq,
+    snapshotEpoch,
     setRuns,
     selectRun,
     selectNode,
@@ -204,6 +238,7 @@ export const usePrismaStore = defineStore('prisma', () => {
     updateTask,
     removeTask,
     applySnapshot,
+    applySnapshotDelta,
     applyEvent,
     updateRun,
     removeRun,
@@ -21,11 +21,14 @@ import type {
   ValidateResponseItem,
 } from './api.interface'
 import { api } from './client'
+import { COLUMNAR_HEADERS, fromColumnarPage, fromColumns } from './columnar'
+import type { ColumnarPage, Columns } from './columnar'
 import type {
   BatchEval,
   Eval,
   Experiment,
   ExperimentMetricHistory,
+  MetricPoint,
   Model,
   Trace,
   TraceDetails,
@@ -115,11 +118,14 @@ export const apiService = {
     maxPoints: number = 1000,
     signal?: AbortSignal,
   ) => {
-    const { data } = await api.get<ExperimentMetricHistory>(
-      `/experiments/${experimentId}/metrics/${encodeURIComponent(metricKey)}`,
-      { params: { max_points: maxPoints }, signal },
-    )
-    return data
+    const { data } = await api.get<
+      Omit<ExperimentMetricHistory, 'history'> & { history: Columns<MetricPoint> }
+    >(`/experiments/${experimentId}/metrics/${encodeURIComponent(metricKey)}`, {
+      params: { max_points: maxPoints },
+      headers: COLUMNAR_HEADERS,
+      signal,
+    })
+    return { ...data, history: fromColumns(data.history) }
   },
 
   getExperimentModels: async (experimentId: string) => {
@@ -129,23 +135,22 @@ export const apiService = {
 
   getExperimentTraces: async (params: GetExperimentTracesParams) => {
     const { experiment_id, ...rest } = params
-    const { data } = await api.get<PaginatedResponse<Trace>>(
-      `/experiments/${experiment_id}/traces`,
-      {
-        params: rest,
-        paramsSerializer: (params) => qs.stringify(params, { arrayFormat: 'repeat' }),
-      },
-    )
-    return data
+    const { data } = await api.get<ColumnarPage<Trace>>(`/experiments/${experiment_id}/traces`, {
+      params: rest,
+      headers: COLUMNAR_HEADERS,
+      paramsSerializer: (params) => qs.stringify(params, { arrayFormat: 'repeat' }),
+    })
+    return fromColumnarPage(data)
   },
 
   getAllExperimentTraces: async (params: GetExperimentTracesParams) => {
     const { experiment_id, ...rest } = params
-    const { data } = await api.get<Trace[]>(`/experiments/${experiment_id}/traces/all`, {
+    const { data } = await api.get<Columns<Trace>>(`/experiments/${experiment_id}/traces/all`, {
       params: rest,
+      headers: COLUMNAR_HEADERS,
       paramsSerializer: (params) => qs.stringify(params, { arrayFormat: 'repeat' }),
     })
-    return data
+    return fromColumns(data)
   },
 
   getTraceDetails: async (experimentId: string, traceId: string) => {
@@ -175,29 +180,32 @@ export const apiService = {
 
   getExperimentEvals: async (params: GetExperimentEvalsParams) => {
     const { experiment_id, ...rest } = params
-    const { data } = await api.get<PaginatedResponse<Eval>>(`/experiments/${experiment_id}/evals`, {
+    const { data } = await api.get<ColumnarPage<Eval>>(`/experiments/${experiment_id}/evals`, {
       params: rest,
+      headers: COLUMNAR_HEADERS,
       paramsSerializer: (params) => qs.stringify(params, { arrayFormat: 'repeat' }),
     })
-    return data
+    return fromColumnarPage(data)
   },
 
   getBatchExperimentEvals: async (params: GetBatchExperimentEvalsParams) => {
     const { experiment_ids, ...rest } = params
-    const { data } = await api.get<PaginatedResponse<BatchEval>>('/experiments/evals/compare', {
+    const { data } = await api.get<ColumnarPage<BatchEval>>('/experiments/evals/compare', {
       params: { experiment_ids, ...rest },
+      headers: COLUMNAR_HEADERS,
       paramsSerializer: (p) => qs.stringify(p, { arrayFormat: 'repeat' }),
     })
-    return data
+    return fromColumnarPage(data)
   },
 
   getAllExperimentEvals: async (params: Omit<GetExperimentEvalsParams, 'limit'>) => {
     const { experiment_id, ...rest } = params
-    const { data } = await api.get<Eval[]>(`/experiments/${experiment_id}/evals/all`, {
+    const { data } = await api.get<Columns<Eval>>(`/experiments/${experiment_id}/evals/all`, {
       params: rest,
+      headers: COLUMNAR_HEADERS,
       paramsSerializer: (params) => qs.stringify(params, { arrayFormat: 'repeat' }),
     })
-    return data
+    return fromColumns(data)
   },
 
   getEvalById: async (experimentId: string, evalId: string) => {
@@ -0,0 +1,28 @@
+import type { PaginatedResponse } from './api.interface'
+
+// List endpoints answer with one array per field when asked for this media type,
+// so field names are sent once per page instead of once per row.
+export const COLUMNAR_HEADERS = { Accept: 'application/vnd.lumlflow.columnar+json' }
+
+export type Columns<T> = { [K in keyof T]: T[K][] }
+
+export interface ColumnarPage<T> {
+  items: Columns<T>
+  cursor: string | null
+}
+
+export function fromColumns<T>(columns: Columns<T>): T[] {
+  const keys = Object.keys(columns) as (keyof T)[]
+  const length = keys.length ? columns[keys[0]!].length : 0
+  const rows = new Array<T>(length)
+  for (let i = 0; i < length; i++) {
+    const row = {} as T
+    for (const key of keys) row[key] = columns[key][i]!
+    rows[i] = row
+  }
+  return rows
+}
+
+export function fromColumnarPage<T>(page: ColumnarPage<T>): PaginatedResponse<T> {
+  return { items: fromColumns(page.items), cursor: page.cursor }
+}
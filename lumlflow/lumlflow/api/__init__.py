@@ -0,0 +1,6 @@
+from lumlflow.infra.response_cache import ResponseCache
+from lumlflow.settings import config
+
+response_cache = ResponseCache(
+    config.BACKEND_STORE_URI, max_bytes=config.RESPONSE_CACHE_MB * 1024 * 1024
+)
@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from lumlflow.infra.change_feed import ChangeFeed, StoreChange
+from lumlflow.settings import config
+
+changes_router = APIRouter(prefix="/api/changes", tags=["changes"])
+
+change_feed = ChangeFeed(config.BACKEND_STORE_URI)
+
+_KEEPALIVE_SECONDS = 15.0
+
+
+async def _change_events(
+    request: Request, experiment_ids: list[str]
+) -> AsyncIterator[str]:
+    # Feed callbacks run on the feed's thread; hand each change to the event
+    # loop so waiting for one never holds a worker thread.
+    loop = asyncio.get_running_loop()
+    changes: asyncio.Queue[StoreChange] = asyncio.Queue()
+    subscription = change_feed.subscribe(
+        lambda change: loop.call_soon_threadsafe(changes.put_nowait, change),
+        experiment_ids,
+    )
+    try:
+        yield ": connected\n\n"
+        while not await request.is_disconnected():
+            try:
+                change = await asyncio.wait_for(
+                    changes.get(), timeout=_KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                # Comment lines keep proxies from closing an idle stream.
+                yield ": keepalive\n\n"
+                continue
+            yield f"data: {change.to_json()}\n\n"
+    finally:
+        subscription.close()
+
+
+@changes_router.get("", response_class=StreamingResponse)
+async def stream_changes(
+    request: Request,
+    experiment_id: Annotated[list[str] | None, Query()] = None,
+) -> StreamingResponse:
+    """Server-sent events for commits to the store.
+
+    Every meta DB change is sent, plus changes to the experiments passed as
+    `experiment_id`. Each event names the experiment (null for the meta DB) and
+    the tables that changed, so the client can re-fetch only those.
+    """
+    return StreamingResponse(
+        _change_events(request, experiment_id or []),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
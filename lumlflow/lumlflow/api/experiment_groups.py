@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Body, Query, status
+from fastapi import APIRouter, Body, Query, Request, status
+from fastapi.responses import Response
 
+from lumlflow.api import response_cache
 from lumlflow.handlers.experiment_groups import ExperimentGroupsHandler
 from lumlflow.schemas.base import SortOrder
 from lumlflow.schemas.experiment_groups import (
@@ -21,18 +23,23 @@ groups_handler = ExperimentGroupsHandler()
 
 @experiment_groups_router.get("", response_model=PaginatedGroups)
 def get_experiment_groups(
+    request: Request,
     limit: int = Query(20, ge=1, le=100),
     cursor: str | None = None,
     sort_by: GroupsSortBy = GroupsSortBy.CREATED_AT,
     order: SortOrder = SortOrder.DESC,
     search: str | None = None,
-) -> PaginatedGroups:
-    return groups_handler.get_experiment_groups(
-        limit=limit,
-        cursor_str=cursor,
-        sort_by=sort_by,
-        order=order,
-        search=search,
+) -> Response:
+    return response_cache.respond(
+        request,
+        [],
+        lambda: groups_handler.get_experiment_groups(
+            limit=limit,
+            cursor_str=cursor,
+            sort_by=sort_by,
+            order=order,
+            search=search,
+        ),
     )
 
 
@@ -53,20 +60,25 @@ def delete_experiment_group(group_id: str) -> None:
 
 @experiment_groups_router.get("/experiments", response_model=PaginatedExperiments)
 def get_groups_experiments(
+    request: Request,
     group_ids: list[str] = Query(default_factory=list),  # noqa: B008
     limit: int = Query(20, ge=1, le=100),
     cursor: str | None = None,
     sort_by: str = "created_at",
     order: SortOrder = SortOrder.DESC,
     search: str | None = None,
-) -> PaginatedExperiments:
-    return groups_handler.list_groups_experiments(
-        group_ids=group_ids,
-        limit=limit,
-        cursor_str=cursor,
-        sort_by=sort_by,
-        order=order,
-        search=search,
+) -> Response:
+    return response_cache.respond(
+        request,
+        [],
+        lambda: groups_handler.list_groups_experiments(
+            group_ids=group_ids,
+            limit=limit,
+            cursor_str=cursor,
+            sort_by=sort_by,
+            order=order,
+            search=search,
+        ),
     )
 
 
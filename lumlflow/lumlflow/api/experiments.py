@@ -1,15 +1,18 @@
-import mimetypes
-
-from fastapi import APIRouter, status
-from fastapi.responses import Response
+from fastapi import APIRouter, Request, status
+from fastapi.responses import FileResponse, Response
 
+from lumlflow.api import response_cache
 from lumlflow.handlers.experiments import ExperimentsHandler
 from lumlflow.handlers.models import ModelsHandler
+from lumlflow.infra.columnar import ColumnarResponse, to_columns, wants_columnar
+from lumlflow.infra.media_types import guess_media_type
+from lumlflow.infra.response_cache import etag_matches
 from lumlflow.schemas.experiments import (
     Experiment,
     ExperimentDetails,
     ExperimentMetricHistory,
     FileNode,
+    MetricPoint,
     UpdateExperiment,
 )
 from lumlflow.schemas.models import Model
@@ -24,8 +27,10 @@ models_handler = ModelsHandler()
 
 
 @experiments_router.get("/{experiment_id}", response_model=ExperimentDetails)
-def get_experiment(experiment_id: str) -> ExperimentDetails:
-    return experiments_handler.get_experiment(experiment_id)
+def get_experiment(request: Request, experiment_id: str) -> Response:
+    return response_cache.respond(
+        request, [], lambda: experiments_handler.get_experiment(experiment_id)
+    )
 
 
 @experiments_router.patch("/{experiment_id}", response_model=Experiment)
@@ -42,11 +47,26 @@ def delete_experiment(experiment_id: str) -> None:
     "/{experiment_id}/metrics/{key:path}", response_model=ExperimentMetricHistory
 )
 def get_experiment_metric_history(
-    experiment_id: str, key: str, max_points: int = 1000
-) -> ExperimentMetricHistory:
-    return experiments_handler.get_experiment_metric_history(
-        experiment_id, key, max_points
-    )
+    request: Request, experiment_id: str, key: str, max_points: int = 1000
+) -> Response:
+    def render() -> ExperimentMetricHistory | ColumnarResponse:
+        if wants_columnar(request):
+            points, subsampled = experiments_handler.get_experiment_metric_points(
+                experiment_id, key, max_points
+            )
+            return ColumnarResponse(
+                {
+                    "experiment_id": experiment_id,
+                    "key": key,
+                    "subsampled": subsampled,
+                    "history": to_columns(points, MetricPoint.model_fields),
+                }
+            )
+        return experiments_handler.get_experiment_metric_history(
+            experiment_id, key, max_points
+        )
+
+    return response_cache.respond(request, [experiment_id], render)
 
 
 @experiments_router.get("/{experiment_id}/models", response_model=list[Model])
@@ -55,10 +75,27 @@ def list_experiment_models(experiment_id: str) -> list[Model]:
 
 
 @experiments_router.get("/{experiment_id}/attachments/content")
-def get_attachment_content(experiment_id: str, file_path: str) -> Response:
-    content = experiments_handler.get_attachment(experiment_id, file_path)
-    media_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
-    return Response(content=content, media_type=media_type)
+def get_attachment_content(
+    experiment_id: str, file_path: str, request: Request
+) -> Response:
+    path = experiments_handler.get_attachment_path(experiment_id, file_path)
+    response = FileResponse(
+        path,
+        media_type=guess_media_type(path),
+        filename=path.name,
+        stat_result=path.stat(),
+        content_disposition_type="inline",
+        headers={"Cache-Control": "no-cache"},
+    )
+    if etag_matches(request.headers.get("if-none-match"), response.headers["etag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={
+                name: response.headers[name]
+                for name in ("etag", "last-modified", "cache-control")
+            },
+        )
+    return response
 
 
 @experiments_router.get("/{experiment_id}/attachments", response_model=list[FileNode])
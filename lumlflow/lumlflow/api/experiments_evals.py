@@ -1,10 +1,14 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Query
+from fastapi import APIRouter, Body, Query, Request
+from fastapi.responses import Response
 
+from lumlflow.api import response_cache
 from lumlflow.handlers.experiments import ExperimentsHandler
+from lumlflow.infra.columnar import ColumnarResponse, to_columns, wants_columnar
 from lumlflow.schemas.base import SortOrder
 from lumlflow.schemas.experiments import (
+    BatchEval,
     Eval,
     EvalColumns,
     EvalTypedColumns,
@@ -63,13 +67,14 @@ def get_experiment_eval_dataset_ids(experiment_id: str) -> list[str]:
 
 @experiments_evals_router.get("/all", response_model=list[Eval])
 def get_experiment_evals_all(
+    request: Request,
     experiment_id: str,
     sort_by: str = "created_at",
     order: SortOrder = SortOrder.DESC,
     dataset_id: str | None = None,
     search: str | None = None,
     filters: list[str] = Query(default_factory=list),  # noqa: B008
-) -> list[Eval]:
+) -> Response:
     """
     search: optional substring filter on eval id
 
@@ -80,26 +85,44 @@ def get_experiment_evals_all(
 
     sort_by: standard column (created_at, updated_at, dataset_id) or
     a score / inputs / outputs / refs key / metadata
+
+    Send `Accept: application/vnd.lumlflow.columnar+json` to receive the evals as
+    one array per field.
     """
-    return experiments_handler.get_experiment_evals_all(
-        experiment_id,
-        sort_by=sort_by,
-        order=order,
-        dataset_id=dataset_id,
-        search=search,
-        filters=filters or None,
-    )
+
+    def render() -> list[Eval] | ColumnarResponse:
+        if wants_columnar(request):
+            records = experiments_handler.get_experiment_eval_records_all(
+                experiment_id,
+                sort_by=sort_by,
+                order=order,
+                dataset_id=dataset_id,
+                search=search,
+                filters=filters or None,
+            )
+            return ColumnarResponse(to_columns(records, Eval.model_fields))
+        return experiments_handler.get_experiment_evals_all(
+            experiment_id,
+            sort_by=sort_by,
+            order=order,
+            dataset_id=dataset_id,
+            search=search,
+            filters=filters or None,
+        )
+
+    return response_cache.respond(request, [experiment_id], render)
 
 
 @experiments_general_evals_router.get("/compare", response_model=PaginatedBatchEvals)
 def get_experiment_evals_for_comparison(
+    request: Request,
     experiment_ids: list[str] = Query(default_factory=list),  # noqa: B008
     limit: int = Query(default=20, ge=1),  # noqa: B008
     cursor: str | None = None,
     dataset_id: str | None = None,
     search: str | None = None,
     filters: list[str] = Query(default_factory=list),  # noqa: B008
-) -> PaginatedBatchEvals:
+) -> Response:
     """
     search: optional substring filter on eval id
 
@@ -107,19 +130,42 @@ def get_experiment_evals_for_comparison(
     Each condition: <field> <op> <value>
     Fields: id, dataset_id, created_at, updated_at,
             inputs.<key>, outputs.<key>, refs.<key>, scores.<key>, metadata.<key>
+
+    Send `Accept: application/vnd.lumlflow.columnar+json` to receive `items` as
+    one array per field.
     """
-    return experiments_handler.get_experiment_evals_for_compare(
-        experiment_ids,
-        limit=limit,
-        cursor=cursor,
-        dataset_id=dataset_id,
-        search=search,
-        filters=filters or None,
-    )
+
+    def render() -> PaginatedBatchEvals | ColumnarResponse:
+        if wants_columnar(request):
+            page = experiments_handler.get_experiment_eval_records_for_compare(
+                experiment_ids,
+                limit=limit,
+                cursor=cursor,
+                dataset_id=dataset_id,
+                search=search,
+                filters=filters or None,
+            )
+            return ColumnarResponse(
+                {
+                    "items": to_columns(page.items, BatchEval.model_fields),
+                    "cursor": page.cursor,
+                }
+            )
+        return experiments_handler.get_experiment_evals_for_compare(
+            experiment_ids,
+            limit=limit,
+            cursor=cursor,
+            dataset_id=dataset_id,
+            search=search,
+            filters=filters or None,
+        )
+
+    return response_cache.respond(request, experiment_ids, render)
 
 
 @experiments_evals_router.get("", response_model=PaginatedEvals)
 def get_experiment_evals(
+    request: Request,
     experiment_id: str,
     limit: int = Query(default=20, ge=1),  # noqa: B008
     cursor: str | None = None,
@@ -128,7 +174,7 @@ def get_experiment_evals(
     dataset_id: str | None = None,
     search: str | None = None,
     filters: list[str] = Query(default_factory=list),  # noqa: B008
-) -> PaginatedEvals:
+) -> Response:
     """
     search: optional substring filter on eval id
 
@@ -139,17 +185,41 @@ def get_experiment_evals(
 
     sort_by: standard column (created_at, updated_at, dataset_id) or
     a score / inputs / outputs / refs key / metadata
+
+    Send `Accept: application/vnd.lumlflow.columnar+json` to receive `items` as
+    one array per field.
     """
-    return experiments_handler.get_experiment_evals(
-        experiment_id,
-        limit=limit,
-        cursor=cursor,
-        sort_by=sort_by,
-        order=order,
-        dataset_id=dataset_id,
-        search=search,
-        filters=filters or None,
-    )
+
+    def render() -> PaginatedEvals | ColumnarResponse:
+        if wants_columnar(request):
+            page = experiments_handler.get_experiment_eval_records(
+                experiment_id,
+                limit=limit,
+                cursor=cursor,
+                sort_by=sort_by,
+                order=order,
+                dataset_id=dataset_id,
+                search=search,
+                filters=filters or None,
+            )
+            return ColumnarResponse(
+                {
+                    "items": to_columns(page.items, Eval.model_fields),
+                    "cursor": page.cursor,
+                }
+            )
+        return experiments_handler.get_experiment_evals(
+            experiment_id,
+            limit=limit,
+            cursor=cursor,
+            sort_by=sort_by,
+            order=order,
+            dataset_id=dataset_id,
+            search=search,
+            filters=filters or None,
+        )
+
+    return response_cache.respond(request, [experiment_id], render)
 
 
 @experiments_general_evals_router.post(
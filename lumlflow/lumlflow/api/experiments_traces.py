@@ -1,8 +1,11 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Query
+from fastapi import APIRouter, Body, Query, Request
+from fastapi.responses import Response
 
+from lumlflow.api import response_cache
 from lumlflow.handlers.experiments import ExperimentsHandler
+from lumlflow.infra.columnar import ColumnarResponse, to_columns, wants_columnar
 from lumlflow.schemas.base import SortOrder
 from lumlflow.schemas.experiments import (
     PaginatedTraces,
@@ -40,13 +43,14 @@ def get_experiment_trace_typed_columns(experiment_id: str) -> TraceTypedColumns:
 
 @experiments_traces_router.get("/all", response_model=list[Trace])
 def get_experiment_traces_all(
+    request: Request,
     experiment_id: str,
     sort_by: TracesSortBy = TracesSortBy.EXECUTION_TIME,
     order: SortOrder = SortOrder.DESC,
     search: str | None = None,
     filters: list[str] = Query(default_factory=list),  # noqa: B008
     states: list[TraceState] | None = None,
-) -> list[Trace]:
+) -> Response:
     """
     search: An optional search by trace_id.
     filters: List of filter conditions, all AND-ed together. Supported fields:
@@ -62,19 +66,37 @@ def get_experiment_traces_all(
     - annotations.expectation.<name> — match only expectation annotations
 
     states: An optional list of TraceState objects to filter traces by their state.
+
+    Send `Accept: application/vnd.lumlflow.columnar+json` to receive the traces
+    as one array per field.
     """
-    return experiments_handler.get_experiment_traces_all(
-        experiment_id,
-        sort_by=sort_by,
-        order=order,
-        search=search,
-        filters=filters or None,
-        states=states,
-    )
+
+    def render() -> list[Trace] | ColumnarResponse:
+        if wants_columnar(request):
+            records = experiments_handler.get_experiment_trace_records_all(
+                experiment_id,
+                sort_by=sort_by,
+                order=order,
+                search=search,
+                filters=filters or None,
+                states=states,
+            )
+            return ColumnarResponse(to_columns(records, Trace.model_fields))
+        return experiments_handler.get_experiment_traces_all(
+            experiment_id,
+            sort_by=sort_by,
+            order=order,
+            search=search,
+            filters=filters or None,
+            states=states,
+        )
+
+    return response_cache.respond(request, [experiment_id], render)
 
 
 @experiments_traces_router.get("", response_model=PaginatedTraces)
 def get_experiment_traces(
+    request: Request,
     experiment_id: str,
     limit: int = Query(default=20, ge=1, le=100),  # noqa: B008
     cursor: str | None = None,
@@ -83,7 +105,7 @@ def get_experiment_traces(
     search: str | None = None,
     filters: list[str] = Query(default_factory=list),  # noqa: B008
     states: list[TraceState] | None = Query(default=None),  # noqa: B008
-) -> PaginatedTraces:
+) -> Response:
     """
     search: An optional search by trace_id.
     filters: List of filter conditions, all AND-ed together. Supported fields:
@@ -99,17 +121,41 @@ def get_experiment_traces(
     - annotations.expectation.<name> — match only expectation annotations
 
     states: An optional list of TraceState objects to filter traces by their state.
+
+    Send `Accept: application/vnd.lumlflow.columnar+json` to receive `items` as
+    one array per field.
     """
-    return experiments_handler.get_experiment_traces(
-        experiment_id,
-        limit=limit,
-        cursor=cursor,
-        sort_by=sort_by,
-        order=order,
-        search=search,
-        filters=filters or None,
-        states=states,
-    )
+
+    def render() -> PaginatedTraces | ColumnarResponse:
+        if wants_columnar(request):
+            page = experiments_handler.get_experiment_trace_records(
+                experiment_id,
+                limit=limit,
+                cursor=cursor,
+                sort_by=sort_by,
+                order=order,
+                search=search,
+                filters=filters or None,
+                states=states,
+            )
+            return ColumnarResponse(
+                {
+                    "items": to_columns(page.items, Trace.model_fields),
+                    "cursor": page.cursor,
+                }
+            )
+        return experiments_handler.get_experiment_traces(
+            experiment_id,
+            limit=limit,
+            cursor=cursor,
+            sort_by=sort_by,
+            order=order,
+            search=search,
+            filters=filters or None,
+            states=states,
+        )
+
+    return response_cache.respond(request, [experiment_id], render)
 
 
 @experiments_general_traces_router.post(
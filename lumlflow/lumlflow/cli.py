@@ -80,7 +80,7 @@ def tui(
     refresh_interval: float = typer.Option(
         2.0,
         "--refresh-interval",
-        help="Live auto-refresh interval (seconds)",
+        help="Minimum seconds between live auto-refreshes",
         min=0.1,
     ),
     no_auto_refresh: bool = typer.Option(
@@ -4,6 +4,7 @@ import getpass
 from luml.experiments.tracker import ExperimentTracker
 
 from lumlflow.infra.exceptions import ApplicationError, NotFound
+from lumlflow.infra.experiment_records import experiment_records
 from lumlflow.schemas.annotations import (
     Annotation,
     AnnotationSummary,
@@ -23,7 +24,7 @@ class AnnotationsHandler:
         self.tracker = tracker or get_tracker()
 
     def _check_experiment(self, experiment_id: str) -> None:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
     def create_eval_annotation(
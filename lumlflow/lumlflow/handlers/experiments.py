@@ -1,9 +1,18 @@
 from math import ceil
-
+from pathlib import Path
+from typing import Any
+
+from luml.experiments.backends.data_types import (
+    BatchEvalRecord,
+    EvalRecord,
+    PaginatedResponse,
+    TraceRecord,
+)
 from luml.experiments.backends.data_types import TraceState as SdkTraceState
 from luml.experiments.tracker import ExperimentTracker
 
 from lumlflow.infra.exceptions import ApplicationError, NotFound
+from lumlflow.infra.experiment_records import experiment_records
 from lumlflow.schemas.annotations import AnnotationSummary
 from lumlflow.schemas.base import SortOrder
 from lumlflow.schemas.experiments import (
@@ -40,7 +49,7 @@ class ExperimentsHandler:
         self.tracker = tracker or get_tracker()
 
     def get_experiment(self, experiment_id: str) -> ExperimentDetails:
-        experiment = self.tracker.get_experiment_record(experiment_id)
+        experiment = experiment_records.get(self.tracker, experiment_id)
         if not experiment:
             raise NotFound("Experiment not found")
 
@@ -66,7 +75,7 @@ class ExperimentsHandler:
         )
 
     def delete_experiment(self, experiment_id: str) -> None:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         models = self.tracker.get_models(experiment_id)
@@ -80,11 +89,12 @@ class ExperimentsHandler:
             self.tracker.delete_experiment(experiment_id)
         except Exception as e:
             raise ApplicationError(str(e), status_code=500) from e
+        experiment_records.invalidate(self.tracker, experiment_id)
 
-    def get_experiment_metric_history(
+    def get_experiment_metric_points(
         self, experiment_id: str, key: str, max_points: int = 1000
-    ) -> ExperimentMetricHistory:
-        if not self.tracker.get_experiment_record(experiment_id):
+    ) -> tuple[list[dict[str, Any]], bool]:
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
         try:
             raw = self.tracker.get_experiment_metric_history(experiment_id, key)
@@ -98,6 +108,14 @@ class ExperimentsHandler:
             raw = raw[::step]
             subsampled = True
 
+        return raw, subsampled
+
+    def get_experiment_metric_history(
+        self, experiment_id: str, key: str, max_points: int = 1000
+    ) -> ExperimentMetricHistory:
+        raw, subsampled = self.get_experiment_metric_points(
+            experiment_id, key, max_points
+        )
         return ExperimentMetricHistory(
             experiment_id=experiment_id,
             key=key,
@@ -105,7 +123,7 @@ class ExperimentsHandler:
             history=[MetricPoint(**p) for p in raw],
         )
 
-    def get_experiment_traces(
+    def get_experiment_trace_records(
         self,
         experiment_id: str,
         limit: int = 20,
@@ -115,8 +133,8 @@ class ExperimentsHandler:
         search: str | None = None,
         filters: list[str] | None = None,
         states: list[TraceState] | None = None,
-    ) -> PaginatedTraces:
-        if not self.tracker.get_experiment_record(experiment_id):
+    ) -> PaginatedResponse[TraceRecord]:
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -141,20 +159,38 @@ class ExperimentsHandler:
             experiment_id, trace_ids
         )
 
-        traces = []
         for t in result.items:
-            trace = Trace.model_validate(t)
-            summary = summaries.get(t.trace_id)
-            if summary is not None:
-                trace.annotations = AnnotationSummary.model_validate(summary)
-            traces.append(trace)
+            t.annotations = summaries.get(t.trace_id)
 
+        return result
+
+    def get_experiment_traces(
+        self,
+        experiment_id: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        sort_by: TracesSortBy = TracesSortBy.EXECUTION_TIME,
+        order: SortOrder = SortOrder.DESC,
+        search: str | None = None,
+        filters: list[str] | None = None,
+        states: list[TraceState] | None = None,
+    ) -> PaginatedTraces:
+        result = self.get_experiment_trace_records(
+            experiment_id,
+            limit=limit,
+            cursor=cursor,
+            sort_by=sort_by,
+            order=order,
+            search=search,
+            filters=filters,
+            states=states,
+        )
         return PaginatedTraces(
-            items=traces,
+            items=[self._to_trace(t) for t in result.items],
             cursor=result.cursor,
         )
 
-    def get_experiment_traces_all(
+    def get_experiment_trace_records_all(
         self,
         experiment_id: str,
         sort_by: TracesSortBy = TracesSortBy.EXECUTION_TIME,
@@ -162,8 +198,8 @@ class ExperimentsHandler:
         search: str | None = None,
         filters: list[str] | None = None,
         states: list[TraceState] | None = None,
-    ) -> list[Trace]:
-        if not self.tracker.get_experiment_record(experiment_id):
+    ) -> list[TraceRecord]:
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -181,17 +217,36 @@ class ExperimentsHandler:
         except Exception as e:
             raise ApplicationError(str(e), status_code=500) from e
 
-        traces = []
-        for t in result:
-            trace = Trace.model_validate(t)
-            if t.annotations is not None:
-                trace.annotations = AnnotationSummary.model_validate(t.annotations)
-            traces.append(trace)
+        return result
 
-        return traces
+    def get_experiment_traces_all(
+        self,
+        experiment_id: str,
+        sort_by: TracesSortBy = TracesSortBy.EXECUTION_TIME,
+        order: SortOrder = SortOrder.DESC,
+        search: str | None = None,
+        filters: list[str] | None = None,
+        states: list[TraceState] | None = None,
+    ) -> list[Trace]:
+        result = self.get_experiment_trace_records_all(
+            experiment_id,
+            sort_by=sort_by,
+            order=order,
+            search=search,
+            filters=filters,
+            states=states,
+        )
+        return [self._to_trace(t) for t in result]
+
+    @staticmethod
+    def _to_trace(record: TraceRecord) -> Trace:
+        trace = Trace.model_validate(record)
+        if record.annotations is not None:
+            trace.annotations = AnnotationSummary.model_validate(record.annotations)
+        return trace
 
     def get_trace(self, experiment_id: str, trace_id: str) -> TraceDetails:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -211,7 +266,7 @@ class ExperimentsHandler:
         )
 
     def get_eval(self, experiment_id: str, eval_id: str) -> Eval:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -238,7 +293,7 @@ class ExperimentsHandler:
 
         return eval_rec
 
-    def get_experiment_evals(
+    def get_experiment_eval_records(
         self,
         experiment_id: str,
         limit: int = 20,
@@ -248,8 +303,8 @@ class ExperimentsHandler:
         dataset_id: str | None = None,
         search: str | None = None,
         filters: list[str] | None = None,
-    ) -> PaginatedEvals:
-        if not self.tracker.get_experiment_record(experiment_id):
+    ) -> PaginatedResponse[EvalRecord]:
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -276,12 +331,35 @@ class ExperimentsHandler:
         except Exception as e:
             raise ApplicationError(str(e), status_code=500) from e
 
+        return result
+
+    def get_experiment_evals(
+        self,
+        experiment_id: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        sort_by: str = "created_at",
+        order: SortOrder = SortOrder.DESC,
+        dataset_id: str | None = None,
+        search: str | None = None,
+        filters: list[str] | None = None,
+    ) -> PaginatedEvals:
+        result = self.get_experiment_eval_records(
+            experiment_id,
+            limit=limit,
+            cursor=cursor,
+            sort_by=sort_by,
+            order=order,
+            dataset_id=dataset_id,
+            search=search,
+            filters=filters,
+        )
         return PaginatedEvals(
             items=[Eval.model_validate(e) for e in result.items],
             cursor=result.cursor,
         )
 
-    def get_experiment_evals_for_compare(
+    def get_experiment_eval_records_for_compare(
         self,
         experiment_ids: list[str],
         limit: int = 20,
@@ -289,7 +367,7 @@ class ExperimentsHandler:
         dataset_id: str | None = None,
         search: str | None = None,
         filters: list[str] | None = None,
-    ) -> PaginatedBatchEvals:
+    ) -> PaginatedResponse[BatchEvalRecord]:
         try:
             self.tracker.check_experiments_exists(experiment_ids)
         except ValueError as e:
@@ -309,12 +387,31 @@ class ExperimentsHandler:
         except Exception as e:
             raise ApplicationError(str(e), status_code=500) from e
 
+        return result
+
+    def get_experiment_evals_for_compare(
+        self,
+        experiment_ids: list[str],
+        limit: int = 20,
+        cursor: str | None = None,
+        dataset_id: str | None = None,
+        search: str | None = None,
+        filters: list[str] | None = None,
+    ) -> PaginatedBatchEvals:
+        result = self.get_experiment_eval_records_for_compare(
+            experiment_ids,
+            limit=limit,
+            cursor=cursor,
+            dataset_id=dataset_id,
+            search=search,
+            filters=filters,
+        )
         return PaginatedBatchEvals(
             items=[BatchEval.model_validate(e) for e in result.items],
             cursor=result.cursor,
         )
 
-    def get_experiment_evals_all(
+    def get_experiment_eval_records_all(
         self,
         experiment_id: str,
         sort_by: str = "created_at",
@@ -322,8 +419,8 @@ class ExperimentsHandler:
         dataset_id: str | None = None,
         search: str | None = None,
         filters: list[str] | None = None,
-    ) -> list[Eval]:
-        if not self.tracker.get_experiment_record(experiment_id):
+    ) -> list[EvalRecord]:
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -349,10 +446,29 @@ class ExperimentsHandler:
         except Exception as e:
             raise ApplicationError(str(e), status_code=500) from e
 
+        return result
+
+    def get_experiment_evals_all(
+        self,
+        experiment_id: str,
+        sort_by: str = "created_at",
+        order: SortOrder = SortOrder.DESC,
+        dataset_id: str | None = None,
+        search: str | None = None,
+        filters: list[str] | None = None,
+    ) -> list[Eval]:
+        result = self.get_experiment_eval_records_all(
+            experiment_id,
+            sort_by=sort_by,
+            order=order,
+            dataset_id=dataset_id,
+            search=search,
+            filters=filters,
+        )
         return [Eval.model_validate(e) for e in result]
 
     def get_experiment_eval_dataset_ids(self, experiment_id: str) -> list[str]:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -361,7 +477,7 @@ class ExperimentsHandler:
             raise ApplicationError(str(e), status_code=500) from e
 
     def get_experiment_trace_columns(self, experiment_id: str) -> TraceColumns:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -374,7 +490,7 @@ class ExperimentsHandler:
     def get_experiment_trace_typed_columns(
         self, experiment_id: str
     ) -> TraceTypedColumns:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -387,7 +503,7 @@ class ExperimentsHandler:
     def get_experiment_eval_typed_columns(
         self, experiment_id: str, dataset_id: str | None = None
     ) -> EvalTypedColumns:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -402,7 +518,7 @@ class ExperimentsHandler:
     def get_experiment_eval_columns(
         self, experiment_id: str, dataset_id: str | None = None
     ) -> EvalColumns:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -419,7 +535,7 @@ class ExperimentsHandler:
         search: str | None = None,
         filters: list[str] | None = None,
     ) -> dict[str, float]:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -441,6 +557,7 @@ class ExperimentsHandler:
             )
         except Exception as e:
             raise ApplicationError(str(e), status_code=500) from e
+        experiment_records.invalidate(self.tracker, experiment_id)
 
         if not experiment:
             raise NotFound("Experiment not found")
@@ -448,7 +565,7 @@ class ExperimentsHandler:
         return Experiment.model_validate(experiment)
 
     def get_attachment(self, experiment_id: str, file_path: str) -> bytes:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
         try:
             return self.tracker.get_attachment(file_path, experiment_id=experiment_id)
@@ -457,8 +574,20 @@ class ExperimentsHandler:
         except Exception as e:
             raise ApplicationError(str(e), status_code=500) from e
 
+    def get_attachment_path(self, experiment_id: str, file_path: str) -> Path:
+        if not experiment_records.get(self.tracker, experiment_id):
+            raise NotFound("Experiment not found")
+        try:
+            return self.tracker.get_attachment_path(
+                file_path, experiment_id=experiment_id
+            )
+        except ValueError as e:
+            raise NotFound(str(e)) from e
+        except Exception as e:
+            raise ApplicationError(str(e), status_code=500) from e
+
     def list_attachments(self, experiment_id: str) -> list[AttachmentRecord]:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
 
         try:
@@ -471,7 +600,7 @@ class ExperimentsHandler:
     def list_attachments_tree(
         self, experiment_id: str, parent_path: str | None = None
     ) -> list[FileNode]:
-        if not self.tracker.get_experiment_record(experiment_id):
+        if not experiment_records.get(self.tracker, experiment_id):
             raise NotFound("Experiment not found")
         try:
             result = self.tracker.list_attachments_tree(
@@ -9,6 +9,7 @@ from luml.experiments.backends.data_types import Model as DbModel
 
 from lumlflow.handlers.luml.base_luml import BaseLumlHandler
 from lumlflow.infra.exceptions import ApplicationError, NotFound
+from lumlflow.infra.experiment_records import experiment_records
 from lumlflow.infra.progress_store import ProgressStore
 from lumlflow.schemas.luml import (
     Artifact,
@@ -74,7 +75,7 @@ class ArtifactHandler(BaseLumlHandler):
         data: UploadArtifactForm,
         on_progress,
     ) -> Artifact:
-        experiment = self.tracker.get_experiment_record(data.experiment_id)
+        experiment = experiment_records.get(self.tracker, data.experiment_id)
         if not experiment:
             raise NotFound("Experiment not found")
 
@@ -0,0 +1,281 @@
+"""Change notifications for the experiment store.
+
+The store is one `meta.db` plus an `<experiment_id>/exp.db` per experiment,
+written by training scripts in other processes. `ChangeFeed` keeps a read-only
+connection per watched database and polls `PRAGMA data_version`, which changes
+whenever another connection commits and costs no table reads. The file's inode
+is checked too, so a deleted and re-created database is picked up again.
+
+When a version moves, the feed compares `max(rowid)` of each table with its
+previous value. Readers use the tables that grew to fetch only what is new,
+such as new metric steps or new spans.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+META_TABLES = ("experiments", "experiment_groups", "models")
+EXPERIMENT_TABLES = (
+    "static_params",
+    "dynamic_metrics",
+    "attachments",
+    "spans",
+    "evals",
+    "eval_traces_bridge",
+    "eval_annotations",
+    "span_annotations",
+)
+
+_DEFAULT_INTERVAL = 0.25
+
+
+@dataclass(frozen=True)
+class StoreChange:
+    """A commit to the meta DB (`experiment_id` is None) or to one experiment DB.
+
+    `tables` are the tables that gained rows. A commit that only updated or
+    deleted rows lists every table of its database.
+    """
+
+    experiment_id: str | None
+    tables: frozenset[str]
+
+    def touches(self, *tables: str) -> bool:
+        return not self.tables.isdisjoint(tables)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"experiment_id": self.experiment_id, "tables": sorted(self.tables)}
+        )
+
+
+class _DatabaseWatcher:
+    def __init__(self, path: Path, tables: tuple[str, ...]) -> None:
+        self._path = path
+        self._tables = tables
+        self._conn: sqlite3.Connection | None = None
+        self._inode: int | None = None
+        self._version: int | None = None
+        self._marks: dict[str, int] = {}
+        self._seen = False
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._inode = None
+
+    def check(self) -> frozenset[str] | None:
+        """Tables changed since the previous check, or None if nothing changed.
+
+        The first check only records a baseline. A database that shows up
+        later, or is replaced, reports all of its tables.
+        """
+        try:
+            inode = self._path.stat().st_ino
+        except OSError:
+            self.close()
+            self._seen = True
+            return None
+        try:
+            if self._conn is None or inode != self._inode:
+                appeared = self._seen
+                self._open(inode)
+                return frozenset(self._tables) if appeared else None
+            version = self._data_version()
+            if version == self._version:
+                return None
+            self._version = version
+            marks = self._read_marks()
+        except sqlite3.Error:
+            # Mid-migration or locked by a writer; try again on the next poll.
+            self.close()
+            return None
+        grown = frozenset(
+            table for table, mark in marks.items() if mark > self._marks.get(table, 0)
+        )
+        self._marks = marks
+        return grown or frozenset(self._tables)
+
+    def _open(self, inode: int) -> None:
+        self.close()
+        self._seen = True
+        self._conn = sqlite3.connect(
+            f"{self._path.as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._inode = inode
+        self._version = self._data_version()
+        self._marks = self._read_marks()
+
+    def _data_version(self) -> int:
+        assert self._conn is not None
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _read_marks(self) -> dict[str, int]:
+        assert self._conn is not None
+        marks = {}
+        for table in self._tables:
+            try:
+                row = self._conn.execute(f"SELECT max(rowid) FROM {table}").fetchone()
+            except sqlite3.OperationalError:
+                # Tables added by a later migration may not exist yet.
+                continue
+            marks[table] = row[0] or 0
+        return marks
+
+
+class Subscription:
+    """A callback registered with a `ChangeFeed`.
+
+    It receives every meta DB change and the changes of `experiment_ids`.
+    """
+
+    def __init__(
+        self,
+        feed: "ChangeFeed",
+        callback: Callable[[StoreChange], None],
+        experiment_ids: Iterable[str],
+    ) -> None:
+        self._feed = feed
+        self._callback = callback
+        self.experiment_ids = frozenset(experiment_ids)
+
+    def wants(self, change: StoreChange) -> bool:
+        return (
+            change.experiment_id is None or change.experiment_id in self.experiment_ids
+        )
+
+    def watch(self, experiment_ids: Iterable[str]) -> None:
+        """Replace the experiments this subscription follows."""
+        experiment_ids = frozenset(experiment_ids)
+        if experiment_ids != self.experiment_ids:
+            self.experiment_ids = experiment_ids
+            self._feed._sync_watchers()
+
+    def close(self) -> None:
+        self._feed._unsubscribe(self)
+
+    def _notify(self, change: StoreChange) -> None:
+        try:
+            self._callback(change)
+        except Exception:
+            logger.exception("Change feed subscriber failed")
+
+
+class ChangeFeed:
+    """Pushes store changes to subscribers.
+
+    The meta DB is watched while there is at least one subscription. An
+    experiment DB is watched only while some subscription follows that
+    experiment. A daemon thread polls every `interval` seconds, starting with
+    the first subscription. Callbacks run on that thread and must hand work off
+    instead of blocking it.
+    """
+
+    def __init__(
+        self, store_path: str | Path, *, interval: float = _DEFAULT_INTERVAL
+    ) -> None:
+        self._base_path = Path(store_path).expanduser().absolute()
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._subscriptions: list[Subscription] = []
+        self._watchers: dict[str | None, _DatabaseWatcher] = {}
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def subscribe(
+        self,
+        callback: Callable[[StoreChange], None],
+        experiment_ids: Iterable[str] = (),
+        *,
+        start: bool = True,
+    ) -> Subscription:
+        """Call `callback` with every meta DB change and every change to one of
+        `experiment_ids`.
+
+        Pass `start=False` to drive the feed with `poll()` instead of the thread.
+        """
+        subscription = Subscription(self, callback, experiment_ids)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            if start and self._thread is None and not self._stopped.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name="lumlflow-change-feed", daemon=True
+                )
+                self._thread.start()
+        self._sync_watchers()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        self._sync_watchers()
+
+    def poll(self) -> list[StoreChange]:
+        """Check every watched database once and notify subscribers."""
+        with self._poll_lock:
+            with self._lock:
+                subscriptions = list(self._subscriptions)
+            changes = []
+            for experiment_id, watcher in self._watchers.items():
+                tables = watcher.check()
+                if tables is not None:
+                    changes.append(StoreChange(experiment_id, tables))
+        for change in changes:
+            for subscription in subscriptions:
+                if subscription.wants(change):
+                    subscription._notify(change)
+        return changes
+
+    def close(self) -> None:
+        """Stop the polling thread and close every connection."""
+        self._stopped.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._poll_lock:
+            for watcher in self._watchers.values():
+                watcher.close()
+            self._watchers.clear()
+
+    def _sync_watchers(self) -> None:
+        """Open watchers for newly followed databases and drop unused ones.
+
+        New watchers record their baseline right away, so the next poll already
+        reports commits made after subscribing.
+        """
+        with self._poll_lock:
+            with self._lock:
+                wanted: set[str | None] = {None} if self._subscriptions else set()
+                for subscription in self._subscriptions:
+                    wanted.update(
+                        experiment_id
+                        for experiment_id in subscription.experiment_ids
+                        if Path(experiment_id).name == experiment_id
+                    )
+            for key in self._watchers.keys() - wanted:
+                self._watchers.pop(key).close()
+            for key in wanted - self._watchers.keys():
+                watcher = self._new_watcher(key)
+                watcher.check()
+                self._watchers[key] = watcher
+
+    def _new_watcher(self, experiment_id: str | None) -> _DatabaseWatcher:
+        if experiment_id is None:
+            return _DatabaseWatcher(self._base_path / "meta.db", META_TABLES)
+        return _DatabaseWatcher(
+            self._base_path / experiment_id / "exp.db", EXPERIMENT_TABLES
+        )
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.poll()
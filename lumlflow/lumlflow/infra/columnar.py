@@ -0,0 +1,44 @@
+"""Column-oriented JSON for list-heavy endpoints.
+
+Clients opt in with `Accept: application/vnd.lumlflow.columnar+json`. Row lists
+are then sent as one array per field instead of one object per row, so field
+names appear once per page instead of once per row:
+
+    {"trace_id": ["a", "b"], "span_count": [3, 5], ...}
+
+Columns are read straight from the tracker's records and encoded with orjson,
+skipping Pydantic validation. The tracker is trusted output, and the field
+names come from the same schemas used for the row format.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from operator import attrgetter, itemgetter
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.lumlflow.columnar+json"
+
+Columns = dict[str, list[Any]]
+
+
+def wants_columnar(request: Request) -> bool:
+    return COLUMNAR_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def to_columns(rows: Sequence[Any], fields: Iterable[str]) -> Columns:
+    """One list per field, read from dicts or from objects with those attributes."""
+    getter = itemgetter if rows and isinstance(rows[0], Mapping) else attrgetter
+    return {name: list(map(getter(name), rows)) for name in fields}
+
+
+class ColumnarResponse(Response):
+    media_type = COLUMNAR_MEDIA_TYPE
+
+    def __init__(self, content: Any, status_code: int = 200) -> None:
+        super().__init__(content, status_code, headers={"Vary": "Accept"})
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
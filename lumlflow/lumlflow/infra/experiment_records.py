@@ -0,0 +1,207 @@
+"""Memoized experiment records for request handlers.
+
+Almost every endpoint starts by loading the experiment's `meta.db` row, if only
+to check that it exists. A compare page sends one request per experiment per
+widget, so the same rows are read many times. `ExperimentRecordCache` keeps
+them at two levels:
+
+- Inside `scope()`, which `ExperimentRecordsMiddleware` opens around every
+  HTTP request, a record is fetched at most once and `meta.db`'s version is
+  read once.
+- Across requests, a record is kept for `ttl` seconds and reused only while
+  `PRAGMA data_version` of `meta.db` is unchanged. An edit from a training
+  script or from the API is therefore seen by the next request.
+
+Lookups for several experiments go to the tracker as one batched query.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from luml.experiments.backends.data_types import Experiment
+from luml.experiments.tracker import ExperimentTracker
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from lumlflow.infra.response_cache import DataVersionProbe
+
+_DEFAULT_TTL = 5.0
+_MAX_ENTRIES = 4096
+_MAX_STORES = 8
+
+_Key = tuple[Path, str]
+_DataVersion = tuple[int, int] | None
+
+
+@dataclass
+class _RequestScope:
+    records: dict[_Key, Experiment | None] = field(default_factory=dict)
+    versions: dict[Path, _DataVersion] = field(default_factory=dict)
+
+
+_request_scope: ContextVar[_RequestScope | None] = ContextVar(
+    "experiment_records_scope", default=None
+)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    record: Experiment | None
+    version: tuple[int, int]
+    expires: float
+
+
+def _meta_db_path(tracker: ExperimentTracker) -> Path | None:
+    path = getattr(getattr(tracker, "backend", None), "meta_db_path", None)
+    return path if isinstance(path, Path) else None
+
+
+class ExperimentRecordCache:
+    """Experiment records by store and ID, including IDs that do not exist.
+
+    Trackers without a SQLite store are always asked directly.
+    """
+
+    def __init__(
+        self, *, ttl: float = _DEFAULT_TTL, max_entries: int = _MAX_ENTRIES
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._probes: OrderedDict[Path, DataVersionProbe] = OrderedDict()
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Share records and the store version across the lookups in the block."""
+        token = _request_scope.set(_RequestScope())
+        try:
+            yield
+        finally:
+            _request_scope.reset(token)
+
+    def get(self, tracker: ExperimentTracker, experiment_id: str) -> Experiment | None:
+        return self.get_many(tracker, [experiment_id]).get(experiment_id)
+
+    def get_many(
+        self, tracker: ExperimentTracker, experiment_ids: Iterable[str]
+    ) -> dict[str, Experiment]:
+        """Records of `experiment_ids` by ID; unknown IDs are left out."""
+        experiment_ids = list(dict.fromkeys(experiment_ids))
+        store = _meta_db_path(tracker)
+        if store is None:
+            return tracker.get_experiment_records(experiment_ids)
+
+        request_scope = _request_scope.get()
+        # Read before fetching, so a commit in between makes the entry stale
+        # instead of hiding it.
+        version = self._version(store, request_scope)
+        now = time.monotonic()
+        found: dict[str, Experiment | None] = {}
+        missing = []
+        with self._lock:
+            for experiment_id in experiment_ids:
+                key = (store, experiment_id)
+                if request_scope is not None and key in request_scope.records:
+                    found[experiment_id] = request_scope.records[key]
+                    continue
+                entry = self._entries.get(key)
+                if (
+                    entry is not None
+                    and entry.version == version
+                    and entry.expires > now
+                ):
+                    self._entries.move_to_end(key)
+                    found[experiment_id] = entry.record
+                else:
+                    missing.append(experiment_id)
+
+        if missing:
+            fetched = tracker.get_experiment_records(missing)
+            with self._lock:
+                for experiment_id in missing:
+                    record = fetched.get(experiment_id)
+                    found[experiment_id] = record
+                    if version is not None and self._ttl > 0:
+                        key = (store, experiment_id)
+                        self._entries[key] = _Entry(record, version, now + self._ttl)
+                        self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+        if request_scope is not None:
+            for experiment_id, record in found.items():
+                request_scope.records[(store, experiment_id)] = record
+        return {
+            experiment_id: record
+            for experiment_id, record in found.items()
+            if record is not None
+        }
+
+    def invalidate(self, tracker: ExperimentTracker, experiment_id: str) -> None:
+        """Forget a record after changing it through `tracker`.
+
+        Other requests would notice the new store version anyway; this keeps
+        the current request from reading its own stale copy.
+        """
+        store = _meta_db_path(tracker)
+        if store is None:
+            return
+        key = (store, experiment_id)
+        request_scope = _request_scope.get()
+        if request_scope is not None:
+            request_scope.records.pop(key, None)
+            request_scope.versions.pop(store, None)
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            probes = list(self._probes.values())
+            self._probes.clear()
+        for probe in probes:
+            probe.close()
+
+    def _version(
+        self, store: Path, request_scope: _RequestScope | None
+    ) -> _DataVersion:
+        if request_scope is not None and store in request_scope.versions:
+            return request_scope.versions[store]
+        evicted = None
+        with self._lock:
+            probe = self._probes.get(store)
+            if probe is None:
+                probe = self._probes[store] = DataVersionProbe(store)
+                if len(self._probes) > _MAX_STORES:
+                    _, evicted = self._probes.popitem(last=False)
+            else:
+                self._probes.move_to_end(store)
+        if evicted is not None:
+            evicted.close()
+        version = probe.version()
+        if request_scope is not None:
+            request_scope.versions[store] = version
+        return version
+
+
+experiment_records = ExperimentRecordCache()
+
+
+class ExperimentRecordsMiddleware:
+    """Opens an `experiment_records` scope for every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with experiment_records.scope():
+            await self.app(scope, receive, send)
@@ -0,0 +1,59 @@
+import mimetypes
+from pathlib import Path
+
+_DEFAULT_MEDIA_TYPE = "application/octet-stream"
+_SNIFF_BYTES = 512
+
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"\x1f\x8b", "application/gzip"),
+    (b"\x1a\x45\xdf\xa3", "video/webm"),
+    (b"OggS", "audio/ogg"),
+    (b"fLaC", "audio/flac"),
+    (b"ID3", "audio/mpeg"),
+    (b"\x93NUMPY", "application/x-npy"),
+    (b"SQLite format 3\x00", "application/vnd.sqlite3"),
+)
+
+
+def _sniff(head: bytes) -> str | None:
+    for signature, media_type in _SIGNATURES:
+        if head.startswith(signature):
+            return media_type
+    if head[4:8] == b"ftyp":
+        return "video/mp4"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "audio/wav"
+    if b"\x00" in head:
+        return None
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the sample is still text.
+        if e.start < len(head) - 3:
+            return None
+    return "text/plain"
+
+
+def guess_media_type(path: Path) -> str:
+    """Media type of `path`, from its extension or else its first bytes.
+
+    Attachments are often logged without an extension (`log`, `checkpoint`), so
+    the file content is checked for common signatures and for UTF-8 text.
+    """
+    media_type = mimetypes.guess_type(path.name)[0]
+    if media_type is not None:
+        return media_type
+    try:
+        with path.open("rb") as f:
+            head = f.read(_SNIFF_BYTES)
+    except OSError:
+        return _DEFAULT_MEDIA_TYPE
+    return _sniff(head) or _DEFAULT_MEDIA_TYPE
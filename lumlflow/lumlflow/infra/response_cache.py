@@ -0,0 +1,219 @@
+"""Response cache for read endpoints, invalidated by the store's data version.
+
+Each cached response is stored against the `PRAGMA data_version` of the
+databases it was built from: `meta.db` plus the `exp.db` of every experiment
+it reads. That pragma changes whenever another connection commits, so a
+lookup costs one pragma per database and never goes stale. Training scripts
+and the tracker both write through their own connections, so every write is
+seen.
+
+The ETag is derived from the request and those versions rather than from the
+body, so a matching `If-None-Match` is answered with 304 without building the
+response at all.
+"""
+
+import hashlib
+import itertools
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from lumlflow.infra.columnar import wants_columnar
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_MAX_PROBES = 256
+
+# Connection counters restart with the process, so ETags from an earlier run
+# must not match.
+_INSTANCE = uuid.uuid4().hex
+_epochs = itertools.count()
+
+Version = tuple[tuple[int, int] | None, ...]
+
+
+class DataVersionProbe:
+    """Reads `PRAGMA data_version` of one database on a connection kept open.
+
+    Values are only comparable within one connection, so each connection gets
+    a new epoch. A missing database reads as None.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._inode: int | None = None
+        self._epoch = 0
+
+    def version(self) -> tuple[int, int] | None:
+        try:
+            inode = self._path.stat().st_ino
+        except OSError:
+            self.close()
+            return None
+        with self._lock:
+            try:
+                if self._conn is None or inode != self._inode:
+                    self._open(inode)
+                assert self._conn is not None
+                data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            except sqlite3.Error:
+                self._close()
+                return None
+            return self._epoch, data_version
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _open(self, inode: int) -> None:
+        self._close()
+        self._conn = sqlite3.connect(
+            f"{self._path.as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._inode = inode
+        self._epoch = next(_epochs)
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._inode = None
+
+
+@dataclass(frozen=True)
+class _Entry:
+    version: Version
+    etag: str
+    body: bytes
+    media_type: str | None
+
+
+class ResponseCache:
+    """LRU cache of encoded responses, bounded to `max_bytes` of bodies.
+
+    Set `max_bytes` to 0 to disable caching; ETags and 304s still work.
+    """
+
+    def __init__(
+        self, store_path: str | Path, *, max_bytes: int = _DEFAULT_MAX_BYTES
+    ) -> None:
+        self._base_path = Path(store_path).expanduser().absolute()
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._probes: OrderedDict[str | None, DataVersionProbe] = OrderedDict()
+
+    def respond(
+        self,
+        request: Request,
+        experiment_ids: Iterable[str],
+        render: Callable[[], Any],
+    ) -> Response:
+        """The response `render` builds for `request`, reused while neither
+        `meta.db` nor the DBs of `experiment_ids` have changed.
+
+        `render` returns a `Response` or a value to encode as JSON. Errors are
+        raised as usual and never cached.
+        """
+        version = self._version(experiment_ids)
+        key = self._key(request)
+        etag = self._etag(key, version)
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(key)
+                return Response(
+                    entry.body, media_type=entry.media_type, headers=headers
+                )
+
+        response = render()
+        if not isinstance(response, Response):
+            response = JSONResponse(jsonable_encoder(response))
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        response.headers.update(headers)
+        self._store(key, _Entry(version, etag, response.body, response.media_type))
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            probes = list(self._probes.values())
+            self._probes.clear()
+        for probe in probes:
+            probe.close()
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        # One oversized page must not flush everything else.
+        if len(entry.body) > self._max_bytes // 4:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._entries[key] = entry
+            self._size += len(entry.body)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def _version(self, experiment_ids: Iterable[str]) -> Version:
+        return tuple(
+            self._probe(experiment_id).version()
+            for experiment_id in (None, *experiment_ids)
+        )
+
+    def _probe(self, experiment_id: str | None) -> DataVersionProbe:
+        with self._lock:
+            probe = self._probes.get(experiment_id)
+            if probe is not None:
+                self._probes.move_to_end(experiment_id)
+                return probe
+            if experiment_id is None:
+                path = self._base_path / "meta.db"
+            else:
+                # Keeps ids like "../x" from probing outside the store.
+                path = self._base_path / Path(experiment_id).name / "exp.db"
+            probe = self._probes[experiment_id] = DataVersionProbe(path)
+            evicted = None
+            if len(self._probes) > _MAX_PROBES:
+                _, evicted = self._probes.popitem(last=False)
+        if evicted is not None:
+            evicted.close()
+        return probe
+
+    @staticmethod
+    def _key(request: Request) -> str:
+        encoding = "columnar" if wants_columnar(request) else "json"
+        return f"{encoding} {request.url.path}?{request.url.query}"
+
+    @staticmethod
+    def _etag(key: str, version: Version) -> str:
+        digest = hashlib.sha1(f"{_INSTANCE} {key} {version}".encode()).hexdigest()
+        return f'"{digest[:24]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
@@ -7,6 +7,7 @@ from fastapi.responses import JSONResponse
 
 from lumlflow.api.annotations import annotations_router
 from lumlflow.api.auth import auth_router
+from lumlflow.api.changes import changes_router
 from lumlflow.api.experiment_groups import experiment_groups_router
 from lumlflow.api.experiments import experiments_router
 from lumlflow.api.experiments_evals import (
@@ -20,6 +21,7 @@ from lumlflow.api.experiments_traces import (
 from lumlflow.api.luml import luml_router
 from lumlflow.api.models import models_router
 from lumlflow.infra.exceptions import ApplicationError
+from lumlflow.infra.experiment_records import ExperimentRecordsMiddleware
 
 
 class AppService(FastAPI):
@@ -32,6 +34,7 @@ class AppService(FastAPI):
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        self.add_middleware(ExperimentRecordsMiddleware)
 
         self.include_router(router=auth_router)
         self.include_router(router=luml_router)
@@ -43,6 +46,7 @@ class AppService(FastAPI):
         self.include_router(router=experiments_general_traces_router)
         self.include_router(router=models_router)
         self.include_router(router=annotations_router)
+        self.include_router(router=changes_router)
         self.include_error_handlers()
         self.custom_openapi()
 
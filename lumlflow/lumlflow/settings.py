@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     )
     LUML_API_KEY: str | None = None
     LUML_BASE_URL: str = "https://api.luml.ai"
+    RESPONSE_CACHE_MB: int = 64
 
     @field_validator("BACKEND_STORE_URI", mode="after")
     @classmethod
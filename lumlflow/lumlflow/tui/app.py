@@ -8,6 +8,7 @@ from textual.binding import Binding
 from textual.widget import Widget
 from textual.widgets import Input
 
+from lumlflow.infra.change_feed import ChangeFeed
 from lumlflow.schemas.experiments import ExperimentDetails
 from lumlflow.tui.clipboard import osc52_copy, read_system_clipboard
 from lumlflow.tui.data import DataFacade
@@ -73,6 +74,7 @@ class LumlflowApp(App[None]):
         store_uri: str | None = None,
         attach_timeout: float = DEFAULT_ATTACH_TIMEOUT,
         show_first_run_hint: bool = True,
+        change_feed: ChangeFeed | None = None,
     ) -> None:
         super().__init__()
         # Facade is constructed lazily on first access if the caller did
@@ -87,8 +89,14 @@ class LumlflowApp(App[None]):
         self.live_refresh_on = auto_refresh
         self._home_screen_factory = home_screen_factory
         self._open_dialog_count = 0
+        # Watches the store so live refresh only re-reads a screen after
+        # a commit it shows. Without a resolved store (tests passing an
+        # in-memory facade) the scheduler refreshes on every tick.
+        if change_feed is None and store_uri is not None:
+            change_feed = ChangeFeed(store_uri.split("://", 1)[-1])
+        self._change_feed: ChangeFeed | None = change_feed
         self._refresh_scheduler = LiveRefreshScheduler(
-            self, interval=refresh_interval
+            self, interval=refresh_interval, change_feed=change_feed
         )
         # Run-and-attach state. `run_spec` is set when `lumlflow tui <script>`
         # was invoked; on boot the app pushes a `RunAttachScreen` so the
@@ -299,6 +307,11 @@ class LumlflowApp(App[None]):
             self._first_run_hint_shown = True
             self.call_after_refresh(self._show_first_run_hint_toast)
 
+    def on_unmount(self) -> None:
+        self._refresh_scheduler.stop()
+        if self._change_feed is not None:
+            self._change_feed.close()
+
     # ----- Scopes / header sync -----
 
     def push_screen(self, screen, callback=None, wait_for_dismiss=False):  # type: ignore[override]
@@ -357,6 +370,7 @@ class LumlflowApp(App[None]):
         footer = self._footer
         if footer is not None:
             footer.set_scopes(screen.footer_scopes())
+        self._refresh_scheduler.sync_scope()
 
     # ----- Modeless input rule -----
 
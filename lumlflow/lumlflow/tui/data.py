@@ -24,7 +24,8 @@ import asyncio
 import sqlite3
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any
 
@@ -38,6 +39,7 @@ from lumlflow.handlers.luml.artifacts import ArtifactHandler
 from lumlflow.handlers.luml.luml import LumlHandler
 from lumlflow.handlers.models import ModelsHandler
 from lumlflow.infra.exceptions import ApplicationError
+from lumlflow.infra.experiment_records import experiment_records
 from lumlflow.infra.progress_store import ProgressStore
 from lumlflow.schemas.annotations import (
     Annotation,
@@ -275,6 +277,17 @@ class DataFacade:
         except Exception as exc:
             return Result.failure(500, str(exc))
 
+    @contextmanager
+    def experiment_scope(self, experiment_ids: list[str]) -> Iterator[None]:
+        """Load the records of `experiment_ids` in one query and reuse them
+        for every read in the block, the way the API does per request."""
+
+        with experiment_records.scope():
+            self._read(
+                lambda: experiment_records.get_many(self.tracker, experiment_ids)
+            )
+            yield
+
     # ----- groups -----
 
     def list_groups(
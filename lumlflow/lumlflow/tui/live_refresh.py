@@ -23,15 +23,30 @@ Key contracts (from SPEC.md):
 Screens opt in by implementing the `LiveRefreshable` protocol — a
 `refresh_live()` method that runs in the worker (it is synchronous and
 returns nothing). Screens that don't implement it are simply skipped.
+
+When the app has a `ChangeFeed` (always, when launched from the CLI),
+ticks are driven by it: a tick re-reads the screen only if the store
+committed something the screen shows since the last refresh, so an idle
+store costs no queries. A change that arrives after a quiet period
+refreshes at once, without waiting for the next tick. Screens that
+implement `ChangeAware` follow specific experiments' databases and get
+the changed table names, so they can re-fetch only the affected parts.
+Without a feed the scheduler falls back to refreshing on every tick.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
+    from textual.screen import Screen
     from textual.timer import Timer
 
+    from lumlflow.infra.change_feed import ChangeFeed, StoreChange, Subscription
     from lumlflow.tui.app import LumlflowApp
 
 
@@ -51,6 +66,21 @@ class LiveRefreshable(Protocol):
     def refresh_live(self) -> None: ...  # pragma: no cover - protocol
 
 
+@runtime_checkable
+class ChangeAware(Protocol):
+    """A refreshable screen that shows specific experiments.
+
+    `watched_experiments()` names the experiments whose databases the
+    change feed should follow while the screen is in front. Changes to
+    them, and to the meta DB, arrive in `refresh_changes(tables)` with
+    the names of the tables that changed, instead of `refresh_live()`.
+    """
+
+    def watched_experiments(self) -> Iterable[str]: ...  # pragma: no cover
+
+    def refresh_changes(self, tables: frozenset[str]) -> None: ...  # pragma: no cover
+
+
 class LiveRefreshScheduler:
     """Periodically asks the foreground screen to refresh in place.
 
@@ -66,10 +96,25 @@ class LiveRefreshScheduler:
     into its table without disturbing the user's cursor.
     """
 
-    def __init__(self, app: LumlflowApp, *, interval: float) -> None:
+    def __init__(
+        self,
+        app: LumlflowApp,
+        *,
+        interval: float,
+        change_feed: ChangeFeed | None = None,
+    ) -> None:
         self._app = app
         self._interval = max(0.1, interval)
         self._timer: Timer | None = None
+        self._change_feed = change_feed
+        self._subscription: Subscription | None = None
+        self._pending: list[StoreChange] = []
+        self._last_refresh = 0.0
+        # Every change bumps the generation; screens remember the
+        # generation they last refreshed at, so a screen returning to
+        # the front knows whether it missed changes in the meantime.
+        self._generation = 0
+        self._refreshed_at: WeakKeyDictionary[Screen, int] = WeakKeyDictionary()
 
     # ----- lifecycle -----
 
@@ -87,11 +132,24 @@ class LiveRefreshScheduler:
         # work — it only delegates to the foreground screen which
         # then schedules a worker thread.
         self._timer = self._app.set_interval(self._interval, self._tick)
+        if self._change_feed is not None and self._subscription is None:
+            # Feed callbacks run on the feed's thread. Hop onto the event
+            # loop without waiting for it, so stopping the feed from the
+            # loop can never deadlock against a pending notification.
+            loop = asyncio.get_running_loop()
+            self._subscription = self._change_feed.subscribe(
+                lambda change: loop.call_soon_threadsafe(self._on_change, change),
+                self._watched_experiments(),
+            )
 
     def stop(self) -> None:
         if self._timer is not None:
             self._timer.stop()
             self._timer = None
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+        self._pending.clear()
 
     # ----- interval -----
 
@@ -129,7 +187,11 @@ class LiveRefreshScheduler:
             return
         if self._app.is_refresh_paused:
             return
-        self.refresh_now()
+        if self._subscription is None:
+            self.refresh_now()
+            return
+        self.sync_scope()
+        self._refresh_pending()
 
     def refresh_now(self) -> None:
         """Trigger a single refresh cycle immediately.
@@ -140,10 +202,96 @@ class LiveRefreshScheduler:
         """
 
         screen = self._app.screen
+        if not screen.is_mounted:
+            return
+        self._pending.clear()
+        self._last_refresh = time.monotonic()
         if not isinstance(screen, LiveRefreshable):
             return
+        self._refreshed_at[screen] = self._generation
+        self._refresh_screen(screen.refresh_live)
+
+    # ----- change feed -----
+
+    def sync_scope(self) -> None:
+        """Follow the experiments of every screen in the stack.
+
+        Called on every tick and by the app whenever a screen is pushed
+        or popped. Screens below the top stay followed so nothing is
+        missed while an overlay or a drill-in covers them.
+        """
+
+        if self._subscription is None:
+            return
+        self._subscription.watch(self._watched_experiments())
+        if self._app.screen_stack:
+            self._refreshed_at.setdefault(self._app.screen, self._generation)
+
+    def _watched_experiments(self) -> set[str]:
+        watched: set[str] = set()
+        for screen in self._app.screen_stack:
+            if isinstance(screen, ChangeAware):
+                watched.update(screen.watched_experiments())
+        return watched
+
+    def _on_change(self, change: StoreChange) -> None:
+        """Queue a change and refresh right away after a quiet period.
+
+        Runs on the event loop. Changes arriving within `interval` of
+        the previous refresh are coalesced into the next tick, so a run
+        logging every few milliseconds refreshes at most once per
+        interval.
+        """
+
+        if self._subscription is None:
+            return
+        self._generation += 1
+        self._pending.append(change)
+        if not self._app.live_refresh_on or self._app.is_refresh_paused:
+            return
+        if time.monotonic() - self._last_refresh >= self._interval:
+            self._refresh_pending()
+
+    def _refresh_pending(self) -> None:
+        """Refresh the foreground screen with the changes it has not seen.
+
+        Changes are kept while the foreground screen cannot refresh (an
+        overlay is open). A screen that was covered while another screen
+        consumed changes gets one full `refresh_live()` when it is back
+        in front. A screen that was just pushed and has not finished
+        mounting loads its own data; the changes wait for the next tick.
+        """
+
+        screen = self._app.screen
+        if not isinstance(screen, LiveRefreshable) or not screen.is_mounted:
+            return
+        seen = self._refreshed_at.setdefault(screen, self._generation)
+        missed = seen < self._generation - len(self._pending)
+        watched = (
+            set(screen.watched_experiments())
+            if isinstance(screen, ChangeAware)
+            else set()
+        )
+        tables = frozenset().union(
+            *(
+                change.tables
+                for change in self._pending
+                if change.experiment_id is None or change.experiment_id in watched
+            )
+        )
+        self._pending.clear()
+        self._refreshed_at[screen] = self._generation
+        if not missed and not tables:
+            return
+        self._last_refresh = time.monotonic()
+        if isinstance(screen, ChangeAware) and not missed:
+            self._refresh_screen(lambda: screen.refresh_changes(tables))
+        else:
+            self._refresh_screen(screen.refresh_live)
+
+    def _refresh_screen(self, refresh: Callable[[], None]) -> None:
         try:
-            screen.refresh_live()
+            refresh()
         except Exception as exc:  # pragma: no cover - defensive
             # A misbehaving screen must not crash the scheduler.
             # Surface the error as a toast and continue.
@@ -152,4 +300,4 @@ class LiveRefreshScheduler:
             )
 
 
-__all__ = ("LiveRefreshable", "LiveRefreshScheduler")
+__all__ = ("ChangeAware", "LiveRefreshable", "LiveRefreshScheduler")
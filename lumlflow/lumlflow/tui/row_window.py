@@ -0,0 +1,259 @@
+"""Bounded, cursor-paged row window for the TUI list panels.
+
+The traces and evals panels page through the handlers' cursor
+pagination as the user scrolls. Keeping every page ever loaded means an
+experiment with hundreds of thousands of rows ends up holding — and
+live-refreshing — all of them. `RowWindow` keeps at most `max_pages`
+consecutive pages instead and remembers the cursor each page started
+at, so a page dropped off the top is fetched again by cursor when the
+user scrolls back up.
+
+Live refresh re-reads exactly the loaded window (one query from the
+window's first cursor) and `sync_table` applies the result to the
+`DataTable`: rows whose cells changed are updated in place, and the
+table is only rebuilt — at most one window of rows — when rows were
+added, removed or reordered.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import Any, Protocol
+
+from textual.widgets import DataTable
+
+MAX_WINDOW_PAGES = 8
+
+
+class KeyedRow(Protocol):
+    key: str
+
+
+class RowWindow[R: KeyedRow]:
+    """Up to `max_pages` consecutive pages of rows, plus page cursors.
+
+    Page `i` is the `i`-th page of the current sort/search/filter from
+    the top. Every page is `page_size` rows except possibly the last
+    one of the listing, so a page index is also a row offset.
+    """
+
+    def __init__(self, page_size: int, *, max_pages: int = MAX_WINDOW_PAGES) -> None:
+        self.page_size = page_size
+        # Two pages minimum, so scrolling across a page boundary never
+        # evicts the page the cursor is on.
+        self.max_pages = max(2, max_pages)
+        self._pages: deque[list[R]] = deque()
+        self._first_page = 0
+        self._starts: list[str | None] = [None]
+        self._has_more = False
+        self._rows: list[R] | None = []
+
+    def reset(self) -> None:
+        """Drop every page and cursor; the next page is the first one."""
+
+        self._pages.clear()
+        self._first_page = 0
+        self._starts = [None]
+        self._has_more = False
+        self._rows = []
+
+    @property
+    def rows(self) -> list[R]:
+        """The loaded rows, top to bottom."""
+
+        if self._rows is None:
+            self._rows = [row for page in self._pages for row in page]
+        return self._rows
+
+    @property
+    def first_page(self) -> int:
+        return self._first_page
+
+    @property
+    def end_page(self) -> int:
+        """Index of the page right after the window."""
+
+        return self._first_page + len(self._pages)
+
+    @property
+    def has_before(self) -> bool:
+        return self._first_page > 0
+
+    @property
+    def has_more(self) -> bool:
+        return self._has_more
+
+    def next_page(self) -> tuple[int, str | None]:
+        """Index and start cursor of the page to load below the window."""
+
+        index = self.end_page
+        return index, self._starts[index] if index < len(self._starts) else None
+
+    def previous_page(self) -> tuple[int, str | None]:
+        """Index and start cursor of the page to load above the window."""
+
+        index = self._first_page - 1
+        return index, self._starts[max(index, 0)]
+
+    def window_request(self) -> tuple[str | None, int]:
+        """Cursor and limit of the one query that re-reads the window."""
+
+        return (
+            self._starts[self._first_page],
+            max(1, len(self._pages)) * self.page_size,
+        )
+
+    def append(
+        self, index: int, items: Sequence[R], cursor: str | None
+    ) -> tuple[list[R], list[R]] | None:
+        """Add page `index` below the window.
+
+        Returns the rows added and the rows evicted from the top, or
+        None when `index` is not the next page — a result that raced a
+        reset or another load and must be dropped.
+        """
+
+        if index != self.end_page:
+            return None
+        added = self._dedupe(items)
+        self._pages.append(added)
+        self._set_start(index + 1, cursor)
+        self._has_more = cursor is not None and len(items) >= self.page_size
+        evicted: list[R] = []
+        if len(self._pages) > self.max_pages:
+            evicted = self._pages.popleft()
+            self._first_page += 1
+        self._rows = None
+        return added, evicted
+
+    def prepend(self, index: int, items: Sequence[R]) -> tuple[list[R], list[R]] | None:
+        """Add page `index` above the window.
+
+        Returns the rows added and the rows evicted from the bottom, or
+        None for a stale result (see `append`).
+        """
+
+        if index != self._first_page - 1:
+            return None
+        added = self._dedupe(items)
+        self._pages.appendleft(added)
+        self._first_page = index
+        evicted: list[R] = []
+        if len(self._pages) > self.max_pages:
+            evicted = self._pages.pop()
+            self._has_more = True
+        self._rows = None
+        return added, evicted
+
+    def replace(self, items: Sequence[R], cursor: str | None) -> None:
+        """Swap in a fresh read of the window made with `window_request`."""
+
+        _, limit = self.window_request()
+        size = self.page_size
+        self._pages = deque(
+            list(items[start : start + size]) for start in range(0, len(items), size)
+        )
+        self._has_more = cursor is not None and len(items) >= limit
+        # With no rows the end of the window is its start, whose cursor
+        # must stay for the next load.
+        if items:
+            self._set_start(self.end_page, cursor)
+        self._rows = None
+
+    def _dedupe(self, items: Sequence[R]) -> list[R]:
+        # Page cursors are positions in the sort order, so a page read
+        # again after rows were inserted can overlap the window.
+        loaded = {row.key for row in self.rows}
+        return [row for row in items if row.key not in loaded]
+
+    def _set_start(self, index: int, cursor: str | None) -> None:
+        if index < len(self._starts):
+            self._starts[index] = cursor
+        else:
+            self._starts.append(cursor)
+
+
+def apply_page[R: KeyedRow](
+    table: DataTable,
+    rows: Sequence[R],
+    added: Sequence[R],
+    evicted: Sequence[R],
+    *,
+    above: bool,
+    render: Callable[[R], Sequence[Any]],
+) -> None:
+    """Show a page `RowWindow.append`/`prepend` just took in.
+
+    `rows` is the window after the change. A page below is appended and
+    the evicted top rows removed; a page above rebuilds the (bounded)
+    table, since `DataTable` cannot insert rows. Either way the cursor
+    stays on the row it was on.
+    """
+
+    cursor = table.cursor_row
+    if above:
+        table.clear()
+        for row in rows:
+            table.add_row(*render(row), key=row.key)
+        cursor += len(added)
+    else:
+        for row in evicted:
+            table.remove_row(row.key)
+        for row in added:
+            table.add_row(*render(row), key=row.key)
+        cursor -= len(evicted)
+    if table.row_count > 0 and (above or evicted):
+        table.move_cursor(row=max(0, min(cursor, table.row_count - 1)), animate=False)
+
+
+def sync_table[R: KeyedRow](
+    table: DataTable,
+    old_rows: Sequence[R],
+    new_rows: Sequence[R],
+    *,
+    render: Callable[[R], Sequence[Any]],
+    differs: Callable[[R, R], bool],
+) -> list[str]:
+    """Bring `table` from `old_rows` to `new_rows` with the least work.
+
+    Rows that kept their key and position are re-rendered only when
+    `differs` says so, cell by cell. Any insertion, removal or
+    reordering rebuilds the table and keeps the cursor on the same
+    index. Returns the keys of added and changed rows.
+    """
+
+    if [row.key for row in old_rows] == [row.key for row in new_rows]:
+        columns = [column.key for column in table.ordered_columns]
+        changed: list[str] = []
+        for old, new in zip(old_rows, new_rows, strict=True):
+            if not differs(old, new):
+                continue
+            changed.append(new.key)
+            for column, cell in zip(columns, render(new), strict=False):
+                table.update_cell(new.key, column, cell)
+        return changed
+
+    old_by_key = {row.key: row for row in old_rows}
+    changed = [
+        row.key
+        for row in new_rows
+        if row.key not in old_by_key or differs(old_by_key[row.key], row)
+    ]
+    saved_cursor = table.cursor_row
+    table.clear()
+    for row in new_rows:
+        table.add_row(*render(row), key=row.key)
+    if table.row_count > 0:
+        clamped = max(0, min(saved_cursor, table.row_count - 1))
+        table.move_cursor(row=clamped, animate=False)
+    return changed
+
+
+__all__ = (
+    "MAX_WINDOW_PAGES",
+    "KeyedRow",
+    "RowWindow",
+    "apply_page",
+    "sync_table",
+)
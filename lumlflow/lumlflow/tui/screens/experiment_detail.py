@@ -43,6 +43,7 @@ from textual.containers import Container, Horizontal, VerticalScroll
 from textual.message import Message
 from textual.widgets import DataTable, Static, Tree
 
+from lumlflow.infra.change_feed import EXPERIMENT_TABLES, META_TABLES
 from lumlflow.schemas.experiments import (
     ExperimentDetails,
     ExperimentMetricHistory,
@@ -84,6 +85,14 @@ TAB_DEFS: tuple[tuple[str, str, int], ...] = (
 )
 
 
+# Store tables behind each part of the screen. A change-feed refresh only
+# re-fetches the parts whose tables changed.
+_ALL_TABLES = frozenset(META_TABLES + EXPERIMENT_TABLES)
+_DETAIL_TABLES = frozenset({*META_TABLES, "static_params", "dynamic_metrics"})
+_TRACE_TABLES = frozenset({"spans", "span_annotations"})
+_EVAL_TABLES = frozenset({"evals", "eval_traces_bridge", "eval_annotations"})
+
+
 # Plain-color counterparts used when rendering through `Static.update`
 # (CSS variables are not expanded outside DataTable / Textual's own CSS
 # rendering, so we use literal style names here).
@@ -1320,33 +1329,44 @@ class ExperimentDetailScreen(BaseScreen):
     # ----- live refresh -----
 
     def refresh_live(self) -> None:
-        """Refresh whatever is currently visible in this detail screen.
+        """Refresh whatever is currently visible in this detail screen."""
+
+        self.refresh_changes(_ALL_TABLES)
+
+    def watched_experiments(self) -> tuple[str, ...]:
+        return (self._experiment_id,)
+
+    def refresh_changes(self, tables: frozenset[str]) -> None:
+        """Refresh the visible parts of the screen that `tables` feed.
 
         Strategy:
-        - Always re-fetch experiment details (status flips, new dynamic
-          metric snapshot values) so the overview/header stay current.
-        - If the metrics tab is active, re-fetch the histories of the
-          visible charts in place so new points appear without losing
-          the user's grid cursor or open zoom view.
-        - Delegate to the active panel (traces/evals/attachments) so it
-          can refresh its own visible rows.
+        - Re-fetch experiment details (status flips, new dynamic metric
+          snapshot values) when the meta DB, params or metrics changed,
+          so the overview/header stay current.
+        - If the metrics tab is active and new metric points landed,
+          re-fetch the histories of the visible charts in place so new
+          points appear without losing the user's grid cursor or open
+          zoom view.
+        - Delegate to the active panel (traces/evals) when its tables
+          changed so it can refresh its own visible rows.
         """
 
         if self.facade is None:
             return
-        self._refresh_details()
-        if self._active_tab == "metrics":
+        if not tables.isdisjoint(_DETAIL_TABLES):
+            self._refresh_details()
+        if self._active_tab == "metrics" and "dynamic_metrics" in tables:
             self._refresh_metrics_visible()
         # Forward refresh into the active panel so it can update its own
         # visible window.
-        if self._active_tab == "traces":
+        if self._active_tab == "traces" and not tables.isdisjoint(_TRACE_TABLES):
             try:
                 panel = self.query_one("#pane-traces-panel", TracesPanel)
             except Exception:
                 return
             if hasattr(panel, "refresh_live"):
                 panel.refresh_live()
-        elif self._active_tab == "evals":
+        elif self._active_tab == "evals" and not tables.isdisjoint(_EVAL_TABLES):
             try:
                 evals = self.query_one("#pane-evals-panel", EvalsPanel)
             except Exception:
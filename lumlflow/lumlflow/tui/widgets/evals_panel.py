@@ -13,6 +13,9 @@ to open the eval detail screen, `j`/`k` for movement, and lazy
 pagination via cursor + prefetch. A dataset selector switches between
 the experiment's eval datasets and surfaces average scores per
 selected dataset.
+
+As in the traces panel, only a bounded window of pages is kept (see
+`RowWindow`). The heatmap range is taken over that window.
 """
 
 from __future__ import annotations
@@ -31,6 +34,7 @@ from textual.widgets import DataTable, Input, ListItem, ListView, Static
 from lumlflow.schemas.base import SortOrder
 from lumlflow.schemas.experiments import Eval, EvalColumns
 from lumlflow.tui.data import DataFacade, Result
+from lumlflow.tui.row_window import RowWindow, apply_page, sync_table
 from lumlflow.tui.widgets.dialogs import (
     FilterEditorDialog,
     FilterValidation,
@@ -253,11 +257,12 @@ class EvalsPanel(Widget):
         self._order: str = SortOrder.DESC.value
         self._search: str | None = None
         self._filter: str | None = None
-        self._cursor: str | None = None
-        self._has_more: bool = False
         self._loading: bool = False
+        # Bumped on every reset so page results requested under an older
+        # dataset/search/filter/sort are dropped.
+        self._generation: int = 0
         # Data + cached column info.
-        self._rows: list[_EvalRow] = []
+        self._window: RowWindow[_EvalRow] = RowWindow(page_size)
         self._dataset_ids: list[str] = []
         self._selected_dataset: str | None = None  # None == all datasets.
         self._columns: EvalColumns | None = None
@@ -565,30 +570,45 @@ class EvalsPanel(Widget):
 
     # ----- pagination -----
 
+    @property
+    def _rows(self) -> list[_EvalRow]:
+        return self._window.rows
+
     def load_first_page(self) -> None:
-        self._cursor = None
-        self._has_more = False
-        self._rows = []
+        self._window.reset()
+        self._generation += 1
         try:
             table = self.query_one("#evals-table", DataTable)
             table.clear()
         except Exception:
             pass
         self._set_loading(True)
-        self._fetch_page(reset=True)
+        self._fetch_page(index=0, cursor=None, generation=self._generation)
 
     def load_next_page(self) -> None:
-        if not self._has_more or self._loading:
+        if not self._window.has_more or self._loading:
+            return
+        index, cursor = self._window.next_page()
+        self._set_loading(True)
+        self._fetch_page(index=index, cursor=cursor, generation=self._generation)
+
+    def load_previous_page(self) -> None:
+        """Re-fetch the page above the window after it was evicted."""
+
+        if not self._window.has_before or self._loading:
             return
+        index, cursor = self._window.previous_page()
         self._set_loading(True)
-        self._fetch_page(reset=False)
+        self._fetch_page(index=index, cursor=cursor, generation=self._generation)
 
     @work(thread=True, exclusive=True, group="evals-fetch")
-    def _fetch_page(self, *, reset: bool) -> None:
+    def _fetch_page(
+        self, *, index: int, cursor: str | None, generation: int
+    ) -> None:
         facade = self.facade
         if facade is None:
             self.app.call_from_thread(
-                self._on_page_failure, "facade unavailable", reset
+                self._on_page_failure, "facade unavailable"
             )
             return
         try:
@@ -599,49 +619,59 @@ class EvalsPanel(Widget):
         result = facade.list_evals(
             self._experiment_id,
             limit=self._page_size,
-            cursor=None if reset else self._cursor,
+            cursor=cursor,
             sort_by=self._sort_by,
             order=order,
             dataset_id=self._selected_dataset,
             search=self._search or None,
             filters=filters,
         )
-        self.app.call_from_thread(self._on_page_result, result, reset)
+        self.app.call_from_thread(self._on_page_result, result, index, generation)
 
-    def _on_page_result(self, result: Result[Any], reset: bool) -> None:
+    def _on_page_result(
+        self, result: Result[Any], index: int, generation: int
+    ) -> None:
+        if generation != self._generation:
+            return
         self._set_loading(False)
         if not result.ok:
             message = result.error.message if result.error else "error"
-            self._on_page_failure(message, reset)
+            self._on_page_failure(message)
             return
         page = result.unwrap()
         new_rows = [_EvalRow(key=e.id, eval=e) for e in page.items]
-        self._rows = self._rows + new_rows if not reset else new_rows
-        self._cursor = page.cursor
-        self._has_more = page.cursor is not None and len(page.items) >= self._page_size
+        above = index < self._window.first_page
+        if above:
+            change = self._window.prepend(index, new_rows)
+        else:
+            change = self._window.append(index, new_rows, page.cursor)
+        if change is None:
+            return
+        added, evicted = change
         self._recompute_score_ranges()
-        self._refresh_table_after_page(new_rows, reset=reset)
+        self._refresh_table_after_page(added, evicted, above=above)
 
-    def _on_page_failure(self, message: str, _reset: bool) -> None:
+    def _on_page_failure(self, message: str) -> None:
         self._set_loading(False)
         self._lumlflow_app.show_toast(
             f"Could not load evals: {message}", severity="error"
         )
 
     def _refresh_table_after_page(
-        self, new_rows: list[_EvalRow], *, reset: bool
+        self, added: list[_EvalRow], evicted: list[_EvalRow], *, above: bool
     ) -> None:
         try:
             table = self.query_one("#evals-table", DataTable)
         except Exception:
             return
-        if reset:
-            table.clear()
-            for row in self._rows:
-                table.add_row(*self._render_row_cells(row), key=row.key)
-        else:
-            for row in new_rows:
-                table.add_row(*self._render_row_cells(row), key=row.key)
+        apply_page(
+            table,
+            self._rows,
+            added,
+            evicted,
+            above=above,
+            render=self._render_row_cells,
+        )
         self._update_empty_state()
         self._update_sort_status()
         self._update_filter_status()
@@ -809,6 +839,10 @@ class EvalsPanel(Widget):
             table = self.query_one("#evals-table", DataTable)
         except Exception:
             return
+        if self._window.has_before:
+            # The top of the listing was evicted; start over from it.
+            self.load_first_page()
+            return
         if table.row_count == 0:
             return
         table.move_cursor(row=0)
@@ -1013,13 +1047,17 @@ class EvalsPanel(Widget):
     def on_data_table_row_highlighted(
         self, event: DataTable.RowHighlighted
     ) -> None:
-        if not self._has_more or self._loading:
+        if self._loading:
             return
-        prefetch_threshold = 5
+        # Kept under a quarter page, so the cursor shift after a page is
+        # evicted never lands it in the opposite end's threshold.
+        prefetch_threshold = max(1, min(5, self._page_size // 4))
         if len(self._rows) <= prefetch_threshold:
             return
         if event.cursor_row >= len(self._rows) - prefetch_threshold:
             self.load_next_page()
+        elif event.cursor_row < prefetch_threshold:
+            self.load_previous_page()
 
     # ----- loading -----
 
@@ -1030,15 +1068,21 @@ class EvalsPanel(Widget):
     # ----- live refresh -----
 
     def refresh_live(self) -> None:
-        """Re-fetch the visible window without disturbing cursor/scroll."""
+        """Re-fetch the loaded window without disturbing cursor/scroll."""
 
         if not self._started or self._loading or self.facade is None:
             return
-        visible = max(self._page_size, len(self._rows))
-        self._refresh_visible_window(limit=visible)
+        cursor, limit = self._window.window_request()
+        self._refresh_visible_window(
+            cursor=cursor,
+            limit=limit,
+            window=(self._generation, self._window.first_page, self._window.end_page),
+        )
 
     @work(thread=True, exclusive=True, group="evals-refresh")
-    def _refresh_visible_window(self, *, limit: int) -> None:
+    def _refresh_visible_window(
+        self, *, cursor: str | None, limit: int, window: tuple[int, int, int]
+    ) -> None:
         facade = self.facade
         if facade is None:
             return
@@ -1050,51 +1094,57 @@ class EvalsPanel(Widget):
         result = facade.list_evals(
             self._experiment_id,
             limit=limit,
-            cursor=None,
+            cursor=cursor,
             sort_by=self._sort_by,
             order=order,
             dataset_id=self._selected_dataset,
             search=self._search or None,
             filters=filters,
         )
-        self.app.call_from_thread(self._on_refresh_result, result)
+        self.app.call_from_thread(self._on_refresh_result, result, window)
 
-    def _on_refresh_result(self, result: Result[Any]) -> None:
-        if not result.ok:
+    def _on_refresh_result(
+        self, result: Result[Any], window: tuple[int, int, int]
+    ) -> None:
+        # A page load or reset since the request moved the window; the
+        # next tick reads the new one.
+        current = (self._generation, self._window.first_page, self._window.end_page)
+        if not result.ok or self._loading or window != current:
             return
         page = result.unwrap()
         new_rows = [_EvalRow(key=e.id, eval=e) for e in page.items]
-        self._apply_diff(new_rows)
-
-    def _apply_diff(self, new_rows: list[_EvalRow]) -> None:
-        old_by_key = {r.key: r for r in self._rows}
-        new_by_key = {r.key: r for r in new_rows}
-        removed = [k for k in old_by_key if k not in new_by_key]
-        added: list[str] = []
-        updated: list[str] = []
-        for row in new_rows:
-            if row.key not in old_by_key:
-                added.append(row.key)
-            elif self._row_differs(old_by_key[row.key], row):
-                updated.append(row.key)
-        if not (removed or added or updated):
-            return
+        self._apply_diff(new_rows, page.cursor)
+
+    def _apply_diff(self, new_rows: list[_EvalRow], cursor: str | None) -> None:
+        old_rows = self._rows
+        old_ranges = self._score_ranges
+        self._window.replace(new_rows, cursor)
+        self._recompute_score_ranges()
         try:
             table = self.query_one("#evals-table", DataTable)
-            saved_cursor = table.cursor_row
         except Exception:
-            table = None
-            saved_cursor = 0
-        self._rows = new_rows
-        self._recompute_score_ranges()
-        if table is not None:
-            table.clear()
-            for row in new_rows:
-                table.add_row(*self._render_row_cells(row), key=row.key)
-            if table.row_count > 0:
-                clamped = max(0, min(saved_cursor, table.row_count - 1))
-                table.move_cursor(row=clamped, animate=False)
-            self._pulse_changed_rows(table, added + updated)
+            return
+        # Heatmap colours are relative to the loaded rows, so a moved
+        # range restyles every row, not just the ones whose values changed.
+        restyle = self._score_ranges != old_ranges
+        changed = sync_table(
+            table,
+            old_rows,
+            self._rows,
+            render=self._render_row_cells,
+            differs=(lambda _a, _b: True) if restyle else self._row_differs,
+        )
+        if restyle:
+            old_by_key = {row.key: row for row in old_rows}
+            changed = [
+                row.key
+                for row in self._rows
+                if row.key not in old_by_key
+                or self._row_differs(old_by_key[row.key], row)
+            ]
+        if len(old_rows) == len(self._rows) and not changed:
+            return
+        self._pulse_changed_rows(table, changed)
         self._update_empty_state()
         self._update_sort_status()
         self._update_filter_status()
@@ -11,6 +11,11 @@ The parent screen calls ``set_metric_keys`` to seed the grid and
 the single focused metric for the zoom view). This keeps the worker /
 result lifecycle on the screen and lets the widgets stay easy to test
 in isolation.
+
+Only cells in (or one row beyond) the grid's viewport ask for history.
+An experiment with hundreds of metrics therefore fetches and redraws a
+screenful of charts at a time; cells scrolled out of view while a
+refresh happens are marked stale and re-fetch when they scroll back in.
 """
 
 from __future__ import annotations
@@ -134,6 +139,8 @@ class MetricCell(PanelFrame):
         self._history: ExperimentMetricHistory | None = None
         self._last_render_width: int = 0
         self._history_requested: bool = False
+        # Set when a live refresh skipped this cell for being off screen.
+        self._stale: bool = False
 
     def compose(self) -> Iterable[Widget]:  # type: ignore[override]
         yield PlotextPlot(classes="metric-cell-chart")
@@ -149,14 +156,39 @@ class MetricCell(PanelFrame):
         # fetch sized to the fallback width would be re-fetched at the
         # real width on the next refresh tick, visibly re-rendering the
         # chart at a different granularity.
-        if self._history_requested or self._history is not None:
+        grid = next(
+            (node for node in self.ancestors if isinstance(node, MetricGrid)), None
+        )
+        if grid is not None and not grid.is_key_in_view(self.metric_key):
             return
+        max_points = self.take_history_request()
+        if max_points is not None:
+            self.post_message(MetricGrid.HistoryNeeded(self.metric_key, max_points))
+
+    @property
+    def needs_history(self) -> bool:
+        """True when the cell is laid out and waiting for (fresh) points."""
+
         if self.size.width <= 0:
-            return
+            return False
+        if self._stale:
+            return True
+        return not self._history_requested and self._history is None
+
+    def take_history_request(self) -> int | None:
+        """Mark the cell's points as requested and return ``max_points``.
+
+        Returns None when the cell is not waiting for points.
+        """
+
+        if not self.needs_history:
+            return None
         self._history_requested = True
-        self.post_message(
-            MetricGrid.HistoryNeeded(self.metric_key, self.chart_max_points())
-        )
+        self._stale = False
+        return self.chart_max_points()
+
+    def mark_stale(self) -> None:
+        self._stale = True
 
     def chart_max_points(self) -> int:
         """Estimate how many points to subsample to for this cell."""
@@ -320,6 +352,21 @@ class MetricGrid(VerticalScroll):
         # Column count and total grid height depend on the viewport
         # width, so recompute the layout whenever the grid is resized.
         self._relayout()
+        self._request_in_view()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        self._request_in_view()
+
+    def _request_in_view(self) -> None:
+        # Posted by the grid rather than the cell: a message created while
+        # the grid is handling a scroll has the grid as its sender and
+        # would stop bubbling there.
+        for key in self.visible_metric_keys():
+            cell = self._cells.get(key)
+            max_points = cell.take_history_request() if cell is not None else None
+            if max_points is not None:
+                self.post_message(self.HistoryNeeded(key, max_points))
 
     def _relayout(self) -> None:
         """Size the cell grid to the number of metrics and the viewport.
@@ -405,19 +452,41 @@ class MetricGrid(VerticalScroll):
         cell.set_history(history)
 
     def visible_metric_keys(self) -> tuple[str, ...]:
-        """Return the keys currently rendered in the grid."""
+        """Return the keys of the cells in the viewport.
 
-        return tuple(self._metric_keys)
+        The cells are laid out in fixed-height rows, so the visible
+        ones follow from the scroll offset alone. One extra row above
+        and below is included so charts are ready as they scroll in.
+        Before the first layout every key counts as visible.
+        """
+
+        height = self.size.height
+        if height <= 0:
+            return tuple(self._metric_keys)
+        pitch = _CELL_HEIGHT + _GRID_GUTTER
+        top = round(self.scroll_y)
+        first_row = max(0, top // pitch - 1)
+        last_row = (top + height) // pitch + 1
+        cols = self._cols
+        return tuple(self._metric_keys[first_row * cols : (last_row + 1) * cols])
+
+    def is_key_in_view(self, metric_key: str) -> bool:
+        return metric_key in self.visible_metric_keys()
 
     def request_refresh_visible(self) -> None:
         """Re-request history for every visible cell.
 
         Called by the screen on live-refresh / resize so existing
         cells keep their cached history but get repainted with the
-        latest points.
+        latest points. Cells out of view are only marked stale; they
+        re-fetch once scrolled back in.
         """
 
+        visible = set(self.visible_metric_keys())
         for key, cell in self._cells.items():
+            if key not in visible:
+                cell.mark_stale()
+                continue
             max_points = cell.chart_max_points()
             self.post_message(self.HistoryNeeded(key, max_points))
 
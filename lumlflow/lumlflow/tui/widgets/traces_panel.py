@@ -6,6 +6,11 @@ search, `f` for the advanced filter DSL (live-validated against the
 handler's `validate_traces_filter`), `s` for sort chooser, `Enter` to
 open the trace detail screen, `j`/`k` navigation, lazy pagination.
 
+Only a bounded window of pages is kept (see `RowWindow`): pages load by
+cursor as the cursor nears either end of the window and fall off the
+other end, so the table stays the same size however many traces the
+experiment holds.
+
 Trace state colour-coding follows the SPEC: `ok` green, `error` red,
 `in_progress` orange (with a clock indicator), `unspecified` dim.
 
@@ -34,6 +39,7 @@ from lumlflow.schemas.experiments import (
     TraceState,
 )
 from lumlflow.tui.data import DataFacade, Result
+from lumlflow.tui.row_window import RowWindow, apply_page, sync_table
 from lumlflow.tui.widgets.dialogs import (
     FilterEditorDialog,
     FilterValidation,
@@ -172,10 +178,11 @@ class TracesPanel(Widget):
         self._order: str = SortOrder.DESC.value
         self._search: str | None = None
         self._filter: str | None = None
-        self._cursor: str | None = None
-        self._has_more: bool = False
         self._loading: bool = False
-        self._rows: list[_TraceRow] = []
+        self._window: RowWindow[_TraceRow] = RowWindow(page_size)
+        # Bumped on every reset so page results requested under an older
+        # search/filter/sort are dropped.
+        self._generation: int = 0
         self._search_timer: Any = None
         # The first time the user navigates to the tab the panel mounts
         # but the parent screen may not yet have data — the panel waits
@@ -236,32 +243,47 @@ class TracesPanel(Widget):
     def _lumlflow_app(self) -> LumlflowApp:
         return cast("LumlflowApp", self.app)
 
+    @property
+    def _rows(self) -> list[_TraceRow]:
+        return self._window.rows
+
     # ----- pagination -----
 
     def load_first_page(self) -> None:
-        self._cursor = None
-        self._has_more = False
-        self._rows = []
+        self._window.reset()
+        self._generation += 1
         try:
             table = self.query_one("#traces-table", DataTable)
             table.clear()
         except Exception:
             pass
         self._set_loading(True)
-        self._fetch_page(reset=True)
+        self._fetch_page(index=0, cursor=None, generation=self._generation)
 
     def load_next_page(self) -> None:
-        if not self._has_more or self._loading:
+        if not self._window.has_more or self._loading:
+            return
+        index, cursor = self._window.next_page()
+        self._set_loading(True)
+        self._fetch_page(index=index, cursor=cursor, generation=self._generation)
+
+    def load_previous_page(self) -> None:
+        """Re-fetch the page above the window after it was evicted."""
+
+        if not self._window.has_before or self._loading:
             return
+        index, cursor = self._window.previous_page()
         self._set_loading(True)
-        self._fetch_page(reset=False)
+        self._fetch_page(index=index, cursor=cursor, generation=self._generation)
 
     @work(thread=True, exclusive=True, group="traces-fetch")
-    def _fetch_page(self, *, reset: bool) -> None:
+    def _fetch_page(
+        self, *, index: int, cursor: str | None, generation: int
+    ) -> None:
         facade = self.facade
         if facade is None:
             self.app.call_from_thread(
-                self._on_page_failure, "facade unavailable", reset
+                self._on_page_failure, "facade unavailable"
             )
             return
         try:
@@ -276,44 +298,57 @@ class TracesPanel(Widget):
         result = facade.list_traces(
             self._experiment_id,
             limit=self._page_size,
-            cursor=None if reset else self._cursor,
+            cursor=cursor,
             sort_by=sort_by,
             order=order,
             search=self._search or None,
             filters=filters,
         )
-        self.app.call_from_thread(self._on_page_result, result, reset)
+        self.app.call_from_thread(self._on_page_result, result, index, generation)
 
-    def _on_page_result(self, result: Result[Any], reset: bool) -> None:
+    def _on_page_result(
+        self, result: Result[Any], index: int, generation: int
+    ) -> None:
+        if generation != self._generation:
+            return
         self._set_loading(False)
         if not result.ok:
             message = result.error.message if result.error else "error"
-            self._on_page_failure(message, reset)
+            self._on_page_failure(message)
             return
         page = result.unwrap()
         new_rows = [_TraceRow(key=t.trace_id, trace=t) for t in page.items]
-        self._rows = self._rows + new_rows if not reset else new_rows
-        self._cursor = page.cursor
-        self._has_more = page.cursor is not None and len(page.items) >= self._page_size
-        self._refresh_table_after_page(new_rows, reset=reset)
+        above = index < self._window.first_page
+        if above:
+            change = self._window.prepend(index, new_rows)
+        else:
+            change = self._window.append(index, new_rows, page.cursor)
+        if change is None:
+            return
+        added, evicted = change
+        self._refresh_table_after_page(added, evicted, above=above)
 
-    def _on_page_failure(self, message: str, _reset: bool) -> None:
+    def _on_page_failure(self, message: str) -> None:
         self._set_loading(False)
         self._lumlflow_app.show_toast(
             f"Could not load traces: {message}", severity="error"
         )
 
     def _refresh_table_after_page(
-        self, new_rows: list[_TraceRow], *, reset: bool
+        self, added: list[_TraceRow], evicted: list[_TraceRow], *, above: bool
     ) -> None:
         try:
             table = self.query_one("#traces-table", DataTable)
         except Exception:
             return
-        if reset:
-            table.clear()
-        for row in new_rows:
-            table.add_row(*self._render_row_cells(row), key=row.key)
+        apply_page(
+            table,
+            self._rows,
+            added,
+            evicted,
+            above=above,
+            render=self._render_row_cells,
+        )
         self._update_empty_state()
         self._update_sort_status()
         self._update_filter_status()
@@ -436,6 +471,10 @@ class TracesPanel(Widget):
             table = self.query_one("#traces-table", DataTable)
         except Exception:
             return
+        if self._window.has_before:
+            # The top of the listing was evicted; start over from it.
+            self.load_first_page()
+            return
         if table.row_count == 0:
             return
         table.move_cursor(row=0)
@@ -632,13 +671,17 @@ class TracesPanel(Widget):
     def on_data_table_row_highlighted(
         self, event: DataTable.RowHighlighted
     ) -> None:
-        if not self._has_more or self._loading:
+        if self._loading:
             return
-        prefetch_threshold = 5
+        # Kept under a quarter page, so the cursor shift after a page is
+        # evicted never lands it in the opposite end's threshold.
+        prefetch_threshold = max(1, min(5, self._page_size // 4))
         if len(self._rows) <= prefetch_threshold:
             return
         if event.cursor_row >= len(self._rows) - prefetch_threshold:
             self.load_next_page()
+        elif event.cursor_row < prefetch_threshold:
+            self.load_previous_page()
 
     # ----- loading -----
 
@@ -649,20 +692,27 @@ class TracesPanel(Widget):
     # ----- live refresh -----
 
     def refresh_live(self) -> None:
-        """Re-fetch the visible window without disturbing cursor/scroll.
+        """Re-fetch the loaded window without disturbing cursor/scroll.
 
         State flips for in-progress traces are the most visible payoff
         here: a row tagged `in_progress` becoming `ok`/`error` re-colours
-        without forcing the user to scroll back.
+        without forcing the user to scroll back. The read covers the
+        window only, never the pages above or below it.
         """
 
         if not self._started or self._loading or self.facade is None:
             return
-        visible = max(self._page_size, len(self._rows))
-        self._refresh_visible_window(limit=visible)
+        cursor, limit = self._window.window_request()
+        self._refresh_visible_window(
+            cursor=cursor,
+            limit=limit,
+            window=(self._generation, self._window.first_page, self._window.end_page),
+        )
 
     @work(thread=True, exclusive=True, group="traces-refresh")
-    def _refresh_visible_window(self, *, limit: int) -> None:
+    def _refresh_visible_window(
+        self, *, cursor: str | None, limit: int, window: tuple[int, int, int]
+    ) -> None:
         facade = self.facade
         if facade is None:
             return
@@ -678,49 +728,43 @@ class TracesPanel(Widget):
         result = facade.list_traces(
             self._experiment_id,
             limit=limit,
-            cursor=None,
+            cursor=cursor,
             sort_by=sort_by,
             order=order,
             search=self._search or None,
             filters=filters,
         )
-        self.app.call_from_thread(self._on_refresh_result, result)
+        self.app.call_from_thread(self._on_refresh_result, result, window)
 
-    def _on_refresh_result(self, result: Result[Any]) -> None:
-        if not result.ok:
+    def _on_refresh_result(
+        self, result: Result[Any], window: tuple[int, int, int]
+    ) -> None:
+        # A page load or reset since the request moved the window; the
+        # next tick reads the new one.
+        current = (self._generation, self._window.first_page, self._window.end_page)
+        if not result.ok or self._loading or window != current:
             return
         page = result.unwrap()
         new_rows = [_TraceRow(key=t.trace_id, trace=t) for t in page.items]
-        self._apply_diff(new_rows)
-
-    def _apply_diff(self, new_rows: list[_TraceRow]) -> None:
-        old_by_key = {r.key: r for r in self._rows}
-        new_by_key = {r.key: r for r in new_rows}
-        removed = [k for k in old_by_key if k not in new_by_key]
-        added: list[str] = []
-        updated: list[str] = []
-        for row in new_rows:
-            if row.key not in old_by_key:
-                added.append(row.key)
-            elif self._row_differs(old_by_key[row.key], row):
-                updated.append(row.key)
-        if not (removed or added or updated):
-            return
+        self._apply_diff(new_rows, page.cursor)
+
+    def _apply_diff(self, new_rows: list[_TraceRow], cursor: str | None) -> None:
+        old_rows = self._rows
+        self._window.replace(new_rows, cursor)
         try:
             table = self.query_one("#traces-table", DataTable)
-            saved_cursor = table.cursor_row
         except Exception:
-            table = None
-            saved_cursor = 0
-        self._rows = new_rows
-        if table is not None:
-            table.clear()
-            for row in new_rows:
-                table.add_row(*self._render_row_cells(row), key=row.key)
-            if table.row_count > 0:
-                clamped = max(0, min(saved_cursor, table.row_count - 1))
-                table.move_cursor(row=clamped, animate=False)
-            self._pulse_changed_rows(table, added + updated)
+            return
+        changed = sync_table(
+            table,
+            old_rows,
+            self._rows,
+            render=self._render_row_cells,
+            differs=self._row_differs,
+        )
+        if len(old_rows) == len(self._rows) and not changed:
+            return
+        self._pulse_changed_rows(table, changed)
         self._update_empty_state()
         self._update_sort_status()
         self._update_filter_status()
@@ -0,0 +1,136 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from luml.experiments.tracker import ExperimentTracker
+from lumlflow.api.changes import _change_events
+from lumlflow.infra.change_feed import ChangeFeed, StoreChange
+
+
+@pytest.fixture
+def store_path(tmp_path: Path) -> Path:
+    return tmp_path / "experiments"
+
+
+@pytest.fixture
+def tracker(store_path: Path) -> ExperimentTracker:
+    return ExperimentTracker(f"sqlite://{store_path}")
+
+
+@pytest.fixture
+def feed(store_path: Path, tracker: ExperimentTracker):  # noqa: ANN201
+    feed = ChangeFeed(store_path)
+    yield feed
+    feed.close()
+
+
+class TestChangeFeed:
+    def test_reports_only_new_commits(
+        self, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        exp_id = tracker.start_experiment(name="run")
+        received: list[StoreChange] = []
+        feed.subscribe(received.append, [exp_id], start=False)
+
+        assert feed.poll() == []
+
+        tracker.log_dynamic("loss", 0.5, step=0, experiment_id=exp_id)
+        assert feed.poll() == [StoreChange(exp_id, frozenset({"dynamic_metrics"}))]
+        assert feed.poll() == []
+        assert received == [StoreChange(exp_id, frozenset({"dynamic_metrics"}))]
+
+    def test_update_reports_all_tables(
+        self, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        exp_id = tracker.start_experiment(name="run")
+        feed.subscribe(lambda _: None, start=False)
+
+        tracker.end_experiment(exp_id)
+
+        [change] = feed.poll()
+        assert change.experiment_id is None
+        assert change.touches("experiments")
+
+    def test_unfollowed_experiments_are_not_watched(
+        self, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        followed = tracker.start_experiment(name="followed")
+        other = tracker.start_experiment(name="other")
+        received: list[StoreChange] = []
+        subscription = feed.subscribe(received.append, [followed], start=False)
+
+        tracker.log_dynamic("loss", 0.5, step=0, experiment_id=other)
+        assert feed.poll() == []
+
+        subscription.watch([other])
+        tracker.log_dynamic("loss", 0.4, step=1, experiment_id=other)
+        feed.poll()
+        assert [change.experiment_id for change in received] == [other]
+
+    def test_database_created_after_subscribing(
+        self, store_path: Path, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        exp_id = "0000-later"
+        feed.subscribe(lambda _: None, [exp_id], start=False)
+        assert feed.poll() == []
+
+        tracker.start_experiment(experiment_id=exp_id, name="later")
+
+        changes = {change.experiment_id: change for change in feed.poll()}
+        assert changes[exp_id].touches("dynamic_metrics", "spans")
+
+    def test_close_subscription_stops_watching(
+        self, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        received: list[StoreChange] = []
+        subscription = feed.subscribe(received.append, start=False)
+        subscription.close()
+
+        tracker.create_group("g")
+
+        assert feed.poll() == []
+        assert received == []
+
+
+class FakeRequest:
+    def __init__(self) -> None:
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+class TestChangeEvents:
+    async def test_streams_changes(
+        self, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        exp_id = tracker.start_experiment(name="run")
+        with patch("lumlflow.api.changes.change_feed", feed):
+            events = _change_events(FakeRequest(), [exp_id])
+            assert await anext(events) == ": connected\n\n"
+
+            tracker.log_dynamic("loss", 0.5, step=0, experiment_id=exp_id)
+            feed.poll()
+            event = await anext(events)
+            await events.aclose()
+
+        assert json.loads(event.removeprefix("data: ")) == {
+            "experiment_id": exp_id,
+            "tables": ["dynamic_metrics"],
+        }
+        assert feed._subscriptions == []
+
+    async def test_ends_when_client_disconnects(self, feed: ChangeFeed) -> None:
+        request = FakeRequest()
+        with (
+            patch("lumlflow.api.changes.change_feed", feed),
+            patch("lumlflow.api.changes._KEEPALIVE_SECONDS", 0.01),
+        ):
+            events = _change_events(request, [])
+            assert await anext(events) == ": connected\n\n"
+            assert await anext(events) == ": keepalive\n\n"
+            request.disconnected = True
+            assert [event async for event in events] == []
+
+        assert feed._subscriptions == []
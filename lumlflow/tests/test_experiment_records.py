@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+from luml.experiments.tracker import ExperimentTracker
+from lumlflow.infra.experiment_records import ExperimentRecordCache
+
+
+@pytest.fixture
+def store_path(tmp_path: Path) -> Path:
+    return tmp_path / "experiments"
+
+
+@pytest.fixture
+def tracker(store_path: Path) -> ExperimentTracker:
+    return ExperimentTracker(f"sqlite://{store_path}")
+
+
+@pytest.fixture
+def lookups(
+    tracker: ExperimentTracker, monkeypatch: pytest.MonkeyPatch
+) -> list[list[str]]:
+    calls: list[list[str]] = []
+    original = tracker.get_experiment_records
+
+    def spy(experiment_ids: list[str]) -> dict:
+        calls.append(list(experiment_ids))
+        return original(experiment_ids)
+
+    monkeypatch.setattr(tracker, "get_experiment_records", spy)
+    return calls
+
+
+class TestExperimentRecordCache:
+    def test_get_many_fetches_missing_ids_in_one_batch(
+        self, tracker: ExperimentTracker, lookups: list[list[str]]
+    ) -> None:
+        first = tracker.start_experiment(name="first")
+        second = tracker.start_experiment(name="second")
+        cache = ExperimentRecordCache()
+
+        records = cache.get_many(tracker, [first, second, "missing"])
+
+        assert {k: v.name for k, v in records.items()} == {
+            first: "first",
+            second: "second",
+        }
+        assert lookups == [[first, second, "missing"]]
+        assert cache.get(tracker, "missing") is None
+        assert len(lookups) == 1
+
+    def test_records_are_reused_until_meta_db_changes(
+        self, tracker: ExperimentTracker, store_path: Path, lookups: list[list[str]]
+    ) -> None:
+        exp_id = tracker.start_experiment(name="before")
+        cache = ExperimentRecordCache()
+
+        assert cache.get(tracker, exp_id).name == "before"
+        assert cache.get(tracker, exp_id).name == "before"
+        assert len(lookups) == 1
+
+        writer = ExperimentTracker(f"sqlite://{store_path}")
+        writer.update_experiment(exp_id, name="after")
+
+        assert cache.get(tracker, exp_id).name == "after"
+        assert len(lookups) == 2
+
+    def test_zero_ttl_disables_process_cache(
+        self, tracker: ExperimentTracker, lookups: list[list[str]]
+    ) -> None:
+        exp_id = tracker.start_experiment()
+        cache = ExperimentRecordCache(ttl=0)
+
+        cache.get(tracker, exp_id)
+        cache.get(tracker, exp_id)
+        assert len(lookups) == 2
+
+        with cache.scope():
+            cache.get(tracker, exp_id)
+            cache.get(tracker, exp_id)
+        assert len(lookups) == 3
+
+    def test_invalidate_drops_the_scoped_copy(
+        self, tracker: ExperimentTracker, lookups: list[list[str]]
+    ) -> None:
+        exp_id = tracker.start_experiment(name="before")
+        cache = ExperimentRecordCache(ttl=0)
+
+        with cache.scope():
+            assert cache.get(tracker, exp_id).name == "before"
+            tracker.update_experiment(exp_id, name="after")
+            cache.invalidate(tracker, exp_id)
+            assert cache.get(tracker, exp_id).name == "after"
+        assert len(lookups) == 2
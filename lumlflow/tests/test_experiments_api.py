@@ -4,6 +4,7 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 from luml.experiments.tracker import ExperimentTracker
+from lumlflow.infra.response_cache import ResponseCache
 from lumlflow.service import AppService
 
 
@@ -13,14 +14,19 @@ def tracker(tmp_path: Path) -> ExperimentTracker:
 
 
 @pytest.fixture()
-def client(tracker: ExperimentTracker) -> TestClient:
+def client(
+    tracker: ExperimentTracker, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> TestClient:
     init_patch = "lumlflow.api.experiments.ExperimentsHandler.__init__"
     with patch(init_patch, lambda self: None):
         app = AppService()
 
-    from lumlflow.api.experiments import experiments_handler
+    from lumlflow.api import experiments, experiments_evals, experiments_traces
 
-    experiments_handler.tracker = tracker
+    cache = ResponseCache(tmp_path / "experiments")
+    for module in (experiments, experiments_evals, experiments_traces):
+        module.experiments_handler.tracker = tracker
+        monkeypatch.setattr(module, "response_cache", cache)
     return TestClient(app)
 
 
@@ -62,3 +68,239 @@ class TestMetricKeyWithSlash:
         assert response.status_code == 200
         data = response.json()
         assert data["key"] == "accuracy"
+
+
+class TestAttachmentContent:
+    def test_serves_file_with_etag(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+        tracker.log_attachment("config.json", '{"lr": 0.1}', experiment_id=exp_id)
+
+        response = client.get(
+            f"/api/experiments/{exp_id}/attachments/content",
+            params={"file_path": "config.json"},
+        )
+        assert response.status_code == 200
+        assert response.content == b'{"lr": 0.1}'
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-disposition"].startswith("inline")
+        assert response.headers["etag"]
+
+    def test_range_request(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+        payload = bytes(range(256)) * 4
+        tracker.log_attachment(
+            "weights.bin", payload, binary=True, experiment_id=exp_id
+        )
+
+        response = client.get(
+            f"/api/experiments/{exp_id}/attachments/content",
+            params={"file_path": "weights.bin"},
+            headers={"Range": "bytes=100-199"},
+        )
+        assert response.status_code == 206
+        assert response.content == payload[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(payload)}"
+
+    def test_if_none_match_returns_not_modified(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+        tracker.log_attachment("notes.txt", "hello", experiment_id=exp_id)
+        url = f"/api/experiments/{exp_id}/attachments/content"
+        params = {"file_path": "notes.txt"}
+
+        etag = client.get(url, params=params).headers["etag"]
+        response = client.get(url, params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        tracker.log_attachment("notes.txt", "hello again", experiment_id=exp_id)
+        response = client.get(url, params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.content == b"hello again"
+
+    def test_sniffs_type_of_files_without_extension(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+        png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+        tracker.log_attachment("plot", png, binary=True, experiment_id=exp_id)
+        tracker.log_attachment("stdout", "epoch 1 done\n", experiment_id=exp_id)
+        url = f"/api/experiments/{exp_id}/attachments/content"
+
+        response = client.get(url, params={"file_path": "plot"})
+        assert response.headers["content-type"] == "image/png"
+        response = client.get(url, params={"file_path": "stdout"})
+        assert response.headers["content-type"].startswith("text/plain")
+
+    def test_path_outside_attachments_is_not_found(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+
+        response = client.get(
+            f"/api/experiments/{exp_id}/attachments/content",
+            params={"file_path": "../exp.db"},
+        )
+        assert response.status_code == 404
+
+
+COLUMNAR = {"Accept": "application/vnd.lumlflow.columnar+json"}
+
+
+def _rows(columns: dict[str, list]) -> list[dict]:
+    return [
+        dict(zip(columns, values, strict=True))
+        for values in zip(*columns.values(), strict=True)
+    ]
+
+
+class TestColumnarResponses:
+    @pytest.fixture()
+    def exp_id(self, tracker: ExperimentTracker) -> str:
+        exp_id = tracker.start_experiment(name="test")
+        for step in range(5):
+            tracker.log_dynamic("loss", 1.0 / (step + 1), step=step)
+        for i in range(3):
+            tracker.log_span(
+                trace_id=f"t-{i}",
+                span_id=f"s-{i}",
+                name="root",
+                start_time_unix_nano=0,
+                end_time_unix_nano=(i + 1) * 1_000,
+                experiment_id=exp_id,
+            )
+            tracker.log_eval_sample(
+                eval_id=f"e-{i}",
+                dataset_id="ds",
+                inputs={"prompt": f"q{i}"},
+                scores={"accuracy": i / 2},
+                experiment_id=exp_id,
+            )
+        tracker.end_experiment(exp_id)
+        return exp_id
+
+    @pytest.mark.parametrize(
+        "path",
+        ["traces", "traces/all", "evals", "evals/all"],
+    )
+    def test_columns_match_rows(
+        self, client: TestClient, exp_id: str, path: str
+    ) -> None:
+        url = f"/api/experiments/{exp_id}/{path}"
+
+        rows = client.get(url).json()
+        response = client.get(url, headers=COLUMNAR)
+
+        assert response.headers["content-type"] == COLUMNAR["Accept"]
+        columnar = response.json()
+        if isinstance(rows, dict):
+            assert columnar["cursor"] == rows["cursor"]
+            rows, columnar = rows["items"], columnar["items"]
+        assert len(rows) == 3
+        assert _rows(columnar) == rows
+
+    def test_compare_columns_match_rows(self, client: TestClient, exp_id: str) -> None:
+        url = "/api/experiments/evals/compare"
+        params = {"experiment_ids": [exp_id]}
+
+        rows = client.get(url, params=params).json()
+        columnar = client.get(url, params=params, headers=COLUMNAR).json()
+
+        assert _rows(columnar["items"]) == rows["items"]
+        assert {row["experiment_id"] for row in rows["items"]} == {exp_id}
+
+    def test_metric_history(self, client: TestClient, exp_id: str) -> None:
+        url = f"/api/experiments/{exp_id}/metrics/loss"
+
+        rows = client.get(url, params={"max_points": 3}).json()
+        columnar = client.get(url, params={"max_points": 3}, headers=COLUMNAR).json()
+
+        assert columnar["subsampled"] is rows["subsampled"] is True
+        assert columnar["history"]["step"] == [0, 2, 4]
+        assert _rows(columnar["history"]) == rows["history"]
+
+    def test_empty_page_keeps_columns(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="empty")
+
+        response = client.get(f"/api/experiments/{exp_id}/traces", headers=COLUMNAR)
+
+        assert response.json()["items"]["trace_id"] == []
+
+
+class TestResponseCache:
+    def test_repeated_request_is_served_from_cache(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+        tracker.log_dynamic("loss", 0.5, step=0, experiment_id=exp_id)
+        url = f"/api/experiments/{exp_id}/metrics/loss"
+
+        from lumlflow.api.experiments import experiments_handler
+
+        with patch.object(
+            experiments_handler,
+            "get_experiment_metric_history",
+            wraps=experiments_handler.get_experiment_metric_history,
+        ) as handler:
+            first = client.get(url)
+            second = client.get(url)
+
+        assert handler.call_count == 1
+        assert second.json() == first.json()
+        assert second.headers["etag"] == first.headers["etag"]
+
+    def test_commit_invalidates(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+        tracker.log_dynamic("loss", 0.5, step=0, experiment_id=exp_id)
+        url = f"/api/experiments/{exp_id}/metrics/loss"
+
+        first = client.get(url)
+        tracker.log_dynamic("loss", 0.4, step=1, experiment_id=exp_id)
+        second = client.get(url)
+
+        assert len(second.json()["history"]) == 2
+        assert second.headers["etag"] != first.headers["etag"]
+
+    def test_if_none_match_skips_the_handler(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+        url = f"/api/experiments/{exp_id}/traces"
+        etag = client.get(url).headers["etag"]
+
+        from lumlflow.api.experiments_traces import experiments_handler
+
+        with patch.object(experiments_handler, "get_experiment_traces") as handler:
+            response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        handler.assert_not_called()
+
+    def test_encodings_are_cached_separately(
+        self, tracker: ExperimentTracker, client: TestClient
+    ) -> None:
+        exp_id = tracker.start_experiment(name="test")
+        url = f"/api/experiments/{exp_id}/evals"
+
+        rows = client.get(url)
+        columnar = client.get(url, headers=COLUMNAR)
+
+        assert rows.json() == {"items": [], "cursor": None}
+        assert columnar.headers["content-type"] == COLUMNAR["Accept"]
+        assert columnar.headers["etag"] != rows.headers["etag"]
+
+    def test_errors_are_not_cached(self, client: TestClient) -> None:
+        assert client.get("/api/experiments/missing/traces").status_code == 404
+        assert client.get("/api/experiments/missing/traces").status_code == 404
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+from luml.experiments.tracker import ExperimentTracker
+from lumlflow.infra.response_cache import ResponseCache
+
+
+@pytest.fixture
+def store_path(tmp_path: Path) -> Path:
+    return tmp_path / "experiments"
+
+
+@pytest.fixture
+def tracker(store_path: Path) -> ExperimentTracker:
+    return ExperimentTracker(f"sqlite://{store_path}")
+
+
+def _app(cache: ResponseCache, calls: list[str]) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items/{size}")
+    def items(request: Request, size: int) -> Response:
+        def render() -> dict[str, str]:
+            calls.append(request.url.path)
+            return {"data": "x" * size}
+
+        return cache.respond(request, [], render)
+
+    return TestClient(app)
+
+
+class TestResponseCache:
+    def test_memory_budget_evicts_least_recently_used(
+        self, store_path: Path, tracker: ExperimentTracker
+    ) -> None:
+        calls: list[str] = []
+        client = _app(ResponseCache(store_path, max_bytes=1000), calls)
+
+        for size in (200, 201, 200, 202, 203, 204, 200, 201):
+            client.get(f"/items/{size}")
+
+        assert calls == [
+            "/items/200",
+            "/items/201",
+            "/items/202",
+            "/items/203",
+            "/items/204",
+            "/items/201",
+        ]
+
+    def test_oversized_responses_are_not_cached(
+        self, store_path: Path, tracker: ExperimentTracker
+    ) -> None:
+        calls: list[str] = []
+        client = _app(ResponseCache(store_path, max_bytes=1000), calls)
+
+        client.get("/items/400")
+        client.get("/items/400")
+
+        assert len(calls) == 2
+
+    def test_disabled_cache_still_answers_not_modified(
+        self, store_path: Path, tracker: ExperimentTracker
+    ) -> None:
+        calls: list[str] = []
+        client = _app(ResponseCache(store_path, max_bytes=0), calls)
+
+        etag = client.get("/items/1").headers["etag"]
+        response = client.get("/items/1", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+        assert len(calls) == 1
+
+    def test_meta_commit_invalidates(
+        self, store_path: Path, tracker: ExperimentTracker
+    ) -> None:
+        calls: list[str] = []
+        client = _app(ResponseCache(store_path), calls)
+
+        client.get("/items/1")
+        tracker.create_group("g")
+        client.get("/items/1")
+
+        assert len(calls) == 2
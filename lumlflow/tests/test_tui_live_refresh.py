@@ -14,9 +14,11 @@ on the wall-clock interval) so the suite stays fast and stable.
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from luml.experiments.tracker import ExperimentTracker
+from lumlflow.infra.change_feed import ChangeFeed, StoreChange
 from lumlflow.tui import LumlflowApp
 from lumlflow.tui.data import DataFacade
 from lumlflow.tui.live_refresh import LiveRefreshScheduler
@@ -406,6 +408,136 @@ class TestExperimentDetailRefresh:
             assert len(history.history) >= initial_len
 
 
+# ---------------------------------------------------------------------------
+# Change feed — refresh only after the store changed
+# ---------------------------------------------------------------------------
+
+
+class TestChangeFeedRefresh:
+    """With a change feed, ticks only refresh after a relevant commit.
+
+    The feed is polled by hand (its thread interval is effectively
+    infinite) so the tests control exactly when changes arrive.
+    """
+
+    @pytest.fixture
+    def feed(self, tmp_path: Path, tracker: ExperimentTracker) -> ChangeFeed:
+        return ChangeFeed(tmp_path / "experiments", interval=3600)
+
+    async def test_idle_store_does_not_refresh(
+        self, facade: DataFacade, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        tracker.create_group("g0")
+        app = _make_app(facade, change_feed=feed)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            assert isinstance(screen, GroupsScreen)
+            with patch.object(screen, "refresh_live") as refresh_live:
+                app._refresh_scheduler._tick()
+                feed.poll()
+                await pilot.pause()
+                refresh_live.assert_not_called()
+
+    async def test_change_refreshes_and_coalesces(
+        self, facade: DataFacade, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        tracker.create_group("g0")
+        app = _make_app(facade, change_feed=feed, refresh_interval=60)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.pause()
+            screen = app.screen
+            assert isinstance(screen, GroupsScreen)
+            # The first change after a quiet period refreshes at once.
+            tracker.create_group("g1")
+            feed.poll()
+            await pilot.pause()
+            await pilot.pause()
+            assert len([r for r in screen._rows if not r.is_synthetic]) == 2
+            # A second change within the interval waits for the next tick.
+            with patch.object(screen, "refresh_live") as refresh_live:
+                tracker.create_group("g2")
+                feed.poll()
+                await pilot.pause()
+                refresh_live.assert_not_called()
+                app._refresh_scheduler._tick()
+                refresh_live.assert_called_once()
+
+    async def test_detail_screen_gets_changed_tables(
+        self, facade: DataFacade, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        exp_id = tracker.start_experiment(name="run")
+        app = _make_app(facade, change_feed=feed)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = ExperimentDetailScreen(
+                facade=facade, experiment_id=exp_id, experiment_name="run"
+            )
+            app.push_screen(screen)
+            await pilot.pause()
+            await pilot.pause()
+            subscription = app._refresh_scheduler._subscription
+            assert subscription is not None
+            assert subscription.experiment_ids == {exp_id}
+            with patch.object(screen, "refresh_changes") as refresh_changes:
+                tracker.log_dynamic("loss", 0.5, step=0, experiment_id=exp_id)
+                feed.poll()
+                await pilot.pause()
+                refresh_changes.assert_called_once_with(frozenset({"dynamic_metrics"}))
+
+    async def test_change_waits_until_pushed_screen_is_mounted(
+        self, facade: DataFacade, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        exp_id = tracker.start_experiment(name="run")
+        app = _make_app(facade, change_feed=feed)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = ExperimentDetailScreen(
+                facade=facade, experiment_id=exp_id, experiment_name="run"
+            )
+            scheduler = app._refresh_scheduler
+            with patch.object(screen, "refresh_changes") as refresh_changes:
+                app.push_screen(screen)
+                # A change lands before the new screen has mounted.
+                scheduler._last_refresh = 0.0
+                scheduler._on_change(
+                    StoreChange(exp_id, frozenset({"dynamic_metrics"}))
+                )
+                refresh_changes.assert_not_called()
+                await pilot.pause()
+                await pilot.pause()
+                assert screen.is_mounted
+                scheduler._tick()
+                refresh_changes.assert_called_once_with(frozenset({"dynamic_metrics"}))
+
+    async def test_covered_screen_catches_up_when_back_in_front(
+        self, facade: DataFacade, tracker: ExperimentTracker, feed: ChangeFeed
+    ) -> None:
+        exp_id = tracker.start_experiment(name="run")
+        app = _make_app(facade, change_feed=feed)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            groups = app.screen
+            assert isinstance(groups, GroupsScreen)
+            app.push_screen(
+                ExperimentDetailScreen(
+                    facade=facade, experiment_id=exp_id, experiment_name="run"
+                )
+            )
+            await pilot.pause()
+            # The detail screen consumes the meta DB change.
+            tracker.create_group("g1")
+            feed.poll()
+            await pilot.pause()
+            app.pop_screen()
+            await pilot.pause()
+            await pilot.pause()
+            with patch.object(groups, "refresh_live") as refresh_live:
+                app._refresh_scheduler._tick()
+                refresh_live.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Refresh-now bypass and screens without the protocol
 # ---------------------------------------------------------------------------
@@ -199,6 +199,45 @@ class TestMetricGrid:
             assert received == ["loss"]
 
 
+    async def test_only_cells_in_view_request_history(self) -> None:
+        received: list[str] = []
+
+        class _CaptureApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield MetricGrid(id="grid")
+
+            def on_metric_grid_history_needed(
+                self, event: MetricGrid.HistoryNeeded
+            ) -> None:
+                received.append(event.metric_key)
+                event.stop()
+
+        keys = [f"m{i:02d}" for i in range(40)]
+        async with _CaptureApp().run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            grid = pilot.app.query_one("#grid", MetricGrid)
+            grid.set_metric_keys(keys)
+            for _ in range(5):
+                await pilot.pause()
+            assert received
+            assert "m39" not in received
+            assert set(received) == set(grid.visible_metric_keys())
+
+            received.clear()
+            grid.request_refresh_visible()
+            for _ in range(3):
+                await pilot.pause()
+            assert set(received) == set(grid.visible_metric_keys())
+
+            # Off-screen cells were marked stale; scrolling them into view
+            # fetches them.
+            received.clear()
+            grid.scroll_end(animate=False)
+            for _ in range(5):
+                await pilot.pause()
+            assert "m39" in received
+
+
 # ---------------------------------------------------------------------------
 # MetricCell behavior
 # ---------------------------------------------------------------------------
@@ -0,0 +1,109 @@
+"""Unit tests for the bounded row window behind the TUI list panels."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from lumlflow.tui.row_window import RowWindow
+
+
+@dataclass
+class _Row:
+    key: str
+    value: int = 0
+
+
+def _page(start: int, size: int = 2) -> list[_Row]:
+    return [_Row(key=f"r{i}") for i in range(start, start + size)]
+
+
+def _keys(window: RowWindow[_Row]) -> list[str]:
+    return [row.key for row in window.rows]
+
+
+class TestRowWindow:
+    def test_pages_load_by_their_start_cursor(self) -> None:
+        window: RowWindow[_Row] = RowWindow(2, max_pages=3)
+        assert window.next_page() == (0, None)
+
+        window.append(0, _page(0), "c2")
+        assert window.next_page() == (1, "c2")
+        window.append(1, _page(2), "c4")
+
+        assert _keys(window) == ["r0", "r1", "r2", "r3"]
+        assert window.has_more
+        assert window.window_request() == (None, 4)
+
+    def test_window_is_bounded_and_evicted_pages_reload(self) -> None:
+        window: RowWindow[_Row] = RowWindow(2, max_pages=2)
+        window.append(0, _page(0), "c2")
+        window.append(1, _page(2), "c4")
+
+        added, evicted = window.append(2, _page(4), "c6")
+
+        assert [row.key for row in added] == ["r4", "r5"]
+        assert [row.key for row in evicted] == ["r0", "r1"]
+        assert _keys(window) == ["r2", "r3", "r4", "r5"]
+        assert window.has_before
+        assert window.window_request() == ("c2", 4)
+        assert window.previous_page() == (0, None)
+
+        added, evicted = window.prepend(0, _page(0))
+
+        assert [row.key for row in evicted] == ["r4", "r5"]
+        assert _keys(window) == ["r0", "r1", "r2", "r3"]
+        assert window.has_more
+        assert window.next_page() == (2, "c4")
+
+    def test_stale_pages_are_dropped(self) -> None:
+        window: RowWindow[_Row] = RowWindow(2)
+        window.append(0, _page(0), "c2")
+
+        assert window.append(0, _page(0), "c2") is None
+        assert window.prepend(0, _page(0)) is None
+        assert _keys(window) == ["r0", "r1"]
+
+    def test_short_page_ends_the_listing(self) -> None:
+        window: RowWindow[_Row] = RowWindow(2)
+        window.append(0, _page(0, size=1), "c1")
+
+        assert not window.has_more
+
+    def test_reloaded_page_skips_rows_already_loaded(self) -> None:
+        window: RowWindow[_Row] = RowWindow(2, max_pages=2)
+        window.append(0, _page(0), "c2")
+        window.append(1, _page(2), "c4")
+        window.append(2, _page(4), "c6")
+
+        window.prepend(0, [_Row("new"), _Row("r2")])
+
+        assert _keys(window) == ["new", "r2", "r3"]
+
+    def test_replace_keeps_the_window_position(self) -> None:
+        window: RowWindow[_Row] = RowWindow(2, max_pages=2)
+        window.append(0, _page(0), "c2")
+        window.append(1, _page(2), "c4")
+        window.append(2, _page(4), "c6")
+
+        window.replace([_Row("r2", 1), _Row("r3"), _Row("r4")], None)
+
+        assert window.first_page == 1
+        assert [(row.key, row.value) for row in window.rows] == [
+            ("r2", 1),
+            ("r3", 0),
+            ("r4", 0),
+        ]
+        assert not window.has_more
+
+    def test_empty_replace_keeps_the_window_start(self) -> None:
+        window: RowWindow[_Row] = RowWindow(2, max_pages=2)
+        window.append(0, _page(0), "c2")
+        window.append(1, _page(2), "c4")
+        window.append(2, _page(4), "c6")
+
+        window.replace([], "bogus")
+
+        assert window.rows == []
+        assert not window.has_more
+        assert window.next_page() == (1, "c2")
+        assert window.window_request() == ("c2", 2)
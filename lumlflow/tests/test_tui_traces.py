@@ -26,6 +26,7 @@ from lumlflow.schemas.annotations import (
 from lumlflow.schemas.experiments import Trace, TraceState
 from lumlflow.tui import LumlflowApp
 from lumlflow.tui.data import DataFacade
+from lumlflow.tui.row_window import RowWindow
 from lumlflow.tui.screens.experiment_detail import ExperimentDetailScreen
 from lumlflow.tui.screens.trace_detail import (
     AUTO_COLLAPSE_THRESHOLD,
@@ -313,6 +314,44 @@ class TestTracesPanelListing:
 # ---------------------------------------------------------------------------
 
 
+class TestTracesPanelWindow:
+    async def test_scrolling_keeps_a_bounded_window(
+        self, facade: DataFacade, tracker: ExperimentTracker
+    ) -> None:
+        traces = [(f"tr-{i:02d}", 1) for i in range(40)]
+        exp_id = _seed_experiment_with_traces(tracker, traces=traces)
+        app = _make_app(facade)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = _push_detail_screen(app, facade, experiment_id=exp_id)
+            await pilot.pause()
+            panel = screen.query_one("#pane-traces-panel", TracesPanel)
+            panel._page_size = 8
+            panel._window = RowWindow(8, max_pages=2)
+            screen.action_jump_tab("traces")
+            for _ in range(3):
+                await pilot.pause()
+            table = panel.query_one("#traces-table", DataTable)
+            first_key = panel._rows[0].key
+
+            seen: set[str] = set()
+            for _ in range(45):
+                panel.action_cursor_down()
+                for _ in range(3):
+                    await pilot.pause()
+                assert table.row_count <= 16
+                seen.update(row.key for row in panel._rows)
+            assert seen == {trace_id for trace_id, _ in traces}
+            assert panel._window.has_before
+            assert first_key not in {row.key for row in panel._rows}
+
+            panel.action_cursor_first()
+            for _ in range(3):
+                await pilot.pause()
+            assert not panel._window.has_before
+            assert panel._rows[0].key == first_key
+
+
 class TestTracesFilterValidation:
     async def test_filter_dialog_opens(
         self, facade: DataFacade, tracker: ExperimentTracker
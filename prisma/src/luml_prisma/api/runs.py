@@ -17,14 +17,13 @@ router = APIRouter(prefix="/api/runs", tags=["runs"])
 def _node_out(
     request: Request,
     node: Any,  # noqa: ANN401
+    session_ids: list[str],
 ) -> dict[str, Any]:
     pty = request.app.state.pty
-    node_repo = request.app.state.db.nodes
-    sessions = node_repo.get_sessions(node.id)
     active_sid = None
-    for s in sessions:
-        if pty.is_alive(s.session_id):
-            active_sid = s.session_id
+    for session_id in session_ids:
+        if pty.is_alive(session_id):
+            active_sid = session_id
             break
     return RunNodeOut.from_db(
         node, active_sid,
@@ -141,8 +140,8 @@ def get_run_graph(
     graph = handler.get_graph(run_id)
     return {
         "nodes": [
-            _node_out(request, n)
-            for n in graph["nodes"]
+            _node_out(request, n, session_ids)
+            for n, session_ids in graph["nodes"]
         ],
         "edges": [
             RunEdgeOut.model_validate(
@@ -1,16 +1,9 @@
 import asyncio
 import contextlib
 import json
-from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from luml_prisma.schemas import (
-    RunEdgeOut,
-    RunNodeOut,
-    RunOut,
-)
-
 router = APIRouter(tags=["websockets"])
 
 
@@ -20,9 +13,8 @@ async def ws_run_events(  # noqa: C901
 ) -> None:
     db = websocket.app.state.db
     engine = websocket.app.state.engine
-    pty = websocket.app.state.pty
 
-    if not (run := db.get_run(run_id)):
+    if not db.get_run(run_id):
         await websocket.close(
             code=4004, reason="Run not found",
         )
@@ -30,37 +22,22 @@ async def ws_run_events(  # noqa: C901
 
     await websocket.accept()
 
-    nodes = db.list_run_nodes(run_id)
-    edges = db.list_run_edges(run_id)
-
-    node_dicts = []
-    for n in nodes:
-        sessions = db.get_node_sessions(n.id)
-        active_sid = None
-        for s in sessions:
-            if pty.is_alive(s.session_id):
-                active_sid = s.session_id
-                break
-        node_dicts.append(
-            RunNodeOut.from_db(n, active_sid).model_dump()
-        )
-
-    snapshot: dict[str, Any] = {
-        "type": "snapshot",
-        "data": {
-            "run": RunOut.from_db(run).model_dump(),
-            "nodes": node_dicts,
-            "edges": [
-                RunEdgeOut.model_validate(
-                    e, from_attributes=True,
-                ).model_dump()
-                for e in edges
-            ],
-        },
-    }
-    await websocket.send_text(json.dumps(snapshot))
-
+    # Subscribed before the snapshot is taken, so no event falls between.
     queue = engine.subscribe(run_id)
+    # A reconnecting client passes the seq and epoch it last saw and gets
+    # only what changed since.
+    since = websocket.query_params.get("since")
+    snapshot = engine.run_snapshot(
+        run_id,
+        since=int(since) if since and since.isdigit() else None,
+        epoch=websocket.query_params.get("epoch"),
+    )
+    if snapshot is not None:
+        try:
+            await websocket.send_text(json.dumps(snapshot))
+        except (WebSocketDisconnect, RuntimeError):
+            engine.unsubscribe(run_id, queue)
+            return
 
     async def _send_events() -> None:
         try:
@@ -1,23 +1,39 @@
 from __future__ import annotations
 
+from array import array
+from collections.abc import Collection
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 import typer
 from luml.experiments.backends.data_types import EvalRecord, Experiment
 from luml.experiments.tracker import ExperimentTracker
 
+from luml_prisma.cli.metric_cache import CachedExperiment, MetricCache, MetricSeries
+
 app = typer.Typer(add_completion=False)
 
 DEFAULT_DB = str(Path.home() / ".luml" / "experiments")
 
+# One tracker per DB for the life of the process, so its connection pool
+# and migration checks are shared by every loader.
+_trackers: dict[str, ExperimentTracker] = {}
+_cache_dir: Path | None = None
 
-@dataclass
-class MetricPoint:
-    step: int
-    value: float
+
+@app.callback()
+def _configure(
+    cache_dir: str = typer.Option(
+        "",
+        "--cache-dir",
+        envvar="LUML_INSPECT_CACHE_DIR",
+        help="Keep columnar copies of experiment data here between runs",
+    ),
+) -> None:
+    global _cache_dir
+    _cache_dir = Path(cache_dir).expanduser() if cache_dir else None
 
 
 @dataclass
@@ -31,11 +47,21 @@ class MetricSummary:
 
 
 def _get_tracker(db: str) -> ExperimentTracker:
+    tracker = _trackers.get(db)
+    if tracker is not None:
+        return tracker
     meta_path = Path(db) / "meta.db"
     if not meta_path.exists():
         typer.echo(f"Error: experiment DB not found at {meta_path}", err=True)
         raise typer.Exit(1)
-    return ExperimentTracker(f"sqlite://{db}")
+    tracker = _trackers[db] = ExperimentTracker(f"sqlite://{db}")
+    return tracker
+
+
+def _get_cache(db: str) -> MetricCache | None:
+    if _cache_dir is None:
+        return None
+    return MetricCache(_cache_dir, db)
 
 
 def _fmt_created_at(value: datetime | str | None) -> str:
@@ -56,35 +82,60 @@ def _load_experiments(db: str) -> list[Experiment]:
     return experiments
 
 
-def _load_static_params(db: str, experiment_id: str) -> dict[str, Any]:
-    tracker = _get_tracker(db)
-    try:
-        return cast(dict[str, Any], tracker.get_experiment(experiment_id).static_params)
-    except ValueError:
-        return {}
+def _to_series(points: list[dict[str, Any]]) -> MetricSeries:
+    return MetricSeries(
+        steps=array("q", [p["step"] for p in points]),
+        values=array("d", [p["value"] for p in points]),
+    )
 
 
-def _load_metrics(db: str, experiment_id: str) -> dict[str, list[MetricPoint]]:
+def _load_experiment(
+    db: str, experiment_id: str, keys: Collection[str] | None = None,
+) -> CachedExperiment:
+    """Static params and metrics (all of them, or just `keys`) of one
+    experiment, from the columnar cache when it is current and from the
+    DB otherwise, in which case the cache is refreshed."""
     tracker = _get_tracker(db)
+    cache = _get_cache(db)
+    if cache is not None:
+        cached = cache.load(experiment_id, keys)
+        if cached is not None:
+            return cached
     try:
-        raw = tracker.get_experiment(experiment_id).dynamic_metrics
+        data = tracker.get_experiment(experiment_id)
     except ValueError:
-        return {}
-    return {
-        key: [MetricPoint(step=p["step"], value=p["value"]) for p in points]
-        for key, points in raw.items()
-    }
+        data = None
+    if data is None:
+        return CachedExperiment(static_params={}, metrics={})
+    loaded = CachedExperiment(
+        static_params=dict(data.static_params),
+        metrics={
+            key: _to_series(points) for key, points in data.dynamic_metrics.items()
+        },
+    )
+    if cache is not None:
+        cache.store(experiment_id, loaded)
+    if keys is not None:
+        loaded.metrics = {k: v for k, v in loaded.metrics.items() if k in keys}
+    return loaded
 
 
-def _load_metric_key(
-    db: str, experiment_id: str, key: str
-) -> list[MetricPoint]:
+def _load_static_params(db: str, experiment_id: str) -> dict[str, Any]:
+    return _load_experiment(db, experiment_id).static_params
+
+
+def _load_metric_key(db: str, experiment_id: str, key: str) -> MetricSeries:
     tracker = _get_tracker(db)
+    cache = _get_cache(db)
+    if cache is not None:
+        cached = cache.load(experiment_id, {key})
+        if cached is not None:
+            return cached.metrics.get(key, MetricSeries())
     try:
         history = tracker.get_experiment_metric_history(experiment_id, key)
     except ValueError:
-        return []
-    return [MetricPoint(step=p["step"], value=p["value"]) for p in history]
+        return MetricSeries()
+    return _to_series(history)
 
 
 def _load_evals(
@@ -103,11 +154,11 @@ def _load_evals(
     return result
 
 
-def _compute_metric_summary(points: list[MetricPoint]) -> MetricSummary:
-    values = [p.value for p in points]
+def _compute_metric_summary(series: MetricSeries) -> MetricSummary:
+    values = series.values
     return MetricSummary(
         key="",
-        steps=len(points),
+        steps=len(values),
         final=values[-1],
         min_val=min(values),
         max_val=max(values),
@@ -227,7 +278,8 @@ def show(
     tags_str = ", ".join(tags) if tags else ""
     typer.echo(f"Created: {created_at}  Group: {group_id}  Tags: {tags_str}")
 
-    static_params = _load_static_params(db, experiment_id)
+    data = _load_experiment(db, experiment_id)
+    static_params = data.static_params
     if static_params:
         typer.echo("")
         typer.echo("PARAMS")
@@ -235,7 +287,7 @@ def show(
         for k, v in static_params.items():
             typer.echo(f"  {k.ljust(key_width)}  {v}")
 
-    all_metrics = _load_metrics(db, experiment_id)
+    all_metrics = data.metrics
     if all_metrics:
         typer.echo("")
         typer.echo("METRICS SUMMARY")
@@ -262,33 +314,32 @@ class Bucket:
     max_val: float
 
 
-def _bucket_points(
-    points: list[MetricPoint], num_buckets: int
-) -> list[Bucket]:
-    n = len(points)
+def _bucket_points(series: MetricSeries, num_buckets: int) -> list[Bucket]:
+    steps, values = series.steps, series.values
+    n = len(values)
     if n == 0:
         return []
     if n <= num_buckets:
         return [
-            Bucket(step=p.step, value=p.value, min_val=p.value, max_val=p.value)
-            for p in points
+            Bucket(step=s, value=v, min_val=v, max_val=v)
+            for s, v in zip(steps, values, strict=True)
         ]
-    buckets: list[Bucket] = []
-    for i in range(num_buckets):
-        start = i * n // num_buckets
-        end = (i + 1) * n // num_buckets
-        chunk = points[start:end]
-        values = [p.value for p in chunk]
-        rep = chunk[-1]
-        buckets.append(
-            Bucket(
-                step=rep.step,
-                value=rep.value,
-                min_val=min(values),
-                max_val=max(values),
-            )
+    # Slices of the typed arrays are copied and scanned in C, so the
+    # per-point work never touches Python objects.
+    bounds = [i * n // num_buckets for i in range(num_buckets + 1)]
+    return [
+        Bucket(
+            step=steps[end - 1],
+            value=values[end - 1],
+            min_val=min(values[start:end]),
+            max_val=max(values[start:end]),
         )
-    return buckets
+        for start, end in zip(bounds, bounds[1:], strict=False)
+    ]
+
+
+def _points(series: MetricSeries) -> list[tuple[int, float]]:
+    return list(zip(series.steps, series.values, strict=True))
 
 
 @app.command()
@@ -304,15 +355,15 @@ def metrics(
     summary: bool = typer.Option(False, "--summary", help="Only show summary line"),
     buckets: int = typer.Option(20, "--buckets", help="Number of buckets"),
 ) -> None:
-    points = _load_metric_key(db, experiment_id, key)
-    if not points:
+    series = _load_metric_key(db, experiment_id, key)
+    if not series:
         typer.echo(f"No data for metric '{key}'")
         return
 
-    total_steps = len(points)
+    total_steps = len(series)
 
     if summary:
-        s = _compute_metric_summary(points)
+        s = _compute_metric_summary(series)
         s = MetricSummary(
             key=key,
             steps=s.steps,
@@ -331,27 +382,27 @@ def metrics(
     if all_points:
         typer.echo(f"{key} ({total_steps} steps)")
         typer.echo(f"  {'STEP':>8}  {'VALUE':>8}")
-        for p in points:
-            typer.echo(f"  {p.step:>8}  {_format_val(p.value):>8}")
+        for step, value in _points(series):
+            typer.echo(f"  {step:>8}  {_format_val(value):>8}")
         return
 
     if last > 0:
-        subset = points[-last:]
+        subset = _points(series)[-last:]
         typer.echo(f"{key} (last {len(subset)} of {total_steps} steps)")
         typer.echo(f"  {'STEP':>8}  {'VALUE':>8}")
-        for p in subset:
-            typer.echo(f"  {p.step:>8}  {_format_val(p.value):>8}")
+        for step, value in subset:
+            typer.echo(f"  {step:>8}  {_format_val(value):>8}")
         return
 
     if every > 0:
-        subset = [p for i, p in enumerate(points) if i % every == 0]
+        subset = _points(series)[::every]
         typer.echo(f"{key} (every {every}, {len(subset)} of {total_steps} steps)")
         typer.echo(f"  {'STEP':>8}  {'VALUE':>8}")
-        for p in subset:
-            typer.echo(f"  {p.step:>8}  {_format_val(p.value):>8}")
+        for step, value in subset:
+            typer.echo(f"  {step:>8}  {_format_val(value):>8}")
         return
 
-    bucketed = _bucket_points(points, buckets)
+    bucketed = _bucket_points(series, buckets)
     typer.echo(f"{key} ({total_steps} steps, showing {len(bucketed)} buckets)")
     typer.echo(f"  {'STEP':>8}  {'VALUE':>8}  {'MIN':>8}  {'MAX':>8}")
     for b in bucketed:
@@ -429,7 +480,7 @@ def _print_params_diff(
 def _print_metric_summary(
     mk: str,
     experiment_ids: list[str],
-    points_per_exp: dict[str, list[MetricPoint]],
+    points_per_exp: dict[str, MetricSeries],
     id_widths: list[int],
 ) -> None:
     typer.echo(f"METRIC: {mk}")
@@ -456,7 +507,7 @@ def _print_metric_summary(
 def _print_metric_raw(
     mk: str,
     experiment_ids: list[str],
-    points_per_exp: dict[str, list[MetricPoint]],
+    points_per_exp: dict[str, MetricSeries],
     max_steps: int,
     *,
     all_points: bool,
@@ -472,25 +523,18 @@ def _print_metric_raw(
     typer.echo("".join(col_hdr))
     typer.echo("".join(sub_hdr))
 
-    all_steps: list[int] = []
     steps_seen: set[int] = set()
-    for pts in points_per_exp.values():
-        selected: list[MetricPoint] = []
+    for series in points_per_exp.values():
         if all_points:
-            selected = pts
+            steps_seen.update(series.steps)
         elif last > 0:
-            selected = pts[-last:]
+            steps_seen.update(series.steps[-last:])
         elif every > 0:
-            selected = [p for i, p in enumerate(pts) if i % every == 0]
-        for p in selected:
-            if p.step not in steps_seen:
-                all_steps.append(p.step)
-                steps_seen.add(p.step)
-    all_steps.sort()
+            steps_seen.update(series.steps[::every])
+    all_steps = sorted(steps_seen)
 
     step_val_maps = {
-        eid: {p.step: p.value for p in points_per_exp[eid]}
-        for eid in experiment_ids
+        eid: dict(_points(points_per_exp[eid])) for eid in experiment_ids
     }
     for step in all_steps:
         row = [f"  {step:>8}"]
@@ -503,7 +547,7 @@ def _print_metric_raw(
 def _print_metric_bucketed(
     mk: str,
     experiment_ids: list[str],
-    points_per_exp: dict[str, list[MetricPoint]],
+    points_per_exp: dict[str, MetricSeries],
     max_steps: int,
     num_buckets: int,
 ) -> None:
@@ -556,24 +600,33 @@ def compare(
     every: int = typer.Option(0, "--every", help="Show every Nth step"),
     summary: bool = typer.Option(False, "--summary", help="Only show summary line"),
     buckets: int = typer.Option(20, "--buckets", help="Number of buckets"),
+    metric_keys: list[str] = typer.Option(  # noqa: B008
+        [], "--metric", help="Only compare these metrics (repeatable)",
+    ),
 ) -> None:
     if len(experiment_ids) < 2:
         typer.echo("Error: compare requires at least 2 experiment IDs", err=True)
         raise typer.Exit(1)
 
     id_widths = [max(len(eid), 6) for eid in experiment_ids]
-    all_params = {eid: _load_static_params(db, eid) for eid in experiment_ids}
+    keys = set(metric_keys) if metric_keys else None
+    loaded = {eid: _load_experiment(db, eid, keys) for eid in experiment_ids}
+    all_params = {eid: loaded[eid].static_params for eid in experiment_ids}
     _print_params_diff(experiment_ids, all_params, id_widths)
 
-    exp_metrics = {eid: _load_metrics(db, eid) for eid in experiment_ids}
-    all_metric_keys = _collect_ordered_keys(list(exp_metrics.values()))
+    exp_metrics = {eid: loaded[eid].metrics for eid in experiment_ids}
+    all_metric_keys = (
+        list(dict.fromkeys(metric_keys))
+        if metric_keys
+        else _collect_ordered_keys(list(exp_metrics.values()))
+    )
     mode = _detect_mode(
         all_points=all_points, last=last, every=every, summary=summary,
     )
 
     for mk in all_metric_keys:
         points_per_exp = {
-            eid: exp_metrics[eid].get(mk, []) for eid in experiment_ids
+            eid: exp_metrics[eid].get(mk, MetricSeries()) for eid in experiment_ids
         }
         max_steps = max(
             (len(pts) for pts in points_per_exp.values()), default=0
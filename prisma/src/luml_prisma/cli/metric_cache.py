@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from array import array
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+_FORMAT_VERSION = 1
+# Bytes per point: one int64 step and one float64 value.
+_POINT_SIZE = 16
+# Offset of the file change counter in the SQLite database header.
+_CHANGE_COUNTER_OFFSET = 24
+
+Stamp = list[list[int] | None]
+
+
+@dataclass
+class MetricSeries:
+    steps: array[int] = field(default_factory=lambda: array("q"))
+    values: array[float] = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class CachedExperiment:
+    static_params: dict[str, Any]
+    metrics: dict[str, MetricSeries]
+
+
+class MetricCache:
+    """Columnar copies of experiment data, one file per experiment.
+
+    Each file is valid for the exp.db it was read from, identified by the
+    mtime and size of the DB and of its WAL plus SQLite's file change
+    counter. The tracker writes in WAL mode, so new points often only
+    touch the WAL; the counter catches rollback-mode writes that land
+    within one mtime tick without growing the file.
+    """
+
+    def __init__(self, cache_dir: Path, db: str) -> None:
+        self._db = Path(db)
+        digest = hashlib.sha1(str(self._db.resolve()).encode()).hexdigest()
+        self._dir = cache_dir / digest[:16]
+
+    def load(
+        self,
+        experiment_id: str,
+        keys: Collection[str] | None = None,
+    ) -> CachedExperiment | None:
+        stamp = self._stamp(experiment_id)
+        if stamp is None:
+            return None
+        try:
+            with self._path(experiment_id).open("rb") as f:
+                header = json.loads(f.readline())
+                if (
+                    header.get("version") != _FORMAT_VERSION
+                    or header.get("byteorder") != sys.byteorder
+                    or header.get("stamp") != stamp
+                ):
+                    return None
+                base = f.tell()
+                offset = 0
+                metrics: dict[str, MetricSeries] = {}
+                for key, count in header["metrics"]:
+                    if keys is None or key in keys:
+                        f.seek(base + offset)
+                        metrics[key] = _read_series(f, count)
+                    offset += count * _POINT_SIZE
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+        return CachedExperiment(header["static_params"], metrics)
+
+    def store(self, experiment_id: str, data: CachedExperiment) -> None:
+        stamp = self._stamp(experiment_id)
+        if stamp is None:
+            return
+        header = {
+            "version": _FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "stamp": stamp,
+            "static_params": data.static_params,
+            "metrics": [[key, len(s)] for key, s in data.metrics.items()],
+        }
+        try:
+            encoded = json.dumps(header).encode()
+        except (TypeError, ValueError):
+            return
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(encoded + b"\n")
+                    for series in data.metrics.values():
+                        series.steps.tofile(f)
+                        series.values.tofile(f)
+                os.replace(tmp, self._path(experiment_id))
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+                raise
+        except OSError:
+            # The cache is an optimisation; a read-only or full disk
+            # only means the next run reads the DB again.
+            pass
+
+    def _path(self, experiment_id: str) -> Path:
+        return self._dir / f"{Path(experiment_id).name}.metrics"
+
+    def _stamp(self, experiment_id: str) -> Stamp | None:
+        exp_db = self._db / Path(experiment_id).name / "exp.db"
+        try:
+            with exp_db.open("rb") as f:
+                f.seek(_CHANGE_COUNTER_OFFSET)
+                counter = int.from_bytes(f.read(4), "big")
+                st = os.fstat(f.fileno())
+        except OSError:
+            return None
+        stamp: Stamp = [[st.st_mtime_ns, st.st_size, counter]]
+        try:
+            wal = exp_db.with_name("exp.db-wal").stat()
+        except OSError:
+            wal = None
+        # Opening a connection creates an empty WAL and closing it deletes
+        # one, so only a WAL with frames in it counts.
+        if wal is None or wal.st_size == 0:
+            stamp.append(None)
+        else:
+            stamp.append([wal.st_mtime_ns, wal.st_size])
+        return stamp
+
+
+def _read_series(f: BinaryIO, count: int) -> MetricSeries:
+    series = MetricSeries()
+    series.steps.fromfile(f, count)
+    series.values.fromfile(f, count)
+    return series
@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Callable, Collection
 from pathlib import Path
 
 from luml_prisma.infra.db import (
@@ -29,6 +31,7 @@ class Database:
             path.parent.mkdir(parents=True, exist_ok=True)
             db_url = f"sqlite:///{path}"
 
+        self._in_memory = db_path is None
         self._engine = create_db_engine(db_url)
         self._session_factory = create_session_factory(self._engine)
         if db_path is None:
@@ -53,6 +56,13 @@ class Database:
     def close(self) -> None:
         self._engine.dispose()
 
+    async def offload[T](self, fn: Callable[..., T], *args: object) -> T:
+        # The in-memory database shares one connection between all
+        # sessions, so its calls cannot leave the event loop thread.
+        if self._in_memory:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
     # -- Repository facade --
 
     def add_repository(
@@ -138,6 +148,11 @@ class Database:
     ) -> list[RunOrm]:
         return self.runs.list_all(repository_id)
 
+    def list_runs_with_nodes(
+        self, run_status: str, node_statuses: Collection[str],
+    ) -> list[tuple[RunOrm, RunNodeOrm | None]]:
+        return self.runs.list_with_nodes(run_status, node_statuses)
+
     def update_run_status(
         self, run_id: str, status: str,
     ) -> None:
@@ -182,11 +197,21 @@ class Database:
     def list_run_nodes(self, run_id: str) -> list[RunNodeOrm]:
         return self.nodes.list_nodes(run_id)
 
+    def list_run_nodes_with_sessions(
+        self, run_id: str, node_ids: Collection[str] | None = None,
+    ) -> list[tuple[RunNodeOrm, list[str]]]:
+        return self.nodes.list_nodes_with_sessions(run_id, node_ids)
+
     def update_node_status(
         self, node_id: str, status: str,
     ) -> None:
         self.nodes.update_node_status(node_id, status)
 
+    def transition_node_status(
+        self, node_id: str, expected: str, status: str,
+    ) -> bool:
+        return self.nodes.transition_node_status(node_id, expected, status)
+
     def update_node_result(
         self, node_id: str, result_json: str,
     ) -> None:
@@ -220,8 +245,10 @@ class Database:
             run_id, from_node_id, to_node_id, reason,
         )
 
-    def list_run_edges(self, run_id: str) -> list[RunEdgeOrm]:
-        return self.nodes.list_edges(run_id)
+    def list_run_edges(
+        self, run_id: str, to_node_ids: Collection[str] | None = None,
+    ) -> list[RunEdgeOrm]:
+        return self.nodes.list_edges(run_id, to_node_ids)
 
     # -- Event facade --
 
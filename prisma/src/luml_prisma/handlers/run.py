@@ -180,7 +180,7 @@ class RunHandler:
     ) -> dict[str, Any]:
         if not self._runs.get(run_id):
             raise RunNotFoundError
-        nodes = self._nodes.list_nodes(run_id)
+        nodes = self._nodes.list_nodes_with_sessions(run_id)
         edges = self._nodes.list_edges(run_id)
         return {"nodes": nodes, "edges": edges}
 
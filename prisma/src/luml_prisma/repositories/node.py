@@ -1,3 +1,5 @@
+from collections.abc import Collection
+
 from sqlalchemy import func
 
 from luml_prisma.models import (
@@ -54,6 +56,28 @@ class RunNodeRepository(RepositoryBase):
                 .all()
             )
 
+    def list_nodes_with_sessions(
+        self, run_id: str, node_ids: Collection[str] | None = None,
+    ) -> list[tuple[RunNodeOrm, list[str]]]:
+        # One outer join instead of a session lookup per node.
+        with self._session_factory() as session:
+            q = (
+                session.query(RunNodeOrm, NodeSessionOrm.session_id)
+                .outerjoin(
+                    NodeSessionOrm, NodeSessionOrm.node_id == RunNodeOrm.id,
+                )
+                .filter(RunNodeOrm.run_id == run_id)
+            )
+            if node_ids is not None:
+                q = q.filter(RunNodeOrm.id.in_(list(node_ids)))
+            rows = q.order_by(RunNodeOrm.created_at, NodeSessionOrm.id).all()
+        grouped: dict[str, tuple[RunNodeOrm, list[str]]] = {}
+        for node, session_id in rows:
+            _, session_ids = grouped.setdefault(node.id, (node, []))
+            if session_id is not None:
+                session_ids.append(session_id)
+        return list(grouped.values())
+
     def update_node_status(
         self, node_id: str, status: str,
     ) -> None:
@@ -63,6 +87,22 @@ class RunNodeRepository(RepositoryBase):
             ).update({"status": status, "updated_at": self._now()})
             session.commit()
 
+    def transition_node_status(
+        self, node_id: str, expected: str, status: str,
+    ) -> bool:
+        """Set ``status`` only if the node is still in ``expected``.
+
+        Returns whether this call made the change, so two callers racing
+        for the same node cannot both win.
+        """
+        with self._session_factory() as session:
+            updated = session.query(RunNodeOrm).filter(
+                RunNodeOrm.id == node_id,
+                RunNodeOrm.status == expected,
+            ).update({"status": status, "updated_at": self._now()})
+            session.commit()
+        return updated == 1
+
     def update_node_result(
         self, node_id: str, result_json: str,
     ) -> None:
@@ -119,14 +159,14 @@ class RunNodeRepository(RepositoryBase):
             session.refresh(edge)
             return edge
 
-    def list_edges(self, run_id: str) -> list[RunEdgeOrm]:
+    def list_edges(
+        self, run_id: str, to_node_ids: Collection[str] | None = None,
+    ) -> list[RunEdgeOrm]:
         with self._session_factory() as session:
-            return list(
-                session.query(RunEdgeOrm)
-                .filter(RunEdgeOrm.run_id == run_id)
-                .order_by(RunEdgeOrm.id)
-                .all()
-            )
+            q = session.query(RunEdgeOrm).filter(RunEdgeOrm.run_id == run_id)
+            if to_node_ids is not None:
+                q = q.filter(RunEdgeOrm.to_node_id.in_(list(to_node_ids)))
+            return list(q.order_by(RunEdgeOrm.id).all())
 
     def add_event(
         self,
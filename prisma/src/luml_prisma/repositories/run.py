@@ -1,3 +1,7 @@
+from collections.abc import Collection
+
+from sqlalchemy import and_
+
 from luml_prisma.models import (
     NodeSessionOrm,
     RunEdgeOrm,
@@ -54,6 +58,31 @@ class RunRepository(RepositoryBase):
                 ).all()
             )
 
+    def list_with_nodes(
+        self, run_status: str, node_statuses: Collection[str],
+    ) -> list[tuple[RunOrm, RunNodeOrm | None]]:
+        # A run with no matching nodes still appears once, paired with None.
+        with self._session_factory() as session:
+            rows = (
+                session.query(RunOrm, RunNodeOrm)
+                .outerjoin(
+                    RunNodeOrm,
+                    and_(
+                        RunNodeOrm.run_id == RunOrm.id,
+                        RunNodeOrm.status.in_(list(node_statuses)),
+                    ),
+                )
+                .filter(RunOrm.status == run_status)
+                .order_by(
+                    RunOrm.created_at,
+                    RunOrm.id,
+                    RunNodeOrm.depth,
+                    RunNodeOrm.created_at,
+                )
+                .all()
+            )
+            return [(run, node) for run, node in rows]
+
     def update_status(
         self, run_id: str, status: str,
     ) -> None:
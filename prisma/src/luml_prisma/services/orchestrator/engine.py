@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from luml_prisma.database import Database
-from luml_prisma.models import RunNodeOrm
+from luml_prisma.models import RunNodeOrm, RunOrm
 from luml_prisma.services.orchestrator.models import (
     NodeStatus,
     NodeType,
@@ -25,11 +25,18 @@ from luml_prisma.services.orchestrator.nodes.result_file import (
 from luml_prisma.services.orchestrator.registry import NodeRegistry
 from luml_prisma.services.orchestrator.utils import ensure_global_luml_dir
 from luml_prisma.services.pty_manager import PtyManager
+from luml_prisma.services.run_snapshots import RunSnapshots
 from luml_prisma.services.upload_queue import UploadQueue
 
 logger = logging.getLogger("luml_prisma.orchestrator")
 
 _TERMINAL_STATUSES = {NodeStatus.SUCCEEDED, NodeStatus.FAILED, NodeStatus.CANCELED}
+_ACTIVE_STATUSES = (NodeStatus.RUNNING, NodeStatus.WAITING_INPUT)
+_SCHEDULABLE_STATUSES = (NodeStatus.QUEUED, *_ACTIVE_STATUSES)
+
+# The scheduler is woken whenever a slot may have opened up; this tick
+# only catches changes made behind the engine's back.
+_FALLBACK_TICK_SECONDS = 5.0
 
 
 class _UnrecoverableSchedulerError(Exception):
@@ -53,30 +60,34 @@ class OrchestratorEngine:
         self._session_exit_codes: dict[str, int | None] = {}
         self._session_scrollback: dict[str, bytes] = {}
         self._event_subscribers: dict[str, list[asyncio.Queue[dict[str, Any]]]] = {}
+        self._snapshots = RunSnapshots(db, pty)
         self._scheduler_task: asyncio.Task[None] | None = None
+        self._scheduler_wakeup = asyncio.Event()
         self._waiting_input_nodes: set[str] = set()
 
     async def start(self) -> None:
         ensure_global_luml_dir()
         self._recover_orphaned_runs()
         self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+        self.wake_scheduler()
+
+    def wake_scheduler(self) -> None:
+        self._scheduler_wakeup.set()
 
     def _recover_orphaned_runs(self) -> None:
-        for run in self._db.list_runs():
-            if run.status != RunStatus.RUNNING:
+        orphans = self._db.list_runs_with_nodes(RunStatus.RUNNING, _ACTIVE_STATUSES)
+        for run, node in orphans:
+            if node is None:
                 continue
-            nodes = self._db.list_run_nodes(run.id)
-            for node in nodes:
-                if node.status in (NodeStatus.RUNNING, NodeStatus.WAITING_INPUT):
-                    logger.info(
-                        "Recovery: re-queuing orphaned node %s (run %s)",
-                        node.id, run.id,
-                    )
-                    self._db.update_node_status(node.id, NodeStatus.QUEUED)
-                    self._emit_event(
-                        run.id, node.id, "node_status_changed",
-                        {"status": NodeStatus.QUEUED},
-                    )
+            logger.info(
+                "Recovery: re-queuing orphaned node %s (run %s)",
+                node.id, run.id,
+            )
+            self._db.update_node_status(node.id, NodeStatus.QUEUED)
+            self._emit_event(
+                run.id, node.id, "node_status_changed",
+                {"status": NodeStatus.QUEUED},
+            )
 
     async def stop(self) -> None:
         if self._scheduler_task:
@@ -130,6 +141,7 @@ class OrchestratorEngine:
             run_id, None, "run_status_changed",
             {"status": RunStatus.RUNNING},
         )
+        self.wake_scheduler()
 
     async def restart_run(self, run_id: str) -> None:
         run = self._db.get_run(run_id)
@@ -137,6 +149,7 @@ class OrchestratorEngine:
             return
         logger.info("Restarting run %s", run_id)
         self._db.reset_run_data(run_id)
+        self._snapshots.drop(run_id)
         self._db.update_run_status(run_id, RunStatus.PENDING)
 
         root_node = self._db.add_run_node(
@@ -171,6 +184,7 @@ class OrchestratorEngine:
             run_id, None, "run_status_changed",
             {"status": RunStatus.CANCELED},
         )
+        self.wake_scheduler()
 
     async def cancel_node(self, run_id: str, node_id: str) -> None:
         node = self._db.get_run_node(node_id)
@@ -201,6 +215,7 @@ class OrchestratorEngine:
             run_id, node.id, "node_status_changed",
             {"status": NodeStatus.CANCELED},
         )
+        self.wake_scheduler()
 
     def register_session_completion(
         self, session_id: str, event: asyncio.Event,
@@ -309,9 +324,19 @@ class OrchestratorEngine:
         with contextlib.suppress(ValueError):
             subs.remove(queue)
 
+    def run_snapshot(
+        self, run_id: str, since: int | None = None, epoch: str | None = None,
+    ) -> dict[str, Any] | None:
+        return self._snapshots.message(run_id, since, epoch)
+
     async def _scheduler_loop(self) -> None:
         while True:
-            await asyncio.sleep(0.5)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._scheduler_wakeup.wait(), _FALLBACK_TICK_SECONDS,
+                )
+            # Cleared before the tick, so a wake-up during it runs another.
+            self._scheduler_wakeup.clear()
             try:
                 await self._schedule_tick()
             except _UnrecoverableSchedulerError:
@@ -345,36 +370,61 @@ class OrchestratorEngine:
 
     async def _schedule_tick(self) -> None:
         try:
-            running_runs = [
-                r for r in self._db.list_runs()
-                if r.status == RunStatus.RUNNING
-            ]
+            rows = await self._db.offload(
+                self._db.list_runs_with_nodes,
+                RunStatus.RUNNING, _SCHEDULABLE_STATUSES,
+            )
         except Exception as exc:
             raise _UnrecoverableSchedulerError(str(exc)) from exc
-        for run in running_runs:
+        running_runs: dict[str, tuple[RunOrm, list[RunNodeOrm]]] = {}
+        for run, node in rows:
+            _, nodes = running_runs.setdefault(run.id, (run, []))
+            if node is not None:
+                nodes.append(node)
+        for run, nodes in running_runs.values():
             config = self._load_config(run.config_json)
-            active_count = self._count_active_nodes(run.id)
+            active_count = self._count_active_nodes(nodes)
             if active_count >= config.max_concurrency:
                 continue
             slots = config.max_concurrency - active_count
-            candidates = self._get_next_candidates(run.id, slots)
+            candidates = self._get_next_candidates(nodes, slots)
             for node in candidates:
                 self._execute_node(node, config, run.id)
 
-    def _count_active_nodes(self, run_id: str) -> int:
-        nodes = self._db.list_run_nodes(run_id)
-        active = (NodeStatus.RUNNING, NodeStatus.WAITING_INPUT)
-        return sum(1 for n in nodes if n.status in active)
+    def _count_active_nodes(self, nodes: list[RunNodeOrm]) -> int:
+        # The nodes may have been read before the latest dispatches.
+        return sum(
+            1 for n in nodes
+            if n.status in _ACTIVE_STATUSES or n.id in self._running_nodes
+        )
 
-    def _get_next_candidates(self, run_id: str, slots: int) -> list[RunNodeOrm]:
-        nodes = self._db.list_run_nodes(run_id)
-        queued = [n for n in nodes if n.status == NodeStatus.QUEUED]
+    def _get_next_candidates(
+        self, nodes: list[RunNodeOrm], slots: int,
+    ) -> list[RunNodeOrm]:
+        queued = [
+            n for n in nodes
+            if n.status == NodeStatus.QUEUED and n.id not in self._running_nodes
+        ]
         queued.sort(key=lambda n: (n.depth, n.created_at))
         return queued[:slots]
 
     def _execute_node(self, node: RunNodeOrm, config: RunConfig, run_id: str) -> None:
+        # The candidates come from a read taken off the loop, during which
+        # the node may have been dispatched, run and finished. Claiming it
+        # in the DB before starting a task makes a stale read harmless.
+        if not self._db.transition_node_status(
+            node.id, NodeStatus.QUEUED, NodeStatus.RUNNING,
+        ):
+            return
+        self._emit_event(
+            run_id, node.id, "node_status_changed",
+            {"status": NodeStatus.RUNNING},
+        )
         task = asyncio.create_task(self._run_node(node, config, run_id))
         self._running_nodes[node.id] = task
+        # Completion, failure and cancellation all free a slot and may
+        # have queued children.
+        task.add_done_callback(lambda _: self.wake_scheduler())
 
     async def _run_node(self, node: RunNodeOrm, config: RunConfig, run_id: str) -> None:
         handler = self._registry.get(node.node_type)
@@ -396,11 +446,6 @@ class OrchestratorEngine:
             "Running node %s (type=%s, depth=%d) for run %s",
             node.id, node.node_type, node.depth, run_id,
         )
-        self._db.update_node_status(node.id, NodeStatus.RUNNING)
-        self._emit_event(
-            run_id, node.id, "node_status_changed",
-            {"status": NodeStatus.RUNNING},
-        )
 
         ctx = self._build_context(node, config, run_id)
         try:
@@ -471,6 +516,7 @@ class OrchestratorEngine:
             ancestor = self._get_implement_ancestor(node)
             if ancestor and ancestor.debug_retries < config.max_debug_retries:
                 self._db.increment_node_debug_retries(ancestor.id)
+                self._snapshots.mark_node(run_id, ancestor.id)
                 self._spawn_child(run_id, node, NodeType.DEBUG, {
                     "failure_context": result.artifacts,
                     "objective": self._get_run_objective(run_id),
@@ -809,6 +855,7 @@ class OrchestratorEngine:
         data: dict[str, Any],
     ) -> None:
         event = self._db.add_run_event(run_id, node_id, event_type, json.dumps(data))
+        self._snapshots.note_event(run_id, event.seq, node_id, data)
         msg = {"seq": event.seq, "type": event_type, "node_id": node_id, "data": data}
         for queue in self._event_subscribers.get(run_id, []):
             with contextlib.suppress(asyncio.QueueFull):
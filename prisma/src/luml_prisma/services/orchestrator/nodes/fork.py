@@ -55,10 +55,10 @@ class ForkNodeHandler:
         )
 
         ctx.services.db.add_node_session(ctx.node_id, session.session_id)
-        ctx.services.engine.notify_session_started(ctx.node_id, session.session_id)
         ctx.services.db.update_node_worktree(
             ctx.node_id, worktree_path, ctx.parent_branch or "",
         )
+        ctx.services.engine.notify_session_started(ctx.node_id, session.session_id)
 
         exit_event = asyncio.Event()
         ctx.services.engine.register_session_completion(session.session_id, exit_event)
@@ -1,11 +1,11 @@
 import asyncio
 import contextlib
-import errno
 import fcntl
 import json
 import os
 import pty
 import re
+import selectors
 import signal
 import struct
 import subprocess
@@ -13,9 +13,15 @@ import termios
 import threading
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 
 _SCROLLBACK_LIMIT = 100_000
+_MIN_READ_SIZE = 4096
+_MAX_READ_SIZE = 65536
+# Output chunks whose printable content has not been checked yet. Past
+# this, the oldest one is checked as a new one comes in.
+_UNSCANNED_LIMIT = 64
 
 _ANSI_ESCAPE_RE = re.compile(
     rb"\x1b"
@@ -34,6 +40,35 @@ def _has_printable_content(data: bytes) -> bool:
     return any(b > 0x1F and b != 0x7F for b in stripped)
 
 
+class ScrollbackBuffer:
+    def __init__(self, capacity: int = _SCROLLBACK_LIMIT) -> None:
+        self._buf = bytearray(capacity)
+        self._capacity = capacity
+        self._end = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, data: bytes) -> None:
+        view = memoryview(data)[-self._capacity :]
+        n = len(view)
+        with self._lock:
+            head = min(n, self._capacity - self._end)
+            self._buf[self._end : self._end + head] = view[:head]
+            self._buf[: n - head] = view[head:]
+            self._end = (self._end + n) % self._capacity
+            self._size = min(self._size + n, self._capacity)
+
+    def getvalue(self) -> bytes:
+        with self._lock:
+            start = self._end - self._size
+            if start >= 0:
+                return bytes(self._buf[start : self._end])
+            return bytes(self._buf[start:]) + bytes(self._buf[: self._end])
+
+
 @dataclass
 class PtySession:
     session_id: str
@@ -44,18 +79,84 @@ class PtySession:
     cols: int
     rows: int
     session_type: str = "agent"
-    scrollback: bytearray = field(default_factory=bytearray)
+    scrollback: ScrollbackBuffer = field(default_factory=ScrollbackBuffer)
     subscribers: list[asyncio.Queue[bytes | str | None]] = field(default_factory=list)
-    reader_thread: threading.Thread | None = None
-    last_output_time: float = field(default_factory=time.monotonic)
-    waiting_notified: bool = False
+    read_size: int = _MIN_READ_SIZE
     last_notified_time: float = 0.0
+    _output_time: float = field(default_factory=time.monotonic, repr=False)
+    _waiting_notified: bool = field(default=False, repr=False)
+    _unscanned: deque[tuple[float, bytes]] = field(
+        default_factory=deque,
+        repr=False,
+    )
+    _idle_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    # Output only counts towards idle tracking if it prints something, but
+    # that takes stripping ANSI escapes. Chunks are queued as they arrive
+    # and checked here, newest first, when the idle state is read. Past
+    # _UNSCANNED_LIMIT the reader thread checks chunks itself, so the idle
+    # fields are shared with it and only touched under _idle_lock.
+
+    @property
+    def last_output_time(self) -> float:
+        self._scan_output()
+        with self._idle_lock:
+            return self._output_time
+
+    @last_output_time.setter
+    def last_output_time(self, value: float) -> None:
+        self._scan_output()
+        with self._idle_lock:
+            self._output_time = value
+
+    @property
+    def waiting_notified(self) -> bool:
+        self._scan_output()
+        with self._idle_lock:
+            return self._waiting_notified
+
+    @waiting_notified.setter
+    def waiting_notified(self, value: bool) -> None:
+        self._scan_output()
+        with self._idle_lock:
+            self._waiting_notified = value
+
+    def record_output(self, data: bytes) -> None:
+        self._unscanned.append((time.monotonic(), data))
+        if len(self._unscanned) > _UNSCANNED_LIMIT:
+            with contextlib.suppress(IndexError):
+                self._mark_output(*self._unscanned.popleft())
+
+    def _scan_output(self) -> None:
+        chunks: list[tuple[float, bytes]] = []
+        with contextlib.suppress(IndexError):
+            while True:
+                chunks.append(self._unscanned.popleft())
+        for received_at, data in reversed(chunks):
+            if self._mark_output(received_at, data):
+                break
+
+    def _mark_output(self, received_at: float, data: bytes) -> bool:
+        if not _has_printable_content(data):
+            return False
+        with self._idle_lock:
+            if received_at <= self._output_time:
+                return False
+            self._output_time = received_at
+            self._waiting_notified = False
+        return True
 
 
 class PtyManager:
     def __init__(self) -> None:
         self._sessions: dict[str, PtySession] = {}
         self._loop: asyncio.AbstractEventLoop | None = None
+        # One reader thread serves every session's master fd. It exits when
+        # the last session is gone and is restarted by the next spawn.
+        self._selector: selectors.BaseSelector | None = None
+        self._selector_lock = threading.Lock()
+        self._wakeup_fds: tuple[int, int] | None = None
+        self._reader: threading.Thread | None = None
 
     def spawn(
         self,
@@ -110,14 +211,52 @@ class PtyManager:
             session_type=session_type,
         )
         self._sessions[session_id] = session
-
-        thread = threading.Thread(
-            target=self._reader_thread, args=(session,), daemon=True
-        )
-        thread.start()
-        session.reader_thread = thread
+        self._watch(session)
         return session
 
+    def _watch(self, session: PtySession) -> None:
+        with self._selector_lock:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+                wake_r, wake_w = os.pipe()
+                os.set_blocking(wake_r, False)
+                os.set_blocking(wake_w, False)
+                self._wakeup_fds = (wake_r, wake_w)
+                self._selector.register(wake_r, selectors.EVENT_READ)
+            self._selector.register(session.fd, selectors.EVENT_READ, session)
+            if self._reader is None:
+                self._reader = threading.Thread(
+                    target=self._reader_loop,
+                    args=(self._selector,),
+                    daemon=True,
+                )
+                self._reader.start()
+
+    def _unwatch(self, session: PtySession) -> None:
+        # Must run before the fd is closed, so the reader never reads a
+        # closed or reused fd.
+        with self._selector_lock:
+            if self._selector is None:
+                return
+            with contextlib.suppress(KeyError, ValueError):
+                self._selector.unregister(session.fd)
+        self._wake_reader()
+
+    def _wake_reader(self) -> None:
+        if self._wakeup_fds is not None:
+            with contextlib.suppress(BlockingIOError, OSError):
+                os.write(self._wakeup_fds[1], b"\0")
+
+    def _post(self, session: PtySession, data: bytes | None) -> None:
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            try:
+                loop.call_soon_threadsafe(self._push_to_subscribers, session, data)
+            except RuntimeError:
+                self._push_to_subscribers(session, data)
+        else:
+            self._push_to_subscribers(session, data)
+
     def _push_to_subscribers(
         self, session: PtySession, data: bytes | str | None
     ) -> None:
@@ -125,45 +264,43 @@ class PtyManager:
             with contextlib.suppress(asyncio.QueueFull):
                 queue.put_nowait(data)
 
-    def _reader_thread(self, session: PtySession) -> None:  # noqa: C901
+    def _reader_loop(self, selector: selectors.BaseSelector) -> None:
+        while True:
+            events = selector.select()
+            with self._selector_lock:
+                for key, _ in events:
+                    if key.data is None:
+                        with contextlib.suppress(BlockingIOError, OSError):
+                            os.read(key.fd, 4096)
+                    # Skip fds unregistered since select() returned.
+                    elif selector.get_map().get(key.fd) is key:
+                        self._read_session(selector, key.data)
+                if len(selector.get_map()) <= 1:
+                    self._reader = None
+                    return
+
+    def _read_session(
+        self,
+        selector: selectors.BaseSelector,
+        session: PtySession,
+    ) -> None:
         try:
-            while True:
-                try:
-                    data = os.read(session.fd, 4096)
-                except OSError as e:
-                    if e.errno in (errno.EIO, errno.EBADF):
-                        break
-                    break
-                if not data:
-                    break
-                if _has_printable_content(data):
-                    session.last_output_time = time.monotonic()
-                    session.waiting_notified = False
-                session.scrollback.extend(data)
-                if len(session.scrollback) > _SCROLLBACK_LIMIT:
-                    excess = len(session.scrollback) - _SCROLLBACK_LIMIT
-                    del session.scrollback[:excess]
-                loop = self._loop
-                if loop is not None and loop.is_running():
-                    try:
-                        loop.call_soon_threadsafe(
-                            self._push_to_subscribers, session, data
-                        )
-                    except RuntimeError:
-                        self._push_to_subscribers(session, data)
-                else:
-                    self._push_to_subscribers(session, data)
-        except Exception:
-            pass
-        finally:
-            loop = self._loop
-            if loop is not None and loop.is_running():
-                try:
-                    loop.call_soon_threadsafe(self._push_to_subscribers, session, None)
-                except RuntimeError:
-                    self._push_to_subscribers(session, None)
-            else:
-                self._push_to_subscribers(session, None)
+            data = os.read(session.fd, session.read_size)
+        except OSError:
+            # EIO once the child side of the PTY is closed.
+            data = b""
+        if not data:
+            selector.unregister(session.fd)
+            self._post(session, None)
+            return
+        # Grow reads for chatty sessions, shrink back for quiet ones.
+        if len(data) == session.read_size:
+            session.read_size = min(session.read_size * 2, _MAX_READ_SIZE)
+        elif len(data) < session.read_size // 4:
+            session.read_size = max(session.read_size // 2, _MIN_READ_SIZE)
+        session.record_output(data)
+        session.scrollback.append(data)
+        self._post(session, data)
 
     def write(self, session_id: str, data: bytes) -> None:
         session = self._sessions.get(session_id)
@@ -194,10 +331,9 @@ class PtyManager:
                 os.kill(session.pid, signal.SIGKILL)
             with contextlib.suppress(subprocess.TimeoutExpired):
                 session.process.wait(timeout=2)
+        self._unwatch(session)
         with contextlib.suppress(OSError):
             os.close(session.fd)
-        if session.reader_thread and session.reader_thread.is_alive():
-            session.reader_thread.join(timeout=2)
 
     def terminate_task(self, task_id: str) -> None:
         for session in self._find_task_sessions(task_id):
@@ -222,7 +358,7 @@ class PtyManager:
         session = self._sessions.get(session_id)
         if session is None:
             return b""
-        return bytes(session.scrollback)
+        return session.scrollback.getvalue()
 
     def subscribe(self, session_id: str) -> asyncio.Queue[bytes | str | None]:
         session = self._sessions.get(session_id)
@@ -257,6 +393,7 @@ class PtyManager:
                 dead.append(
                     (session_id, session.task_id, session.session_type, exit_code)
                 )
+                self._unwatch(session)
                 with contextlib.suppress(OSError):
                     os.close(session.fd)
                 del self._sessions[session_id]
@@ -333,3 +470,15 @@ class PtyManager:
     def shutdown(self) -> None:
         for session_id in list(self._sessions.keys()):
             self.terminate(session_id)
+        reader = self._reader
+        if reader is not None:
+            reader.join(timeout=2)
+        with self._selector_lock:
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+            if self._wakeup_fds is not None:
+                for fd in self._wakeup_fds:
+                    with contextlib.suppress(OSError):
+                        os.close(fd)
+                self._wakeup_fds = None
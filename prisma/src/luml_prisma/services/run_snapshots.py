@@ -0,0 +1,176 @@
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from luml_prisma.database import Database
+from luml_prisma.models import RunNodeOrm
+from luml_prisma.schemas import RunEdgeOut, RunNodeOut, RunOut
+from luml_prisma.services.pty_manager import PtyManager
+
+_MAX_CACHED_RUNS = 32
+
+
+@dataclass
+class _NodeEntry:
+    data: dict[str, Any]
+    session_ids: list[str]
+    changed_seq: int
+
+
+@dataclass
+class _EdgeEntry:
+    data: dict[str, Any]
+    changed_seq: int
+
+
+@dataclass
+class _RunSnapshot:
+    # A new epoch means the client's copy cannot be patched: the snapshot
+    # was rebuilt, and event seqs restart when a run is reset.
+    epoch: str
+    seq: int
+    nodes: dict[str, _NodeEntry] = field(default_factory=dict)
+    edges: dict[str, _EdgeEntry] = field(default_factory=dict)
+    dirty: dict[str, int] = field(default_factory=dict)
+
+
+class RunSnapshots:
+    """In-memory run graphs, patched from the engine's events.
+
+    Events only mark the nodes they touch; those nodes and the edges into
+    them are re-read in one batch the next time the snapshot is sent.
+    """
+
+    def __init__(self, db: Database, pty: PtyManager) -> None:
+        self._db = db
+        self._pty = pty
+        self._runs: OrderedDict[str, _RunSnapshot] = OrderedDict()
+
+    def note_event(
+        self,
+        run_id: str,
+        seq: int,
+        node_id: str | None,
+        data: dict[str, Any],
+    ) -> None:
+        snapshot = self._runs.get(run_id)
+        if snapshot is None:
+            return
+        snapshot.seq = max(snapshot.seq, seq)
+        # edge_created carries no node_id; re-reading the child picks the
+        # edge up along with it.
+        target = node_id or data.get("to_node_id")
+        if isinstance(target, str):
+            snapshot.dirty[target] = seq
+
+    def mark_node(self, run_id: str, node_id: str) -> None:
+        # For writes that emit no event of their own: sent to every client
+        # that has seen the latest event.
+        snapshot = self._runs.get(run_id)
+        if snapshot is not None:
+            snapshot.dirty[node_id] = snapshot.seq + 1
+
+    def drop(self, run_id: str) -> None:
+        self._runs.pop(run_id, None)
+
+    def message(
+        self,
+        run_id: str,
+        since: int | None = None,
+        epoch: str | None = None,
+    ) -> dict[str, Any] | None:
+        run = self._db.get_run(run_id)
+        if run is None:
+            self.drop(run_id)
+            return None
+        snapshot = self._current(run_id)
+        cutoff = (
+            since
+            if since is not None and epoch == snapshot.epoch and since <= snapshot.seq
+            else None
+        )
+        nodes = [
+            self._node_out(entry)
+            for entry in snapshot.nodes.values()
+            if cutoff is None or entry.changed_seq > cutoff
+        ]
+        edges = [
+            entry.data
+            for entry in snapshot.edges.values()
+            if cutoff is None or entry.changed_seq > cutoff
+        ]
+        return {
+            "type": "snapshot" if cutoff is None else "snapshot_delta",
+            "data": {
+                "run": RunOut.from_db(run).model_dump(),
+                "nodes": nodes,
+                "edges": edges,
+                "seq": snapshot.seq,
+                "epoch": snapshot.epoch,
+            },
+        }
+
+    def _current(self, run_id: str) -> _RunSnapshot:
+        snapshot = self._runs.get(run_id)
+        if snapshot is None:
+            snapshot = self._build(run_id)
+            self._runs[run_id] = snapshot
+            while len(self._runs) > _MAX_CACHED_RUNS:
+                self._runs.popitem(last=False)
+        else:
+            self._runs.move_to_end(run_id)
+            if snapshot.dirty:
+                self._refresh(run_id, snapshot)
+        return snapshot
+
+    def _build(self, run_id: str) -> _RunSnapshot:
+        seq = self._db.get_next_event_seq(run_id) - 1
+        snapshot = _RunSnapshot(epoch=uuid.uuid4().hex, seq=seq)
+        for node, session_ids in self._db.list_run_nodes_with_sessions(run_id):
+            snapshot.nodes[node.id] = _node_entry(node, session_ids, seq)
+        for edge in self._db.list_run_edges(run_id):
+            snapshot.edges[edge.id] = _EdgeEntry(_edge_out(edge), seq)
+        return snapshot
+
+    def _refresh(self, run_id: str, snapshot: _RunSnapshot) -> None:
+        dirty, snapshot.dirty = snapshot.dirty, {}
+        rows = self._db.list_run_nodes_with_sessions(run_id, node_ids=dirty)
+        for node, session_ids in rows:
+            snapshot.nodes[node.id] = _node_entry(
+                node,
+                session_ids,
+                dirty[node.id],
+            )
+        for node_id in dirty.keys() - {node.id for node, _ in rows}:
+            snapshot.nodes.pop(node_id, None)
+        for edge in self._db.list_run_edges(run_id, to_node_ids=dirty):
+            snapshot.edges[edge.id] = _EdgeEntry(
+                _edge_out(edge),
+                dirty[edge.to_node_id],
+            )
+
+    def _node_out(self, entry: _NodeEntry) -> dict[str, Any]:
+        # Liveness comes from the PTYs, not the database, so it is
+        # looked up on every send.
+        active_sid = next(
+            (sid for sid in entry.session_ids if self._pty.is_alive(sid)),
+            None,
+        )
+        return {
+            **entry.data,
+            "session_id": active_sid,
+            "is_alive": active_sid is not None,
+        }
+
+
+def _node_entry(
+    node: RunNodeOrm,
+    session_ids: list[str],
+    seq: int,
+) -> _NodeEntry:
+    return _NodeEntry(RunNodeOut.from_db(node).model_dump(), session_ids, seq)
+
+
+def _edge_out(edge: Any) -> dict[str, Any]:  # noqa: ANN401
+    return RunEdgeOut.model_validate(edge, from_attributes=True).model_dump()
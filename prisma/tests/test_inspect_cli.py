@@ -5,8 +5,11 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+import pytest
+from luml.experiments.tracker import ExperimentTracker
 from typer.testing import CliRunner
 
+from luml_prisma.cli import inspect as inspect_cli
 from luml_prisma.cli.inspect import app
 
 runner = CliRunner()
@@ -991,6 +994,93 @@ class TestCompareCommand:
         assert result.exit_code == 0
         assert "buckets" not in result.output
 
+    def test_compare_metric_filter(self, tmp_path: Path) -> None:
+        db_path = _seed_db(tmp_path)
+        result = runner.invoke(
+            app,
+            [
+                "compare", "abc-123", "def-456",
+                "--db", str(db_path), "--metric", "loss",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "METRIC: loss" in result.output
+        assert "METRIC: accuracy" not in result.output
+        assert "learning_rate" in result.output
+
+    def test_compare_repeated_metric_printed_once(self, tmp_path: Path) -> None:
+        db_path = _seed_db(tmp_path)
+        result = runner.invoke(
+            app,
+            [
+                "compare", "abc-123", "def-456", "--db", str(db_path),
+                "--metric", "loss", "--metric", "accuracy", "--metric", "loss",
+            ],
+        )
+        assert result.exit_code == 0
+        assert result.output.count("METRIC: loss") == 1
+        assert result.output.index("METRIC: loss") < result.output.index(
+            "METRIC: accuracy"
+        )
+
+    def test_compare_reads_each_experiment_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        db_path = _seed_db(tmp_path)
+        loads: list[str] = []
+        original = ExperimentTracker.get_experiment
+
+        def spy(self: ExperimentTracker, experiment_id: str) -> Any:  # noqa: ANN401
+            loads.append(experiment_id)
+            return original(self, experiment_id)
+
+        monkeypatch.setattr(ExperimentTracker, "get_experiment", spy)
+        monkeypatch.setattr(inspect_cli, "_trackers", {})
+        result = runner.invoke(
+            app, ["compare", "abc-123", "def-456", "--db", str(db_path)],
+        )
+        assert result.exit_code == 0
+        assert loads == ["abc-123", "def-456"]
+        assert list(inspect_cli._trackers) == [str(db_path)]
+
+    def test_compare_cache_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        db_path = _seed_db(tmp_path)
+        cache_dir = tmp_path / "cache"
+        args = [
+            "--cache-dir", str(cache_dir),
+            "compare", "abc-123", "def-456", "--db", str(db_path), "--summary",
+        ]
+        first = runner.invoke(app, args)
+        assert first.exit_code == 0
+
+        loads: list[str] = []
+        original = ExperimentTracker.get_experiment
+
+        def spy(self: ExperimentTracker, experiment_id: str) -> Any:  # noqa: ANN401
+            loads.append(experiment_id)
+            return original(self, experiment_id)
+
+        monkeypatch.setattr(ExperimentTracker, "get_experiment", spy)
+        cached = runner.invoke(app, args)
+        assert cached.exit_code == 0
+        assert cached.output == first.output
+        assert loads == []
+
+        conn = sqlite3.connect(str(db_path / "abc-123" / "exp.db"))
+        conn.execute(
+            "INSERT INTO dynamic_metrics (key, value, step) VALUES (?, ?, ?)",
+            ("accuracy", 0.99, 501),
+        )
+        conn.commit()
+        conn.close()
+
+        updated = runner.invoke(app, args)
+        assert updated.exit_code == 0
+        assert loads == ["abc-123"]
+        assert "0.99" in updated.output
+
     def test_compare_too_few_ids(self, tmp_path: Path) -> None:
         db_path = _seed_db(tmp_path)
         result = runner.invoke(
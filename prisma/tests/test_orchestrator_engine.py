@@ -1,5 +1,6 @@
 import asyncio
 import json
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -192,7 +193,7 @@ class TestScheduling:
         await engine.start_run(run_id)
 
         candidates = engine._get_next_candidates(
-            run_id, 3,
+            db.list_run_nodes(run_id), 3,
         )
         assert candidates[0].depth == 0
         assert candidates[1].depth == 1
@@ -227,10 +228,108 @@ class TestScheduling:
         await engine._schedule_tick()
         await asyncio.sleep(0.05)
 
-        active = engine._count_active_nodes(run_id)
+        active = engine._count_active_nodes(db.list_run_nodes(run_id))
         assert active <= 1
 
 
+class TestSchedulerWakeup:
+    @pytest.mark.asyncio
+    async def test_start_run_schedules_without_polling(
+        self,
+        engine: OrchestratorEngine,
+        db: Database,
+        registry: NodeRegistry,
+    ) -> None:
+        pid = db.list_repositories()[0].id
+        handler = MockNodeHandler("implement")
+        registry.register(handler)
+        run_id = await engine.create_run(
+            pid, "r", "", RunConfig(), {"prompt": "test"},
+        )
+        await engine.start()
+        try:
+            await engine.start_run(run_id)
+            for _ in range(50):
+                if handler.execute_count:
+                    break
+                await asyncio.sleep(0.01)
+            assert handler.execute_count == 1
+        finally:
+            await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_scheduler_does_not_tick(
+        self,
+        engine: OrchestratorEngine,
+    ) -> None:
+        ticks = 0
+
+        async def counting_tick() -> None:
+            nonlocal ticks
+            ticks += 1
+
+        engine._schedule_tick = counting_tick  # type: ignore[method-assign]
+        await engine.start()
+        try:
+            await asyncio.sleep(0.6)
+            assert ticks == 1
+            engine.wake_scheduler()
+            await asyncio.sleep(0.05)
+            assert ticks == 2
+        finally:
+            await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_dispatched_node_is_not_started_twice(
+        self,
+        engine: OrchestratorEngine,
+        db: Database,
+        registry: NodeRegistry,
+    ) -> None:
+        pid = db.list_repositories()[0].id
+        handler = MockNodeHandler("implement", delay=0.1)
+        registry.register(handler)
+        run_id = await engine.create_run(
+            pid, "r", "", RunConfig(max_concurrency=2), {"prompt": "test"},
+        )
+        await engine.start_run(run_id)
+
+        await engine._schedule_tick()
+        await engine._schedule_tick()
+        await asyncio.sleep(0.2)
+
+        assert handler.execute_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_read_does_not_restart_finished_node(
+        self,
+        tmp_path: Path,
+        pty: PtyManager,
+        registry: NodeRegistry,
+    ) -> None:
+        db = Database(tmp_path / "prisma.db")
+        pid = db.add_repository("test", "/tmp/test-repo").id
+        engine = OrchestratorEngine(db=db, pty=pty, registry=registry)
+        handler = MockNodeHandler("implement")
+        registry.register(handler)
+        run_id = await engine.create_run(
+            pid, "r", "", RunConfig(max_concurrency=2), {"prompt": "test"},
+        )
+        await engine.start_run(run_id)
+        # A read taken before the node was dispatched, as a tick whose
+        # offloaded query was still running would see it.
+        stale = db.list_runs_with_nodes(RunStatus.RUNNING, [NodeStatus.QUEUED])
+
+        await engine._schedule_tick()
+        await asyncio.sleep(0.05)
+        assert handler.execute_count == 1
+        db.list_runs_with_nodes = lambda *args: stale  # type: ignore[method-assign]
+        await engine._schedule_tick()
+        await asyncio.sleep(0.05)
+
+        assert handler.execute_count == 1
+
+
 class TestAutoSpawn:
     @pytest.mark.asyncio
     async def test_auto_spawn_run_after_implement(
@@ -1060,14 +1159,14 @@ class TestWaitingInputStatus:
         await engine._schedule_tick()
         await asyncio.sleep(0.05)
 
-        assert engine._count_active_nodes(run_id) == 1
+        assert engine._count_active_nodes(db.list_run_nodes(run_id)) == 1
 
         nodes = db.list_run_nodes(run_id)
         session_id = "fake-session-count"
         db.add_node_session(nodes[0].id, session_id)
         engine.notify_session_idle(session_id)
 
-        assert engine._count_active_nodes(run_id) == 1
+        assert engine._count_active_nodes(db.list_run_nodes(run_id)) == 1
 
         await engine.cancel_run(run_id)
 
@@ -49,6 +49,28 @@ class TestRunCRUD:
         assert updated is not None
         assert updated.status == RunStatus.RUNNING
 
+    def test_list_runs_with_nodes(self, db: Database) -> None:
+        pid = db.list_repositories()[0].id
+        busy = db.add_run(repository_id=pid, name="busy", objective="")
+        idle = db.add_run(repository_id=pid, name="idle", objective="")
+        pending = db.add_run(repository_id=pid, name="pending", objective="")
+        for run in (busy, idle):
+            db.update_run_status(run.id, RunStatus.RUNNING)
+        deep = db.add_run_node(busy.id, None, NodeType.IMPLEMENT, depth=1)
+        root = db.add_run_node(busy.id, None, NodeType.IMPLEMENT, depth=0)
+        done = db.add_run_node(busy.id, None, NodeType.RUN, depth=0)
+        db.update_node_status(done.id, NodeStatus.SUCCEEDED)
+        db.add_run_node(pending.id, None, NodeType.IMPLEMENT, depth=0)
+
+        rows = db.list_runs_with_nodes(RunStatus.RUNNING, [NodeStatus.QUEUED])
+
+        pairs = [(run.id, node.id if node else None) for run, node in rows]
+        assert sorted(pairs, key=lambda p: p[0] != busy.id) == [
+            (busy.id, root.id),
+            (busy.id, deep.id),
+            (idle.id, None),
+        ]
+
     def test_remove_run_cascades(self, db: Database) -> None:
         pid = db.list_repositories()[0].id
         run = db.add_run(repository_id=pid, name="r", objective="")
@@ -91,6 +113,23 @@ class TestRunNodeCRUD:
         nodes = db.list_run_nodes(run.id)
         assert len(nodes) == 2
 
+    def test_list_run_nodes_with_sessions(self, db: Database) -> None:
+        pid = db.list_repositories()[0].id
+        run = db.add_run(repository_id=pid, name="r", objective="")
+        first = db.add_run_node(run.id, None, NodeType.IMPLEMENT, depth=0)
+        second = db.add_run_node(run.id, first.id, NodeType.RUN, depth=0)
+        db.add_node_session(first.id, "sess-a")
+        db.add_node_session(first.id, "sess-b")
+
+        rows = db.list_run_nodes_with_sessions(run.id)
+        assert [(n.id, sorted(s)) for n, s in rows] == [
+            (first.id, ["sess-a", "sess-b"]),
+            (second.id, []),
+        ]
+
+        only = db.list_run_nodes_with_sessions(run.id, node_ids=[second.id])
+        assert [n.id for n, _ in only] == [second.id]
+
     def test_parent_child_relationship(self, db: Database) -> None:
         pid = db.list_repositories()[0].id
         run = db.add_run(repository_id=pid, name="r", objective="")
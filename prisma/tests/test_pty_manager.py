@@ -1,10 +1,15 @@
 import asyncio
 import json
+import threading
 import time
 
 import pytest
 
-from luml_prisma.services.pty_manager import PtyManager, _has_printable_content
+from luml_prisma.services.pty_manager import (
+    PtyManager,
+    ScrollbackBuffer,
+    _has_printable_content,
+)
 
 
 @pytest.fixture
@@ -404,3 +409,48 @@ def test_get_idle_agent_sessions(pty_manager: PtyManager) -> None:
     pty_manager.terminate(s1.session_id)
     pty_manager.terminate(s2.session_id)
     pty_manager.terminate(s3.session_id)
+
+
+def test_scrollback_buffer_keeps_latest_bytes() -> None:
+    buf = ScrollbackBuffer(capacity=8)
+    buf.append(b"abc")
+    assert buf.getvalue() == b"abc"
+    buf.append(b"defgh")
+    buf.append(b"ij")
+    assert buf.getvalue() == b"cdefghij"
+    buf.append(b"0123456789")
+    assert buf.getvalue() == b"23456789"
+    assert len(buf) == 8
+
+
+def test_sessions_share_one_reader_thread(pty_manager: PtyManager) -> None:
+    before = threading.active_count()
+    sessions = [
+        pty_manager.spawn(f"t{i}", ["sleep", "60"], cwd="/tmp") for i in range(10)
+    ]
+    assert threading.active_count() <= before + 1
+
+    for session in sessions:
+        pty_manager.terminate(session.session_id)
+    reader = pty_manager._reader
+    if reader is not None:
+        reader.join(timeout=2)
+    assert pty_manager._reader is None
+
+
+def test_output_is_scanned_when_idle_state_is_read(
+    pty_manager: PtyManager,
+) -> None:
+    session = pty_manager.spawn("t1", ["sleep", "60"], cwd="/tmp")
+    session.last_output_time = time.monotonic() - 10.0
+    session.waiting_notified = True
+
+    session.record_output(b"\x1b[H\x1b[2J")
+    assert session.waiting_notified is True
+    assert pty_manager.get_idle_duration(session.session_id) >= 9.0
+
+    session.record_output(b"\x1b[32mdone\x1b[0m")
+    session.record_output(b"\x1b[?25h")
+    assert session.waiting_notified is False
+    assert pty_manager.get_idle_duration(session.session_id) < 1.0
+    pty_manager.terminate(session.session_id)
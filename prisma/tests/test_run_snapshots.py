@@ -0,0 +1,152 @@
+from unittest.mock import patch
+
+import pytest
+
+from luml_prisma.database import Database
+from luml_prisma.services.orchestrator.engine import OrchestratorEngine
+from luml_prisma.services.orchestrator.models import (
+    NodeStatus,
+    NodeType,
+    RunConfig,
+)
+from luml_prisma.services.orchestrator.registry import NodeRegistry
+from luml_prisma.services.pty_manager import PtyManager
+
+
+@pytest.fixture
+def db() -> Database:
+    d = Database()
+    d.add_repository("test", "/tmp/test-repo")
+    return d
+
+
+@pytest.fixture
+def pty() -> PtyManager:
+    mgr = PtyManager()
+    yield mgr
+    mgr.shutdown()
+
+
+@pytest.fixture
+def engine(db: Database, pty: PtyManager) -> OrchestratorEngine:
+    return OrchestratorEngine(db=db, pty=pty, registry=NodeRegistry())
+
+
+async def _create_run(engine: OrchestratorEngine, db: Database) -> str:
+    pid = db.list_repositories()[0].id
+    return await engine.create_run(
+        pid,
+        "r",
+        "obj",
+        RunConfig(),
+        {"prompt": "test"},
+    )
+
+
+class TestRunSnapshots:
+    @pytest.mark.asyncio
+    async def test_snapshot_uses_one_node_query(
+        self,
+        engine: OrchestratorEngine,
+        db: Database,
+    ) -> None:
+        run_id = await _create_run(engine, db)
+        root = db.list_run_nodes(run_id)[0]
+        for i in range(20):
+            child = db.add_run_node(run_id, root.id, NodeType.RUN, depth=0)
+            db.add_run_edge(run_id, root.id, child.id)
+            db.add_node_session(child.id, f"sess-{i}")
+
+        with (
+            patch.object(
+                db,
+                "list_run_nodes_with_sessions",
+                wraps=db.list_run_nodes_with_sessions,
+            ) as joined,
+            patch.object(
+                db,
+                "get_node_sessions",
+                wraps=db.get_node_sessions,
+            ) as per_node,
+        ):
+            message = engine.run_snapshot(run_id)
+
+        assert message is not None
+        assert message["type"] == "snapshot"
+        assert len(message["data"]["nodes"]) == 21
+        assert len(message["data"]["edges"]) == 20
+        assert joined.call_count == 1
+        assert per_node.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_reconnect_gets_only_changed_nodes(
+        self,
+        engine: OrchestratorEngine,
+        db: Database,
+    ) -> None:
+        run_id = await _create_run(engine, db)
+        root = db.list_run_nodes(run_id)[0]
+        first = engine.run_snapshot(run_id)
+        assert first is not None
+        seen = first["data"]
+
+        child = engine._spawn_child(run_id, root, NodeType.RUN, {}, "auto")
+        assert child is not None
+        db.update_node_status(root.id, NodeStatus.RUNNING)
+        engine._emit_event(
+            run_id,
+            root.id,
+            "node_status_changed",
+            {"status": NodeStatus.RUNNING},
+        )
+
+        with patch.object(
+            db,
+            "list_run_nodes_with_sessions",
+            wraps=db.list_run_nodes_with_sessions,
+        ) as joined:
+            delta = engine.run_snapshot(
+                run_id,
+                since=seen["seq"],
+                epoch=seen["epoch"],
+            )
+
+        assert delta is not None
+        assert delta["type"] == "snapshot_delta"
+        nodes = {n["id"]: n for n in delta["data"]["nodes"]}
+        assert set(nodes) == {root.id, child.id}
+        assert nodes[root.id]["status"] == NodeStatus.RUNNING
+        assert [e["to_node_id"] for e in delta["data"]["edges"]] == [child.id]
+        assert delta["data"]["seq"] > seen["seq"]
+        assert joined.call_args.kwargs["node_ids"].keys() == {root.id, child.id}
+
+    @pytest.mark.asyncio
+    async def test_unknown_epoch_gets_full_snapshot(
+        self,
+        engine: OrchestratorEngine,
+        db: Database,
+    ) -> None:
+        run_id = await _create_run(engine, db)
+        first = engine.run_snapshot(run_id)
+        assert first is not None
+
+        await engine.restart_run(run_id)
+        message = engine.run_snapshot(
+            run_id,
+            since=first["data"]["seq"],
+            epoch=first["data"]["epoch"],
+        )
+
+        assert message is not None
+        assert message["type"] == "snapshot"
+        assert message["data"]["epoch"] != first["data"]["epoch"]
+        assert [n["id"] for n in message["data"]["nodes"]] == [
+            n.id for n in db.list_run_nodes(run_id)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_run_returns_none(
+        self,
+        engine: OrchestratorEngine,
+    ) -> None:
+        assert engine.run_snapshot("nonexistent") is None
@@ -373,7 +373,7 @@ class TestSchedulerResilience:
 
         with (
             patch.object(
-                db, "list_runs",
+                db, "list_runs_with_nodes",
                 side_effect=RuntimeError("DB gone"),
             ),
             pytest.raises(_UnrecoverableSchedulerError),
@@ -417,7 +417,7 @@ class TestSchedulerResilience:
         call_count = 0
 
         def failing_candidates(
-            run_id: str, slots: int,
+            nodes: list, slots: int,
         ) -> list:
             nonlocal call_count
             call_count += 1
@@ -1,10 +1,14 @@
+import asyncio
 import contextlib
+import json
 import logging
-from typing import Self
+from typing import Any, Self
 from uuid import UUID
 
 import aiodocker
+from aiodocker.channel import ChannelSubscriber
 from aiodocker.containers import DockerContainer
+from aiodocker.events import DockerEvents
 from aiodocker.exceptions import DockerError
 
 from agent._exceptions import ContainerNotFoundError, ContainerNotRunningError
@@ -13,6 +17,61 @@ from agent.settings import config as config_settings
 logger = logging.getLogger(__name__)
 
 
+class ContainerEvents:
+    """Docker daemon events for a single container, read one action at a time.
+
+    Use as an async context manager: leaving it drops the subscription and, when it
+    was the last one, stops the client's event stream.
+    """
+
+    def __init__(
+        self, events: DockerEvents, subscriber: ChannelSubscriber, container_name: str
+    ) -> None:
+        self._events = events
+        self._subscriber: ChannelSubscriber | None = subscriber
+        self._queue: asyncio.Queue | None = subscriber.queue
+        self._container_name = container_name
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        await self.close()
+
+    async def close(self) -> None:
+        queue, self._queue = self._queue, None
+        if queue is None:
+            return
+        # The subscriber takes its queue off the channel once it is collected,
+        # which happens as soon as the last reference goes.
+        self._subscriber = None
+        if not any(q is not queue for q in self._events.channel.queues):
+            await self._events.stop()
+
+    async def _next_matching(self) -> str | None:
+        while self._subscriber is not None:
+            event: dict[str, Any] | None = await self._subscriber.get()
+            if event is None:
+                # The daemon closed the stream; nothing more will arrive.
+                self._subscriber = None
+                return None
+            attributes = event.get("Actor", {}).get("Attributes", {})
+            if attributes.get("name") == self._container_name:
+                return str(event.get("Action") or event.get("status") or "")
+        return None
+
+    async def next(self, timeout: float) -> str | None:
+        """The next action for the container (``start``, ``die``, ``health_status: healthy``,
+        ...), or None when nothing arrives within ``timeout`` seconds."""
+        if self._subscriber is None:
+            await asyncio.sleep(timeout)
+            return None
+        try:
+            return await asyncio.wait_for(self._next_matching(), timeout)
+        except TimeoutError:
+            return None
+
+
 class DockerService:
     def __init__(self) -> None:
         self.client = aiodocker.Docker()
@@ -109,6 +168,11 @@ class DockerService:
 
         return container
 
+    def container_events(self, container_name: str) -> ContainerEvents:
+        events = self.client.events
+        subscriber = events.subscribe(filters=json.dumps({"type": ["container"]}))
+        return ContainerEvents(events, subscriber, container_name)
+
     async def check_container_running(self, deployment_id: str) -> None:
         try:
             container = await self.client.containers.get(f"sat-{deployment_id}")
@@ -1,4 +1,7 @@
+import asyncio
+import hashlib
 import logging
+from collections.abc import Iterable
 from typing import Any, Self
 from uuid import UUID
 
@@ -15,20 +18,33 @@ cache.setup("mem://")
 
 _AUTHORIZATION_CACHE_TTL_SECONDS = 60
 _SECRETS_CACHE_TTL_SECONDS = 60
+# Extra time the HTTP client allows beyond the long-poll wait before giving up.
+_LONG_POLL_GRACE_SECONDS = 10.0
 
 
 class PlatformClient:
-    def __init__(self, base_url: str, token: str, timeout_s: float = 30.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        timeout_s: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self._timeout: float | httpx.Timeout = timeout_s
         self._headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        self._transport = transport
         self._session: httpx.AsyncClient | None = None
+        # Scopes cached responses to the satellite token that fetched them.
+        self._cache_scope = hashlib.sha256(token.encode()).hexdigest()[:16]
 
     async def __aenter__(self) -> Self:
-        self._session = httpx.AsyncClient(timeout=self._timeout, headers=self._headers)
+        self._session = httpx.AsyncClient(
+            timeout=self._timeout, headers=self._headers, transport=self._transport
+        )
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001, ANN201
@@ -41,10 +57,18 @@ class PlatformClient:
             path = "/" + path
         return f"{self.base_url}{path}"
 
-    async def list_tasks(self, status: SatelliteTaskStatus | None = None) -> list[dict[str, Any]]:
+    async def list_tasks(
+        self, status: SatelliteTaskStatus | None = None, wait_s: float | None = None
+    ) -> list[dict[str, Any]]:
         assert self._session is not None
-        params = {"status": status.value if status else None}
-        r = await self._session.get(self._url("/satellites/v1/tasks"), params=params)
+        params: dict[str, Any] = {"status": status.value if status else None}
+        timeout: float | httpx.Timeout = self._timeout
+        if wait_s:
+            params["wait"] = wait_s
+            timeout = wait_s + _LONG_POLL_GRACE_SECONDS
+        r = await self._session.get(
+            self._url("/satellites/v1/tasks"), params=params, timeout=timeout
+        )
         r.raise_for_status()
         tasks = r.json()
         return tasks
@@ -121,20 +145,51 @@ class PlatformClient:
         data = r.json()
         return data.get("model"), str(data.get("url", ""))
 
-    @cache(ttl=_SECRETS_CACHE_TTL_SECONDS, key="get_orbit_secret:{secret_id}")
+    @cache(ttl=_SECRETS_CACHE_TTL_SECONDS, key="get_orbit_secret:{self._cache_scope}:{secret_id}")
     async def get_orbit_secret(self, secret_id: UUID) -> dict[str, Any]:
         assert self._session is not None
         r = await self._session.get(self._url(f"/satellites/v1/secrets/{secret_id}"))
         r.raise_for_status()
         return r.json()
 
-    @cache(ttl=_SECRETS_CACHE_TTL_SECONDS, key="get_orbit_secrets")
+    @cache(ttl=_SECRETS_CACHE_TTL_SECONDS, key="get_orbit_secrets:{self._cache_scope}")
     async def get_orbit_secrets(self) -> list[dict[str, Any]]:
         assert self._session is not None
         r = await self._session.get(self._url("/satellites/v1/secrets"))
         r.raise_for_status()
         return r.json()
 
+    async def resolve_orbit_secrets(self, secret_ids: Iterable[UUID]) -> dict[str, dict[str, Any]]:
+        """Secrets keyed by id, resolved from one cached listing of the orbit's secrets.
+
+        Ids missing from the listing (e.g. created after it was cached) are fetched one
+        by one, concurrently. Ids that cannot be resolved are left out of the result.
+        """
+        wanted = {str(secret_id) for secret_id in secret_ids}
+        if not wanted:
+            return {}
+
+        resolved: dict[str, dict[str, Any]] = {}
+        try:
+            for secret in await self.get_orbit_secrets():
+                secret_id = str(secret.get("id"))
+                if secret_id in wanted:
+                    resolved[secret_id] = secret
+        except httpx.HTTPError as e:
+            logger.warning(f"[PlatformClient] Failed to list orbit secrets: {e}")
+
+        async def _fetch(secret_id: str) -> dict[str, Any]:
+            return await self.get_orbit_secret(UUID(secret_id))
+
+        missing = sorted(wanted - resolved.keys())
+        results = await asyncio.gather(*map(_fetch, missing), return_exceptions=True)
+        for secret_id, result in zip(missing, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"[PlatformClient] Failed to fetch secret {secret_id}: {result}")
+                continue
+            resolved[secret_id] = result
+        return resolved
+
     async def list_deployments(self) -> list[dict[str, Any]]:
         assert self._session is not None
         r = await self._session.get(self._url("/satellites/v1/deployments"))
@@ -1,3 +1,3 @@
-from agent.controllers.periodic import PeriodicController
+from agent.controllers.tasks import TaskController
 
-__all__ = ["PeriodicController"]
+__all__ = ["TaskController"]
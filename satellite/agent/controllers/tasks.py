@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any
+
+from agent.handlers import TaskHandler
+from agent.schemas import SatelliteTaskStatus
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+logger = logging.getLogger("satellite")
+
+# Pending tasks that are already in flight (not yet reported running, or waiting for a
+# concurrency slot) make a long-poll answer at once; recheck at this pace meanwhile.
+_IN_FLIGHT_RECHECK_S = 0.5
+
+
+class _KeyedLock:
+    """Per-key mutual exclusion; a key's lock is dropped once nobody holds or awaits it."""
+
+    def __init__(self) -> None:
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._users: dict[str, int] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: str | None) -> AsyncIterator[None]:
+        if key is None:
+            yield
+            return
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._users[key] = self._users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._users[key] -= 1
+            if self._users[key] == 0:
+                del self._users[key]
+                del self._locks[key]
+
+
+class TaskController:
+    """Receives pending platform tasks over a long-poll and runs them concurrently.
+
+    The platform holds each ``list_tasks`` request for up to ``long_poll_s`` until a
+    task is queued, so new work starts as soon as it is requested. A platform that
+    answers at once with nothing new (no long-poll support) or fails is polled again
+    after ``poll_interval_s``. Tasks run as independent asyncio tasks, at most
+    ``concurrency[type]`` of a type at a time (``default_concurrency`` otherwise), and
+    tasks for the same deployment run one at a time in arrival order.
+    """
+
+    def __init__(
+        self,
+        *,
+        handler: TaskHandler,
+        poll_interval_s: float,
+        long_poll_s: float = 20.0,
+        concurrency: dict[str, int] | None = None,
+        default_concurrency: int = 4,
+    ) -> None:
+        self.handler = handler
+        self.poll_interval_s = poll_interval_s
+        self.long_poll_s = long_poll_s
+        self._concurrency = dict(concurrency or {})
+        self._default_concurrency = default_concurrency
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._deployment_locks = _KeyedLock()
+        self._in_flight: dict[str, asyncio.Task] = {}
+        # Tasks that finished while a listing was outstanding: that listing may have
+        # been read while they were still pending.
+        self._finished_since_listing: set[str] = set()
+        self._stopped = False
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def tick(self) -> int:
+        """Fetch pending tasks and start the ones not already running; returns that count."""
+        self._finished_since_listing.clear()
+        tasks = await self.handler.platform.list_tasks(
+            SatelliteTaskStatus.PENDING, wait_s=self.long_poll_s
+        )
+        new_tasks = [
+            task
+            for task in tasks
+            if task.get("id") not in self._in_flight
+            and task.get("id") not in self._finished_since_listing
+        ]
+        if new_tasks:
+            logger.info(
+                f"[tasks] Found {len(new_tasks)} pending tasks: "
+                f"{[t.get('id', 'unknown') for t in new_tasks]}"
+            )
+        for task in new_tasks:
+            self._start(task)
+        return len(new_tasks)
+
+    def _start(self, raw_task: dict[str, Any]) -> None:
+        task_id = raw_task.get("id")
+        running = asyncio.create_task(self._run(raw_task))
+        self._in_flight[task_id] = running
+        running.add_done_callback(lambda _: self._finish(task_id))
+
+    def _finish(self, task_id: str) -> None:
+        self._in_flight.pop(task_id, None)
+        self._finished_since_listing.add(task_id)
+
+    def _semaphore(self, task_type: str) -> asyncio.Semaphore:
+        if task_type not in self._semaphores:
+            limit = self._concurrency.get(task_type, self._default_concurrency)
+            self._semaphores[task_type] = asyncio.Semaphore(max(1, limit))
+        return self._semaphores[task_type]
+
+    async def _run(self, raw_task: dict[str, Any]) -> None:
+        deployment_id = (raw_task.get("payload") or {}).get("deployment_id")
+        async with (
+            self._deployment_locks.hold(deployment_id),
+            self._semaphore(str(raw_task.get("type", ""))),
+        ):
+            try:
+                await self.handler.dispatch(raw_task)
+            except Exception as error:
+                with suppress(Exception):
+                    await self.handler.platform.update_task_status(
+                        raw_task["id"],
+                        SatelliteTaskStatus.FAILED,
+                        {"reason": f"handler error: {error}"},
+                    )
+
+    async def run_forever(self) -> None:
+        logger.info("[satellite] starting task controller...")
+        while not self._stopped:
+            started = time.monotonic()
+            try:
+                dispatched = await self.tick()
+            except KeyboardInterrupt:
+                self._stopped = True
+                break
+            except Exception as e:
+                logger.info(f"[satellite] tick error: {e}")
+                dispatched = 0
+            if not dispatched:
+                # Nothing new: either the long-poll expired (no wait needed) or the
+                # platform answered immediately, in which case fall back to polling.
+                pause = self.poll_interval_s - (time.monotonic() - started)
+                if self._in_flight:
+                    pause = min(pause, _IN_FLIGHT_RECHECK_S)
+                await asyncio.sleep(max(0.0, pause))
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
@@ -1,11 +1,26 @@
 from agent.handlers.model_server_handler import ModelServerHandler
-from agent.monitoring import create_telemetry
+from agent.monitoring import PayloadPolicy, SamplingPolicy, create_telemetry
 from agent.settings import config
 
 ms_handler = ModelServerHandler(
     telemetry=create_telemetry(
         endpoint=config.OTEL_EXPORTER_OTLP_ENDPOINT,
         enabled=config.MONITORING_ENABLED,
+        payload_policy=PayloadPolicy(
+            max_bytes=config.MONITORING_EVENT_MAX_PAYLOAD_BYTES,
+            features=(
+                frozenset(config.MONITORING_EVENT_FEATURES)
+                if config.MONITORING_EVENT_FEATURES is not None
+                else None
+            ),
+        ),
+        event_queue_size=config.MONITORING_EVENT_QUEUE_SIZE,
+        event_batch_size=config.MONITORING_EVENT_BATCH_SIZE,
+    ),
+    sampling=SamplingPolicy(
+        rate=config.MONITORING_SAMPLE_RATE,
+        deployment_rates=config.MONITORING_DEPLOYMENT_SAMPLE_RATES,
+        keep_errors=config.MONITORING_SAMPLE_KEEP_ERRORS,
     ),
 )
 
@@ -8,6 +8,7 @@ from agent._exceptions import ContainerNotFoundError, ContainerNotRunningError
 from agent.clients import ModelServerClient, ModelServerError, PlatformClient
 from agent.clients.docker_client import DockerService
 from agent.monitoring.instrumentation import InferenceInstrumentation
+from agent.monitoring.sampling import SamplingPolicy
 from agent.monitoring.telemetry import TelemetrySetup
 from agent.schemas import (
     Deployment,
@@ -23,13 +24,17 @@ logger = logging.getLogger(__name__)
 
 
 class ModelServerHandler:
-    def __init__(self, telemetry: TelemetrySetup | None = None) -> None:
+    def __init__(
+        self,
+        telemetry: TelemetrySetup | None = None,
+        sampling: SamplingPolicy | None = None,
+    ) -> None:
         self.deployments: dict[str, LocalDeployment] = {}
         self._openapi_cache_invalidation_callbacks: list[Callable] = []
         self._telemetry = telemetry
         self._instrumentation: InferenceInstrumentation | None = None
         if telemetry and telemetry.active:
-            self._instrumentation = InferenceInstrumentation(telemetry)
+            self._instrumentation = InferenceInstrumentation(telemetry, sampling)
 
     async def add_single_deployment(
         self,
@@ -201,18 +206,16 @@ class ModelServerHandler:
             async with PlatformClient(
                 str(config.PLATFORM_URL), config.SATELLITE_TOKEN
             ) as platform_client:
-                for attr_name, secret_id in secrets_to_fetch:
-                    try:
-                        secret_data = await platform_client.get_orbit_secret(secret_id)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to fetch secret '{attr_name}' (id={secret_id}): {e}"
-                        )
-                        secret_data = None
-
-                    if secret_data:
-                        secret = Secret.model_validate(secret_data)
-                        missing_secrets[attr_name] = secret.value
+                secrets = await platform_client.resolve_orbit_secrets(
+                    secret_id for _, secret_id in secrets_to_fetch
+                )
+            for attr_name, secret_id in secrets_to_fetch:
+                secret_data = secrets.get(str(secret_id))
+                if secret_data:
+                    secret = Secret.model_validate(secret_data)
+                    missing_secrets[attr_name] = secret.value
+                else:
+                    logger.warning(f"Failed to fetch secret '{attr_name}' (id={secret_id})")
         except Exception as error:
             logger.error("Failed to fetch secrets for compute: %s", error)
 
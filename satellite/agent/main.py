@@ -6,7 +6,7 @@ import uvicorn
 from agent.agent_api import create_agent_app
 from agent.agent_manager import SatelliteManager
 from agent.clients import DockerService, PlatformClient
-from agent.controllers import PeriodicController
+from agent.controllers import TaskController
 from agent.handlers.handler_instances import ms_handler
 from agent.handlers.tasks import TaskHandler
 from agent.monitoring import (
@@ -49,8 +49,11 @@ async def run_async() -> None:
         uv_task = asyncio.create_task(uv_server.serve())
         async with DockerService() as docker:
             handler = TaskHandler(platform=platform, docker=docker)
-            controller = PeriodicController(
-                handler=handler, poll_interval_s=float(config.POLL_INTERVAL_SEC)
+            controller = TaskController(
+                handler=handler,
+                poll_interval_s=float(config.POLL_INTERVAL_SEC),
+                long_poll_s=float(config.TASK_LONG_POLL_SEC),
+                concurrency=config.TASK_CONCURRENCY,
             )
             satellite_manager = SatelliteManager(platform)
 
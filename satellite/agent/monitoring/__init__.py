@@ -21,6 +21,7 @@ from agent.monitoring.multivariate_drift import MultivariateDriftMetric
 from agent.monitoring.output_drift import OutputDriftMetric
 from agent.monitoring.registry import MetricRegistry, default_registry
 from agent.monitoring.runtime_health import RuntimeHealthMetric
+from agent.monitoring.sampling import PayloadPolicy, SamplingPolicy
 from agent.monitoring.store import InMemoryMonitoringStore, MonitoringStore
 from agent.monitoring.telemetry import TelemetrySetup, create_telemetry
 from agent.monitoring.worker import MonitoringWorker, monitored_deployments
@@ -47,8 +48,10 @@ __all__ = [
     "MonitoringWorker",
     "MultivariateDriftMetric",
     "OutputDriftMetric",
+    "PayloadPolicy",
     "QualityThreshold",
     "RuntimeHealthMetric",
+    "SamplingPolicy",
     "Severity",
     "TelemetrySetup",
     "TimeWindow",
@@ -9,6 +9,7 @@ from typing import Any
 from opentelemetry import context, propagate, trace
 
 from agent.monitoring.events import InferenceEvent
+from agent.monitoring.sampling import SamplingPolicy
 from agent.monitoring.telemetry import TelemetrySetup
 
 logger = logging.getLogger(__name__)
@@ -28,19 +29,34 @@ def _inject_trace_context() -> dict[str, str]:
 
 
 class InferenceInstrumentation:
-    def __init__(self, telemetry: TelemetrySetup) -> None:
+    """Wraps a model-server call with a span, request metrics and an inference event.
+
+    Metrics are recorded for every request; whether the request also produces an event
+    is decided up front by the sampling policy. The event is only handed to the
+    telemetry exporter here, its serialization happens off the request path. The time
+    spent outside ``forward_fn`` is recorded as ``inference.instrumentation.overhead_ms``.
+    """
+
+    def __init__(
+        self,
+        telemetry: TelemetrySetup,
+        sampling: SamplingPolicy | None = None,
+    ) -> None:
         self._telemetry = telemetry
         self._tracer = telemetry.tracer()
         self._metrics = telemetry.inference_metrics()
+        self._sampling = sampling or SamplingPolicy()
 
     async def instrumented_compute(
         self,
         deployment_id: str,
         safe_inputs: dict[str, Any] | None,
         forward_fn: Callable[..., Awaitable[dict]],
-    ) -> tuple[dict, str]:
+    ) -> tuple[dict, str | None]:
         event_id = _generate_event_id()
+        sampled = self._sampling.sample(deployment_id)
         start = time.monotonic()
+        forward_s = 0.0
         span = None
         try:
             span = self._tracer.start_span(
@@ -58,7 +74,11 @@ class InferenceInstrumentation:
 
         try:
             propagation_headers = _inject_trace_context()
-            result = await forward_fn(extra_headers=propagation_headers)
+            forward_start = time.monotonic()
+            try:
+                result = await forward_fn(extra_headers=propagation_headers)
+            finally:
+                forward_s = time.monotonic() - forward_start
             latency_ms = (time.monotonic() - start) * 1000
 
             trace_id = None
@@ -72,7 +92,7 @@ class InferenceInstrumentation:
                 except Exception:
                     logger.warning("Failed to read span context", exc_info=True)
 
-            self._record_success(
+            recorded = self._record_success(
                 event_id=event_id,
                 deployment_id=deployment_id,
                 latency_ms=latency_ms,
@@ -80,8 +100,9 @@ class InferenceInstrumentation:
                 output=result,
                 trace_id=trace_id,
                 span_id=span_id,
+                keep_event=self._sampling.keep(sampled, error=False),
             )
-            return result, event_id
+            return result, event_id if recorded else None
 
         except Exception as exc:
             latency_ms = (time.monotonic() - start) * 1000
@@ -106,6 +127,7 @@ class InferenceInstrumentation:
                 error=exc,
                 trace_id=trace_id,
                 span_id=span_id,
+                keep_event=self._sampling.keep(sampled, error=True),
             )
             raise
 
@@ -118,6 +140,23 @@ class InferenceInstrumentation:
             if token is not None:
                 with suppress(Exception):
                     context.detach(token)
+            self._record_overhead(deployment_id, time.monotonic() - start - forward_s)
+
+    def _record_overhead(self, deployment_id: str, overhead_s: float) -> None:
+        try:
+            self._metrics.overhead_histogram.record(
+                overhead_s * 1000, {"deployment_id": deployment_id}
+            )
+        except Exception:
+            logger.warning("Failed to record instrumentation overhead", exc_info=True)
+
+    def _record_sampled_out(self, deployment_id: str, status: str) -> None:
+        try:
+            self._metrics.sampled_out_counter.add(
+                1, {"deployment_id": deployment_id, "status": status}
+            )
+        except Exception:
+            logger.warning("Failed to record sampled-out event", exc_info=True)
 
     def _record_success(
         self,
@@ -129,7 +168,8 @@ class InferenceInstrumentation:
         output: dict,
         trace_id: str | None,
         span_id: str | None,
-    ) -> None:
+        keep_event: bool = True,
+    ) -> bool:
         try:
             self._metrics.request_counter.add(
                 1, {"deployment_id": deployment_id, "status": "success"}
@@ -140,6 +180,10 @@ class InferenceInstrumentation:
         except Exception:
             logger.warning("Failed to record success metrics", exc_info=True)
 
+        if not keep_event:
+            self._record_sampled_out(deployment_id, "success")
+            return False
+
         try:
             event = InferenceEvent(
                 event_id=event_id,
@@ -155,6 +199,7 @@ class InferenceInstrumentation:
             self._telemetry.emit_event(event)
         except Exception:
             logger.warning("Failed to emit success event", exc_info=True)
+        return True
 
     def _record_error(
         self,
@@ -166,7 +211,8 @@ class InferenceInstrumentation:
         error: Exception,
         trace_id: str | None,
         span_id: str | None,
-    ) -> None:
+        keep_event: bool = True,
+    ) -> bool:
         from agent.clients.model_server_client import ModelServerError
 
         status_code: int | None = None
@@ -187,6 +233,10 @@ class InferenceInstrumentation:
         except Exception:
             logger.warning("Failed to record error metrics", exc_info=True)
 
+        if not keep_event:
+            self._record_sampled_out(deployment_id, "error")
+            return False
+
         try:
             event = InferenceEvent(
                 event_id=event_id,
@@ -203,3 +253,4 @@ class InferenceInstrumentation:
             self._telemetry.emit_event(event)
         except Exception:
             logger.warning("Failed to emit error event", exc_info=True)
+        return True
@@ -16,3 +16,12 @@ class InferenceMetrics:
             description="Inference latency in milliseconds",
             unit="ms",
         )
+        self.sampled_out_counter: Counter = meter.create_counter(
+            name="inference.events.sampled_out",
+            description="Inference requests whose event was not recorded by sampling",
+        )
+        self.overhead_histogram: Histogram = meter.create_histogram(
+            name="inference.instrumentation.overhead_ms",
+            description="Time instrumentation adds to an inference request",
+            unit="ms",
+        )
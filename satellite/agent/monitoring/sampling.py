@@ -0,0 +1,70 @@
+import json
+import random
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+TRUNCATED_MARKER = "_truncated"
+
+
+@dataclass(frozen=True)
+class SamplingPolicy:
+    """Head sampling for inference events; request metrics always see every request.
+
+    The keep/drop decision is made when the request starts, from the deployment's rate
+    (``deployment_rates`` overrides the global ``rate``). With ``keep_errors`` a failed
+    request is recorded even when it was sampled out, so error analysis loses nothing.
+    """
+
+    rate: float = 1.0
+    deployment_rates: Mapping[str, float] = field(default_factory=dict)
+    keep_errors: bool = True
+
+    def rate_for(self, deployment_id: str) -> float:
+        return self.deployment_rates.get(deployment_id, self.rate)
+
+    def sample(self, deployment_id: str, rand: Callable[[], float] = random.random) -> bool:
+        rate = self.rate_for(deployment_id)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        return rand() < rate
+
+    def keep(self, sampled: bool, *, error: bool) -> bool:
+        return sampled or (error and self.keep_errors)
+
+
+@dataclass(frozen=True)
+class PayloadPolicy:
+    """Shapes the JSON payloads attached to an inference event.
+
+    ``features`` projects the recorded inputs down to the named keys, which is all the
+    drift and quality metrics read. A payload whose UTF-8 encoding exceeds ``max_bytes``
+    is replaced by a small marker carrying its original size in bytes, so it still parses
+    downstream but contributes no feature values.
+    """
+
+    max_bytes: int | None = None
+    features: frozenset[str] | None = None
+
+    def encode(self, key: str, value: dict[str, Any]) -> str:
+        if key == "inputs" and self.features is not None:
+            value = _project(value, self.features)
+        encoded = json.dumps(value, ensure_ascii=False)
+        if self.max_bytes is None:
+            return encoded
+        size = len(encoded.encode())
+        if size > self.max_bytes:
+            return json.dumps({TRUNCATED_MARKER: True, "bytes": size})
+        return encoded
+
+
+def _project(payload: dict[str, Any], features: frozenset[str]) -> dict[str, Any]:
+    projected: dict[str, Any] = {}
+    for key, value in payload.items():
+        if key in features:
+            projected[key] = value
+        elif isinstance(value, dict):
+            projected[key] = {k: v for k, v in value.items() if k in features}
+    return projected
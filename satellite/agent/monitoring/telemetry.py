@@ -1,10 +1,12 @@
-import json
 import logging
+import queue
+import threading
+from contextlib import suppress
 
 from opentelemetry import metrics, trace
 from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.metrics import MeterProvider, NoOpMeterProvider
+from opentelemetry.metrics import Counter, MeterProvider, NoOpMeterProvider
 from opentelemetry.sdk.metrics import MeterProvider as SDKMeterProvider
 from opentelemetry.sdk.metrics.export import (
     MetricExporter,
@@ -17,6 +19,7 @@ from opentelemetry.trace import NoOpTracerProvider, TracerProvider
 
 from agent.monitoring.events import InferenceEvent
 from agent.monitoring.metrics import InferenceMetrics
+from agent.monitoring.sampling import PayloadPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -32,19 +35,26 @@ class _NoOpEventExporter:
 
 
 class _OTLPEventExporter:
-    def __init__(self, span_exporter: SpanExporter) -> None:
+    def __init__(
+        self,
+        span_exporter: SpanExporter,
+        payload_policy: PayloadPolicy | None = None,
+    ) -> None:
         self._provider = SDKTracerProvider(
             resource=Resource.create({"service.name": f"{_SERVICE_NAME}.events"}),
         )
         self._provider.add_span_processor(BatchSpanProcessor(span_exporter))
         self._tracer = self._provider.get_tracer("inference.events")
+        self._payload_policy = payload_policy or PayloadPolicy()
 
     def emit(self, event: InferenceEvent) -> None:
         with self._tracer.start_as_current_span("inference_event") as span:
             for key, value in event.to_dict().items():
                 if value is not None:
                     if isinstance(value, dict):
-                        span.set_attribute(f"inference.{key}", json.dumps(value))
+                        span.set_attribute(
+                            f"inference.{key}", self._payload_policy.encode(key, value)
+                        )
                     elif isinstance(value, (str, int, float, bool)):
                         span.set_attribute(f"inference.{key}", value)
 
@@ -52,6 +62,71 @@ class _OTLPEventExporter:
         self._provider.shutdown()
 
 
+class _BatchingEventExporter:
+    """Moves event serialization and export off the request path.
+
+    ``emit`` only enqueues; a daemon thread drains the bounded queue in batches into the
+    wrapped exporter. When the queue is full the event is dropped and counted, so a slow
+    collector caps instrumentation cost instead of backing up inference.
+    """
+
+    def __init__(
+        self,
+        exporter: _OTLPEventExporter,
+        *,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 256,
+        dropped_counter: Counter | None = None,
+    ) -> None:
+        self._exporter = exporter
+        self._queue: queue.Queue[InferenceEvent | None] = queue.Queue(maxsize=max_queue_size)
+        self._max_batch_size = max_batch_size
+        self._dropped_counter = dropped_counter
+        self._dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="inference-event-exporter", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def emit(self, event: InferenceEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self._dropped += 1
+            if self._dropped_counter is not None:
+                with suppress(Exception):
+                    self._dropped_counter.add(1, {"reason": "queue_full"})
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for event in batch:
+                if event is None:
+                    return
+                try:
+                    self._exporter.emit(event)
+                except Exception:
+                    logger.warning("Failed to export inference event", exc_info=True)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        with suppress(queue.Full):
+            self._queue.put(None, timeout=timeout)
+        self._thread.join(timeout=timeout)
+        self._exporter.shutdown()
+
+
+type _EventExporter = _NoOpEventExporter | _OTLPEventExporter | _BatchingEventExporter
+
+
 class TelemetrySetup:
     def __init__(
         self,
@@ -60,9 +135,12 @@ class TelemetrySetup:
         enabled: bool = True,
         tracer_provider: TracerProvider | None = None,
         meter_provider: MeterProvider | None = None,
-        event_exporter: _NoOpEventExporter | _OTLPEventExporter | None = None,
+        event_exporter: _EventExporter | None = None,
         span_exporter: SpanExporter | None = None,
         metric_exporter: MetricExporter | None = None,
+        payload_policy: PayloadPolicy | None = None,
+        event_queue_size: int = 2048,
+        event_batch_size: int = 256,
     ) -> None:
         self._active = False
         self._owns_providers = False
@@ -70,9 +148,7 @@ class TelemetrySetup:
         if tracer_provider or meter_provider or event_exporter:
             self._tracer_provider: TracerProvider = tracer_provider or NoOpTracerProvider()
             self._meter_provider: MeterProvider = meter_provider or NoOpMeterProvider()
-            self._event_exporter: _NoOpEventExporter | _OTLPEventExporter = (
-                event_exporter or _NoOpEventExporter()
-            )
+            self._event_exporter: _EventExporter = event_exporter or _NoOpEventExporter()
             self._active = bool(enabled and endpoint)
             return
 
@@ -97,7 +173,15 @@ class TelemetrySetup:
             self._meter_provider = SDKMeterProvider(resource=resource, metric_readers=[reader])
 
             event_span_exporter = OTLPSpanExporter(endpoint=endpoint, insecure=True)
-            self._event_exporter = _OTLPEventExporter(event_span_exporter)
+            self._event_exporter = _BatchingEventExporter(
+                _OTLPEventExporter(event_span_exporter, payload_policy),
+                max_queue_size=event_queue_size,
+                max_batch_size=event_batch_size,
+                dropped_counter=self.meter().create_counter(
+                    name="inference.events.dropped",
+                    description="Inference events dropped because the export queue was full",
+                ),
+            )
 
             self._active = True
             self._owns_providers = True
@@ -142,5 +226,14 @@ def create_telemetry(
     *,
     endpoint: str | None = None,
     enabled: bool = True,
+    payload_policy: PayloadPolicy | None = None,
+    event_queue_size: int = 2048,
+    event_batch_size: int = 256,
 ) -> TelemetrySetup:
-    return TelemetrySetup(endpoint=endpoint, enabled=enabled)
+    return TelemetrySetup(
+        endpoint=endpoint,
+        enabled=enabled,
+        payload_policy=payload_policy,
+        event_queue_size=event_queue_size,
+        event_batch_size=event_batch_size,
+    )
@@ -10,13 +10,25 @@ class Settings(BaseSettings):
     BASE_URL: str = "http://localhost"
     MODEL_IMAGE: str = "luml-random-svc:latest"
     POLL_INTERVAL_SEC: float = 2.0
+    TASK_LONG_POLL_SEC: float = 20.0
+    TASK_CONCURRENCY: dict[str, int] = {"deploy": 4, "undeploy": 4}
     MODEL_SERVER_PORT: int = 8080
+    MODEL_SERVER_WORKERS: str = "1"
 
     OTEL_EXPORTER_OTLP_ENDPOINT: str | None = None
     MONITORING_ENABLED: bool = True
     MONITORING_INTERVAL_SEC: float = 60.0
     MONITORING_WINDOW_SEC: float = 300.0
     MONITORING_LATENCY_P95_THRESHOLD_MS: float = 1000.0
+    MONITORING_SAMPLE_RATE: float = 1.0
+    MONITORING_DEPLOYMENT_SAMPLE_RATES: dict[str, float] = {}
+    MONITORING_SAMPLE_KEEP_ERRORS: bool = True
+    # Payloads whose UTF-8 encoding is larger are replaced by a size marker.
+    # Unset keeps every payload whole.
+    MONITORING_EVENT_MAX_PAYLOAD_BYTES: int | None = None
+    MONITORING_EVENT_FEATURES: list[str] | None = None
+    MONITORING_EVENT_QUEUE_SIZE: int = 2048
+    MONITORING_EVENT_BATCH_SIZE: int = 256
     GREPTIMEDB_HOST: str = "localhost"
     GREPTIMEDB_HTTP_PORT: int = 4000
     GREPTIMEDB_DATABASE: str = "public"
@@ -23,6 +23,12 @@ from agent.tasks.base import Task
 
 logger = logging.getLogger(__name__)
 
+_PROBE_INITIAL_DELAY_S = 0.1
+_PROBE_MAX_DELAY_S = 5.0
+# Container liveness is re-checked at least this often, even without Docker events.
+_LIVENESS_INTERVAL_S = 5.0
+_CONTAINER_STOPPED_ACTIONS = frozenset({"die", "oom", "kill", "stop", "destroy"})
+
 
 class DeployTask(Task):
     default_health_check_timeout = 1800
@@ -67,14 +73,16 @@ class DeployTask(Task):
             raise
 
     async def _get_secrets_env(self, secrets_payload: dict[str, str]) -> dict[str, str]:
+        if not isinstance(secrets_payload, dict) or not secrets_payload:
+            return {}
+        secrets = await self.platform.resolve_orbit_secrets(
+            secret_id for secret_id in secrets_payload.values() if _is_uuid(secret_id)
+        )
         secrets_env: dict[str, str] = {}
-        if isinstance(secrets_payload, dict):
-            for key, secret_id in secrets_payload.items():
-                try:
-                    secret = await self.platform.get_orbit_secret(UUID(secret_id))
-                    secrets_env[str(key)] = str(secret.get("value", ""))
-                except Exception:
-                    continue
+        for key, secret_id in secrets_payload.items():
+            secret = secrets.get(str(secret_id))
+            if secret is not None:
+                secrets_env[str(key)] = str(secret.get("value", ""))
         return secrets_env
 
     async def _get_container_env(
@@ -86,6 +94,7 @@ class DeployTask(Task):
             "MODEL_ARTIFACT_URL": str(presigned_url),
             "DEPLOYMENT_ID": str(deployment.id),
             "MODEL_NAME": deployment.artifact_name,
+            "MODEL_SERVER_WORKERS": config.MODEL_SERVER_WORKERS,
         }
         if config.OTEL_EXPORTER_OTLP_ENDPOINT:
             env["OTEL_EXPORTER_OTLP_ENDPOINT"] = config.OTEL_EXPORTER_OTLP_ENDPOINT
@@ -146,6 +155,42 @@ class DeployTask(Task):
             DeploymentUpdate(status=DeploymentStatus.FAILED, error_message=error_message),
         )
 
+    async def _wait_until_healthy(self, dep_id: str, timeout: float) -> bool:
+        """Probe the model server until it reports healthy or ``timeout`` seconds pass.
+
+        Probes back off exponentially from 0.1 s to 5 s. Docker events for the container
+        cut a wait short: a start or health-status event triggers an immediate probe,
+        a stop/die event an immediate liveness check, which raises
+        ``ContainerNotFoundError``/``ContainerNotRunningError`` if the container is gone.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        next_liveness_check = loop.time()
+        delay = _PROBE_INITIAL_DELAY_S
+        async with (
+            self.docker.container_events(f"sat-{dep_id}") as events,
+            ModelServerClient() as client,
+        ):
+            while True:
+                if loop.time() >= next_liveness_check:
+                    await self.docker.check_container_running(dep_id)
+                    next_liveness_check = loop.time() + _LIVENESS_INTERVAL_S
+
+                if await client.check_health_once(dep_id):
+                    return True
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+
+                action = await events.next(min(delay, remaining))
+                if action is None:
+                    delay = min(delay * 2, _PROBE_MAX_DELAY_S)
+                elif action in _CONTAINER_STOPPED_ACTIONS:
+                    next_liveness_check = loop.time()
+                else:
+                    delay = _PROBE_INITIAL_DELAY_S
+
     async def run(self, task: SatelliteQueueTask) -> None:
         await self.platform.update_task_status(task.id, SatelliteTaskStatus.RUNNING)
 
@@ -186,21 +231,11 @@ class DeployTask(Task):
 
         inference_url = f"/deployments/{dep_id}"
 
-        health_ok = False
-        async with ModelServerClient() as client:
-            for i in range(int(health_check_timeout)):
-                if i % 5 == 0:
-                    try:
-                        await self.docker.check_container_running(dep_id)
-                    except (ContainerNotFoundError, ContainerNotRunningError) as e:
-                        await self._handle_deploying_error(container, task.id, dep_id, str(e))
-                        return
-
-                if await client.check_health_once(dep_id):
-                    health_ok = True
-                    break
-
-                await asyncio.sleep(1)
+        try:
+            health_ok = await self._wait_until_healthy(dep_id, float(health_check_timeout))
+        except (ContainerNotFoundError, ContainerNotRunningError) as e:
+            await self._handle_deploying_error(container, task.id, dep_id, str(e))
+            return
 
         if not health_ok:
             await self._handle_healthcheck_timeout(container, task.id, dep_id)
@@ -231,3 +266,11 @@ class DeployTask(Task):
                 dep_id,
                 DeploymentUpdate(status=DeploymentStatus.FAILED, error_message=error_message),
             )
+
+
+def _is_uuid(value: object) -> bool:
+    try:
+        UUID(str(value))
+    except ValueError:
+        return False
+    return True
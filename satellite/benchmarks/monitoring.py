@@ -0,0 +1,225 @@
+"""Offline benchmark of the satellite monitoring pipeline.
+
+Generates a synthetic reference profile and a window of inference events of a given
+size and feature width, then measures every metric in the default registry and one
+full ``MonitoringWorker`` tick over ``InMemoryMonitoringStore``. Reports throughput
+(events per second) and peak traced memory per metric. Seeded, so runs are
+reproducible::
+
+    uv run python -m benchmarks.monitoring --events 10000 --features 32
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from agent.monitoring.metric import MetricInput
+from agent.monitoring.models import (
+    DeploymentContext,
+    InferenceEvent,
+    MonitoredDeployment,
+    TimeWindow,
+)
+from agent.monitoring.registry import MetricRegistry, default_registry
+from agent.monitoring.store import InMemoryMonitoringStore
+from agent.monitoring.worker import MonitoringWorker
+
+DEPLOYMENT_ID = "bench-deployment"
+WINDOW_SECONDS = 300.0
+_NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+_CATEGORIES = ["a", "b", "c", "d", "e"]
+_BINS = 10
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    events: int
+    features: int
+    seconds: float
+    events_per_second: float
+    peak_memory_bytes: int
+
+
+def synthetic_profile(features: int, *, components: int = 3) -> dict[str, Any]:
+    """A reference profile every built-in metric applies to.
+
+    Even-indexed features are numerical (standard normal reference), odd-indexed ones
+    categorical. The PCA profile spans the numerical features with orthonormal axes.
+    """
+    numerical = [f"num_{i}" for i in range(0, features, 2)]
+    categorical = [f"cat_{i}" for i in range(1, features, 2)]
+    edges = [-3.0 + 6.0 * i / _BINS for i in range(_BINS + 1)]
+    probabilities = [1.0 / _BINS] * _BINS
+    uniform = {c: 1.0 / len(_CATEGORIES) for c in _CATEGORIES}
+    n_components = max(1, min(components, len(numerical)))
+
+    return {
+        "task_type": "regression",
+        "profile_status": "ready",
+        "feature_summaries": {
+            "numerical_features": {
+                name: {"min": -3.0, "max": 3.0, "bin_edges": edges, "probabilities": probabilities}
+                for name in numerical
+            },
+            "categorical_features": {
+                name: {"categories": _CATEGORIES, "probabilities": uniform} for name in categorical
+            },
+        },
+        "output_summary": {
+            "type": "numerical",
+            "summary": {"bin_edges": edges, "probabilities": probabilities},
+        },
+        "pca_profile": {
+            "pca": {
+                "feature_names": numerical,
+                "mean_": [0.0] * len(numerical),
+                "components": [
+                    [1.0 if j == i else 0.0 for j in range(len(numerical))]
+                    for i in range(n_components)
+                ],
+            },
+            "scaler": {"mean_": [0.0] * len(numerical), "scale_": [1.0] * len(numerical)},
+            "reconstruction_error_reference": {"mean": 1.0, "std": 0.5},
+        },
+    }
+
+
+def synthetic_events(
+    count: int, features: int, window: TimeWindow, *, seed: int = 0
+) -> list[InferenceEvent]:
+    """``count`` successful events spread over ``window`` with ``features`` inputs each."""
+    rng = random.Random(seed)
+    span = (window.end - window.start).total_seconds()
+    events: list[InferenceEvent] = []
+    for i in range(count):
+        inputs: dict[str, Any] = {}
+        for j in range(features):
+            if j % 2 == 0:
+                inputs[f"num_{j}"] = rng.gauss(0.0, 1.0)
+            else:
+                inputs[f"cat_{j}"] = rng.choice(_CATEGORIES)
+        events.append(
+            InferenceEvent(
+                event_id=f"evt-{i}",
+                deployment_id=DEPLOYMENT_ID,
+                status="success",
+                status_code=200,
+                latency_ms=rng.lognormvariate(3.0, 0.5),
+                inputs=inputs,
+                output=rng.gauss(0.0, 1.0),
+                timestamp=window.start + timedelta(seconds=span * i / max(count, 1)),
+            )
+        )
+    return events
+
+
+def _measure(name: str, events: int, features: int, fn: Callable[[], object]) -> BenchmarkResult:
+    # Timed and traced in separate runs: tracemalloc itself slows allocation-heavy code.
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(
+        name=name,
+        events=events,
+        features=features,
+        seconds=seconds,
+        events_per_second=events / seconds if seconds > 0 else math.inf,
+        peak_memory_bytes=peak,
+    )
+
+
+def run_benchmark(
+    *,
+    events: int,
+    features: int,
+    repeats: int = 3,
+    seed: int = 0,
+    registry: MetricRegistry | None = None,
+) -> list[BenchmarkResult]:
+    """Best-of-``repeats`` timing for each registry metric and one full worker tick."""
+    registry = registry or default_registry()
+    window = TimeWindow(start=_NOW - timedelta(seconds=WINDOW_SECONDS), end=_NOW)
+    profile = synthetic_profile(features)
+    window_events = synthetic_events(events, features, window, seed=seed)
+    context = DeploymentContext(deployment_id=DEPLOYMENT_ID, profile=profile, has_events=True)
+    data = MetricInput(context=context, events=window_events, window=window)
+
+    results: list[BenchmarkResult] = []
+    for metric in registry.metrics():
+        if not metric.applies(context):
+            continue
+        runs = [
+            _measure(metric.metric, events, features, lambda m=metric: m.compute(data))
+            for _ in range(repeats)
+        ]
+        results.append(min(runs, key=lambda r: r.seconds))
+
+    def _tick() -> None:
+        store = InMemoryMonitoringStore()
+        store.add_events(DEPLOYMENT_ID, window_events)
+        worker = MonitoringWorker(
+            store=store,
+            registry=registry,
+            provider=lambda: [MonitoredDeployment(DEPLOYMENT_ID, profile)],
+            window_seconds=WINDOW_SECONDS,
+            interval_seconds=WINDOW_SECONDS,
+        )
+        asyncio.run(worker.tick(_NOW + timedelta(seconds=1)))
+
+    runs = [_measure("worker_tick", events, features, _tick) for _ in range(repeats)]
+    results.append(min(runs, key=lambda r: r.seconds))
+    return results
+
+
+def _format_table(results: list[BenchmarkResult]) -> str:
+    header = (
+        f"{'metric':<16}{'events':>10}{'features':>10}{'ms':>12}{'events/s':>14}{'peak KiB':>12}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.name:<16}{r.events:>10}{r.features:>10}{r.seconds * 1000:>12.2f}"
+            f"{r.events_per_second:>14.0f}{r.peak_memory_bytes / 1024:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the satellite monitoring pipeline.")
+    parser.add_argument("--events", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--features", type=int, nargs="+", default=[8, 32])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit results as JSON lines")
+    args = parser.parse_args(argv)
+
+    for features in args.features:
+        for events in args.events:
+            results = run_benchmark(
+                events=events, features=features, repeats=args.repeats, seed=args.seed
+            )
+            if args.json:
+                for result in results:
+                    print(json.dumps(asdict(result)))
+            else:
+                print(_format_table(results), end="\n\n")
+
+
+if __name__ == "__main__":
+    main()
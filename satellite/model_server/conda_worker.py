@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 import sys
 from typing import Any
 
@@ -7,6 +8,7 @@ import uvicorn
 from openapi_generator import OpenAPIGenerator
 from services.base_service import HTTPException
 from services.service import UvicornService
+from workers import WorkerStats, resolve_worker_count, serve_prefork
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -23,6 +25,11 @@ try:
     extracted_path = sys.argv[1]
     port = int(sys.argv[2]) if len(sys.argv) > 2 else 8080
     model_data = json.loads(sys.argv[3]) if len(sys.argv) > 3 else {}
+    workers = resolve_worker_count(os.getenv("MODEL_SERVER_WORKERS"))
+    # Loading before the fork shares the weights across workers; runtimes whose
+    # sessions do not survive a fork can opt into one load per worker instead.
+    preload = os.getenv("MODEL_SERVER_PRELOAD", "true").strip().lower() != "false"
+    stats = WorkerStats(workers)
 
     try:
         import numpy as np
@@ -47,11 +54,18 @@ try:
             return [to_jsonable(v) for v in obj]
         return obj
 
-    handler = Runtime(
-        bundle_path=extracted_path,
-        device_map=DeviceMap(accelerator="cpu", node_device_map={}),
-        handler_config=LocalHandlerConfig(auto_cleanup=False),
-    )
+    handler: Runtime | None = None
+
+    def load_runtime() -> None:
+        global handler
+        handler = Runtime(
+            bundle_path=extracted_path,
+            device_map=DeviceMap(accelerator="cpu", node_device_map={}),
+            handler_config=LocalHandlerConfig(auto_cleanup=False),
+        )
+
+    if preload or workers == 1:
+        load_runtime()
 
     from telemetry import model_span
 
@@ -60,13 +74,17 @@ try:
         dynamic_attributes: dict,
         headers: dict[str, str] | None = None,
     ) -> dict:
-        async with model_span(headers or {}):
-            try:
-                result = await handler.compute_async(inputs, dynamic_attributes)
-            except NotImplementedError:
-                logger.info("compute_async not implemented, falling back to sync compute")
-                result = handler.compute(inputs, dynamic_attributes)
-            return to_jsonable(result)
+        stats.request_started()
+        try:
+            async with model_span(headers or {}):
+                try:
+                    result = await handler.compute_async(inputs, dynamic_attributes)
+                except NotImplementedError:
+                    logger.info("compute_async not implemented, falling back to sync compute")
+                    result = handler.compute(inputs, dynamic_attributes)
+                return to_jsonable(result)
+        finally:
+            stats.request_finished()
 
     openapi_gen = None
     title = None
@@ -93,6 +111,15 @@ try:
     async def healthz() -> dict[str, str]:
         return {"status": "healthy"}
 
+    @app.get(
+        "/workers",
+        summary="Worker Stats",
+        description="Per-worker queue depth, request count and CPU seconds",
+        tags=["model"],
+    )
+    async def get_workers() -> dict[str, Any]:  # noqa: ANN401
+        return {"workers": stats.snapshot()}
+
     @app.get(
         "/manifest",
         summary="Get Model Manifest",
@@ -179,7 +206,17 @@ try:
 
     if __name__ == "__main__":
         logger.info("Starting server...")
-        uvicorn.run(app, host="0.0.0.0", port=port)
+        if workers > 1:
+            serve_prefork(
+                app,
+                host="0.0.0.0",
+                port=port,
+                stats=stats,
+                on_worker_start=None if preload else load_runtime,
+            )
+        else:
+            stats.bind(0)
+            uvicorn.run(app, host="0.0.0.0", port=port)
 
 except Exception:
     logger.exception("Fatal error in conda worker")
@@ -0,0 +1,172 @@
+"""Pre-fork serving for the conda worker.
+
+The model is loaded once in the parent process and the serving workers are forked
+after the load, so they share its weights copy-on-write instead of holding one copy
+each. All workers accept from a single listening socket: a worker busy with a
+CPU-bound request stops accepting and the kernel hands new connections to an idle
+one. Per-worker counters live in anonymous shared memory, so any worker can report
+the state of all of them.
+"""
+
+import contextlib
+import logging
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from multiprocessing.sharedctypes import RawArray
+from typing import Any
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+_FIELDS = ("pid", "in_flight", "requests", "cpu_seconds")
+_PID, _IN_FLIGHT, _REQUESTS, _CPU_SECONDS = range(len(_FIELDS))
+_LISTEN_BACKLOG = 2048
+# Pause before replacing a crashed worker, so a model that fails on every request
+# does not turn into a fork loop.
+_RESPAWN_DELAY_S = 1.0
+
+
+def resolve_worker_count(value: str | None) -> int:
+    """Worker count from ``MODEL_SERVER_WORKERS``: a number, or ``auto`` for one per core."""
+    if not value or not value.strip():
+        return 1
+    if value.strip().lower() == "auto":
+        return os.cpu_count() or 1
+    try:
+        count = int(value)
+    except ValueError:
+        logger.warning(f"Invalid MODEL_SERVER_WORKERS={value!r}, using 1 worker")
+        return 1
+    if count < 1:
+        logger.warning(f"MODEL_SERVER_WORKERS={value!r} is below 1, using 1 worker")
+        return 1
+    return count
+
+
+class WorkerStats:
+    """Queue depth, request count and CPU time per worker, in memory shared across forks.
+
+    Must be created in the parent before forking. Each worker ``bind``\\ s to its slot
+    and updates only that slot; ``snapshot`` reads every slot.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._values = RawArray("d", workers * len(_FIELDS))
+        self._slot = 0
+
+    def _offset(self, slot: int, field: int) -> int:
+        return slot * len(_FIELDS) + field
+
+    def bind(self, slot: int) -> None:
+        self._slot = slot
+        for field in range(len(_FIELDS)):
+            self._values[self._offset(slot, field)] = 0.0
+        self._values[self._offset(slot, _PID)] = os.getpid()
+
+    def request_started(self) -> None:
+        self._values[self._offset(self._slot, _IN_FLIGHT)] += 1
+        self._values[self._offset(self._slot, _REQUESTS)] += 1
+
+    def request_finished(self) -> None:
+        self._values[self._offset(self._slot, _IN_FLIGHT)] -= 1
+        self._values[self._offset(self._slot, _CPU_SECONDS)] = time.process_time()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        workers = []
+        for slot in range(self.workers):
+            values = [self._values[self._offset(slot, field)] for field in range(len(_FIELDS))]
+            workers.append(
+                {
+                    "worker": slot,
+                    "pid": int(values[_PID]),
+                    "in_flight": int(values[_IN_FLIGHT]),
+                    "requests": int(values[_REQUESTS]),
+                    "cpu_seconds": round(values[_CPU_SECONDS], 3),
+                }
+            )
+        return workers
+
+
+def _listen(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(_LISTEN_BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve_prefork(
+    app: Any,  # noqa: ANN401
+    *,
+    host: str,
+    port: int,
+    stats: WorkerStats,
+    on_worker_start: Callable[[], None] | None = None,
+) -> None:
+    """Serve ``app`` from ``stats.workers`` forked uvicorn workers until SIGTERM/SIGINT.
+
+    ``on_worker_start`` runs in each worker right after the fork, before it serves;
+    use it for state that must not be shared across a fork. Workers that exit
+    unexpectedly are replaced.
+    """
+    sock = _listen(host, port)
+    children: dict[int, int] = {}
+    stopping = False
+
+    def spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid:
+            children[pid] = slot
+            return
+        exit_code = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            stats.bind(slot)
+            if on_worker_start is not None:
+                on_worker_start()
+            uvicorn.Server(uvicorn.Config(app, log_level="info")).run(sockets=[sock])
+            exit_code = 0
+        except BaseException:
+            logger.exception(f"Worker {slot} failed")
+        finally:
+            os._exit(exit_code)
+
+    def stop(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    logger.info(f"Starting {stats.workers} workers on {host}:{port}")
+    for slot in range(stats.workers):
+        spawn(slot)
+
+    try:
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            slot = children.pop(pid, None)
+            if slot is None or stopping:
+                continue
+            logger.error(
+                f"Worker {slot} (pid {pid}) exited with status "
+                f"{os.waitstatus_to_exitcode(status)}, restarting"
+            )
+            time.sleep(_RESPAWN_DELAY_S)
+            if not stopping:
+                spawn(slot)
+    finally:
+        sock.close()
@@ -0,0 +1,94 @@
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from agent.clients import PlatformClient
+
+
+class FakePlatform:
+    """Stand-in for the platform satellite API: a task queue with optional long-poll,
+    plus the orbit secrets listing (``secrets``, ``listed_secrets`` hides entries from it).
+
+    ``long_poll=False`` emulates a platform that ignores ``wait`` and answers at once.
+    """
+
+    def __init__(self, *, long_poll: bool = True) -> None:
+        self.long_poll = long_poll
+        self.tasks: dict[str, dict[str, Any]] = {}
+        self.list_calls = 0
+        self.secrets: dict[str, dict[str, Any]] = {}
+        self.listed_secrets: set[str] | None = None
+        self.secret_calls: list[str] = []
+        self._changed = asyncio.Event()
+        self.app = self._build_app()
+
+    def enqueue(self, task_type: str, deployment_id: str | None = None) -> str:
+        task_id = str(uuid.uuid4())
+        now = datetime.now(UTC).isoformat()
+        self.tasks[task_id] = {
+            "id": task_id,
+            "satellite_id": "sat-1",
+            "orbit_id": "orbit-1",
+            "type": task_type,
+            "payload": {"deployment_id": deployment_id} if deployment_id else {},
+            "status": "pending",
+            "scheduled_at": now,
+            "created_at": now,
+        }
+        self._changed.set()
+        return task_id
+
+    def add_secret(self, name: str, value: str) -> str:
+        secret_id = str(uuid.uuid4())
+        self.secrets[secret_id] = {"id": secret_id, "name": name, "value": value}
+        return secret_id
+
+    def client(self, token: str = "token") -> PlatformClient:
+        return PlatformClient("http://platform", token, transport=httpx.ASGITransport(app=self.app))
+
+    def _pending(self, status: str | None) -> list[dict[str, Any]]:
+        return [t for t in self.tasks.values() if status is None or t["status"] == status]
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/satellites/v1/tasks")
+        async def list_tasks(
+            status: str | None = None, wait: float | None = None
+        ) -> list[dict[str, Any]]:
+            self.list_calls += 1
+            tasks = self._pending(status)
+            if tasks or not wait or not self.long_poll:
+                return tasks
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), wait)
+            except TimeoutError:
+                return []
+            return self._pending(status)
+
+        @app.post("/satellites/v1/tasks/{task_id}/status")
+        async def update_task_status(task_id: str, body: dict[str, Any]) -> dict[str, Any]:
+            task = self.tasks[task_id]
+            task["status"] = body["status"]
+            task["result"] = body.get("result")
+            return task
+
+        @app.get("/satellites/v1/secrets")
+        async def list_secrets() -> list[dict[str, Any]]:
+            self.secret_calls.append("*")
+            listed = self.listed_secrets
+            return [s for i, s in self.secrets.items() if listed is None or i in listed]
+
+        @app.get("/satellites/v1/secrets/{secret_id}")
+        async def get_secret(secret_id: str) -> dict[str, Any]:
+            self.secret_calls.append(secret_id)
+            if secret_id not in self.secrets:
+                raise HTTPException(status_code=404)
+            return self.secrets[secret_id]
+
+        return app
@@ -0,0 +1,185 @@
+import asyncio
+import time
+import uuid
+from collections.abc import AsyncIterator
+from typing import Self
+
+import httpx
+import pytest
+import respx
+from aiodocker.events import DockerEvents
+from cashews import cache
+from tests.fake_platform import FakePlatform
+
+from agent._exceptions import ContainerNotRunningError
+from agent.clients.docker_client import ContainerEvents
+from agent.handlers.tasks import DeployTask
+
+
+class FakeContainerEvents:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        self.closed = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.closed = True
+
+    async def next(self, timeout: float) -> str | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class FakeDocker:
+    def __init__(self) -> None:
+        self.events = FakeContainerEvents()
+        self.status = "running"
+        self.liveness_checks = 0
+
+    def container_events(self, container_name: str) -> FakeContainerEvents:
+        return self.events
+
+    async def check_container_running(self, deployment_id: str) -> None:
+        self.liveness_checks += 1
+        if self.status != "running":
+            raise ContainerNotRunningError(deployment_id, self.status)
+
+
+@pytest.fixture(autouse=True)
+async def _clear_secret_cache() -> AsyncIterator[None]:
+    await cache.clear()
+    yield
+    await cache.clear()
+
+
+@pytest.fixture()
+def healthz(respx_mock: respx.MockRouter) -> respx.Route:
+    return respx_mock.get(url__regex=r"http://sat-[^/]+:\d+/healthz")
+
+
+async def test_secrets_are_resolved_with_one_listing_call() -> None:
+    fake = FakePlatform()
+    ids = {f"KEY_{i}": fake.add_secret(f"s{i}", f"value-{i}") for i in range(5)}
+
+    async with fake.client() as platform:
+        task = DeployTask(platform=platform, docker=FakeDocker())
+        env = await task._get_secrets_env(ids)
+
+    assert env == {f"KEY_{i}": f"value-{i}" for i in range(5)}
+    assert fake.secret_calls == ["*"]
+
+
+async def test_secrets_missing_from_listing_are_fetched_individually() -> None:
+    fake = FakePlatform()
+    listed = fake.add_secret("listed", "a")
+    late = fake.add_secret("late", "b")
+    fake.listed_secrets = {listed}
+    payload = {"LISTED": listed, "LATE": late, "GONE": str(uuid.uuid4()), "BAD": "not-a-uuid"}
+
+    async with fake.client() as platform:
+        task = DeployTask(platform=platform, docker=FakeDocker())
+        env = await task._get_secrets_env(payload)
+
+    assert env == {"LISTED": "a", "LATE": "b"}
+    assert fake.secret_calls[0] == "*"
+    assert sorted(fake.secret_calls[1:]) == sorted([late, payload["GONE"]])
+
+
+async def test_secrets_listing_is_cached_per_token() -> None:
+    fake = FakePlatform()
+    ids = {"KEY": fake.add_secret("s", "value")}
+
+    for token in ("token-a", "token-a", "token-b"):
+        async with fake.client(token) as platform:
+            task = DeployTask(platform=platform, docker=FakeDocker())
+            await task._get_secrets_env(ids)
+
+    assert fake.secret_calls == ["*", "*"]
+
+
+async def test_health_probes_back_off_until_ready(healthz: respx.Route) -> None:
+    healthz.side_effect = [httpx.Response(503)] * 3 + [httpx.Response(200)]
+    task = DeployTask(platform=None, docker=FakeDocker())  # type: ignore[arg-type]
+
+    start = time.monotonic()
+    assert await task._wait_until_healthy("dep-1", timeout=10) is True
+    elapsed = time.monotonic() - start
+
+    # 0.1 + 0.2 + 0.4 s of backoff instead of three one-second sleeps.
+    assert healthz.call_count == 4
+    assert 0.6 <= elapsed < 1.5
+
+
+async def test_health_event_triggers_an_immediate_probe(healthz: respx.Route) -> None:
+    ready = False
+    healthz.side_effect = lambda request: httpx.Response(200 if ready else 503)
+    docker = FakeDocker()
+    task = DeployTask(platform=None, docker=docker)  # type: ignore[arg-type]
+
+    waiter = asyncio.create_task(task._wait_until_healthy("dep-1", timeout=30))
+    await asyncio.sleep(2.0)  # probes are now ~1.6 s apart
+    ready = True
+    start = time.monotonic()
+    docker.events.queue.put_nowait("health_status: healthy")
+
+    assert await waiter is True
+    assert time.monotonic() - start < 0.5
+
+
+async def test_container_death_fails_fast(healthz: respx.Route) -> None:
+    healthz.mock(return_value=httpx.Response(503))
+    docker = FakeDocker()
+    task = DeployTask(platform=None, docker=docker)  # type: ignore[arg-type]
+
+    waiter = asyncio.create_task(task._wait_until_healthy("dep-1", timeout=30))
+    await asyncio.sleep(0.5)
+    docker.status = "exited"
+    docker.events.queue.put_nowait("die")
+
+    with pytest.raises(ContainerNotRunningError):
+        await asyncio.wait_for(waiter, 1.0)
+
+
+async def test_health_wait_times_out(healthz: respx.Route) -> None:
+    healthz.mock(return_value=httpx.Response(503))
+    task = DeployTask(platform=None, docker=FakeDocker())  # type: ignore[arg-type]
+
+    start = time.monotonic()
+    assert await task._wait_until_healthy("dep-1", timeout=0.5) is False
+    assert time.monotonic() - start < 1.0
+
+
+async def test_health_wait_closes_container_events(healthz: respx.Route) -> None:
+    healthz.mock(return_value=httpx.Response(503))
+    docker = FakeDocker()
+    task = DeployTask(platform=None, docker=docker)  # type: ignore[arg-type]
+
+    assert await task._wait_until_healthy("dep-1", timeout=0.2) is False
+    assert docker.events.closed
+
+    docker.events = FakeContainerEvents()
+    waiter = asyncio.create_task(task._wait_until_healthy("dep-1", timeout=30))
+    await asyncio.sleep(0.1)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert docker.events.closed
+
+
+async def test_closing_last_subscription_stops_event_stream() -> None:
+    events = DockerEvents(docker=None)
+    events.task = asyncio.create_task(asyncio.sleep(3600))
+    first = ContainerEvents(events, events.subscribe(create_task=False), "sat-1")
+    second = ContainerEvents(events, events.subscribe(create_task=False), "sat-2")
+
+    await first.close()
+    assert events.task is not None
+    assert len(events.channel.queues) == 1
+
+    await second.close()
+    assert events.task is None
+    assert events.channel.queues == []
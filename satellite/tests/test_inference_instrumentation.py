@@ -11,6 +11,7 @@ from agent.handlers.model_server_handler import (
     _extract_safe_inputs,
 )
 from agent.monitoring.instrumentation import InferenceInstrumentation
+from agent.monitoring.sampling import SamplingPolicy
 from agent.monitoring.testing import FakeTelemetry
 from agent.schemas.deployments import LocalDeployment
 
@@ -360,3 +361,94 @@ class TestInferenceInstrumentationUnit:
         assert len(fake_telemetry.events) == 1
         assert fake_telemetry.events[0].status == "error"
         assert fake_telemetry.events[0].status_code == 500
+
+
+async def _ok_forward(*, extra_headers: dict[str, str] | None = None) -> dict:
+    return {"result": "ok"}
+
+
+async def _failing_forward(*, extra_headers: dict[str, str] | None = None) -> dict:
+    raise ModelServerError(500, "internal")
+
+
+class TestSampling:
+    async def test_sampled_out_success_records_metrics_but_no_event(
+        self,
+        fake_telemetry: FakeTelemetry,
+    ) -> None:
+        instr = InferenceInstrumentation(fake_telemetry.setup, SamplingPolicy(rate=0.0))
+
+        result, event_id = await instr.instrumented_compute(
+            deployment_id="dep-unit", safe_inputs={"x": 1}, forward_fn=_ok_forward
+        )
+
+        assert result == {"result": "ok"}
+        assert event_id is None
+        assert fake_telemetry.events == []
+        metrics = fake_telemetry.get_metrics()
+        assert "inference.requests" in metrics
+        assert "inference.events.sampled_out" in metrics
+
+    async def test_errors_kept_when_sampled_out(
+        self,
+        fake_telemetry: FakeTelemetry,
+    ) -> None:
+        instr = InferenceInstrumentation(fake_telemetry.setup, SamplingPolicy(rate=0.0))
+
+        with pytest.raises(ModelServerError):
+            await instr.instrumented_compute(
+                deployment_id="dep-unit", safe_inputs={"x": 1}, forward_fn=_failing_forward
+            )
+
+        assert len(fake_telemetry.events) == 1
+        assert fake_telemetry.events[0].status == "error"
+
+    async def test_errors_dropped_when_keep_errors_disabled(
+        self,
+        fake_telemetry: FakeTelemetry,
+    ) -> None:
+        instr = InferenceInstrumentation(
+            fake_telemetry.setup, SamplingPolicy(rate=0.0, keep_errors=False)
+        )
+
+        with pytest.raises(ModelServerError):
+            await instr.instrumented_compute(
+                deployment_id="dep-unit", safe_inputs={"x": 1}, forward_fn=_failing_forward
+            )
+
+        assert fake_telemetry.events == []
+
+    async def test_per_deployment_rate_overrides_global(
+        self,
+        fake_telemetry: FakeTelemetry,
+    ) -> None:
+        policy = SamplingPolicy(rate=0.0, deployment_rates={"dep-keep": 1.0})
+        instr = InferenceInstrumentation(fake_telemetry.setup, policy)
+
+        _, kept_id = await instr.instrumented_compute(
+            deployment_id="dep-keep", safe_inputs=None, forward_fn=_ok_forward
+        )
+        _, dropped_id = await instr.instrumented_compute(
+            deployment_id="dep-other", safe_inputs=None, forward_fn=_ok_forward
+        )
+
+        assert kept_id is not None
+        assert dropped_id is None
+        assert [e.deployment_id for e in fake_telemetry.events] == ["dep-keep"]
+
+    async def test_overhead_histogram_recorded(
+        self,
+        fake_telemetry: FakeTelemetry,
+    ) -> None:
+        instr = InferenceInstrumentation(fake_telemetry.setup)
+
+        await instr.instrumented_compute(
+            deployment_id="dep-unit", safe_inputs=None, forward_fn=_ok_forward
+        )
+
+        assert "inference.instrumentation.overhead_ms" in fake_telemetry.get_metrics()
+
+    def test_fractional_rate_uses_random_draw(self) -> None:
+        policy = SamplingPolicy(rate=0.25)
+        assert policy.sample("dep", rand=lambda: 0.1)
+        assert not policy.sample("dep", rand=lambda: 0.5)
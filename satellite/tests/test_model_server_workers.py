@@ -0,0 +1,112 @@
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+
+# model_server code imports via bare module names because conda_worker.py runs
+# with model_server/ on sys.path.
+_model_server_dir = str(Path(__file__).resolve().parent.parent / "model_server")
+if _model_server_dir not in sys.path:
+    sys.path.insert(0, _model_server_dir)
+
+from model_server.workers import WorkerStats, resolve_worker_count  # noqa: E402
+
+_SERVER_SCRIPT = textwrap.dedent(
+    """
+    import asyncio, json, os, sys
+    from workers import WorkerStats, serve_prefork
+
+    stats = WorkerStats(int(sys.argv[2]))
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        stats.request_started()
+        try:
+            await asyncio.sleep(0.2)
+            body = json.dumps({"pid": os.getpid(), "workers": stats.snapshot()}).encode()
+        finally:
+            stats.request_finished()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": body})
+
+    serve_prefork(app, host="127.0.0.1", port=int(sys.argv[1]), stats=stats)
+    """
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_resolve_worker_count() -> None:
+    assert resolve_worker_count(None) == 1
+    assert resolve_worker_count("") == 1
+    assert resolve_worker_count("4") == 4
+    assert resolve_worker_count("0") == 1
+    assert resolve_worker_count("auto") == (os.cpu_count() or 1)
+
+
+def test_resolve_worker_count_falls_back_on_bad_values(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        assert resolve_worker_count("abc") == 1
+        assert resolve_worker_count("-2") == 1
+    assert len(caplog.records) == 2
+
+
+def test_worker_stats_track_their_own_slot() -> None:
+    stats = WorkerStats(2)
+    stats.bind(1)
+    stats.request_started()
+    stats.request_started()
+    stats.request_finished()
+
+    idle, busy = stats.snapshot()
+    assert idle == {"worker": 0, "pid": 0, "in_flight": 0, "requests": 0, "cpu_seconds": 0.0}
+    assert busy["pid"] == os.getpid()
+    assert busy["in_flight"] == 1
+    assert busy["requests"] == 2
+    assert busy["cpu_seconds"] > 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-fork serving needs os.fork")
+def test_prefork_spreads_requests_across_workers(tmp_path: Path) -> None:
+    script = tmp_path / "serve.py"
+    script.write_text(_SERVER_SCRIPT)
+    port = _free_port()
+    env = {**os.environ, "PYTHONPATH": _model_server_dir}
+    proc = subprocess.Popen([sys.executable, str(script), str(port), "3"], env=env)
+    url = f"http://127.0.0.1:{port}/"
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                httpx.get(url, timeout=1.0)
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+
+        # Concurrent requests on separate connections land on several workers.
+        with ThreadPoolExecutor(6) as pool:
+            responses = list(pool.map(lambda _: httpx.get(url, timeout=5.0).json(), range(6)))
+
+        pids = {r["pid"] for r in responses}
+        assert len(pids) > 1
+        assert pids <= {w["pid"] for w in responses[-1]["workers"]}
+        assert len(responses[-1]["workers"]) == 3
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(timeout=10) == 0
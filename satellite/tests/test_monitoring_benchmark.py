@@ -0,0 +1,43 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from benchmarks.monitoring import main, run_benchmark, synthetic_events, synthetic_profile
+
+from agent.monitoring.models import DeploymentContext, TimeWindow
+from agent.monitoring.registry import default_registry
+
+
+class TestSyntheticData:
+    def test_every_registered_metric_applies_to_profile(self) -> None:
+        context = DeploymentContext(
+            deployment_id="dep", profile=synthetic_profile(6), has_events=True
+        )
+        assert all(metric.applies(context) for metric in default_registry().metrics())
+
+    def test_events_are_reproducible(self) -> None:
+        end = datetime(2026, 1, 1, tzinfo=UTC)
+        window = TimeWindow(start=end - timedelta(minutes=5), end=end)
+        first = synthetic_events(20, 4, window, seed=7)
+        second = synthetic_events(20, 4, window, seed=7)
+
+        assert [e.inputs for e in first] == [e.inputs for e in second]
+        assert all(window.contains(e.timestamp) for e in first)
+        assert set(first[0].inputs) == {"num_0", "cat_1", "num_2", "cat_3"}
+
+
+class TestRunBenchmark:
+    def test_reports_every_metric_and_worker_tick(self) -> None:
+        results = run_benchmark(events=50, features=4, repeats=1)
+
+        names = [r.name for r in results]
+        assert names == [m.metric for m in default_registry().metrics()] + ["worker_tick"]
+        for result in results:
+            assert result.events == 50
+            assert result.events_per_second > 0
+            assert result.peak_memory_bytes > 0
+
+    def test_cli_json_output(self, capsys: pytest.CaptureFixture[str]) -> None:
+        main(["--events", "10", "--features", "2", "--repeats", "1", "--json"])
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == len(default_registry().metrics()) + 1
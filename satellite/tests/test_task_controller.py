@@ -0,0 +1,189 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from tests.fake_platform import FakePlatform
+
+from agent.clients import PlatformClient
+from agent.controllers import TaskController
+from agent.schemas import SatelliteTaskStatus
+
+
+class FakeTaskHandler:
+    """Records dispatches; a task blocks until its ``release`` event is set, if any."""
+
+    def __init__(self, platform: PlatformClient) -> None:
+        self.platform = platform
+        self.started: dict[str, float] = {}
+        self.dispatches: list[str] = []
+        self.finished: list[str] = []
+        self.release: dict[str, asyncio.Event] = {}
+        self.fail: set[str] = set()
+        self.running = 0
+        self.max_running = 0
+
+    async def dispatch(self, raw_task: dict[str, Any]) -> None:
+        task_id = raw_task["id"]
+        self.started[task_id] = time.monotonic()
+        self.dispatches.append(task_id)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.platform.update_task_status(task_id, SatelliteTaskStatus.RUNNING)
+            if task_id in self.fail:
+                raise RuntimeError("boom")
+            if task_id in self.release:
+                await self.release[task_id].wait()
+            await self.platform.update_task_status(task_id, SatelliteTaskStatus.DONE)
+            self.finished.append(task_id)
+        finally:
+            self.running -= 1
+
+
+@asynccontextmanager
+async def running_controller(
+    fake: FakePlatform, **kwargs: object
+) -> AsyncIterator[tuple[TaskController, FakeTaskHandler]]:
+    async with fake.client() as platform:
+        handler = FakeTaskHandler(platform)
+        kwargs.setdefault("poll_interval_s", 5.0)
+        kwargs.setdefault("long_poll_s", 2.0)
+        controller = TaskController(handler=handler, **kwargs)
+        loop_task = asyncio.create_task(controller.run_forever())
+        try:
+            yield controller, handler
+        finally:
+            controller.stop()
+            for event in handler.release.values():
+                event.set()
+            loop_task.cancel()
+            await asyncio.gather(loop_task, return_exceptions=True)
+
+
+async def _wait_for(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestLongPoll:
+    async def test_new_task_starts_within_a_second(self) -> None:
+        fake = FakePlatform()
+        async with running_controller(fake) as (_, handler):
+            await asyncio.sleep(0.1)
+            requested = time.monotonic()
+            task_id = fake.enqueue("deploy", "dep-1")
+
+            await _wait_for(lambda: task_id in handler.started)
+
+            assert handler.started[task_id] - requested < 1.0
+
+    async def test_fallback_polling_without_long_poll_support(self) -> None:
+        fake = FakePlatform(long_poll=False)
+        async with running_controller(fake, poll_interval_s=0.05) as (_, handler):
+            task_id = fake.enqueue("deploy", "dep-1")
+            await _wait_for(lambda: task_id in handler.finished)
+
+            calls = fake.list_calls
+            await asyncio.sleep(0.3)
+
+            # Idle polling is paced by the interval instead of spinning.
+            assert fake.list_calls - calls <= 8
+
+
+class TestConcurrentDispatch:
+    async def test_slow_task_does_not_block_others(self) -> None:
+        fake = FakePlatform()
+        async with running_controller(fake) as (_, handler):
+            slow = fake.enqueue("deploy", "dep-slow")
+            handler.release[slow] = asyncio.Event()
+            await _wait_for(lambda: slow in handler.started)
+
+            fast = fake.enqueue("deploy", "dep-fast")
+            await _wait_for(lambda: fast in handler.finished)
+
+            assert slow not in handler.finished
+
+    async def test_per_type_concurrency_limit(self) -> None:
+        fake = FakePlatform()
+        async with running_controller(fake, concurrency={"deploy": 1}) as (_, handler):
+            first = fake.enqueue("deploy", "dep-1")
+            handler.release[first] = asyncio.Event()
+            await _wait_for(lambda: first in handler.started)
+            second = fake.enqueue("deploy", "dep-2")
+            undeploy = fake.enqueue("undeploy", "dep-3")
+
+            await _wait_for(lambda: undeploy in handler.finished)
+            assert second not in handler.started
+
+            handler.release[first].set()
+            await _wait_for(lambda: second in handler.finished)
+            assert handler.max_running == 2
+
+    async def test_same_deployment_runs_in_order(self) -> None:
+        fake = FakePlatform()
+        async with running_controller(fake) as (_, handler):
+            deploy = fake.enqueue("deploy", "dep-1")
+            handler.release[deploy] = asyncio.Event()
+            await _wait_for(lambda: deploy in handler.started)
+            undeploy = fake.enqueue("undeploy", "dep-1")
+
+            await asyncio.sleep(0.1)
+            assert undeploy not in handler.started
+
+            handler.release[deploy].set()
+            await _wait_for(lambda: undeploy in handler.finished)
+            assert handler.finished == [deploy, undeploy]
+
+    async def test_failed_dispatch_marks_task_failed(self) -> None:
+        fake = FakePlatform()
+        async with running_controller(fake) as (_, handler):
+            task_id = fake.enqueue("deploy", "dep-1")
+            handler.fail.add(task_id)
+
+            await _wait_for(lambda: fake.tasks[task_id]["status"] == "failed")
+
+            assert "boom" in fake.tasks[task_id]["result"]["reason"]
+
+
+class StaleListingPlatform:
+    """Answers every listing with the same task, as read before it finished.
+
+    Listings after the first are held until ``ready()`` is true, so a task can finish
+    while the answer is on its way.
+    """
+
+    def __init__(self, task: dict[str, Any]) -> None:
+        self.task = task
+        self.ready: Callable[[], bool] = lambda: True
+        self.list_calls = 0
+        self.statuses: list[str] = []
+
+    async def list_tasks(self, status: str, wait_s: float) -> list[dict[str, Any]]:
+        self.list_calls += 1
+        if self.list_calls > 1:
+            await _wait_for(self.ready)
+        return [self.task]
+
+    async def update_task_status(
+        self, task_id: str, status: str, result: dict[str, Any] | None = None
+    ) -> None:
+        self.statuses.append(status)
+
+
+class TestStaleListing:
+    async def test_task_finished_during_listing_is_not_restarted(self) -> None:
+        platform = StaleListingPlatform({"id": "t-1", "type": "deploy", "payload": {}})
+        handler = FakeTaskHandler(platform)  # type: ignore[arg-type]
+        handler.fail.add("t-1")
+        controller = TaskController(handler=handler, poll_interval_s=5.0)
+        platform.ready = lambda: SatelliteTaskStatus.FAILED in platform.statuses
+
+        assert await controller.tick() == 1
+        assert await controller.tick() == 0
+
+        assert handler.dispatches == ["t-1"]
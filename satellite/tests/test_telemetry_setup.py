@@ -1,5 +1,11 @@
-from agent.monitoring import InferenceEvent, create_telemetry
-from agent.monitoring.testing import FakeTelemetry
+import json
+import threading
+
+from agent.monitoring import InferenceEvent, PayloadPolicy, create_telemetry
+from agent.monitoring.sampling import TRUNCATED_MARKER
+from agent.monitoring.telemetry import _BatchingEventExporter
+from agent.monitoring.testing import FakeEventExporter, FakeTelemetry
+from agent.settings import Settings
 
 
 class TestTelemetryNoOp:
@@ -160,3 +166,103 @@ class TestInferenceEvent:
         )
         d = event.to_dict()
         assert set(d.keys()) == {"event_id", "deployment_id", "status", "latency_ms", "timestamp"}
+
+
+def _event(i: int = 0) -> InferenceEvent:
+    return InferenceEvent(
+        event_id=f"evt-{i}", deployment_id="dep-1", status="success", latency_ms=1.0
+    )
+
+
+class _BlockingEventExporter(FakeEventExporter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def emit(self, event: InferenceEvent) -> None:
+        self.release.wait(timeout=5)
+        super().emit(event)
+
+
+class TestBatchingEventExporter:
+    def test_events_exported_off_thread_and_flushed_on_shutdown(self) -> None:
+        inner = FakeEventExporter()
+        exporter = _BatchingEventExporter(inner, max_queue_size=100, max_batch_size=8)
+        for i in range(20):
+            exporter.emit(_event(i))
+        exporter.shutdown()
+
+        assert [e.event_id for e in inner.events] == [f"evt-{i}" for i in range(20)]
+        assert exporter.dropped == 0
+
+    def test_full_queue_drops_instead_of_blocking(self) -> None:
+        inner = _BlockingEventExporter()
+        exporter = _BatchingEventExporter(inner, max_queue_size=2, max_batch_size=1)
+        for i in range(10):
+            exporter.emit(_event(i))
+
+        assert exporter.dropped > 0
+        inner.release.set()
+        exporter.shutdown()
+        assert len(inner.events) + exporter.dropped == 10
+
+    def test_failing_exporter_does_not_stop_worker(self) -> None:
+        inner = FakeEventExporter()
+        calls = {"n": 0}
+        original_emit = inner.emit
+
+        def flaky_emit(event: InferenceEvent) -> None:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("collector down")
+            original_emit(event)
+
+        inner.emit = flaky_emit
+        exporter = _BatchingEventExporter(inner)
+        exporter.emit(_event(0))
+        exporter.emit(_event(1))
+        exporter.shutdown()
+
+        assert [e.event_id for e in inner.events] == ["evt-1"]
+
+
+class TestPayloadPolicy:
+    def test_default_encodes_verbatim(self) -> None:
+        value = {"inputs": {"a": 1, "b": "x"}}
+        assert json.loads(PayloadPolicy().encode("inputs", value)) == value
+
+    def test_projects_inputs_to_features(self) -> None:
+        policy = PayloadPolicy(features=frozenset({"a", "c"}))
+        value = {"inputs": {"a": 1, "b": 2}, "dynamic_attributes": {"c": 3, "d": 4}}
+
+        encoded = json.loads(policy.encode("inputs", value))
+
+        assert encoded == {"inputs": {"a": 1}, "dynamic_attributes": {"c": 3}}
+
+    def test_projection_leaves_output_untouched(self) -> None:
+        policy = PayloadPolicy(features=frozenset({"a"}))
+        value = {"prediction": 1, "score": 0.5}
+        assert json.loads(policy.encode("output", value)) == value
+
+    def test_oversized_payload_replaced_by_marker(self) -> None:
+        policy = PayloadPolicy(max_bytes=32)
+        value = {"inputs": {"blob": "x" * 100}}
+
+        encoded = json.loads(policy.encode("inputs", value))
+
+        assert encoded[TRUNCATED_MARKER] is True
+        assert encoded["bytes"] == len(json.dumps(value).encode())
+
+    def test_limit_is_measured_in_encoded_bytes(self) -> None:
+        value = {"text": "é" * 20}
+        encoded = json.dumps(value, ensure_ascii=False)
+        # Within the limit counted in characters, over it counted in bytes.
+        policy = PayloadPolicy(max_bytes=len(encoded))
+
+        assert len(encoded.encode()) > len(encoded)
+        assert json.loads(policy.encode("inputs", value))[TRUNCATED_MARKER] is True
+        assert PayloadPolicy(max_bytes=len(encoded.encode())).encode("inputs", value) == encoded
+
+    def test_no_limit_by_default(self) -> None:
+        field = Settings.model_fields["MONITORING_EVENT_MAX_PAYLOAD_BYTES"]
+        assert field.default is None
@@ -25,6 +25,9 @@ from luml_api.utils.progress import BaseProgressHandler
 if TYPE_CHECKING:
     from luml_api._client import AsyncLumlClient, LumlClient
 
+# Largest number of ids the batch endpoint accepts per request.
+_BATCH_LIMIT = 500
+
 
 class ArtifactResourceBase(ABC):
     """Abstract Resource for managing artifacts."""
@@ -53,12 +56,24 @@ class ArtifactResourceBase(ABC):
     ) -> list[Artifact] | Coroutine[Any, Any, list[Artifact]]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_many(
+        self, artifact_ids: builtins.list[str]
+    ) -> builtins.list[Artifact] | Coroutine[Any, Any, builtins.list[Artifact]]:
+        raise NotImplementedError()
+
     @abstractmethod
     def download_url(
         self, artifact_id: str, *, collection_id: str | None = None
     ) -> dict | Coroutine[Any, Any, dict]:
         raise NotImplementedError()
 
+    @staticmethod
+    def _batches(artifact_ids: builtins.list[str]) -> Iterator[builtins.list[str]]:
+        unique = list(dict.fromkeys(artifact_ids))
+        for start in range(0, len(unique), _BATCH_LIMIT):
+            yield unique[start : start + _BATCH_LIMIT]
+
     @abstractmethod
     def delete_url(
         self, artifact_id: str, *, collection_id: str | None = None
@@ -482,6 +497,47 @@ class ArtifactResource(ArtifactResourceBase, ListedResource):
 
         return ArtifactsList.model_validate(response)
 
+    def get_many(self, artifact_ids: builtins.list[str]) -> builtins.list[Artifact]:
+        """
+        Get several artifacts of the orbit by ID.
+
+        Fetches up to 500 artifacts per request instead of one request per artifact.
+        Artifacts can belong to any collection of the orbit. IDs that do not exist
+        are skipped.
+
+        Args:
+            artifact_ids: IDs of the artifacts to retrieve.
+
+        Returns:
+            Artifacts in the order of ``artifact_ids``, without duplicates.
+
+        Example:
+        ```python
+        luml = LumlClient(
+            api_key="luml_your_key",
+            organization="0199c455-21ec-7c74-8efe-41470e29bae5",
+            orbit="0199c455-21ed-7aba-9fe5-5231611220de",
+        )
+        artifacts = luml.artifacts.get_many(
+            [
+                "0199c455-21ee-74c6-b747-19a82f1a1e67",
+                "0199c455-21ee-74c6-b747-19a82f1a1e68",
+            ]
+        )
+        ```
+        """
+        artifacts: builtins.list[Artifact] = []
+        for batch in self._batches(artifact_ids):
+            response = self._client.post(
+                f"/v1/organizations/{self._client.organization}/orbits/{self._client.orbit}/artifacts/batch",
+                json={"artifact_ids": batch},
+            )
+            if response:
+                artifacts.extend(
+                    Artifact.model_validate(item) for item in response["items"]
+                )
+        return artifacts
+
     @validate_collection
     def download_url(
         self, artifact_id: str, *, collection_id: str | None = None
@@ -1482,6 +1538,53 @@ class AsyncArtifactResource(ArtifactResourceBase, ListedResource):
 
         return ArtifactsList.model_validate(response)
 
+    async def get_many(
+        self, artifact_ids: builtins.list[str]
+    ) -> builtins.list[Artifact]:
+        """
+        Get several artifacts of the orbit by ID.
+
+        Fetches up to 500 artifacts per request instead of one request per artifact.
+        Artifacts can belong to any collection of the orbit. IDs that do not exist
+        are skipped.
+
+        Args:
+            artifact_ids: IDs of the artifacts to retrieve.
+
+        Returns:
+            Artifacts in the order of ``artifact_ids``, without duplicates.
+
+        Example:
+        ```python
+        luml = AsyncLumlClient(
+            api_key="luml_your_key",
+        )
+
+        async def main():
+            await luml.setup_config(
+                organization="0199c455-21ec-7c74-8efe-41470e29bae5",
+                orbit="0199c455-21ed-7aba-9fe5-5231611220de",
+            )
+            artifacts = await luml.artifacts.get_many(
+                [
+                    "0199c455-21ee-74c6-b747-19a82f1a1e67",
+                    "0199c455-21ee-74c6-b747-19a82f1a1e68",
+                ]
+            )
+        ```
+        """
+        artifacts: builtins.list[Artifact] = []
+        for batch in self._batches(artifact_ids):
+            response = await self._client.post(
+                f"/v1/organizations/{self._client.organization}/orbits/{self._client.orbit}/artifacts/batch",
+                json={"artifact_ids": batch},
+            )
+            if response:
+                artifacts.extend(
+                    Artifact.model_validate(item) for item in response["items"]
+                )
+        return artifacts
+
     @validate_collection
     async def download_url(
         self, artifact_id: str, *, collection_id: str | None = None
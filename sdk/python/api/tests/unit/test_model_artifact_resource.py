@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
@@ -197,6 +197,28 @@ def test_artifact_delete(mock_sync_client: Mock) -> None:
     assert result is None
 
 
+def test_artifact_get_many_batches_unique_ids(
+    mock_sync_client: Mock, sample_artifact: Artifact
+) -> None:
+    organization_id = mock_sync_client.organization
+    orbit_id = mock_sync_client.orbit
+    artifact_ids = [f"id-{i}" for i in range(501)]
+    mock_sync_client.post.return_value = {
+        "items": [sample_artifact.model_dump()],
+        "not_found": [],
+    }
+
+    resource = ArtifactResource(mock_sync_client)
+    artifacts = resource.get_many([*artifact_ids, "id-0"])
+
+    url = f"/v1/organizations/{organization_id}/orbits/{orbit_id}/artifacts/batch"
+    assert mock_sync_client.post.call_args_list == [
+        call(url, json={"artifact_ids": artifact_ids[:500]}),
+        call(url, json={"artifact_ids": artifact_ids[500:]}),
+    ]
+    assert [artifact.id for artifact in artifacts] == [sample_artifact.id] * 2
+
+
 @pytest.mark.asyncio
 async def test_async_artifact_list(
     mock_async_client: AsyncMock, sample_artifact: Artifact
@@ -516,3 +538,39 @@ async def test_async_artifact_delete(mock_async_client: AsyncMock) -> None:
         f"/v1/organizations/{organization_id}/orbits/{orbit_id}/collections/{collection_id}/artifacts/{artifact_id}"
     )
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_async_artifact_get_many(
+    mock_async_client: AsyncMock, sample_artifact: Artifact
+) -> None:
+    organization_id = mock_async_client.organization
+    orbit_id = mock_async_client.orbit
+    mock_async_client.post.return_value = {
+        "items": [sample_artifact.model_dump()],
+        "not_found": ["1236640f-fec6-478d-8772-90eb531cc727"],
+    }
+
+    resource = AsyncArtifactResource(mock_async_client)
+    artifacts = await resource.get_many(
+        [sample_artifact.id, "1236640f-fec6-478d-8772-90eb531cc727"]
+    )
+
+    mock_async_client.post.assert_called_once_with(
+        f"/v1/organizations/{organization_id}/orbits/{orbit_id}/artifacts/batch",
+        json={
+            "artifact_ids": [
+                sample_artifact.id,
+                "1236640f-fec6-478d-8772-90eb531cc727",
+            ]
+        },
+    )
+    assert artifacts == [sample_artifact]
+
+
+@pytest.mark.asyncio
+async def test_async_artifact_get_many_empty(mock_async_client: AsyncMock) -> None:
+    resource = AsyncArtifactResource(mock_async_client)
+
+    assert await resource.get_many([]) == []
+    mock_async_client.post.assert_not_called()
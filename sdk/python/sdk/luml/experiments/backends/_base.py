@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any, Literal
 
 from luml.artifacts._base import _BaseFile
@@ -115,6 +116,10 @@ class Backend(ABC):
     def get_attachment(self, experiment_id: str, name: str) -> bytes:
         pass
 
+    @abstractmethod
+    def get_attachment_path(self, experiment_id: str, name: str) -> Path:
+        pass
+
     @abstractmethod
     def list_attachments(self, experiment_id: str) -> list[AttachmentRecord]:
         pass
@@ -133,6 +138,10 @@ class Backend(ABC):
     def get_experiment(self, experiment_id: str) -> Experiment | None:
         pass
 
+    @abstractmethod
+    def get_experiments(self, experiment_ids: list[str]) -> list[Experiment]:
+        pass
+
     @abstractmethod
     def delete_experiment(self, experiment_id: str) -> None:
         pass
@@ -56,8 +56,8 @@ from luml.experiments.utils import guess_span_type
 from luml.utils.tar import create_and_index_tar
 
 
-def _parse_timestamp(s: bytes) -> datetime:
-    dt = datetime.fromisoformat(s.decode())
+def _parse_timestamp(s: bytes | str) -> datetime:
+    dt = datetime.fromisoformat(s.decode() if isinstance(s, bytes) else s)
     return dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)
 
 
@@ -812,18 +812,40 @@ class SQLiteBackend(Backend, SQLitePaginationMixin):
             ValueError: If the specified attachment file is not found within the
                 directory of the given experiment.
         """
+        with self.get_attachment_path(experiment_id, name).open("rb") as f:
+            return f.read()
+
+    def get_attachment_path(self, experiment_id: str, name: str) -> Path:
+        """
+        Resolves the file holding an attachment without reading it.
+
+        Callers that serve large attachments can stream the file from this path
+        instead of loading it with `get_attachment`.
+
+        Args:
+            experiment_id (str): Identifier for the experiment whose attachment is
+                being accessed.
+            name (str): Name of the attachment file, relative to the experiment's
+                attachments directory.
+
+        Returns:
+            Path: Absolute path of the attachment file.
+
+        Raises:
+            ValueError: If the attachment does not exist or `name` points outside
+                the experiment's attachments directory.
+        """
         self._ensure_experiment_initialized(experiment_id)
 
-        attachments_dir = self._get_attachments_dir(experiment_id)
-        file_path = attachments_dir / name
+        attachments_dir = self._get_attachments_dir(experiment_id).resolve()
+        file_path = (attachments_dir / name).resolve()
 
-        if not file_path.exists():
+        if not file_path.is_relative_to(attachments_dir) or not file_path.is_file():
             raise ValueError(
                 f"Attachment {name} not found in experiment {experiment_id}"
             )
 
-        with file_path.open("rb") as f:
-            return f.read()
+        return file_path
 
     def list_attachments(self, experiment_id: str) -> list[AttachmentRecord]:
         self._ensure_experiment_initialized(experiment_id)
@@ -1027,6 +1049,33 @@ class SQLiteBackend(Backend, SQLitePaginationMixin):
             "or a valid dynamic metric / static param key."
         )
 
+    _EXPERIMENT_RECORD_QUERY = (
+        "SELECT e.id, e.name, e.created_at, e.status, e.tags, e.duration, e.description, "
+        "e.group_id, e.static_params, e.dynamic_params, eg.name AS group_name, e.source, "
+        "e.metadata, e.upload_status "
+        "FROM experiments e "
+        "LEFT JOIN experiment_groups eg ON e.group_id = eg.id "
+    )
+
+    @staticmethod
+    def _experiment_from_record_row(row: tuple[Any, ...]) -> Experiment:
+        return Experiment(
+            id=row[0],
+            name=row[1],
+            created_at=row[2],
+            status=row[3],
+            tags=json.loads(row[4]) if row[4] else [],
+            duration=row[5],
+            description=row[6],
+            group_id=row[7],
+            static_params=json.loads(row[8]) if row[8] else {},
+            dynamic_params=json.loads(row[9]) if row[9] else {},
+            group_name=row[10],
+            source=row[11],
+            metadata=json.loads(row[12]) if row[12] else {},
+            upload_status=row[13] or "unknown",
+        )
+
     def get_experiment(self, experiment_id: str) -> Experiment | None:
         """
         Fetches an experiment's details from the database by the given experiment ID.
@@ -1044,33 +1093,39 @@ class SQLiteBackend(Backend, SQLitePaginationMixin):
         conn = self._get_meta_connection()
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT e.id, e.name, e.created_at, e.status, e.tags, e.duration, e.description, "
-            "e.group_id, e.static_params, e.dynamic_params, eg.name AS group_name, e.source, "
-            "e.metadata, e.upload_status "
-            "FROM experiments e "
-            "LEFT JOIN experiment_groups eg ON e.group_id = eg.id "
-            "WHERE e.id = ?",
-            (experiment_id,),
+            self._EXPERIMENT_RECORD_QUERY + "WHERE e.id = ?", (experiment_id,)
         )
         row = cursor.fetchone()
         if not row:
             return None
-        return Experiment(
-            id=row[0],
-            name=row[1],
-            created_at=row[2],
-            status=row[3],
-            tags=json.loads(row[4]) if row[4] else [],
-            duration=row[5],
-            description=row[6],
-            group_id=row[7],
-            static_params=json.loads(row[8]) if row[8] else {},
-            dynamic_params=json.loads(row[9]) if row[9] else {},
-            group_name=row[10],
-            source=row[11],
-            metadata=json.loads(row[12]) if row[12] else {},
-            upload_status=row[13] or "unknown",
-        )
+        return self._experiment_from_record_row(row)
+
+    def get_experiments(self, experiment_ids: list[str]) -> list[Experiment]:
+        """
+        Fetches the details of several experiments with one query per 500 IDs.
+
+        Args:
+            experiment_ids (list[str]): Identifiers of the experiments to retrieve.
+
+        Returns:
+            list[Experiment]: The experiments that exist, in no particular order.
+            Unknown IDs are skipped.
+        """
+        conn = self._get_meta_connection()
+        cursor = conn.cursor()
+        unique_ids = list(dict.fromkeys(experiment_ids))
+        experiments = []
+        for start in range(0, len(unique_ids), 500):
+            batch = unique_ids[start : start + 500]
+            placeholders = ", ".join("?" for _ in batch)
+            cursor.execute(
+                self._EXPERIMENT_RECORD_QUERY + f"WHERE e.id IN ({placeholders})",
+                batch,
+            )
+            experiments.extend(
+                self._experiment_from_record_row(row) for row in cursor.fetchall()
+            )
+        return experiments
 
     def delete_experiment(self, experiment_id: str) -> None:
         """
@@ -2604,7 +2659,8 @@ class SQLiteBackend(Backend, SQLitePaginationMixin):
                 trace_id=row[0],
                 execution_time=row[1],
                 span_count=row[2],
-                created_at=row[3],
+                # Aggregated in a subquery, so the TIMESTAMP converter doesn't apply.
+                created_at=_parse_timestamp(row[3]),
                 state=TraceState(row[4]),
             )
             for row in rows
@@ -2753,7 +2809,8 @@ class SQLiteBackend(Backend, SQLitePaginationMixin):
                 trace_id=row[0],
                 execution_time=row[1],
                 span_count=row[2],
-                created_at=row[3],
+                # Aggregated in a subquery, so the TIMESTAMP converter doesn't apply.
+                created_at=_parse_timestamp(row[3]),
                 state=TraceState(row[4]),
             )
             for row in rows
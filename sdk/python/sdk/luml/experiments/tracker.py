@@ -572,6 +572,28 @@ class ExperimentTracker:
             raise ValueError("No active experiment. Call start_experiment() first.")
         return self.backend.get_attachment(exp_id, name)
 
+    def get_attachment_path(self, name: str, experiment_id: str | None = None) -> Path:
+        """
+        Locate a previously logged attachment on disk without reading it.
+
+        Args:
+            name (str): Name of the attachment as specified during
+                :meth:`log_attachment`.
+            experiment_id (str | None): Experiment ID. Uses current experiment if
+                not specified.
+
+        Returns:
+            Path: Path of the attachment file.
+
+        Raises:
+            ValueError: If no experiment is active and ``experiment_id`` is not
+                provided, or if the attachment does not exist.
+        """
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.get_attachment_path(exp_id, name)
+
     def list_attachments(
         self, experiment_id: str | None = None
     ) -> list[AttachmentRecord]:
@@ -1143,6 +1165,31 @@ class ExperimentTracker:
         """
         return self.backend.get_experiment(experiment_id)
 
+    def get_experiment_records(
+        self, experiment_ids: list[str]
+    ) -> dict[str, Experiment]:
+        """
+        Retrieve the metadata of several experiments at once.
+
+        Args:
+            experiment_ids (list[str]): The experiments to look up.
+
+        Returns:
+            dict[str, Experiment]: Experiment metadata by ID. IDs that do not
+                exist are left out.
+
+        Example:
+        ```python
+        tracker = ExperimentTracker()
+        records = tracker.get_experiment_records(["exp-1", "exp-2"])
+        for exp_id, exp in records.items():
+            print(exp_id, exp.name)
+        ```
+        """
+        return {
+            exp.id: exp for exp in self.backend.get_experiments(list(experiment_ids))
+        }
+
     def get_trace(self, experiment_id: str, trace_id: str) -> TraceDetails | None:
         """
         Retrieve full trace details including all spans.
@@ -70,6 +70,21 @@ class TestLogExperiment:
         exp = tracker.get_experiment_record(exp_id)
         assert exp.group_id == group.id
 
+    def test_get_experiment_records_batches_lookup(
+        self, tracker: ExperimentTracker
+    ) -> None:
+        first = tracker.start_experiment(name="first", group="batch-group")
+        second = tracker.start_experiment(name="second", tags=["v2"])
+
+        records = tracker.get_experiment_records([first, second, "missing", first])
+
+        assert set(records) == {first, second}
+        assert records[first].name == "first"
+        assert records[first].group_name == "batch-group"
+        assert records[second].tags == ["v2"]
+        assert records[second] == tracker.get_experiment_record(second)
+        assert tracker.get_experiment_records([]) == {}
+
     def test_start_sets_current_experiment_id(self, tracker: ExperimentTracker) -> None:
         assert tracker.current_experiment_id is None
         exp_id = tracker.start_experiment()
@@ -568,6 +583,30 @@ class TestGetAttachment:
         with pytest.raises(ValueError, match="not found"):
             tracker.get_attachment("does_not_exist.txt")
 
+    def test_get_attachment_path(
+        self,
+        tracker_with_experiment: tuple[ExperimentTracker, str],
+        tmp_path: Path,
+    ) -> None:
+        tracker, exp_id = tracker_with_experiment
+
+        tracker.log_attachment("plots/loss.png", b"\x89PNG", binary=True)
+
+        path = tracker.get_attachment_path("plots/loss.png")
+        expected = tmp_path / "experiments" / exp_id / "attachments" / "plots/loss.png"
+        assert path == expected.resolve()
+        assert path.read_bytes() == b"\x89PNG"
+
+    def test_get_attachment_path_rejects_escaping_names(
+        self,
+        tracker_with_experiment: tuple[ExperimentTracker, str],
+    ) -> None:
+        tracker, _ = tracker_with_experiment
+        with pytest.raises(ValueError, match="not found"):
+            tracker.get_attachment_path("../exp.db")
+        with pytest.raises(ValueError, match="not found"):
+            tracker.get_attachment("../exp.db")
+
     def test_get_attachment_requires_experiment(
         self, tracker: ExperimentTracker
     ) -> None: